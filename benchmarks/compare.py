@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Compare benchmark results against a baseline.
+
+Usage:
+    python -m benchmarks.compare BASELINE.json CURRENT.json [--threshold 0.15]
+
+Exits with status 1 when any benchmark regressed beyond the threshold.
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.harness import compare_results, format_comparison, load_results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare benchmark results")
+    parser.add_argument("baseline", help="Baseline results JSON")
+    parser.add_argument("current", help="Current results JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="Allowed relative slowdown of the median time (default: 0.15)",
+    )
+    parser.add_argument(
+        "--rss-threshold",
+        type=float,
+        default=None,
+        help="Allowed relative peak RSS growth (default: same as --threshold)",
+    )
+    args = parser.parse_args(argv)
+
+    rows = compare_results(
+        load_results(args.baseline),
+        load_results(args.current),
+        args.threshold,
+        args.rss_threshold,
+    )
+    print(format_comparison(rows))
+    regressions = [r for r in rows if r.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond threshold")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
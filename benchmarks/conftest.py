@@ -0,0 +1,126 @@
+"""
+Benchmark suite configuration.
+
+Run the suite (results go to benchmarks/results/latest.json):
+    python -m pytest benchmarks -q
+
+Save a baseline, then compare later runs against it:
+    python -m pytest benchmarks --bench-save=main
+    python -m pytest benchmarks --bench-compare=main --bench-threshold=0.15
+
+A run with --bench-compare exits non-zero when a benchmark regressed beyond
+the threshold. Baselines are machine-specific; compare runs from the same box.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.harness import (
+    BenchmarkFixture,
+    compare_results,
+    format_comparison,
+    load_results,
+    save_results,
+)
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_DIR = os.path.join(BENCH_DIR, "baselines")
+DEFAULT_RESULTS = os.path.join(BENCH_DIR, "results", "latest.json")
+
+_results = []
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--bench-rounds", type=int, default=5, help="Timed rounds per benchmark"
+    )
+    group.addoption(
+        "--bench-json", default=DEFAULT_RESULTS, help="Where to write run results"
+    )
+    group.addoption(
+        "--bench-save", metavar="NAME", help="Also save results as baseline NAME"
+    )
+    group.addoption(
+        "--bench-compare",
+        metavar="NAME",
+        help="Compare against baseline NAME (or a JSON path)",
+    )
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=0.15,
+        help="Allowed relative slowdown before flagging a regression",
+    )
+
+
+def _baseline_path(name: str) -> str:
+    if name.endswith(".json") or os.sep in name:
+        return name
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+@pytest.fixture
+def benchmark(request):
+    """Measure a hot path; see benchmarks.harness.BenchmarkFixture."""
+    group = request.module.__name__.rsplit(".", 1)[-1]
+    if group.startswith("test_"):
+        group = group[len("test_") :]
+    fixture = BenchmarkFixture(
+        request.node.name, group, rounds=request.config.getoption("--bench-rounds")
+    )
+    yield fixture
+    if fixture.result is not None:
+        _results.append(fixture.result)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if not _results:
+        return
+    current = save_results(config.getoption("--bench-json"), _results)
+    saved = config.getoption("--bench-save")
+    if saved:
+        save_results(_baseline_path(saved), _results)
+
+    compare = config.getoption("--bench-compare")
+    if compare:
+        rows = compare_results(
+            load_results(_baseline_path(compare)),
+            current,
+            config.getoption("--bench-threshold"),
+        )
+        config._bench_comparison = rows
+        if any(r.regressed for r in rows) and exitstatus == 0:
+            session.exitstatus = 1
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not _results:
+        return
+    tr = terminalreporter
+    tr.section("benchmarks")
+    for r in sorted(_results, key=lambda r: (r.group, r.name)):
+        rate = f"  {r.throughput:,.1f} {r.unit}/s" if r.throughput else ""
+        tr.write_line(
+            f"{r.name:<48} median {r.median_s * 1000:9.2f} ms  "
+            f"peak +{r.peak_rss_mb:7.1f} MB{rate}"
+        )
+    tr.write_line(f"Results: {config.getoption('--bench-json')}")
+    saved = config.getoption("--bench-save")
+    if saved:
+        tr.write_line(f"Saved baseline: {_baseline_path(saved)}")
+
+    rows = getattr(config, "_bench_comparison", None)
+    if rows is not None:
+        tr.write_line("")
+        tr.write_line(format_comparison(rows))
+        regressions = sum(r.regressed for r in rows)
+        if regressions:
+            tr.write_line(f"{regressions} benchmark regression(s)", red=True)
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Benchmark Harness
+
+Timing, memory and throughput measurement for the benchmark suite, plus the
+JSON result format and baseline comparison.
+
+The ``benchmark`` fixture follows the pytest-benchmark calling convention
+(``benchmark(fn, *args)`` and ``benchmark.pedantic(...)``) so benchmarks read
+the same either way, but needs no plugin. Each run records:
+
+- wall time per round (min/median/mean/stddev/max)
+- peak RSS above the pre-run baseline, sampled in a background thread and
+  including child processes (ffmpeg) when psutil is available
+- throughput (units per second at the median time) when the benchmark
+  declares how much work one round does
+"""
+
+import json
+import os
+import platform
+import statistics
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil is in requirements
+    psutil = None
+
+RESULTS_VERSION = 1
+RSS_SAMPLE_INTERVAL_S = 0.002
+# Peak RSS deltas below this are allocator noise and are never flagged
+RSS_FLOOR_MB = 8.0
+
+
+def current_rss() -> int:
+    """Resident set size of this process and its children, in bytes."""
+    if psutil is not None:
+        proc = psutil.Process()
+        total = proc.memory_info().rss
+        for child in proc.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return total
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+class RSSSampler:
+    """Track the peak RSS while a block runs."""
+
+    def __init__(self, interval_s: float = RSS_SAMPLE_INTERVAL_S):
+        self.interval_s = interval_s
+        self.baseline = 0
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            self.peak = max(self.peak, current_rss())
+
+    def __enter__(self):
+        self.baseline = self.peak = current_rss()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+        return False
+
+    @property
+    def peak_delta_mb(self) -> float:
+        return max(0, self.peak - self.baseline) / (1024 * 1024)
+
+
+@dataclass
+class BenchmarkResult:
+    """Summary statistics for one benchmark."""
+
+    name: str
+    group: str
+    rounds: int
+    min_s: float
+    median_s: float
+    mean_s: float
+    stddev_s: float
+    max_s: float
+    peak_rss_mb: float
+    throughput: Optional[float] = None
+    unit: Optional[str] = None
+    extra_info: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_times(
+        cls,
+        name: str,
+        group: str,
+        times: List[float],
+        peak_rss_mb: float,
+        units: Optional[float] = None,
+        unit: Optional[str] = None,
+        extra_info: Optional[Dict[str, Any]] = None,
+    ) -> "BenchmarkResult":
+        median = statistics.median(times)
+        return cls(
+            name=name,
+            group=group,
+            rounds=len(times),
+            min_s=min(times),
+            median_s=median,
+            mean_s=statistics.fmean(times),
+            stddev_s=statistics.stdev(times) if len(times) > 1 else 0.0,
+            max_s=max(times),
+            peak_rss_mb=round(peak_rss_mb, 2),
+            throughput=(units / median) if units and median > 0 else None,
+            unit=unit,
+            extra_info=extra_info if extra_info is not None else {},
+        )
+
+
+class BenchmarkFixture:
+    """
+    Callable measuring a target, pytest-benchmark style.
+
+    Args:
+        name: Benchmark name (the pytest node name)
+        group: Group name (the hot path being measured)
+        rounds: Default timed rounds
+        warmup_rounds: Default untimed rounds before timing
+    """
+
+    def __init__(self, name: str, group: str, rounds: int = 5, warmup_rounds: int = 1):
+        self.name = name
+        self.group = group
+        self.rounds = rounds
+        self.warmup_rounds = warmup_rounds
+        self.extra_info: Dict[str, Any] = {}
+        self.result: Optional[BenchmarkResult] = None
+        self._units: Optional[float] = None
+        self._unit: Optional[str] = None
+
+    def set_throughput(self, units: float, unit: str):
+        """Declare how much work one round does (e.g. 30 "frames")."""
+        self._units = units
+        self._unit = unit
+
+    def __call__(self, target: Callable, *args, **kwargs) -> Any:
+        return self.pedantic(target, args=args, kwargs=kwargs)
+
+    def pedantic(
+        self,
+        target: Callable,
+        args: tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        setup: Optional[Callable[[], Any]] = None,
+        rounds: Optional[int] = None,
+        warmup_rounds: Optional[int] = None,
+    ) -> Any:
+        """
+        Run ``target`` for a number of timed rounds.
+
+        Args:
+            target: Function to measure
+            args: Positional arguments for ``target``
+            kwargs: Keyword arguments for ``target``
+            setup: Untimed callable run before every round; if it returns an
+                ``(args, kwargs)`` pair those are used for that round
+            rounds: Timed rounds (defaults to the fixture's setting)
+            warmup_rounds: Untimed rounds first (defaults to the fixture's)
+
+        Returns:
+            The value returned by the last round
+        """
+        if self.result is not None:
+            raise RuntimeError(f"{self.name}: benchmark fixture used twice")
+        kwargs = kwargs or {}
+        rounds = rounds or self.rounds
+        warmup_rounds = self.warmup_rounds if warmup_rounds is None else warmup_rounds
+
+        def prepared():
+            if setup is None:
+                return args, kwargs
+            prepared_args = setup()
+            return prepared_args if prepared_args is not None else (args, kwargs)
+
+        for _ in range(warmup_rounds):
+            a, k = prepared()
+            target(*a, **k)
+
+        times = []
+        value = None
+        with RSSSampler() as sampler:
+            for _ in range(rounds):
+                a, k = prepared()
+                start = time.perf_counter()
+                value = target(*a, **k)
+                times.append(time.perf_counter() - start)
+
+        self.result = BenchmarkResult.from_times(
+            self.name,
+            self.group,
+            times,
+            sampler.peak_delta_mb,
+            self._units,
+            self._unit,
+            self.extra_info,
+        )
+        return value
+
+
+def machine_info() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def results_to_dict(results: List[BenchmarkResult]) -> Dict[str, Any]:
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "benchmarks": {r.name: asdict(r) for r in results},
+    }
+
+
+def save_results(path: str, results: List[BenchmarkResult]) -> Dict[str, Any]:
+    """Write results as JSON (atomically) and return the written document."""
+    data = results_to_dict(results)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+    return data
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(
+            f"{path}: unsupported results version {data.get('version')!r}"
+        )
+    return data
+
+
+@dataclass
+class Comparison:
+    """One metric of one benchmark, baseline vs current."""
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+    change: float  # relative; positive is worse
+    regressed: bool
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.15,
+    rss_threshold: Optional[float] = None,
+) -> List[Comparison]:
+    """
+    Compare two result documents.
+
+    Median wall time regresses when it grows by more than ``threshold``
+    (relative). Peak RSS uses ``rss_threshold`` (defaulting to
+    ``threshold``) and is only judged once either side exceeds RSS_FLOOR_MB.
+    Benchmarks present on only one side are skipped.
+
+    Args:
+        baseline: Baseline results document
+        current: Current results document
+        threshold: Allowed relative slowdown, e.g. 0.15 for 15%
+        rss_threshold: Allowed relative peak RSS growth
+
+    Returns:
+        Comparisons for every shared benchmark and metric
+    """
+    rss_threshold = threshold if rss_threshold is None else rss_threshold
+    rows = []
+    base_runs = baseline.get("benchmarks", {})
+    for name, cur in sorted(current.get("benchmarks", {}).items()):
+        base = base_runs.get(name)
+        if base is None:
+            continue
+
+        old, new = base["median_s"], cur["median_s"]
+        change = (new - old) / old if old > 0 else 0.0
+        rows.append(
+            Comparison(name, "median_s", old, new, change, change > threshold)
+        )
+
+        old, new = base.get("peak_rss_mb", 0.0), cur.get("peak_rss_mb", 0.0)
+        if max(old, new) >= RSS_FLOOR_MB:
+            change = (new - old) / max(old, RSS_FLOOR_MB)
+            regressed = change > rss_threshold
+            rows.append(Comparison(name, "peak_rss_mb", old, new, change, regressed))
+    return rows
+
+
+def format_comparison(rows: List[Comparison]) -> str:
+    """Render comparisons as an aligned text table."""
+    if not rows:
+        return "No benchmarks in common with the baseline."
+    width = max(len(r.name) for r in rows)
+    lines = [
+        f"{'benchmark':<{width}}  {'metric':<11} {'baseline':>10} {'current':>10} "
+        f"{'change':>7}"
+    ]
+    for r in rows:
+        flag = "  REGRESSION" if r.regressed else ""
+        lines.append(
+            f"{r.name:<{width}}  {r.metric:<11} {r.baseline:>10.4f} "
+            f"{r.current:>10.4f} {r.change:>+7.1%}{flag}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,50 @@
+"""Benchmarks for the video assembly hot paths: Ken Burns frames and encode."""
+
+import pytest
+
+from benchmarks.fixtures import has_ffmpeg, paper_frame, write_test_video
+
+needs_ffmpeg = pytest.mark.skipif(not has_ffmpeg(), reason="ffmpeg not available")
+
+W, H = 640, 360
+FPS = 24
+SECONDS = 1.0
+
+
+@pytest.fixture(scope="module")
+def still(tmp_path_factory):
+    path = tmp_path_factory.mktemp("stills") / "still.png"
+    paper_frame(size=(1600, 1000)).save(path)
+    return str(path)
+
+
+def test_ken_burns_frames(benchmark, still):
+    from bin.assemble_video import ken_burns_imageclip
+
+    clip = ken_burns_imageclip(still, SECONDS, W, H)
+    times = [i / FPS for i in range(int(SECONDS * FPS))]
+
+    def render():
+        return [clip.get_frame(t) for t in times]
+
+    benchmark.set_throughput(len(times), "frames")
+    frames = benchmark.pedantic(render, rounds=3)
+    assert frames[0].shape[:2] == (H, W)
+
+
+@needs_ffmpeg
+def test_encode_with_fallback(benchmark, tmp_path):
+    from bin.utils.ffmpeg import encode_with_fallback
+
+    source = write_test_video(tmp_path / "src.mp4", seconds=2.0, size=f"{W}x{H}")
+    out = tmp_path / "out.mp4"
+
+    benchmark.set_throughput(2.0 * 30, "frames")
+    benchmark.pedantic(
+        encode_with_fallback,
+        args=(source, str(out)),
+        kwargs={"extra_video_args": ["-preset", "ultrafast"]},
+        rounds=3,
+        warmup_rounds=0,
+    )
+    assert out.exists()
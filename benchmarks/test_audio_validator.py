@@ -0,0 +1,52 @@
+"""Benchmarks for audio acceptance validation (loudness and ducking)."""
+
+import pytest
+
+from benchmarks.fixtures import has_ffmpeg, has_ffprobe, tone_with_noise, write_wav
+
+pytestmark = pytest.mark.skipif(
+    not (has_ffmpeg() and has_ffprobe()), reason="ffmpeg/ffprobe not available"
+)
+
+SECONDS = 10.0
+RATE = 48000
+
+
+@pytest.fixture(scope="module")
+def audio(tmp_path_factory):
+    root = tmp_path_factory.mktemp("audio")
+    voice = tone_with_noise(SECONDS, 220.0, RATE, gate_period_s=1.0)
+    music = tone_with_noise(SECONDS, 523.0, RATE, noise_db=-40.0, seed=7)
+    speaking = voice != 0
+    ducked_music = music * (0.25 + 0.75 * (abs(voice) < 1e-3))
+    return {
+        "voice": write_wav(root / "vo.wav", voice, RATE),
+        "music": write_wav(root / "music.wav", music, RATE),
+        "mixed": write_wav(root / "mix.wav", 0.6 * voice + 0.4 * ducked_music, RATE),
+        "speaking": speaking,
+    }
+
+
+@pytest.fixture(scope="module")
+def validator():
+    from bin.audio_validator import AudioValidator
+
+    return AudioValidator()
+
+
+def test_validate_mixed_audio(benchmark, audio, validator):
+    benchmark.set_throughput(SECONDS, "audio-seconds")
+    result = benchmark.pedantic(
+        validator.validate_audio_for_acceptance, args=(audio["mixed"],), rounds=3
+    )
+    assert isinstance(result, dict)
+
+
+def test_validate_ducking(benchmark, audio, validator):
+    benchmark.set_throughput(SECONDS, "audio-seconds")
+    result = benchmark.pedantic(
+        validator.validate_ducking,
+        args=(audio["mixed"], audio["voice"], audio["music"]),
+        rounds=3,
+    )
+    assert isinstance(result, dict)
@@ -0,0 +1,40 @@
+"""Benchmarks for fact-guard claim detection and beat mapping."""
+
+import re
+
+from benchmarks.fixtures import synthetic_beats, synthetic_script
+from bin import fact_guard
+
+LINES = 4000
+
+
+def _scan_per_pattern(script_lines):
+    # Reference: one search per claim pattern per line, as a line-at-a-time
+    # checker would do it
+    patterns = [re.compile(p) for p in fact_guard.CLAIM_PATTERNS.values()]
+    found = 0
+    for line in script_lines:
+        for pattern in patterns:
+            found += sum(1 for _ in pattern.finditer(line))
+    return found
+
+
+def test_claims_per_line(benchmark):
+    script = synthetic_script(LINES)
+    benchmark.set_throughput(LINES, "lines")
+    benchmark(_scan_per_pattern, script)
+
+
+def test_claims_single_pass(benchmark):
+    script = synthetic_script(LINES)
+    benchmark.set_throughput(LINES, "lines")
+    by_line = benchmark(fact_guard.scan_script, script)
+    benchmark.extra_info["matches"] = sum(len(m) for m in by_line.values())
+
+
+def test_map_script_to_beats(benchmark):
+    script = synthetic_script(LINES)
+    beats = synthetic_beats()
+    benchmark.set_throughput(LINES, "lines")
+    mapped = benchmark(fact_guard.map_script_to_beats, script, beats)
+    benchmark.extra_info["mapped_lines"] = len(mapped)
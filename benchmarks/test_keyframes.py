@@ -0,0 +1,45 @@
+"""Benchmarks for compiled keyframe animation (anim_fx.apply_keyframes)."""
+
+import numpy as np
+import pytest
+
+from benchmarks.fixtures import paper_frame
+from bin.cutout.anim_fx import apply_keyframes
+from bin.cutout.keyframe_engine import KeyframeTrack
+from bin.cutout.sdk import Keyframe
+
+moviepy = pytest.importorskip("moviepy.editor")
+
+DURATION_S = 2.0
+
+
+def _keyframes(count: int):
+    step = int(DURATION_S * 1000 / (count - 1))
+    return [
+        Keyframe(t=i * step, x=40 + i * 8, y=60, scale=1.0 + (i % 3) / 4, rotate=i)
+        for i in range(count)
+    ]
+
+
+def test_compile_track(benchmark):
+    keyframes = _keyframes(64)
+    benchmark.set_throughput(len(keyframes), "keyframes")
+    track = benchmark(KeyframeTrack.compile, keyframes, DURATION_S)
+    assert len(track) == int(DURATION_S * track.fps) + 1
+
+
+@pytest.mark.parametrize("count", [2, 32])
+def test_render_animated_element(benchmark, count):
+    element = np.asarray(paper_frame((320, 180)))
+    clip = moviepy.ImageClip(element, duration=DURATION_S)
+    animated = apply_keyframes(clip, _keyframes(count))
+    times = [i / 30 for i in range(int(DURATION_S * 30))]
+    benchmark.set_throughput(len(times), "frames")
+
+    def render():
+        for t in times:
+            animated.get_frame(t)
+            animated.mask.get_frame(t)
+            animated.pos(t)
+
+    benchmark(render)
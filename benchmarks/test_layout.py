@@ -0,0 +1,34 @@
+"""Benchmarks for cutout layout placement and packing."""
+
+import random
+
+from benchmarks.fixtures import SEED
+from bin.cutout.layout_engine import LayoutEngine
+
+
+def test_poisson_points(benchmark):
+    engine = LayoutEngine(SEED)
+    points = benchmark(engine.poisson_points, 1920, 1080, 40, 30, SEED)
+    benchmark.extra_info["points"] = len(points)
+    assert points
+
+
+def test_place_non_overlapping(benchmark):
+    rng = random.Random(SEED)
+    rects = [(rng.randint(60, 240), rng.randint(40, 180)) for _ in range(40)]
+    engine = LayoutEngine(SEED)
+    benchmark.set_throughput(len(rects), "rects")
+    positions = benchmark(engine.place_non_overlapping, rects, 16, SEED)
+    assert len(positions) == len(rects)
+
+
+def test_pack_text_blocks(benchmark):
+    rng = random.Random(SEED)
+    blocks = [
+        {"id": f"b{i}", "w": rng.randint(80, 420), "h": rng.randint(30, 120)}
+        for i in range(200)
+    ]
+    engine = LayoutEngine(SEED)
+    benchmark.set_throughput(len(blocks), "blocks")
+    packed = benchmark(engine.pack_text_blocks, blocks)
+    assert packed
@@ -0,0 +1,45 @@
+"""Benchmarks for cutout QA gates over scenes and rendered frames."""
+
+import pytest
+
+from benchmarks.fixtures import PALETTE, SEED, paper_frame, synthetic_scenes
+from bin.cutout.frame_analyzer import TextRegion
+from bin.cutout.qa_gates import check_collisions, check_frame_contrast, run_all
+
+SCENES = 40
+
+
+@pytest.fixture(scope="module")
+def scenes():
+    return synthetic_scenes(SCENES, n_elements=24)
+
+
+def test_run_all_scenes(benchmark, scenes):
+    def run():
+        return [run_all(scene, scenes, PALETTE[:3]) for scene in scenes]
+
+    benchmark.set_throughput(len(scenes), "scenes")
+    results = benchmark(run)
+    assert len(results) == len(scenes)
+
+
+def test_check_collisions_dense(benchmark):
+    boxes = [
+        (x * 37 % 1800, y * 53 % 1000, x * 37 % 1800 + 90, y * 53 % 1000 + 60)
+        for x in range(20)
+        for y in range(10)
+    ]
+    benchmark.set_throughput(len(boxes), "boxes")
+    result = benchmark(check_collisions, boxes)
+    assert result.details
+
+
+def test_check_frame_contrast(benchmark):
+    frame = paper_frame(size=(1920, 1080), seed=SEED)
+    regions = [
+        TextRegion(f"line_{i}", (192, 135 + i * 28, 960, 151 + i * 28))
+        for i in range(6)
+    ]
+    benchmark.set_throughput(1, "frames")
+    result = benchmark(check_frame_contrast, frame, 4.5, regions)
+    assert result.details
@@ -0,0 +1,38 @@
+"""Benchmarks for SVG rasterization, cold and cached."""
+
+import pytest
+
+from benchmarks.fixtures import write_svg_assets
+from bin.cutout import raster_cache
+
+SIZE = 256
+
+
+@pytest.fixture
+def svgs(tmp_path, monkeypatch):
+    monkeypatch.setattr(raster_cache, "CACHE_DIR", tmp_path / "render_cache")
+    raster_cache.CACHE_DIR.mkdir()
+    return write_svg_assets(tmp_path / "svg", count=12)
+
+
+def test_rasterize_cold(benchmark, svgs):
+    def setup():
+        raster_cache.clear_cache()
+
+    def run():
+        return [raster_cache.rasterize_svg(p, SIZE, SIZE) for p in svgs]
+
+    benchmark.set_throughput(len(svgs), "assets")
+    out = benchmark.pedantic(run, setup=setup, warmup_rounds=0)
+    assert len(out) == len(svgs)
+
+
+def test_rasterize_cached(benchmark, svgs):
+    for path in svgs:
+        raster_cache.rasterize_svg(path, SIZE, SIZE)
+
+    def run():
+        return [raster_cache.get_cached(p, SIZE, SIZE) for p in svgs]
+
+    benchmark.set_throughput(len(svgs), "assets")
+    assert all(benchmark(run))
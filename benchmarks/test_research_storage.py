@@ -0,0 +1,44 @@
+"""Benchmarks for the batched research storage write path."""
+
+import itertools
+from unittest.mock import patch
+
+import pytest
+
+from bin.research_collect import ResearchCollector
+
+PARAGRAPH = "Color theory explains how designers combine hues for contrast. " * 2
+SOURCES = 40
+CHUNKS_PER_SOURCE = 150
+
+
+def _content(i):
+    return "\n\n".join(f"{i}-{j} {PARAGRAPH}" for j in range(CHUNKS_PER_SOURCE))
+
+
+@pytest.fixture
+def collector(tmp_path):
+    with patch("bin.research_collect.BASE", str(tmp_path)):
+        collector = ResearchCollector(mode="live")
+    yield collector
+    collector.close()
+
+
+def test_ingest_sources(benchmark, collector):
+    rounds = itertools.count()
+
+    def setup():
+        # New URLs every round, so each one measures first-time ingestion
+        n = next(rounds)
+        sources = [
+            (f"https://example{i % 4}.com/{n}/article-{i}", _content(i))
+            for i in range(SOURCES)
+        ]
+        return (sources,), {}
+
+    def run(sources):
+        for url, content in sources:
+            assert collector._store_content(url, content)
+
+    benchmark.set_throughput(SOURCES * CHUNKS_PER_SOURCE, "chunks")
+    benchmark.pedantic(run, setup=setup)
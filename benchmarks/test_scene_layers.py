@@ -0,0 +1,60 @@
+"""Benchmarks for scene compositing with static-layer flattening."""
+
+import numpy as np
+import pytest
+
+from benchmarks.fixtures import paper_frame, synthetic_scene
+from bin.cutout.anim_fx import apply_keyframes
+from bin.cutout.scene_layers import flatten_scene, keyframe_motion
+from bin.cutout.sdk import FPS, VIDEO_H, VIDEO_W, Keyframe
+
+moviepy = pytest.importorskip("moviepy.editor")
+
+DURATION_S = 2.0
+
+
+def _layers():
+    background = moviepy.ImageClip(
+        np.asarray(paper_frame((VIDEO_W, VIDEO_H))), duration=DURATION_S
+    )
+    clips, motion = [background], [None]
+    for i, element in enumerate(synthetic_scene(12)["elements"]):
+        rgba = np.zeros((element["h"], element["w"], 4), np.uint8)
+        rgba[..., 3] = 200
+        clip = moviepy.ImageClip(rgba, transparent=True, duration=DURATION_S)
+        clip = clip.set_position((element["x"] % 1100, element["y"] % 600))
+        keyframes = None
+        if i % 6 == 0:  # two of twelve elements drift for half a second
+            keyframes = [
+                Keyframe(t=500, x=element["x"] % 1100, y=element["y"] % 600),
+                Keyframe(t=1000, x=element["x"] % 1100 + 40, y=element["y"] % 600),
+            ]
+            clip = apply_keyframes(clip, keyframes, DURATION_S)
+        clips.append(clip)
+        motion.append(keyframe_motion(keyframes, DURATION_S))
+    return clips, motion
+
+
+def _render(clip):
+    for i in range(int(DURATION_S * FPS)):
+        clip.get_frame(i / FPS)
+
+
+def test_composite_all_layers(benchmark):
+    clips, _ = _layers()
+    scene = moviepy.CompositeVideoClip(clips, size=(VIDEO_W, VIDEO_H))
+    benchmark.set_throughput(int(DURATION_S * FPS), "frames")
+    benchmark.pedantic(_render, args=(scene,), rounds=3)
+
+
+def test_composite_flattened(benchmark):
+    clips, motion = _layers()
+    benchmark.set_throughput(int(DURATION_S * FPS), "frames")
+
+    def flatten_and_render():
+        scene, plan = flatten_scene(clips, motion, DURATION_S)
+        _render(scene)
+        return plan
+
+    plan = benchmark.pedantic(flatten_and_render, rounds=3)
+    benchmark.extra_info.update(plan.to_dict())
@@ -0,0 +1,45 @@
+"""Benchmarks for text block rendering (anim_fx.make_text_clip)."""
+
+import pytest
+
+from bin.cutout import text_render
+from bin.cutout.sdk import load_style
+
+HOOKS = [
+    "Why the Eames lounge chair still matters",
+    "Plywood, bent by hand and by steam",
+    "Mid century modern design changed how we sit and work",
+    "Three chairs that defined a decade",
+]
+
+
+@pytest.fixture
+def cold_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(text_render, "CACHE_DIR", tmp_path / "text")
+
+    def reset():
+        text_render._blocks.clear()
+        text_render.get_atlas.cache_clear()
+        for path in (tmp_path / "text").glob("*.png"):
+            path.unlink()
+
+    return reset
+
+
+def test_render_cold(benchmark, cold_cache):
+    style = load_style()
+    benchmark.set_throughput(len(HOOKS), "blocks")
+    benchmark.pedantic(
+        lambda: [text_render.render_text_block(h, style, "hook") for h in HOOKS],
+        setup=cold_cache,
+    )
+
+
+def test_render_cached(benchmark, cold_cache):
+    style = load_style()
+    cold_cache()
+    benchmark.set_throughput(len(HOOKS), "blocks")
+    blocks = benchmark(
+        lambda: [text_render.render_text_block(h, style, "hook") for h in HOOKS]
+    )
+    assert len(blocks) == len(HOOKS)
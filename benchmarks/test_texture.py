@@ -0,0 +1,36 @@
+"""Benchmarks for the paper/print texture engine."""
+
+import pytest
+
+from benchmarks.fixtures import SEED, paper_frame
+from bin.cutout.texture_engine import apply_textures_to_frame
+
+FRAMES = 4
+BASE_CFG = {
+    "enable": True,
+    "grain_strength": 0.12,
+    "feather_px": 1.5,
+    "posterize_levels": 6,
+}
+
+
+@pytest.fixture(scope="module")
+def frames():
+    return [paper_frame(seed=SEED + i) for i in range(FRAMES)]
+
+
+def _texture_all(frames, cfg):
+    return [apply_textures_to_frame(f.copy(), cfg, seed=SEED) for f in frames]
+
+
+def test_texture_frames_default(benchmark, frames):
+    benchmark.set_throughput(FRAMES, "frames")
+    out = benchmark(_texture_all, frames, BASE_CFG)
+    assert out[0].size == frames[0].size
+
+
+def test_texture_frames_halftone(benchmark, frames):
+    cfg = dict(BASE_CFG, halftone={"enable": True, "cell_px": 6, "opacity": 0.12})
+    benchmark.set_throughput(FRAMES, "frames")
+    out = benchmark(_texture_all, frames, cfg)
+    assert out[0].size == frames[0].size
@@ -8,12 +8,15 @@ Enhanced with Phase 1 fixes: FFmpeg robustness, SRT fallbacks, legibility defaul
 """
 
 import argparse
+import copy
 import json
 import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
 from pathlib import Path
 
@@ -23,6 +26,8 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 from bin.core import BASE, get_logger, load_config, load_modules_cfg, single_lock
+from bin.manifest_store import ManifestStore
+from bin.utils.artifact_cache import ArtifactCache
 
 log = get_logger("acceptance")
 
@@ -41,6 +46,12 @@ class AcceptanceValidator:
         import tempfile
 
         self.temp_dir = tempfile.mktemp(prefix="acceptance_")
+
+        # Per-run artifact cache and validator tasks (see run_validation)
+        self.artifact_cache = ArtifactCache()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tasks: Dict[str, Future] = {}
+        self._tasks_lock = threading.Lock()
         self.results = {
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "pipeline": "acceptance_harness",
@@ -208,11 +219,16 @@ class AcceptanceValidator:
             asset_results["reuse_ratio"]["value"] = reuse_ratio
 
             # Check if we have a substantial library to enforce reuse ratio
-            library_manifest_path = os.path.join(BASE, "data", "library_manifest.json")
-            if os.path.exists(library_manifest_path):
-                try:
-                    with open(library_manifest_path, "r") as f:
-                        manifest = json.load(f)
+            try:
+                manifest = self._load_library_manifest()
+            except Exception as e:
+                log.warning(f"[acceptance-assets] Could not read library manifest: {e}")
+                asset_results["reuse_ratio"]["status"] = "unknown"
+            else:
+                if manifest is None:
+                    asset_results["reuse_ratio"]["status"] = "no_manifest"
+                    asset_results["warnings"].append("No library manifest found")
+                else:
                     total_assets = manifest.get("total_assets", 0)
                     asset_results["reuse_ratio"]["total_library_assets"] = total_assets
 
@@ -233,14 +249,6 @@ class AcceptanceValidator:
                         asset_results["warnings"].append(
                             f"Library has only {total_assets} assets, reuse ratio not enforced"
                         )
-                except Exception as e:
-                    log.warning(
-                        f"[acceptance-assets] Could not read library manifest: {e}"
-                    )
-                    asset_results["reuse_ratio"]["status"] = "unknown"
-            else:
-                asset_results["reuse_ratio"]["status"] = "no_manifest"
-                asset_results["warnings"].append("No library manifest found")
 
             # Check palette compliance
             palette_compliance = self._check_palette_compliance(asset_plan, slug)
@@ -277,6 +285,35 @@ class AcceptanceValidator:
             asset_results["errors"].append(f"Asset validation error: {str(e)}")
             return asset_results
 
+    def _load_library_manifest(
+        self, hashes: Iterable[str] = ()
+    ) -> Optional[Dict[str, Any]]:
+        """Load the library manifest, or None if there is none.
+
+        Reads the SQLite manifest store when present, fetching only the
+        requested assets; otherwise falls back to the JSON export.
+
+        Args:
+            hashes: Asset hashes whose manifest entries are needed
+
+        Returns:
+            Dict with "total_assets" and "assets" (hash -> entry)
+        """
+        db_path = os.path.join(BASE, "data", "library_manifest.db")
+        if os.path.exists(db_path):
+            store = ManifestStore(db_path)
+            hashes = list(hashes)
+            return {
+                "total_assets": store.count(),
+                "assets": store.query(hashes=hashes) if hashes else {},
+            }
+
+        json_path = os.path.join(BASE, "data", "library_manifest.json")
+        if os.path.exists(json_path):
+            with open(json_path, "r") as f:
+                return json.load(f)
+        return None
+
     def _check_palette_compliance(
         self, asset_plan: Dict[str, Any], slug: str
     ) -> Dict[str, Any]:
@@ -306,14 +343,13 @@ class AcceptanceValidator:
             approved_colors = list(design_language.get("colors", {}).values())
             result["approved_colors"] = approved_colors
 
-            # Load library manifest for palette validation
-            library_manifest_path = os.path.join(BASE, "data", "library_manifest.json")
-            if os.path.exists(library_manifest_path):
-                with open(library_manifest_path, "r") as f:
-                    manifest = json.load(f)
-
+            # Load library manifest entries for the resolved assets
+            resolved_assets = asset_plan.get("resolved", [])
+            manifest = self._load_library_manifest(
+                [a["asset_hash"] for a in resolved_assets if a.get("asset_hash")]
+            )
+            if manifest is not None:
                 # Check resolved assets against manifest
-                resolved_assets = asset_plan.get("resolved", [])
                 result["total_assets"] = len(resolved_assets)
 
                 for asset in resolved_assets:
@@ -547,8 +583,7 @@ class AcceptanceValidator:
             try:
                 metadata_path = os.path.join(BASE, "videos", video_metadata)
                 if os.path.exists(metadata_path):
-                    with open(metadata_path, "r") as f:
-                        metadata = json.load(f)
+                    metadata = self.artifact_cache.read_json(metadata_path)
                     return metadata.get("slug")
             except Exception:
                 pass
@@ -568,6 +603,9 @@ class AcceptanceValidator:
         """Update video metadata with asset coverage and reuse information"""
         log.info(f"[acceptance-assets] Updating video metadata for {slug}")
 
+        # Validators may still be reading the current file
+        self._wait_for_validators()
+
         video_metadata_path = os.path.join(BASE, "videos", f"{slug}.metadata.json")
         if not os.path.exists(video_metadata_path):
             log.warning(
@@ -612,6 +650,7 @@ class AcceptanceValidator:
             # Write updated metadata
             with open(video_metadata_path, "w") as f:
                 json.dump(metadata, f, indent=2, ensure_ascii=False)
+            self.artifact_cache.invalidate(video_metadata_path)
 
             log.info(
                 "[acceptance-assets] Updated video metadata with asset information"
@@ -628,6 +667,9 @@ class AcceptanceValidator:
             f"[acceptance-evidence] Updating video metadata with evidence information for {slug}"
         )
 
+        # Validators may still be reading the current file
+        self._wait_for_validators()
+
         video_metadata_path = os.path.join(BASE, "videos", f"{slug}.metadata.json")
         if not os.path.exists(video_metadata_path):
             log.warning(
@@ -681,6 +723,7 @@ class AcceptanceValidator:
             # Write updated metadata
             with open(video_metadata_path, "w") as f:
                 json.dump(metadata, f, indent=2, ensure_ascii=False)
+            self.artifact_cache.invalidate(video_metadata_path)
 
             log.info(
                 "[acceptance-evidence] Updated video metadata with evidence information"
@@ -699,6 +742,9 @@ class AcceptanceValidator:
             f"[acceptance-pacing] Updating video metadata with pacing information for {slug}"
         )
 
+        # Validators may still be reading the current file
+        self._wait_for_validators()
+
         video_metadata_path = os.path.join(BASE, "videos", f"{slug}.metadata.json")
         if not os.path.exists(video_metadata_path):
             log.warning(
@@ -730,6 +776,7 @@ class AcceptanceValidator:
             # Write updated metadata
             with open(video_metadata_path, "w") as f:
                 json.dump(metadata, f, indent=2, ensure_ascii=False)
+            self.artifact_cache.invalidate(video_metadata_path)
 
             log.info(
                 "[acceptance-pacing] Updated video metadata with pacing validation information"
@@ -740,6 +787,85 @@ class AcceptanceValidator:
                 f"[acceptance-pacing] Failed to update video metadata with pacing: {e}"
             )
 
+    def _concurrent_validators(self) -> Dict[str, Callable[[Dict], Dict[str, Any]]]:
+        """Validators that only read artifacts and can run side by side.
+
+        Captions (may generate an SRT) and the animatics checks (rewrite the
+        video metadata) are not listed and always run in sequence.
+        """
+        return {
+            "quality": self._validate_youtube_quality,
+            "audio": self._validate_youtube_audio,
+            "assets": self._validate_assets_quality,
+            "legibility": self._validate_legibility,
+            "visual_polish": self._validate_visual_polish,
+            "pacing": self._validate_pacing,
+            "evidence": self._validate_evidence_quality,
+        }
+
+    def _submit(self, name: str, fn: Callable, *args) -> Optional[Future]:
+        """Start validator ``name`` on the run's pool unless already started.
+
+        Returns None (and does nothing) outside run_validation.
+        """
+        if self._executor is None:
+            return None
+        with self._tasks_lock:
+            future = self._tasks.get(name)
+            if future is None:
+                future = self._tasks[name] = self._executor.submit(fn, *args)
+        return future
+
+    def _wait_for_validators(self):
+        """Wait for every started validator.
+
+        Called before an artifact is rewritten, so no validator sees a mix of
+        the old and the new content.
+        """
+        with self._tasks_lock:
+            futures = list(self._tasks.values())
+        wait(futures)
+
+    def _start_validators(self, artifacts: Dict[str, Any], names: Sequence[str]):
+        """Start the named concurrent validators (no-op outside run_validation).
+
+        The lane starts each validator only once no gate that can still fail
+        comes before its result is used, so a failing lane does not start
+        (and then wait for) work whose result is discarded.
+        """
+        if self._executor is None:
+            return
+
+        # Load the video metadata before anything can rewrite it, so readers
+        # never observe a partially written file
+        slug = self._extract_slug_from_artifacts(artifacts)
+        metadata_paths = []
+        if artifacts.get("video_metadata"):
+            metadata_paths.append(
+                os.path.join(BASE, "videos", artifacts["video_metadata"])
+            )
+        if slug:
+            metadata_paths.append(os.path.join(BASE, "videos", f"{slug}.metadata.json"))
+        for path in metadata_paths:
+            try:
+                self.artifact_cache.content_hash(path)
+            except OSError:
+                pass
+
+        validators = self._concurrent_validators()
+        for name in names:
+            self._submit(name, validators[name], artifacts)
+
+    def _validator_result(self, name: str, fn: Callable, *args) -> Dict[str, Any]:
+        """Result of validator ``name``.
+
+        Inside run_validation the validator runs at most once per run and each
+        caller gets its own copy of the result; otherwise it runs inline.
+        """
+        if self._executor is None:
+            return fn(*args)
+        return copy.deepcopy(self._submit(name, fn, *args).result())
+
     def validate_youtube_lane(self) -> bool:
         """Validate YouTube lane artifacts and quality"""
         log.info("=== VALIDATING YOUTUBE LANE ===")
@@ -869,8 +995,9 @@ class AcceptanceValidator:
                 # Check video metadata for source_mode
                 if artifacts["video_metadata"]:
                     try:
-                        with open(artifacts["video_metadata"], "r") as f:
-                            metadata = json.load(f)
+                        metadata = self.artifact_cache.read_json(
+                            artifacts["video_metadata"]
+                        )
                         source_mode = metadata.get("source_mode", "unknown")
                         if source_mode != "animatics":
                             youtube_results["status"] = "FAIL"
@@ -906,12 +1033,23 @@ class AcceptanceValidator:
         if not artifacts["thumbnail"]:
             youtube_results["quality"]["warning"] = "Missing thumbnail PNG"
 
+        # Artifact gates are done. The remaining validators only read
+        # artifacts: start the ones whose results are used whatever the
+        # gates below decide (evidence and pacing are read by the run)
+        self._start_validators(
+            artifacts, ("quality", "audio", "assets", "evidence", "pacing")
+        )
+
         # Quality validation
-        quality = self._validate_youtube_quality(artifacts)
+        quality = self._validator_result(
+            "quality", self._validate_youtube_quality, artifacts
+        )
         youtube_results["quality"].update(quality)
 
         # Audio validation
-        audio_quality = self._validate_youtube_audio(artifacts)
+        audio_quality = self._validator_result(
+            "audio", self._validate_youtube_audio, artifacts
+        )
 
         # Debug: Log audio validation structure
         log.info(f"Audio validation completed: {len(audio_quality)} items")
@@ -960,7 +1098,9 @@ class AcceptanceValidator:
             return False
 
         # Asset validation (run regardless of audio status)
-        asset_quality = self._validate_assets_quality(artifacts)
+        asset_quality = self._validator_result(
+            "assets", self._validate_assets_quality, artifacts
+        )
         youtube_results["quality"]["assets"] = asset_quality
 
         # Update video metadata with asset information
@@ -988,10 +1128,6 @@ class AcceptanceValidator:
 
             return False
 
-        # SRT/Caption validation and generation
-        caption_validation = self._validate_captions(artifacts)
-        youtube_results["quality"]["captions"] = caption_validation
-
         # Check if caption failure blocks acceptance
         caption_required = self.render_cfg.get("acceptance", {}).get(
             "caption_validation_required", True
@@ -1000,6 +1136,15 @@ class AcceptanceValidator:
             "caption_failure_blocks", False
         )
 
+        # The rendered legibility check overlaps the captions step only when
+        # captions cannot fail the lane
+        if not (caption_required and caption_blocks):
+            self._start_validators(artifacts, ("legibility",))
+
+        # SRT/Caption validation and generation
+        caption_validation = self._validate_captions(artifacts)
+        youtube_results["quality"]["captions"] = caption_validation
+
         if (
             not caption_validation.get("valid", False)
             and caption_required
@@ -1013,7 +1158,9 @@ class AcceptanceValidator:
             return False
 
         # Legibility validation
-        legibility_validation = self._validate_legibility(artifacts)
+        legibility_validation = self._validator_result(
+            "legibility", self._validate_legibility, artifacts
+        )
         youtube_results["quality"]["legibility"] = legibility_validation
 
         # Check if legibility failure blocks acceptance
@@ -1040,8 +1187,13 @@ class AcceptanceValidator:
             youtube_results["quality"]["error"] = error_msg
             return False
 
+        # No gate is left; visual polish runs beside pacing if still going
+        self._start_validators(artifacts, ("visual_polish",))
+
         # Visual polish validation
-        visual_polish_quality = self._validate_visual_polish(artifacts)
+        visual_polish_quality = self._validator_result(
+            "visual_polish", self._validate_visual_polish, artifacts
+        )
         youtube_results["quality"]["visual_polish"] = visual_polish_quality
 
         # Check visual polish results (non-blocking for overall status)
@@ -1053,7 +1205,9 @@ class AcceptanceValidator:
             youtube_results["quality"]["warning"] = f"Visual polish issues: {error_msg}"
 
         # Pacing validation
-        pacing_quality = self._validate_pacing(artifacts)
+        pacing_quality = self._validator_result(
+            "pacing", self._validate_pacing, artifacts
+        )
         youtube_results["quality"]["pacing"] = pacing_quality
 
         # Check pacing results (non-blocking for overall status, but can affect final verdict)
@@ -1104,8 +1258,7 @@ class AcceptanceValidator:
                         # Score this script based on quality and completeness
                         script_path = os.path.join(scripts_dir, script_file)
                         try:
-                            with open(script_path, "r", encoding="utf-8") as f:
-                                script_content = f.read()
+                            script_content = self.artifact_cache.read_text(script_path)
 
                             # Calculate quality score
                             words = len(script_content.split())
@@ -1256,8 +1409,7 @@ class AcceptanceValidator:
         if artifacts["script"]:
             script_path = os.path.join(BASE, "scripts", artifacts["script"])
             if os.path.exists(script_path):
-                with open(script_path, "r", encoding="utf-8") as f:
-                    script_content = f.read()
+                script_content = self.artifact_cache.read_text(script_path)
 
                 # Word count
                 words = len(script_content.split())
@@ -1358,7 +1510,12 @@ class AcceptanceValidator:
             if artifacts["voiceover"]:
                 vo_path = os.path.join(BASE, "voiceovers", artifacts["voiceover"])
                 if os.path.exists(vo_path):
-                    vo_validation = validate_audio_for_acceptance(vo_path, "voiceover")
+                    # Decoded audio stats are shared by content across the run
+                    vo_validation = self.artifact_cache.memo(
+                        "audio:voiceover",
+                        vo_path,
+                        lambda _: validate_audio_for_acceptance(vo_path, "voiceover"),
+                    )
                     audio_quality["voiceover"] = vo_validation
                 else:
                     audio_quality["voiceover"] = {
@@ -1481,8 +1638,7 @@ class AcceptanceValidator:
                     BASE, "scenescripts", artifacts["scenescript"]
                 )
                 if os.path.exists(scenescript_path):
-                    with open(scenescript_path, "r", encoding="utf-8") as f:
-                        scenescript_data = json.load(f)
+                    scenescript_data = self.artifact_cache.read_json(scenescript_path)
 
                     # Import SceneScript validation
                     from bin.cutout.validate_scenescript import validate_schema
@@ -1834,6 +1990,7 @@ class AcceptanceValidator:
             metadata_path = videos_dir / f"{slug}.metadata.json"
             with open(metadata_path, "w") as f:
                 json.dump(metadata, f, indent=2)
+            self.artifact_cache.invalidate(str(metadata_path))
 
             log.info(f"Video metadata written to: {metadata_path}")
             return str(metadata_path)
@@ -2080,8 +2237,7 @@ class AcceptanceValidator:
                         f"[acceptance-visual-polish] Reading video metadata from: {metadata_path}"
                     )
 
-                    with open(metadata_path, "r") as f:
-                        metadata = json.load(f)
+                    metadata = self.artifact_cache.read_json(metadata_path)
 
                     log.info(
                         f"[acceptance-visual-polish] Video metadata keys: {list(metadata.keys())}"
@@ -2262,8 +2418,7 @@ class AcceptanceValidator:
                     if not os.path.isabs(metadata_path):
                         metadata_path = os.path.join(BASE, metadata_path)
 
-                    with open(metadata_path, "r") as f:
-                        metadata = json.load(f)
+                    metadata = self.artifact_cache.read_json(metadata_path)
 
                     performance_metrics = metadata.get("performance", {})
                     render_time_with = performance_metrics.get(
@@ -2473,8 +2628,7 @@ class AcceptanceValidator:
             outline_path = os.path.join(BASE, "scripts", f"{slug}.outline.json")
             if os.path.exists(outline_path):
                 try:
-                    with open(outline_path, "r") as f:
-                        outline = json.load(f)
+                    outline = self.artifact_cache.read_json(outline_path)
 
                     intent_type = outline.get("intent", "unknown")
 
@@ -2661,15 +2815,13 @@ class AcceptanceValidator:
                 )
                 return pacing_results
 
-            with open(pacing_report_path, "r") as f:
-                pacing_report = json.load(f)
+            pacing_report = self.artifact_cache.read_json(pacing_report_path)
 
             # Load video metadata to check if adjustments were applied
             video_metadata_path = os.path.join(BASE, "videos", f"{slug}.metadata.json")
             video_metadata = {}
             if os.path.exists(video_metadata_path):
-                with open(video_metadata_path, "r") as f:
-                    video_metadata = json.load(f)
+                video_metadata = self.artifact_cache.read_json(video_metadata_path)
 
             # Extract KPI metrics and comparison data
             kpi_metrics = pacing_report.get("kpi_metrics", {})
@@ -2825,8 +2977,7 @@ class AcceptanceValidator:
                     outline_path = os.path.join(BASE, "scripts", artifacts["outline"])
                     if os.path.exists(outline_path):
                         try:
-                            with open(outline_path, "r", encoding="utf-8") as f:
-                                outline_data = json.load(f)
+                            outline_data = self.artifact_cache.read_json(outline_path)
                             intent_type = outline_data.get("intent", "default")
                         except Exception as e:
                             log.warning(
@@ -2919,8 +3070,7 @@ class AcceptanceValidator:
                 }
 
             try:
-                with open(scenescript_path, "r", encoding="utf-8") as f:
-                    scenescript_data = json.load(f)
+                scenescript_data = self.artifact_cache.read_json(scenescript_path)
             except Exception as e:
                 return {
                     "valid": False,
@@ -2943,6 +3093,23 @@ class AcceptanceValidator:
                         f"[acceptance] Legibility validation failed: {legibility_result['summary']}"
                     )
 
+                # Frame-level analysis of the rendered animatics
+                frame_analysis = self._validate_rendered_legibility(
+                    artifacts, scenescript_data
+                )
+                if frame_analysis is not None:
+                    legibility_result["frame_analysis"] = frame_analysis
+                    frames_block = self.render_cfg.get("acceptance", {}).get(
+                        "frame_legibility_blocks", False
+                    )
+                    if not frame_analysis.get("valid", False) and frames_block:
+                        legibility_result["valid"] = False
+                        legibility_result.setdefault(
+                            "error",
+                            frame_analysis.get("summary")
+                            or frame_analysis.get("error", "Frame legibility failed"),
+                        )
+
                 return legibility_result
 
             except ImportError as e:
@@ -2966,21 +3133,72 @@ class AcceptanceValidator:
                 "error_type": "validation_error",
             }
 
+    def _validate_rendered_legibility(
+        self, artifacts: Dict[str, Any], scenescript_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Run frame-level contrast analysis over rendered animatics, if any"""
+        acceptance_cfg = self.render_cfg.get("acceptance", {})
+        if not acceptance_cfg.get("frame_legibility_enabled", True):
+            return None
+
+        animatics = artifacts.get("animatics") or []
+        if not animatics or not artifacts.get("scenescript"):
+            return None
+
+        slug = artifacts["scenescript"].replace(".json", "")
+        animatics_dir = os.path.join(BASE, "assets", f"{slug}_animatics")
+
+        from bin.legibility import validate_rendered_legibility
+
+        sample_fps = acceptance_cfg.get("frame_legibility_sample_fps", 10.0)
+        frame_analysis = validate_rendered_legibility(
+            scenescript_data, animatics_dir, sample_fps or None
+        )
+        log.info(
+            f"[acceptance] Frame legibility: {frame_analysis.get('summary', frame_analysis.get('error'))}"
+        )
+        return frame_analysis
+
     def run_validation(self) -> Dict[str, Any]:
-        """Run complete validation and return results"""
+        """Run complete validation and return results
+
+        Independent validators run on a thread pool and share a per-run
+        artifact cache; results are merged in the original order, so the
+        outcome matches a sequential run.
+        """
         log.info("Starting acceptance validation...")
 
+        max_workers = self.render_cfg.get("acceptance", {}).get("max_workers")
+        self.artifact_cache.clear()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="acceptance"
+        ) as executor:
+            self._executor = executor
+            self._tasks = {}
+            try:
+                return self._run_validation_steps()
+            finally:
+                self._executor = None
+                self._tasks = {}
+
+    def _run_validation_steps(self) -> Dict[str, Any]:
+        """Validation steps; sequential when called outside run_validation."""
         # Validate YouTube lane
         youtube_ok = self.validate_youtube_lane()
+        artifacts = self.results["lanes"]["youtube"]["artifacts"]
+
+        # Evidence and pacing are usually already running (started by the lane)
+        self._submit("evidence", self._validate_evidence_quality, artifacts)
+        self._submit("pacing", self._validate_pacing, artifacts)
 
         # Validate evidence quality (research rigor)
-        evidence_ok = self._validate_evidence_quality(
-            self.results["lanes"]["youtube"]["artifacts"]
+        evidence_ok = self._validator_result(
+            "evidence", self._validate_evidence_quality, artifacts
         )
         self.results["evidence"] = evidence_ok
 
         # Validate pacing
-        pacing_ok = self._validate_pacing(self.results["lanes"]["youtube"]["artifacts"])
+        pacing_ok = self._validator_result("pacing", self._validate_pacing, artifacts)
         self.results["pacing"] = pacing_ok
 
         # Update video metadata with evidence and pacing information
@@ -2,13 +2,15 @@
 """
 Analytics collector for pipeline performance monitoring.
 Collects and aggregates metrics from logs, system resources, and pipeline state.
+
+History lives in an incremental SQLite store (see bin/analytics_store.py), so
+each call only ingests what changed since the previous one.
 """
 import json
 import os
 import sys
 import time
 from collections import defaultdict, deque
-from datetime import datetime, timedelta
 from typing import Any, Dict, List
 
 import psutil
@@ -18,17 +20,30 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
+from bin.analytics_store import AnalyticsStore
 from bin.core import BASE, get_logger
 
 log = get_logger("analytics_collector")
 
+# Trend samples older than this are pruned from the store
+SAMPLE_RETENTION_DAYS = 30
+
 
 class MetricsCollector:
     """Collects and processes pipeline metrics."""
 
-    def __init__(self, data_dir: str = None):
+    def __init__(
+        self, data_dir: str = None, state_file: str = None, assets_dir: str = None
+    ):
         self.data_dir = data_dir or os.path.join(BASE, "data", "analytics")
+        self.state_file = state_file or os.path.join(BASE, "jobs", "state.jsonl")
+        self.assets_dir = assets_dir or os.path.join(BASE, "assets")
         self.ensure_data_dir()
+        db_path = os.path.join(self.data_dir, "analytics.db")
+        new_store = not os.path.exists(db_path)
+        self.store = AnalyticsStore(db_path)
+        if new_store:
+            self.import_daily_metrics()
 
         # In-memory storage for recent data
         self.recent_metrics = deque(maxlen=1000)  # Last 1000 data points
@@ -88,83 +103,39 @@ class MetricsCollector:
 
     def parse_state_logs(self, hours: int = 24) -> Dict[str, Any]:
         """Parse recent state logs for pipeline metrics."""
-        state_file = os.path.join(BASE, "jobs", "state.jsonl")
+        state_file = self.state_file
         if not os.path.exists(state_file):
             return {"steps": {}, "errors": [], "performance": {}}
 
         cutoff_time = time.time() - (hours * 3600)
-        steps = defaultdict(
-            lambda: {"count": 0, "statuses": defaultdict(int), "durations": []}
-        )
-        errors = []
-        recent_activities = []
 
         try:
-            with open(state_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-
-                    try:
-                        entry = json.loads(line)
-                        entry_time = entry.get("ts", 0)
-
-                        # Convert timestamp string to epoch if needed
-                        if isinstance(entry_time, str):
-                            try:
-                                dt = datetime.fromisoformat(
-                                    entry_time.replace("Z", "+00:00")
-                                )
-                                entry_time = dt.timestamp()
-                            except ValueError:
-                                continue
-
-                        if entry_time < cutoff_time:
-                            continue
-
-                        step = entry.get("step", "unknown")
-                        status = entry.get("status", "unknown")
-
-                        steps[step]["count"] += 1
-                        steps[step]["statuses"][status] += 1
-
-                        # Track errors
-                        if "error" in status.lower() or "fail" in status.lower():
-                            errors.append(
-                                {
-                                    "step": step,
-                                    "status": status,
-                                    "timestamp": entry_time,
-                                    "notes": entry.get("notes", ""),
-                                }
-                            )
-
-                        recent_activities.append(entry)
-
-                    except json.JSONDecodeError as e:
-                        log.warning(f"Invalid JSON in state log: {e}")
-                        continue
+            # Only lines appended since the previous call are parsed
+            self.store.ingest_state_log(state_file)
+            counts = self.store.step_status_counts(cutoff_time)
 
             # Calculate success rates and trends
+            steps = {}
             performance = {}
-            for step, data in steps.items():
-                total = data["count"]
-                success = data["statuses"].get("OK", 0)
+            for step, statuses in counts.items():
+                total = sum(statuses.values())
+                success = statuses.get("OK", 0)
                 success_rate = (success / total) * 100 if total > 0 else 0
 
+                steps[step] = {"count": total, "statuses": statuses, "durations": []}
                 performance[step] = {
                     "total_runs": total,
                     "success_rate": round(success_rate, 2),
                     "success_count": success,
                     "error_count": total - success,
-                    "statuses": dict(data["statuses"]),
+                    "statuses": dict(statuses),
                 }
 
             return {
-                "steps": dict(steps),
-                "errors": errors[-50:],  # Last 50 errors
+                "steps": steps,
+                "errors": self.store.recent_errors(cutoff_time, 50),  # Last 50 errors
                 "performance": performance,
-                "recent_activity": recent_activities[-100:],  # Last 100 activities
+                "recent_activity": self.store.recent_entries(cutoff_time, 100),
             }
 
         except Exception as e:
@@ -224,8 +195,8 @@ class MetricsCollector:
         """Collect metrics about asset usage and provider performance."""
         metrics = {
             "total_assets": 0,
-            "by_provider": defaultdict(int),
-            "by_type": defaultdict(int),
+            "by_provider": {},
+            "by_type": {},
             "avg_file_size": 0,
             "license_compliance": {"with_license": 0, "total": 0},
             "quality_metrics": {
@@ -237,100 +208,17 @@ class MetricsCollector:
         }
 
         try:
-            assets_dir = os.path.join(BASE, "assets")
-            if not os.path.exists(assets_dir):
+            if not os.path.exists(self.assets_dir):
                 return metrics
 
-            total_size = 0
-            file_count = 0
-
-            for folder in os.listdir(assets_dir):
-                folder_path = os.path.join(assets_dir, folder)
-                if not os.path.isdir(folder_path):
-                    continue
-
-                # Check for license file
-                license_file = os.path.join(folder_path, "license.json")
-                if os.path.exists(license_file):
-                    metrics["license_compliance"]["with_license"] += 1
-
-                    try:
-                        with open(license_file, "r", encoding="utf-8") as f:
-                            license_data = json.load(f)
-
-                        items = license_data.get("items", [])
-                        quality_scores = []
-                        relevance_scores = []
-                        total_issues = 0
-
-                        for item in items:
-                            provider = item.get("provider", "unknown")
-                            metrics["by_provider"][provider] += 1
-
-                            # Extract quality metrics if available
-                            quality_data = item.get("quality", {})
-                            if quality_data:
-                                overall_score = quality_data.get("overall_score", 0)
-                                relevance_score = quality_data.get("relevance_score", 0)
-                                issues = quality_data.get("quality_issues", [])
-
-                                if overall_score > 0:
-                                    quality_scores.append(overall_score)
-                                if relevance_score > 0:
-                                    relevance_scores.append(relevance_score)
-                                total_issues += len(issues)
-
-                        # Update quality metrics
-                        if quality_scores:
-                            metrics["quality_metrics"]["avg_overall_score"] = sum(
-                                quality_scores
-                            ) / len(quality_scores)
-                            metrics["quality_metrics"]["assets_analyzed"] += len(
-                                quality_scores
-                            )
-
-                        if relevance_scores:
-                            metrics["quality_metrics"]["avg_relevance_score"] = sum(
-                                relevance_scores
-                            ) / len(relevance_scores)
-
-                        metrics["quality_metrics"][
-                            "total_quality_issues"
-                        ] += total_issues
-
-                    except Exception:
-                        pass
-
-                metrics["license_compliance"]["total"] += 1
-
-                # Analyze files in folder
-                for file in os.listdir(folder_path):
-                    if file in ["license.json", "sources_used.txt"]:
-                        continue
-
-                    file_path = os.path.join(folder_path, file)
-                    if os.path.isfile(file_path):
-                        file_size = os.path.getsize(file_path)
-                        total_size += file_size
-                        file_count += 1
-                        metrics["total_assets"] += 1
-
-                        # Categorize by type
-                        ext = os.path.splitext(file)[1].lower()
-                        if ext in [".jpg", ".jpeg", ".png", ".webp"]:
-                            metrics["by_type"]["image"] += 1
-                        elif ext in [".mp4", ".avi", ".mov"]:
-                            metrics["by_type"]["video"] += 1
-                        else:
-                            metrics["by_type"]["other"] += 1
-
-            if file_count > 0:
-                metrics["avg_file_size"] = total_size // file_count
+            # Only folders whose mtime or license.json changed are re-read
+            self.store.refresh_assets(self.assets_dir)
+            metrics = self.store.asset_summary()
 
         except Exception as e:
             log.error(f"Failed to collect asset metrics: {e}")
 
-        return dict(metrics)
+        return metrics
 
     def generate_alerts(self, metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate alerts based on current metrics."""
@@ -436,32 +324,60 @@ class MetricsCollector:
         log.info(f"Metrics collection complete: {len(alerts)} alerts generated")
         return metrics
 
-    def store_metrics(self, metrics: Dict[str, Any]):
-        """Store metrics to disk for historical analysis."""
-        timestamp = metrics["timestamp"]
-        date_str = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+    @staticmethod
+    def _sample(metrics: Dict[str, Any]) -> tuple:
+        """Trend sample (ts, cpu, memory, disk, pipeline_success) of a snapshot."""
+        system = metrics.get("system", {})
 
-        # Store daily metrics file
-        daily_file = os.path.join(self.data_dir, "metrics", f"{date_str}.json")
+        # Calculate overall pipeline success rate
+        performance = metrics.get("pipeline", {}).get("performance", {})
+        success_rates = [perf.get("success_rate", 0) for perf in performance.values()]
+        avg_success = sum(success_rates) / len(success_rates) if success_rates else 0
+
+        return (
+            metrics["timestamp"],
+            system.get("cpu", {}).get("percent", 0),
+            system.get("memory", {}).get("percent", 0),
+            system.get("disk", {}).get("percent", 0),
+            avg_success,
+        )
 
-        # Load existing daily data or create new
-        daily_data = []
-        if os.path.exists(daily_file):
+    def store_metrics(self, metrics: Dict[str, Any]):
+        """Store a metrics sample for historical analysis."""
+        timestamp = metrics["timestamp"]
+        self.store.add_sample(*self._sample(metrics))
+        self.store.prune_samples(timestamp - SAMPLE_RETENTION_DAYS * 24 * 3600)
+
+    def import_daily_metrics(self) -> int:
+        """
+        Import the daily JSON history (metrics/<date>.json) into the store.
+
+        Earlier versions kept trend samples in those files; they are read
+        once, when the store is first created, and left in place.
+
+        Returns:
+            Number of samples imported
+        """
+        metrics_dir = os.path.join(self.data_dir, "metrics")
+        samples = []
+        for name in sorted(os.listdir(metrics_dir)):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(metrics_dir, name)
             try:
-                with open(daily_file, "r", encoding="utf-8") as f:
-                    daily_data = json.load(f)
-            except Exception:
-                daily_data = []
-
-        daily_data.append(metrics)
-
-        # Keep only last 24 hours of data per file
-        cutoff = timestamp - (24 * 3600)
-        daily_data = [m for m in daily_data if m.get("timestamp", 0) > cutoff]
+                with open(path, "r", encoding="utf-8") as f:
+                    entries = json.load(f)
+                samples.extend(
+                    self._sample(entry) for entry in entries if "timestamp" in entry
+                )
+            except Exception as e:
+                log.warning(f"Skipping unreadable metrics history {path}: {e}")
 
-        # Save updated data
-        with open(daily_file, "w", encoding="utf-8") as f:
-            json.dump(daily_data, f, indent=2)
+        if samples:
+            self.store.add_samples(samples)
+            self.store.prune_samples(time.time() - SAMPLE_RETENTION_DAYS * 24 * 3600)
+            log.info(f"Imported {len(samples)} trend sample(s) from {metrics_dir}")
+        return len(samples)
 
     def get_trend_data(self, hours: int = 24) -> Dict[str, Any]:
         """Get trend data for the specified time range."""
@@ -474,51 +390,15 @@ class MetricsCollector:
             "pipeline_success": [],
         }
 
-        # Look for recent daily files
-        for days_back in range(2):  # Check last 2 days
-            date = datetime.now() - timedelta(days=days_back)
-            date_str = date.strftime("%Y-%m-%d")
-            daily_file = os.path.join(self.data_dir, "metrics", f"{date_str}.json")
-
-            if not os.path.exists(daily_file):
-                continue
-
-            try:
-                with open(daily_file, "r", encoding="utf-8") as f:
-                    daily_data = json.load(f)
-
-                for entry in daily_data:
-                    if entry.get("timestamp", 0) < cutoff:
-                        continue
-
-                    trend_data["timestamps"].append(entry["timestamp"])
-
-                    system = entry.get("system", {})
-                    trend_data["cpu"].append(system.get("cpu", {}).get("percent", 0))
-                    trend_data["memory"].append(
-                        system.get("memory", {}).get("percent", 0)
-                    )
-                    trend_data["disk"].append(system.get("disk", {}).get("percent", 0))
-
-                    # Calculate overall pipeline success rate
-                    pipeline = entry.get("pipeline", {})
-                    performance = pipeline.get("performance", {})
-
-                    if performance:
-                        success_rates = [
-                            perf.get("success_rate", 0) for perf in performance.values()
-                        ]
-                        avg_success = (
-                            sum(success_rates) / len(success_rates)
-                            if success_rates
-                            else 0
-                        )
-                        trend_data["pipeline_success"].append(avg_success)
-                    else:
-                        trend_data["pipeline_success"].append(0)
-
-            except Exception as e:
-                log.error(f"Failed to load trend data from {daily_file}: {e}")
+        try:
+            for ts, cpu, memory, disk, success in self.store.samples_since(cutoff):
+                trend_data["timestamps"].append(ts)
+                trend_data["cpu"].append(cpu)
+                trend_data["memory"].append(memory)
+                trend_data["disk"].append(disk)
+                trend_data["pipeline_success"].append(success)
+        except Exception as e:
+            log.error(f"Failed to load trend data: {e}")
 
         return trend_data
 
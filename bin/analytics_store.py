@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Incremental analytics store.
+
+Backs MetricsCollector with a small SQLite database so dashboard queries do
+not rescan history:
+
+- jobs/state.jsonl is ingested from a remembered byte offset; each entry is
+  stored once and rolled up into per-hour/step/status counts.
+- Asset folders are re-scanned only when their directory or license.json
+  mtime changes; per-folder aggregates are summed on read.
+- System metric samples are stored in an indexed table for trend charts.
+"""
+import json
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Ensure repo root on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from bin.core import get_logger
+from bin.utils.logtail import LogCursor, LogFollower
+
+log = get_logger("analytics_store")
+
+HOUR = 3600
+IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".webp"}
+VIDEO_EXTS = {".mp4", ".avi", ".mov"}
+ASSET_SIDECARS = {"license.json", "sources_used.txt"}
+
+
+def _parse_ts(value: Any) -> Optional[float]:
+    """Convert a state log timestamp to epoch seconds (None if unparseable)."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return 0.0
+
+
+def _is_error_status(status: str) -> bool:
+    lowered = status.lower()
+    return "error" in lowered or "fail" in lowered
+
+
+class AnalyticsStore:
+    """SQLite-backed rollups for pipeline, asset and system metrics."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_database(self):
+        """Create tables and indexes."""
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS ingest_offsets (
+                    path TEXT PRIMARY KEY,
+                    offset INTEGER NOT NULL,
+                    file_id TEXT
+                );
+
+                CREATE TABLE IF NOT EXISTS state_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ts REAL NOT NULL,
+                    step TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    is_error INTEGER NOT NULL,
+                    notes TEXT,
+                    entry TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_state_events_ts
+                    ON state_events(ts);
+                CREATE INDEX IF NOT EXISTS idx_state_events_error
+                    ON state_events(is_error, ts);
+
+                CREATE TABLE IF NOT EXISTS step_rollups (
+                    hour INTEGER NOT NULL,
+                    step TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (hour, step, status)
+                );
+
+                CREATE TABLE IF NOT EXISTS asset_folders (
+                    folder TEXT PRIMARY KEY,
+                    dir_mtime REAL NOT NULL,
+                    license_mtime REAL,
+                    has_license INTEGER NOT NULL,
+                    file_count INTEGER NOT NULL,
+                    total_size INTEGER NOT NULL,
+                    image_count INTEGER NOT NULL,
+                    video_count INTEGER NOT NULL,
+                    other_count INTEGER NOT NULL,
+                    quality_sum REAL NOT NULL,
+                    quality_n INTEGER NOT NULL,
+                    relevance_sum REAL NOT NULL,
+                    relevance_n INTEGER NOT NULL,
+                    quality_issues INTEGER NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS asset_providers (
+                    folder TEXT NOT NULL,
+                    provider TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (folder, provider)
+                );
+
+                CREATE TABLE IF NOT EXISTS metric_samples (
+                    ts REAL NOT NULL,
+                    cpu REAL,
+                    memory REAL,
+                    disk REAL,
+                    pipeline_success REAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_metric_samples_ts
+                    ON metric_samples(ts);
+                """
+            )
+
+    # ------------------------------------------------------------------
+    # State log ingestion
+    # ------------------------------------------------------------------
+
+    def ingest_state_log(self, path: str) -> int:
+        """
+        Ingest entries appended to a state log since the last call.
+
+        If the file was truncated or replaced, previously ingested entries
+        are discarded and the file is read from the start.
+
+        Args:
+            path: Path to jobs/state.jsonl
+
+        Returns:
+            Number of new entries stored
+        """
+        key = os.path.abspath(path)
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT offset, file_id FROM ingest_offsets WHERE path = ?", (key,)
+            ).fetchone()
+            cursor = LogCursor()
+            if row:
+                cursor.offset = row[0]
+                cursor.file_id = (
+                    tuple(int(x) for x in row[1].split(":")) if row[1] else None
+                )
+
+            follower = LogFollower(path)
+            ingested = 0
+            while True:
+                lines, reset = follower.read_new(cursor)
+                if reset:
+                    log.info(f"State log {path} was rotated or truncated; re-ingesting")
+                    conn.execute("DELETE FROM state_events")
+                    conn.execute("DELETE FROM step_rollups")
+                    ingested = 0
+                if not lines:
+                    break
+                ingested += self._store_entries(conn, lines)
+
+            file_id = ":".join(str(x) for x in cursor.file_id) if cursor.file_id else None
+            conn.execute(
+                "INSERT INTO ingest_offsets (path, offset, file_id) VALUES (?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET offset = excluded.offset, "
+                "file_id = excluded.file_id",
+                (key, cursor.offset, file_id),
+            )
+        return ingested
+
+    def _store_entries(self, conn: sqlite3.Connection, lines: Iterable[str]) -> int:
+        events = []
+        rollups: Dict[Tuple[int, str, str], int] = {}
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                log.warning(f"Invalid JSON in state log: {e}")
+                continue
+            if not isinstance(entry, dict):
+                continue
+
+            ts = _parse_ts(entry.get("ts", 0))
+            if ts is None:
+                continue
+            step = str(entry.get("step", "unknown"))
+            status = str(entry.get("status", "unknown"))
+            events.append(
+                (
+                    ts,
+                    step,
+                    status,
+                    int(_is_error_status(status)),
+                    entry.get("notes", ""),
+                    json.dumps(entry, default=str),
+                )
+            )
+            key = (int(ts // HOUR), step, status)
+            rollups[key] = rollups.get(key, 0) + 1
+
+        conn.executemany(
+            "INSERT INTO state_events (ts, step, status, is_error, notes, entry) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            events,
+        )
+        conn.executemany(
+            "INSERT INTO step_rollups (hour, step, status, count) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(hour, step, status) DO UPDATE SET "
+            "count = count + excluded.count",
+            [(h, s, st, c) for (h, s, st), c in rollups.items()],
+        )
+        return len(events)
+
+    def step_status_counts(self, since: float) -> Dict[str, Dict[str, int]]:
+        """
+        Count state entries per step and status since a timestamp.
+
+        Whole hours come from the rollup table; only the partial hour at the
+        start of the window touches individual events.
+
+        Args:
+            since: Epoch seconds (inclusive)
+
+        Returns:
+            Mapping of step -> status -> count
+        """
+        first_full_hour = int(since // HOUR) + 1
+        counts: Dict[str, Dict[str, int]] = {}
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT step, status, SUM(count) FROM step_rollups "
+                "WHERE hour >= ? GROUP BY step, status",
+                (first_full_hour,),
+            ).fetchall()
+            rows += conn.execute(
+                "SELECT step, status, COUNT(*) FROM state_events "
+                "WHERE ts >= ? AND ts < ? GROUP BY step, status",
+                (since, first_full_hour * HOUR),
+            ).fetchall()
+
+        for step, status, count in rows:
+            statuses = counts.setdefault(step, {})
+            statuses[status] = statuses.get(status, 0) + count
+        return counts
+
+    def recent_errors(self, since: float, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent error entries since a timestamp, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT step, status, ts, notes FROM state_events "
+                "WHERE is_error = 1 AND ts >= ? ORDER BY id DESC LIMIT ?",
+                (since, limit),
+            ).fetchall()
+        return [
+            {"step": step, "status": status, "timestamp": ts, "notes": notes}
+            for step, status, ts, notes in reversed(rows)
+        ]
+
+    def recent_entries(self, since: float, limit: int = 100) -> List[Dict[str, Any]]:
+        """Most recent raw state entries since a timestamp, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT entry FROM state_events WHERE ts >= ? "
+                "ORDER BY id DESC LIMIT ?",
+                (since, limit),
+            ).fetchall()
+        return [json.loads(row[0]) for row in reversed(rows)]
+
+    # ------------------------------------------------------------------
+    # Asset folders
+    # ------------------------------------------------------------------
+
+    def refresh_assets(self, assets_dir: str) -> int:
+        """
+        Re-scan asset folders whose directory or license.json changed.
+
+        Args:
+            assets_dir: Root assets directory
+
+        Returns:
+            Number of folders re-scanned
+        """
+        try:
+            entries = [e for e in os.scandir(assets_dir) if e.is_dir()]
+        except OSError:
+            entries = []
+
+        rescanned = 0
+        with self._lock, self._connect() as conn:
+            known = {
+                row[0]: (row[1], row[2])
+                for row in conn.execute(
+                    "SELECT folder, dir_mtime, license_mtime FROM asset_folders"
+                )
+            }
+
+            for entry in entries:
+                dir_mtime = entry.stat().st_mtime
+                license_path = os.path.join(entry.path, "license.json")
+                try:
+                    license_mtime = os.stat(license_path).st_mtime
+                except OSError:
+                    license_mtime = None
+
+                if known.pop(entry.name, None) == (dir_mtime, license_mtime):
+                    continue
+                self._scan_folder(conn, entry.name, entry.path, dir_mtime, license_mtime)
+                rescanned += 1
+
+            # Folders that disappeared since the last refresh
+            for folder in known:
+                conn.execute("DELETE FROM asset_folders WHERE folder = ?", (folder,))
+                conn.execute("DELETE FROM asset_providers WHERE folder = ?", (folder,))
+        return rescanned
+
+    def _scan_folder(
+        self,
+        conn: sqlite3.Connection,
+        folder: str,
+        folder_path: str,
+        dir_mtime: float,
+        license_mtime: Optional[float],
+    ):
+        providers: Dict[str, int] = {}
+        quality_sum = relevance_sum = 0.0
+        quality_n = relevance_n = issues = 0
+
+        if license_mtime is not None:
+            try:
+                with open(
+                    os.path.join(folder_path, "license.json"), "r", encoding="utf-8"
+                ) as f:
+                    license_data = json.load(f)
+
+                for item in license_data.get("items", []):
+                    provider = item.get("provider", "unknown")
+                    providers[provider] = providers.get(provider, 0) + 1
+
+                    quality_data = item.get("quality", {})
+                    if quality_data:
+                        overall_score = quality_data.get("overall_score", 0)
+                        relevance_score = quality_data.get("relevance_score", 0)
+                        if overall_score > 0:
+                            quality_sum += overall_score
+                            quality_n += 1
+                        if relevance_score > 0:
+                            relevance_sum += relevance_score
+                            relevance_n += 1
+                        issues += len(quality_data.get("quality_issues", []))
+            except Exception:
+                pass
+
+        file_count = total_size = images = videos = others = 0
+        for child in os.scandir(folder_path):
+            if child.name in ASSET_SIDECARS or not child.is_file():
+                continue
+            file_count += 1
+            total_size += child.stat().st_size
+            ext = os.path.splitext(child.name)[1].lower()
+            if ext in IMAGE_EXTS:
+                images += 1
+            elif ext in VIDEO_EXTS:
+                videos += 1
+            else:
+                others += 1
+
+        conn.execute(
+            "INSERT OR REPLACE INTO asset_folders VALUES "
+            "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                folder,
+                dir_mtime,
+                license_mtime,
+                int(license_mtime is not None),
+                file_count,
+                total_size,
+                images,
+                videos,
+                others,
+                quality_sum,
+                quality_n,
+                relevance_sum,
+                relevance_n,
+                issues,
+            ),
+        )
+        conn.execute("DELETE FROM asset_providers WHERE folder = ?", (folder,))
+        conn.executemany(
+            "INSERT INTO asset_providers (folder, provider, count) VALUES (?, ?, ?)",
+            [(folder, provider, count) for provider, count in providers.items()],
+        )
+
+    def asset_summary(self) -> Dict[str, Any]:
+        """Aggregate asset metrics across all known folders."""
+        with self._connect() as conn:
+            (
+                folders,
+                with_license,
+                file_count,
+                total_size,
+                images,
+                videos,
+                others,
+                quality_sum,
+                quality_n,
+                relevance_sum,
+                relevance_n,
+                issues,
+            ) = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(has_license), 0), "
+                "COALESCE(SUM(file_count), 0), COALESCE(SUM(total_size), 0), "
+                "COALESCE(SUM(image_count), 0), COALESCE(SUM(video_count), 0), "
+                "COALESCE(SUM(other_count), 0), COALESCE(SUM(quality_sum), 0), "
+                "COALESCE(SUM(quality_n), 0), COALESCE(SUM(relevance_sum), 0), "
+                "COALESCE(SUM(relevance_n), 0), COALESCE(SUM(quality_issues), 0) "
+                "FROM asset_folders"
+            ).fetchone()
+            providers = dict(
+                conn.execute(
+                    "SELECT provider, SUM(count) FROM asset_providers GROUP BY provider"
+                ).fetchall()
+            )
+
+        by_type = {
+            name: count
+            for name, count in (("image", images), ("video", videos), ("other", others))
+            if count
+        }
+        return {
+            "total_assets": file_count,
+            "by_provider": providers,
+            "by_type": by_type,
+            "avg_file_size": total_size // file_count if file_count else 0,
+            "license_compliance": {"with_license": with_license, "total": folders},
+            "quality_metrics": {
+                "avg_overall_score": quality_sum / quality_n if quality_n else 0,
+                "avg_relevance_score": (
+                    relevance_sum / relevance_n if relevance_n else 0
+                ),
+                "total_quality_issues": issues,
+                "assets_analyzed": quality_n,
+            },
+        }
+
+    # ------------------------------------------------------------------
+    # System metric samples
+    # ------------------------------------------------------------------
+
+    def add_sample(
+        self,
+        ts: float,
+        cpu: float,
+        memory: float,
+        disk: float,
+        pipeline_success: float,
+    ):
+        """Record one system/pipeline sample for trend charts."""
+        self.add_samples([(ts, cpu, memory, disk, pipeline_success)])
+
+    def add_samples(self, samples: Iterable[Tuple[float, float, float, float, float]]):
+        """Record (ts, cpu, memory, disk, pipeline_success) samples in one batch."""
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO metric_samples (ts, cpu, memory, disk, pipeline_success) "
+                "VALUES (?, ?, ?, ?, ?)",
+                samples,
+            )
+
+    def samples_since(self, since: float) -> List[Tuple[float, float, float, float, float]]:
+        """Samples recorded since a timestamp, oldest first."""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT ts, cpu, memory, disk, pipeline_success FROM metric_samples "
+                "WHERE ts >= ? ORDER BY ts",
+                (since,),
+            ).fetchall()
+
+    def prune_samples(self, older_than: float) -> int:
+        """Delete samples older than a timestamp."""
+        with self._connect() as conn:
+            return conn.execute(
+                "DELETE FROM metric_samples WHERE ts < ?", (older_than,)
+            ).rowcount
+
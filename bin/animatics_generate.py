@@ -21,7 +21,7 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
-from moviepy.editor import CompositeVideoClip, VideoClip
+from moviepy.editor import VideoClip
 
 from bin.core import BASE, get_logger, guard_system, load_config, log_state, single_lock
 from bin.cutout.anim_fx import (
@@ -34,6 +34,7 @@ from bin.cutout.color_engine import pick_scene_colors
 from bin.cutout.layout_apply import auto_layout_scene, check_scene_layout_validity
 from bin.cutout.motif_generators import generate_background_motif
 from bin.cutout.raster_cache import rasterize_svg
+from bin.cutout.scene_layers import flatten_scene, keyframe_motion
 from bin.cutout.sdk import (
     FPS,
     VIDEO_H,
@@ -514,6 +515,10 @@ def render_scene(
                 f"[micro-anim] Failed to generate micro-animations for scene {scene.id}: {e}"
             )
 
+        # Background layers are static images; element motion comes from
+        # keyframes (including micro-animations applied above)
+        motion = [None] * len(clips)
+
         # Create element clips
         for element in scene.elements:
             element_clip = create_element_clip(
@@ -521,21 +526,26 @@ def render_scene(
             )
             if element_clip:
                 clips.append(element_clip)
+                motion.append(keyframe_motion(element.keyframes, scene_duration))
 
         if not clips:
             log.warning(f"No clips created for scene {scene.id}")
             return False
 
-        # Compose final scene
-        if len(clips) == 1:
-            final_clip = clips[0]
-        else:
-            final_clip = CompositeVideoClip(clips, size=(VIDEO_W, VIDEO_H))
-
-        # Set duration and export
-        final_clip = final_clip.set_duration(scene_duration)
+        # Compose final scene: static layers flattened once, animated layers
+        # composited per frame, unchanged frames held
+        final_clip, layer_plan = flatten_scene(clips, motion, scene_duration)
+        log.info(
+            f"[flatten] Scene {scene.id}: {layer_plan.static_layers} static "
+            f"layer(s) in {layer_plan.static_groups} raster(s), "
+            f"{layer_plan.animated_layers} animated; "
+            f"{layer_plan.rendered_frames}/{layer_plan.total_frames} frames "
+            f"composited, {layer_plan.held_frames} held "
+            f"(~{layer_plan.speedup:.1f}x fewer layer blits)"
+        )
 
         # Export to MP4
+        render_start = time.time()
         final_clip.write_videofile(
             str(output_path),
             fps=FPS,
@@ -546,6 +556,11 @@ def render_scene(
             logger=None,
         )
 
+        log.info(
+            f"[flatten] Scene {scene.id} encoded in "
+            f"{time.time() - render_start:.2f}s"
+        )
+
         # Verify duration accuracy (±3%)
         actual_duration = final_clip.duration
         duration_diff = abs(actual_duration - scene_duration)
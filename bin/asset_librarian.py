@@ -8,11 +8,15 @@ an asset plan with resolved assets and identified gaps.
 """
 
 import argparse
+import hashlib
+import heapq
 import json
 import logging
 import random
+import re
+import sqlite3
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from pathlib import Path
 
@@ -21,6 +25,8 @@ ROOT = Path(__file__).parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from bin.manifest_store import ManifestStore
+
 
 # Simple logging setup for standalone operation
 def get_logger(name="asset_librarian"):
@@ -37,6 +43,111 @@ def get_logger(name="asset_librarian"):
 
 log = get_logger("asset_librarian")
 
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric runs."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class AssetIndex:
+    """
+    Inverted index over manifest assets.
+
+    Maps tokens from asset paths and tags to asset ids, with facets for exact
+    tags and palette compliance. Queries narrow candidates with set
+    intersections; callers still apply the exact match predicate to the
+    (small) candidate set, so results are identical to a linear scan.
+    """
+
+    def __init__(
+        self,
+        assets: Dict[str, Dict[str, Any]],
+        approved_colors: Iterable[str],
+        key: Any = None,
+    ):
+        self.key = key
+        self.order: Dict[str, int] = {}
+        self.by_tag: Dict[str, Set[str]] = {}
+        self.by_token: Dict[str, Set[str]] = {}
+        self.palette_compliant: Set[str] = set()
+        self.match_cache: Dict[Tuple, List[str]] = {}
+        self.rank_heaps: Dict[Tuple, List[Tuple[int, int, str]]] = {}
+        self._term_cache: Dict[str, FrozenSet[str]] = {}
+
+        approved = set(approved_colors)
+        for ordinal, (asset_id, asset) in enumerate(assets.items()):
+            self.order[asset_id] = ordinal
+            tags = asset.get("tags", [])
+            for tag in tags:
+                self.by_tag.setdefault(tag, set()).add(asset_id)
+            for token in _tokenize(asset.get("path", "")) + _tokenize(str(tags)):
+                self.by_token.setdefault(token, set()).add(asset_id)
+            if all(color in approved for color in asset.get("palette", [])):
+                self.palette_compliant.add(asset_id)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def _containing(self, run: str) -> FrozenSet[str]:
+        """Ids of assets with a token containing ``run`` as a substring."""
+        cached = self._term_cache.get(run)
+        if cached is None:
+            ids: Set[str] = set(self.by_token.get(run, ()))
+            for token, postings in self.by_token.items():
+                if run in token and token != run:
+                    ids |= postings
+            cached = self._term_cache[run] = frozenset(ids)
+        return cached
+
+    def candidates_for_substring(self, text: str) -> Optional[Set[str]]:
+        """
+        Superset of assets whose path or tags could contain ``text``.
+
+        Every alphanumeric run of a substring match must lie inside one of
+        the asset's tokens, so intersecting per-run postings never drops a
+        true match. Returns None when ``text`` has no runs (no restriction).
+        """
+        runs = sorted(set(_tokenize(text)), key=len, reverse=True)
+        if not runs:
+            return None
+        result: Optional[Set[str]] = None
+        for run in runs:
+            ids = self._containing(run)
+            result = set(ids) if result is None else result & ids
+            if not result:
+                break
+        return result
+
+    def query(
+        self,
+        tag: str,
+        terms: Iterable[str] = (),
+        palette_compliant: bool = False,
+    ) -> List[str]:
+        """
+        Candidate asset ids in manifest order.
+
+        Args:
+            tag: Exact tag every candidate must carry
+            terms: Substrings that must be matchable in path or tags
+            palette_compliant: Restrict to palette-compliant assets
+
+        Returns:
+            Candidate ids, ordered as in the manifest
+        """
+        result = set(self.by_tag.get(tag, ()))
+        for term in terms:
+            if not result:
+                break
+            ids = self.candidates_for_substring(term)
+            if ids is not None:
+                result &= ids
+        if palette_compliant:
+            result &= self.palette_compliant
+        return sorted(result, key=self.order.__getitem__)
+
 
 class AssetLibrarian:
     """Resolves storyboard placeholders into concrete asset files using the manifest."""
@@ -44,6 +155,7 @@ class AssetLibrarian:
     def __init__(self, base_dir: str = "."):
         self.base_dir = Path(base_dir)
         self.manifest_path = self.base_dir / "data" / "library_manifest.json"
+        self.db_path = self.base_dir / "data" / "library_manifest.db"
         self.runs_dir = self.base_dir / "runs"
         self.videos_dir = self.base_dir / "videos"
 
@@ -51,7 +163,12 @@ class AssetLibrarian:
         self.runs_dir.mkdir(parents=True, exist_ok=True)
         self.videos_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load manifest
+        # Load manifest (index is built lazily and rebuilt when it changes)
+        self._manifest_stat: Optional[Tuple[int, int]] = None
+        self._manifest_generation: Optional[int] = None
+        self._manifest_hash: Optional[str] = None
+        self._index: Optional[AssetIndex] = None
+        self._store: Optional[ManifestStore] = None
         self.manifest = self._load_manifest()
 
         # Load design language for palette validation
@@ -63,20 +180,46 @@ class AssetLibrarian:
         # Seed for deterministic asset selection
         self.seed = None
         self.random_state = None
+        self._tiebreakers: Dict[str, int] = {}
+
+    def _manifest_store(self) -> ManifestStore:
+        """The manifest store, opened once per librarian."""
+        if self._store is None:
+            self._store = ManifestStore(str(self.db_path))
+        return self._store
 
     def _load_manifest(self) -> Dict[str, Any]:
-        """Load the asset library manifest."""
+        """Load the asset library manifest (SQLite store, else JSON export)."""
+        if self.db_path.exists():
+            try:
+                store = self._manifest_store()
+                generation = store.generation()
+                manifest = store.to_manifest()
+                log.info(
+                    f"[librarian] Loaded manifest with {len(manifest['assets'])} assets"
+                )
+                self._manifest_generation = generation
+                self._manifest_stat = None
+                self._manifest_hash = None
+                return manifest
+            except sqlite3.Error as e:
+                log.warning(f"Failed to read manifest store, using JSON: {e}")
+
         if not self.manifest_path.exists():
             log.error(f"Manifest not found: {self.manifest_path}")
             log.info("Run 'python bin/asset_manifest.py --rebuild' first")
             return {"assets": {}}
 
         try:
+            st = self.manifest_path.stat()
             with open(self.manifest_path, "r") as f:
                 manifest = json.load(f)
                 log.info(
                     f"[librarian] Loaded manifest with {len(manifest.get('assets', {}))} assets"
                 )
+                self._manifest_stat = (st.st_mtime_ns, st.st_size)
+                self._manifest_generation = None
+                self._manifest_hash = None
                 return manifest
         except Exception as e:
             log.error(f"Failed to load manifest: {e}")
@@ -111,6 +254,7 @@ class AssetLibrarian:
 
         self.seed = seed
         self.random_state = random.Random(seed)
+        self._tiebreakers = {}
         log.info(f"[librarian] Set deterministic seed: {seed}")
 
     def _get_palette_colors(self) -> List[str]:
@@ -118,13 +262,44 @@ class AssetLibrarian:
         colors = self.design_language.get("colors", {})
         return list(colors.values())
 
-    def _is_palette_compliant(self, asset_colors: List[str]) -> bool:
-        """Check if asset colors are palette compliant."""
-        approved_colors = self._get_palette_colors()
-        for color in asset_colors:
-            if color not in approved_colors:
+    def _manifest_changed_on_disk(self) -> bool:
+        """True if the manifest store or file changed since it was loaded."""
+        if self._manifest_generation is not None:
+            try:
+                return self._manifest_store().generation() != self._manifest_generation
+            except sqlite3.Error:
                 return False
-        return True
+        if self._manifest_stat is None:
+            return False
+        try:
+            st = self.manifest_path.stat()
+        except OSError:
+            return False
+        return (st.st_mtime_ns, st.st_size) != self._manifest_stat
+
+    def _get_index(self) -> AssetIndex:
+        """Return the asset index, rebuilding it if the manifest changed."""
+        if self._manifest_changed_on_disk():
+            self.manifest = self._load_manifest()
+
+        assets = self.manifest.get("assets", {})
+        if self._manifest_generation is not None:
+            key = ("store", self._manifest_generation)
+        elif self._manifest_stat is not None:
+            key = ("file", self._manifest_stat)
+        else:
+            # Manifest supplied in memory: key on its content hash
+            if self._manifest_hash is None:
+                self._manifest_hash = hashlib.sha1(
+                    json.dumps(assets, sort_keys=True, default=str).encode()
+                ).hexdigest()
+            key = ("content", self._manifest_hash)
+        key = (key, id(assets), len(assets))
+
+        if self._index is None or self._index.key != key:
+            self._index = AssetIndex(assets, self._get_palette_colors(), key)
+            log.debug(f"[librarian] Indexed {len(self._index)} assets")
+        return self._index
 
     def _find_matching_assets(
         self,
@@ -133,15 +308,103 @@ class AssetLibrarian:
         style: Optional[str] = None,
         palette: Optional[List[str]] = None,
         size_constraints: Optional[Dict[str, float]] = None,
+        limit: Optional[int] = None,
     ) -> List[Tuple[str, Dict[str, Any]]]:
         """Find matching assets based on type, category, style, and constraints."""
-        matches = []
+        index = self._get_index()
         assets = self.manifest.get("assets", {})
 
-        for asset_hash, asset in assets.items():
-            # Check type match
-            if asset_type not in asset.get("tags", []):
-                continue
+        # Placeholders repeat across a storyboard; reuse the filtered match set
+        query_key = (
+            asset_type,
+            category.lower(),
+            style.lower() if style else None,
+            bool(palette),
+            tuple(sorted(size_constraints.items())) if size_constraints else None,
+        )
+        matched_ids = index.match_cache.get(query_key)
+        if matched_ids is None:
+            matched_ids = self._filter_candidates(
+                index, assets, asset_type, category, style, palette, size_constraints
+            )
+            index.match_cache[query_key] = matched_ids
+
+        if limit == 1:
+            best = self._best_match(index, query_key, matched_ids, assets)
+            return [(best, assets[best])] if best is not None else []
+
+        # Rank: least-used first, then a seeded per-asset tiebreaker
+        ranked = sorted(
+            matched_ids,
+            key=lambda h: (assets[h].get("usage_count", 0), self._tiebreaker(h)),
+        )
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(asset_hash, assets[asset_hash]) for asset_hash in ranked]
+
+    def _best_match(
+        self,
+        index: AssetIndex,
+        query_key: Tuple,
+        matched_ids: List[str],
+        assets: Dict[str, Dict[str, Any]],
+    ) -> Optional[str]:
+        """
+        Top-ranked match via a lazily updated heap.
+
+        Usage counts only grow while resolving, so heap entries are lower
+        bounds; a stale top entry is re-pushed with its current count until
+        the top is up to date.
+        """
+        heap_key = (query_key, self.seed)
+        heap = index.rank_heaps.get(heap_key)
+        if heap is None:
+            heap = [
+                (assets[h].get("usage_count", 0), self._tiebreaker(h), h)
+                for h in matched_ids
+            ]
+            heapq.heapify(heap)
+            index.rank_heaps[heap_key] = heap
+
+        while heap:
+            usage, tiebreaker, asset_hash = heap[0]
+            current = assets[asset_hash].get("usage_count", 0)
+            if current == usage:
+                return asset_hash
+            heapq.heapreplace(heap, (current, tiebreaker, asset_hash))
+        return None
+
+    def _tiebreaker(self, asset_hash: str) -> int:
+        """Deterministic per-asset tiebreaker derived from the seed."""
+        if self.seed is None:
+            return 0
+        value = self._tiebreakers.get(asset_hash)
+        if value is None:
+            digest = hashlib.blake2b(
+                f"{self.seed}:{asset_hash}".encode(), digest_size=8
+            ).digest()
+            value = self._tiebreakers[asset_hash] = int.from_bytes(digest, "big")
+        return value
+
+    def _filter_candidates(
+        self,
+        index: AssetIndex,
+        assets: Dict[str, Dict[str, Any]],
+        asset_type: str,
+        category: str,
+        style: Optional[str],
+        palette: Optional[List[str]],
+        size_constraints: Optional[Dict[str, float]],
+    ) -> List[str]:
+        """Apply the exact match checks to index candidates."""
+        matches = []
+
+        # Narrow to candidates via the index, then apply the exact checks below
+        terms = [category] + ([style] if style else [])
+        candidates = index.query(asset_type, terms, palette_compliant=bool(palette))
+
+        for asset_hash in candidates:
+            asset = assets[asset_hash]
 
             # Check category match (in path or tags)
             asset_path = asset.get("path", "")
@@ -155,11 +418,7 @@ class AssetLibrarian:
             if style and style.lower() not in asset_path.lower():
                 continue
 
-            # Check palette compliance if specified
-            if palette:
-                asset_colors = asset.get("palette", [])
-                if not self._is_palette_compliant(asset_colors):
-                    continue
+            # Palette compliance (if specified) is applied by the index facet
 
             # Check size constraints if specified
             if size_constraints:
@@ -174,20 +433,9 @@ class AssetLibrarian:
                     if abs(asset_aspect - target_aspect) / target_aspect > 0.2:
                         continue
 
-            # Calculate match score (lower is better)
-            score = asset.get("usage_count", 0)  # Prefer less-used assets
-
-            # Add deterministic tiebreaker using seed
-            if self.random_state:
-                tiebreaker = self.random_state.random()
-            else:
-                tiebreaker = 0.0
+            matches.append(asset_hash)
 
-            matches.append((asset_hash, asset, score, tiebreaker))
-
-        # Sort by score (lowest first) and tiebreaker for deterministic selection
-        matches.sort(key=lambda x: (x[2], x[3]))
-        return [(hash_key, asset) for hash_key, asset, _, _ in matches]
+        return matches
 
     def _select_variant(
         self, asset: Dict[str, Any], requested_variants: Optional[List[str]] = None
@@ -238,6 +486,9 @@ class AssetLibrarian:
         """Resolve storyboard placeholders into concrete assets."""
         if manifest:
             self.manifest = manifest
+            self._manifest_stat = None
+            self._manifest_generation = None
+            self._manifest_hash = None
 
         # Set seed for deterministic selection
         self.set_seed(seed)
@@ -332,11 +583,28 @@ class AssetLibrarian:
             f"[librarian] Resolved {len(resolved)}/{total_placeholders} assets (reuse ratio: {reuse_ratio:.2%})"
         )
 
+        self._record_usage(resolved, asset_plan["generated_at"])
+
         # Update video metadata if it exists
         self._update_video_metadata(slug, asset_plan)
 
         return asset_plan
 
+    def _record_usage(self, resolved: List[Dict[str, Any]], timestamp: str):
+        """Persist this run's asset usage to the manifest store."""
+        generation = self._manifest_generation
+        if generation is None or not resolved:
+            return
+        try:
+            store = self._manifest_store()
+            store.record_usage([r["asset_hash"] for r in resolved], timestamp)
+            # The loaded manifest already counts these uses; only reload for
+            # changes made by someone else in the meantime
+            if store.generation() == generation + 1:
+                self._manifest_generation = generation + 1
+        except sqlite3.Error as e:
+            log.warning(f"Failed to record asset usage: {e}")
+
     def _resolve_background(
         self, bg_id: str, scene_id: str
     ) -> Optional[Dict[str, Any]]:
@@ -344,7 +612,7 @@ class AssetLibrarian:
         log.debug(f"[librarian] Resolving background {bg_id} for scene {scene_id}")
 
         # Look for background assets
-        matches = self._find_matching_assets("background", bg_id)
+        matches = self._find_matching_assets("background", bg_id, limit=1)
 
         if matches:
             asset_hash, asset = matches[0]
@@ -397,7 +665,9 @@ class AssetLibrarian:
 
         # Look for matching assets
         for style_hint in style_hints:
-            matches = self._find_matching_assets(element_type, element_type, style_hint)
+            matches = self._find_matching_assets(
+                element_type, element_type, style_hint, limit=1
+            )
             if matches:
                 asset_hash, asset = matches[0]
                 variant = self._select_variant(asset)
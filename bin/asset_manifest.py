@@ -15,10 +15,17 @@ import re
 import subprocess
 import sys
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from pathlib import Path
 
+# Ensure repo root on path
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from bin.manifest_store import ManifestStore
+
 # Try to import Pillow for thumbnail generation fallback
 try:
     from PIL import Image, ImageDraw
@@ -160,6 +167,7 @@ class AssetManifest:
         self.assets_dir = self.base_dir / "assets"
         self.thumbnails_dir = self.assets_dir / "thumbnails"
         self.manifest_path = self.base_dir / "data" / "library_manifest.json"
+        self.db_path = self.base_dir / "data" / "library_manifest.db"
 
         # Ensure directories exist
         self.thumbnails_dir.mkdir(parents=True, exist_ok=True)
@@ -172,8 +180,33 @@ class AssetManifest:
         ]
         self.generated_dir = self.assets_dir / "generated"
 
-        # Load existing manifest if it exists
-        self.manifest = self._load_existing_manifest()
+        # The SQLite store is the source of truth; the JSON file is an export
+        self.store = ManifestStore(str(self.db_path))
+        if self.store.count() == 0 and self.manifest_path.exists():
+            self._import_json_manifest()
+        self._manifest: Optional[Dict[str, Any]] = None
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        """Full manifest in the library_manifest.json layout (loaded lazily)."""
+        if self._manifest is None:
+            self._manifest = self.store.to_manifest()
+        return self._manifest
+
+    def _import_json_manifest(self):
+        """Seed an empty store from an existing library_manifest.json."""
+        data = self._load_existing_manifest()
+        assets = data.get("assets", {})
+        if not assets:
+            return
+        self.store.sync(assets)
+        for asset_hash, asset in assets.items():
+            if asset.get("quality"):
+                self.store.set_quality(asset_hash, asset["quality"])
+        self.store.set_meta(
+            version=data.get("version", "1.0"), generated_at=data.get("generated_at")
+        )
+        log.info(f"Imported {len(assets)} assets from {self.manifest_path}")
 
     def _load_existing_manifest(self) -> Dict[str, Any]:
         """Load existing manifest or create new one."""
@@ -544,77 +577,68 @@ class AssetManifest:
         return svg_files
 
     def rebuild_manifest(self, filter_palette_only: bool = False) -> Dict[str, Any]:
-        """Rebuild the complete asset manifest."""
+        """Rebuild the asset manifest.
+
+        Files whose mtime and size match the stored row are not re-parsed;
+        changed rows are upserted and vanished assets removed in a single
+        transaction, then the JSON export is refreshed.
+        """
         log.info("[manifest] Starting manifest rebuild")
 
         svg_files = self._scan_assets()
-        new_assets = {}
-        violations = []
-        palette_stats = {
-            "total_colors": 0,
-            "compliant_colors": 0,
-            "violation_count": 0,
-            "delta_e_violations": 0,
-        }
+        known = self.store.file_states()
+        changed_assets: Dict[str, Dict[str, Any]] = {}
+        file_stats: Dict[str, Tuple[int, int]] = {}
+        unchanged = set()
 
         # Process each SVG file
         for svg_path in svg_files:
             log.debug(f"Processing {svg_path.name}")
 
+            # Generate thumbnail (skipped internally when up to date)
+            self._generate_thumbnail(svg_path)
+
+            rel_path = str(svg_path.relative_to(self.base_dir))
+            try:
+                st = svg_path.stat()
+            except OSError:
+                continue
+            stat = (st.st_mtime_ns, st.st_size)
+            previous = known.get(rel_path)
+            if previous and previous[:2] == stat:
+                unchanged.add(previous[2])
+                continue
+
             # Extract metadata
             metadata = self._extract_svg_metadata(svg_path)
             if not metadata:
                 continue
 
-            # Generate thumbnail
-            self._generate_thumbnail(svg_path)
-
-            # Validate palette compliance
-            is_compliant, color_violations = self._validate_palette_compliance_delta_e(
-                metadata["palette"]
-            )
-
-            if not is_compliant:
-                violations.append(
-                    {
-                        "asset": metadata["path"],
-                        "violations": metadata["delta_e_violations"],
-                        "type": "palette_violation",
-                    }
-                )
+            if not metadata["palette_ok"]:
                 log.warning(
                     f"Palette violations in {svg_path.name}: {len(metadata['delta_e_violations'])} violations"
                 )
 
-            # Update palette stats
-            palette_stats["total_colors"] += len(metadata["palette"])
-            if is_compliant:
-                palette_stats["compliant_colors"] += len(metadata["palette"])
-            palette_stats["violation_count"] += len(color_violations)
-            palette_stats["delta_e_violations"] += len(metadata["delta_e_violations"])
-
             # Use hash as key to avoid duplicates
-            new_assets[metadata["hash"]] = metadata
-
-        # Preserve usage counts from existing manifest
-        for hash_key, asset in new_assets.items():
-            if hash_key in self.manifest.get("assets", {}):
-                existing = self.manifest["assets"][hash_key]
-                asset["usage_count"] = existing.get("usage_count", 0)
-                asset["last_used"] = existing.get("last_used")
-
-        # Update manifest
-        self.manifest["assets"] = new_assets
-        self.manifest["violations"] = violations
-        self.manifest["palette_stats"] = palette_stats
-        self.manifest["total_assets"] = len(new_assets)
-        self.manifest["generated_at"] = self._get_timestamp()
+            changed_assets[metadata["hash"]] = metadata
+            file_stats[metadata["hash"]] = stat
+
+        counts = self.store.sync(changed_assets, keep=unchanged, file_stats=file_stats)
+        self.store.set_meta(version="1.0", generated_at=self._get_timestamp())
+        upserted = counts["inserted"] + counts["updated"]
+        kept = len(unchanged) + counts["unchanged"]
+        log.info(
+            f"[manifest] Upserted {upserted} assets, removed {counts['deleted']}, "
+            f"{kept} unchanged"
+        )
 
         # Save manifest
+        self._manifest = None
         self._save_manifest()
 
         log.info(
-            f"[manifest] Manifest rebuilt: {len(new_assets)} assets, {len(violations)} violations"
+            f"[manifest] Manifest rebuilt: {self.manifest['total_assets']} assets, "
+            f"{len(self.manifest['violations'])} violations"
         )
         return self.manifest
 
@@ -625,44 +649,28 @@ class AssetManifest:
         return datetime.utcnow().isoformat() + "Z"
 
     def _save_manifest(self):
-        """Save manifest to file."""
+        """Export the manifest to JSON for consumers that still read the file."""
         try:
-            with open(self.manifest_path, "w") as f:
-                json.dump(self.manifest, f, indent=2)
+            self._manifest = self.store.export_json(str(self.manifest_path))
             log.info(f"Manifest saved to {self.manifest_path}")
         except Exception as e:
             log.error(f"Failed to save manifest: {e}")
 
     def get_manifest_summary(self) -> Dict[str, Any]:
         """Get summary statistics of the manifest."""
-        assets = self.manifest.get("assets", {})
-
-        # Count by source
-        brand_count = sum(
-            1 for a in assets.values() if a["provenance"]["source"] == "brand"
-        )
-        generated_count = sum(
-            1 for a in assets.values() if a["provenance"]["source"] == "generated"
-        )
-
-        # Count by tags
-        tag_counts = {}
-        for asset in assets.values():
-            for tag in asset.get("tags", []):
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-        # Count palette compliance
-        palette_ok_count = sum(1 for a in assets.values() if a.get("palette_ok", False))
+        sources = self.store.source_counts()
+        violations, palette_stats = self.store.palette_summary()
+        total = self.store.count()
 
         return {
-            "total_assets": len(assets),
-            "brand_assets": brand_count,
-            "generated_count": generated_count,
-            "tag_distribution": tag_counts,
-            "palette_stats": self.manifest.get("palette_stats", {}),
-            "palette_ok_count": palette_ok_count,
-            "palette_violations": len(self.manifest.get("violations", [])),
-            "violations": len(self.manifest.get("violations", [])),
+            "total_assets": total,
+            "brand_assets": sources.get("brand", 0),
+            "generated_count": sources.get("generated", 0),
+            "tag_distribution": self.store.tag_counts(),
+            "palette_stats": palette_stats,
+            "palette_ok_count": total - len(violations),
+            "palette_violations": len(violations),
+            "violations": len(violations),
         }
 
 
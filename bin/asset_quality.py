@@ -2,7 +2,10 @@
 """
 Asset quality assessment module for intelligent asset selection.
 Analyzes image and video quality, relevance scoring, and provider performance.
+Scores of library assets are stored in the asset manifest (bin/manifest_store.py)
+so the librarian can filter on them.
 """
+import hashlib
 import json
 import os
 import re
@@ -23,6 +26,15 @@ from bin.core import get_logger
 
 log = get_logger("asset_quality")
 
+# QualityMetrics fields stored as manifest quality scores
+STORED_METRICS = (
+    "overall_score",
+    "relevance_score",
+    "compression_quality",
+    "sharpness",
+    "contrast",
+)
+
 
 @dataclass
 class QualityMetrics:
@@ -535,6 +547,27 @@ class AssetQualityAnalyzer:
 
         return metrics
 
+    def record_quality(self, metrics: QualityMetrics, store) -> bool:
+        """
+        Store the scores of an analyzed library asset in the manifest store.
+
+        The asset is matched by content hash, as the manifest keys it.
+
+        Args:
+            metrics: Result of analyze_asset()
+            store: ManifestStore to write to
+
+        Returns:
+            False if the file is not in the manifest
+        """
+        with open(metrics.file_path, "rb") as f:
+            asset_hash = hashlib.sha1(f.read()).hexdigest()
+        if not store.query(hashes=[asset_hash]):
+            return False
+        scores = {name: getattr(metrics, name) for name in STORED_METRICS}
+        store.set_quality(asset_hash, scores)
+        return True
+
     def rank_assets(
         self, asset_metrics: List[QualityMetrics], max_count: int = 10
     ) -> List[QualityMetrics]:
@@ -572,6 +605,11 @@ def main():
     parser.add_argument("file_path", help="Path to asset file")
     parser.add_argument("--query", default="", help="Search query for relevance")
     parser.add_argument("--output", help="Output JSON file")
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Store the scores in the asset manifest (data/library_manifest.db)",
+    )
 
     args = parser.parse_args()
 
@@ -602,6 +640,15 @@ def main():
     if metrics.semantic_keywords:
         print(f"  Keywords: {', '.join(metrics.semantic_keywords[:5])}")
 
+    if args.record:
+        from bin.manifest_store import ManifestStore
+
+        store = ManifestStore(os.path.join(ROOT, "data", "library_manifest.db"))
+        if analyzer.record_quality(metrics, store):
+            print("\nScores stored in the asset manifest")
+        else:
+            print("\nNot in the asset manifest; scores not stored")
+
     # Save detailed results
     if args.output:
         with open(args.output, "w", encoding="utf-8") as f:
@@ -77,6 +77,8 @@ class ResearchConfig(BaseModel):
 class OllamaConfig(BaseModel):
     base_url: str = "http://127.0.0.1:11434"
     timeout_sec: float = Field(60, gt=0, le=600)
+    # Shared bin/llm_gateway.py in front of base_url (None: talk to Ollama)
+    gateway_url: Optional[str] = None
 
     class Config:
         extra = "allow"
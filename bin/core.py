@@ -127,6 +127,11 @@ class ASRCfg(BaseModel):
     )
     model: str = Field(default_factory=lambda: _default_whisper_paths()["model"])
     openai_enabled: bool = False
+    # Keep a whisper-server running with the model loaded (falls back to
+    # whisper-cli when the server binary is not built)
+    server: bool = True
+    server_port: int = 8178
+    server_threads: Optional[int] = None
 
 
 class TTSCfg(BaseModel):
@@ -6,13 +6,15 @@ This module provides reusable primitives for text, images, backgrounds, and keyf
 for the Branded Animatics Pipeline. All time values are in milliseconds and converted to seconds
 via FPS for MoviePy compatibility.
 
-Note: This implementation uses ColorClip for compatibility since ImageMagick is not available.
-In a production environment with ImageMagick, TextClip could be used for better text rendering.
+Text is rendered with Pillow/FreeType through text_render (glyph atlas plus a
+rendered-block cache) rather than TextClip, so ImageMagick is not required.
 """
 
 import os
 import tempfile
-from typing import List, Literal
+from typing import Dict, List, Literal, Optional
+
+import numpy as np
 
 from bin.core import get_logger
 
@@ -64,7 +66,14 @@ except ImportError:
 
     MOVIEPY_AVAILABLE = False
 
+from .keyframe_engine import KeyframeTrack, animate_clip
 from .sdk import FPS, VIDEO_H, VIDEO_W, AnimType, BrandStyle, Keyframe, load_style
+from .text_render import (
+    DEFAULT_MAX_WIDTH,
+    font_for_kind,
+    render_text_block,
+    text_block_size,
+)
 
 log = get_logger("anim_fx")
 
@@ -84,31 +93,35 @@ def _seconds_to_ms(seconds: float) -> int:
 
 
 def make_text_clip(
-    text: str, style: BrandStyle, kind: Literal["hook", "body", "lower_third"]
-) -> ColorClip:
+    text: str,
+    style: BrandStyle,
+    kind: Literal["hook", "body", "lower_third"],
+    max_width: Optional[int] = DEFAULT_MAX_WIDTH,
+) -> ImageClip:
     """
     Create a text clip with brand styling.
 
+    Text is rendered with text_render (glyph atlas, kerning, wrapping) and
+    cached per (text, style, kind, width), so repeated text is a lookup.
+
     Args:
         text: Text content to display
         style: BrandStyle configuration
         kind: Text type for size and positioning
+        max_width: Width to wrap the text block to (None: single line)
 
     Returns:
-        ColorClip with text content (simplified for compatibility)
+        ImageClip of the rendered text with an alpha mask
     """
-    # Get font size for text kind
-    font_size = style.font_sizes.get(kind, style.font_sizes["body"])
-
-    # For compatibility, create a simple colored rectangle as text placeholder
-    # In a full implementation, this would use proper text rendering
-    width = len(text) * font_size // 2  # Approximate width
-    height = font_size + 20  # Approximate height with padding
+    if not MOVIEPY_AVAILABLE:
+        font_size = style.font_sizes.get(kind, style.font_sizes["body"])
+        size = text_block_size(
+            text, font_size, font_for_kind(style.fonts, kind), max_width
+        )
+        return ColorClip(size=size, color=(255, 255, 255), duration=1.0)
 
-    # Create a colored rectangle as text placeholder using RGB values
-    clip = ColorClip(
-        size=(width, height), color=(255, 255, 255), duration=1.0  # White RGB
-    )
+    block = render_text_block(text, style, kind, max_width)
+    clip = ImageClip(np.asarray(block), transparent=True, duration=1.0)
 
     # Center the clip
     clip = clip.set_position("center")
@@ -218,51 +231,64 @@ def make_background_clip(bg_path: str, duration: float) -> VideoClip:
         )
 
 
+def _base_position(clip: VideoClip) -> Dict[str, float]:
+    """Top-left position a clip was given with set_position, in pixels."""
+    try:
+        pos = clip.pos(0)
+    except Exception:
+        return {}
+    if not isinstance(pos, (tuple, list)) or len(pos) != 2:
+        return {}
+    w, h = clip.size
+    anchors = (
+        {"left": 0, "center": (VIDEO_W - w) / 2, "right": VIDEO_W - w},
+        {"top": 0, "center": (VIDEO_H - h) / 2, "bottom": VIDEO_H - h},
+    )
+    base = {}
+    for prop, value, named in zip(("x", "y"), pos, anchors):
+        if isinstance(value, str):
+            value = named.get(value)
+        if isinstance(value, (int, float)):
+            base[prop] = float(value)
+    return base
+
+
 def apply_keyframes(
-    clip: VideoClip, keyframes: List[Keyframe], scene_duration: float
+    clip: VideoClip,
+    keyframes: List[Keyframe],
+    scene_duration: Optional[float] = None,
+    easing: str = "ease_in_out",
 ) -> VideoClip:
     """
     Apply keyframe animations to a clip.
 
+    The keyframes are compiled once into per-frame tables (see
+    keyframe_engine), so each rendered frame costs one affine warp no matter
+    how many keyframes the element has.
+
     Args:
         clip: VideoClip to animate
         keyframes: List of Keyframe objects with timing and properties
-        scene_duration: Total scene duration in seconds
+        scene_duration: Total scene duration in seconds (defaults to the
+            clip's duration)
+        easing: Easing between keyframes (linear, ease_in, ease_out,
+            ease_in_out)
 
     Returns:
         VideoClip with keyframe animations applied
     """
-    if not keyframes:
+    if not keyframes or not MOVIEPY_AVAILABLE:
         return clip
 
-    # Sort keyframes by time
-    sorted_keyframes = sorted(keyframes, key=lambda k: k.t)
-
-    # Apply each keyframe
-    for keyframe in sorted_keyframes:
-        time_seconds = _ms_to_seconds(keyframe.t)
-
-        # Apply position changes
-        if keyframe.x is not None or keyframe.y is not None:
-            current_pos = clip.pos if hasattr(clip, "pos") else (0, 0)
-            new_x = keyframe.x if keyframe.x is not None else current_pos[0]
-            new_y = keyframe.y if keyframe.y is not None else current_pos[1]
-            clip = clip.set_position((new_x, new_y))
-
-        # Apply scale changes (simplified)
-        if keyframe.scale is not None:
-            # Simple scale without complex resize
-            pass
-
-        # Apply rotation changes
-        if keyframe.rotate is not None:
-            clip = clip.rotate(keyframe.rotate)
-
-        # Apply opacity changes
-        if keyframe.opacity is not None:
-            clip = clip.set_opacity(keyframe.opacity)
+    duration = scene_duration if scene_duration is not None else clip.duration
+    if duration is None:
+        duration = max(k.t for k in keyframes) / 1000.0
+        clip = clip.set_duration(duration)
 
-    return clip
+    track = KeyframeTrack.compile(
+        keyframes, duration, fps=FPS, base=_base_position(clip), easing=easing
+    )
+    return animate_clip(clip, track)
 
 
 def entrance(clip: VideoClip, anim_type: AnimType) -> VideoClip:
@@ -10,15 +10,12 @@ procedurally, and revalidates the storyboard before rendering.
 import json
 import logging
 import time
-from typing import Dict, List, Optional, Tuple, Union
+import zlib
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from pathlib import Path
 
-from .motif_generators import (
-    generate_background_motif,
-    generate_character_motif,
-    generate_prop_motif,
-)
+from .motif_generators import MotifRequest, generate_motifs_batch
 from .sdk import BrandStyle, SceneScript, load_style
 from .svg_path_ops import (
     create_path_processor,
@@ -47,37 +44,121 @@ class AssetRequirement:
         return f"{self.asset_type}:{self.identifier} for {self.element_id} in {self.scene_id}"
 
 
+def _trigrams(text: str) -> Set[str]:
+    """Distinct character trigrams of a lower-cased string."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
 class AssetLibrary:
     """Manages the existing asset library and provides matching capabilities."""
 
-    def __init__(self, brand_style: BrandStyle):
+    # Directories scanned for SVG assets, as (directory, key prefix)
+    ASSET_DIRS = [
+        ("assets/brand/backgrounds", "backgrounds"),
+        ("assets/brand/props", "props"),
+        ("assets/brand/characters", "characters"),
+        ("assets/generated", "generated"),
+    ]
+    INDEX_VERSION = 1
+    FUZZY_CANDIDATES = 50  # Candidates scored per fuzzy lookup
+
+    def __init__(
+        self,
+        brand_style: BrandStyle,
+        index_path: Optional[str] = "render_cache/asset_index.json",
+    ):
         self.brand_style = brand_style
+        self.index_path = Path(index_path) if index_path else None
         self.asset_cache: Dict[str, str] = {}  # identifier -> file_path
+        self._dir_state: Dict[str, Dict] = {}  # directory -> {"mtime_ns", "files"}
+        self._keys: List[str] = []
+        self._key_trigrams: List[int] = []  # distinct trigram count per key
+        self._postings: Dict[str, List[int]] = {}  # trigram -> key ordinals
         self._build_asset_index()
 
     def _build_asset_index(self):
-        """Build an index of existing assets for fast lookup."""
-        # Index brand assets
-        brand_dirs = ["backgrounds", "props", "characters"]
-        for asset_type in brand_dirs:
-            brand_dir = Path("assets/brand") / asset_type
-            if brand_dir.exists():
-                for asset_file in brand_dir.glob("*.svg"):
-                    identifier = asset_file.stem
-                    self.asset_cache[f"{asset_type}:{identifier}"] = str(asset_file)
-                    log.debug(
-                        f"Indexed brand asset: {asset_type}:{identifier} -> {asset_file}"
-                    )
-
-        # Index generated assets
-        generated_dir = Path("assets/generated")
-        if generated_dir.exists():
-            for asset_file in generated_dir.glob("*.svg"):
-                identifier = asset_file.stem
-                self.asset_cache[f"generated:{identifier}"] = str(asset_file)
-                log.debug(
-                    f"Indexed generated asset: generated:{identifier} -> {asset_file}"
-                )
+        """Build an index of existing assets for fast lookup.
+
+        The index is persisted to ``index_path``; on later runs only directories
+        whose mtime changed are re-globbed, and the trigram postings are reused
+        as-is when nothing changed.
+        """
+        cached = self._load_index()
+        cached_dirs = cached.get("dirs", {})
+
+        changed = False
+        for directory, prefix in self.ASSET_DIRS:
+            asset_dir = Path(directory)
+            try:
+                mtime_ns = asset_dir.stat().st_mtime_ns
+            except OSError:
+                changed = changed or directory in cached_dirs
+                continue
+
+            entry = cached_dirs.get(directory)
+            if not entry or entry.get("mtime_ns") != mtime_ns:
+                entry = {
+                    "mtime_ns": mtime_ns,
+                    "files": sorted(f.name for f in asset_dir.glob("*.svg")),
+                }
+                changed = True
+                log.debug(f"Indexed {len(entry['files'])} assets in {directory}")
+            self._dir_state[directory] = entry
+
+            for filename in entry["files"]:
+                identifier = Path(filename).stem
+                self.asset_cache[f"{prefix}:{identifier}"] = str(asset_dir / filename)
+
+        if not changed and cached.get("keys") == list(self.asset_cache):
+            self._keys = cached["keys"]
+            self._key_trigrams = cached["key_trigrams"]
+            self._postings = cached["postings"]
+        else:
+            self._build_postings()
+            self._save_index()
+
+    def _build_postings(self):
+        """Build the character-trigram posting lists over all asset keys."""
+        self._keys = list(self.asset_cache)
+        self._key_trigrams = []
+        self._postings = {}
+        for ordinal, key in enumerate(self._keys):
+            grams = _trigrams(key.lower())
+            self._key_trigrams.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(ordinal)
+
+    def _load_index(self) -> Dict:
+        if not self.index_path or not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable asset index {self.index_path}: {e}")
+            return {}
+        if data.get("version") != self.INDEX_VERSION:
+            return {}
+        return data
+
+    def _save_index(self):
+        if not self.index_path:
+            return
+        data = {
+            "version": self.INDEX_VERSION,
+            "dirs": self._dir_state,
+            "keys": self._keys,
+            "key_trigrams": self._key_trigrams,
+            "postings": self._postings,
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            tmp_path.replace(self.index_path)
+        except OSError as e:
+            log.warning(f"Could not save asset index {self.index_path}: {e}")
 
     def find_asset(self, asset_type: str, identifier: str) -> Optional[str]:
         """Find an existing asset by type and identifier."""
@@ -92,14 +173,51 @@ class AssetLibrary:
             return self.asset_cache[brand_key]
 
         # Try fuzzy matching for similar identifiers
-        for existing_key, path in self.asset_cache.items():
-            if (
-                identifier.lower() in existing_key.lower()
-                or existing_key.lower() in identifier.lower()
-            ):
-                log.debug(f"Fuzzy match: {identifier} -> {existing_key}")
-                return path
+        match = self._fuzzy_match(identifier.lower())
+        if match:
+            log.debug(f"Fuzzy match: {identifier} -> {match}")
+            return self.asset_cache[match]
+
+        return None
 
+    def _fuzzy_match(self, needle: str) -> Optional[str]:
+        """Find a key that contains, or is contained in, ``needle``.
+
+        Candidates come from the trigram postings: a key containing the needle
+        shares all of the needle's trigrams, and a key contained in the needle
+        has all of its own trigrams in the needle. Only the best-overlapping
+        candidates are verified, most similar first.
+        """
+        grams = _trigrams(needle)
+        if not grams:
+            # Too short for trigrams; scan directly
+            for existing_key in self._keys:
+                lowered = existing_key.lower()
+                if needle in lowered or lowered in needle:
+                    return existing_key
+            return None
+
+        overlap: Dict[int, int] = {}
+        for gram in grams:
+            for ordinal in self._postings.get(gram, ()):
+                overlap[ordinal] = overlap.get(ordinal, 0) + 1
+
+        candidates = [
+            ordinal
+            for ordinal, shared in overlap.items()
+            if shared == len(grams) or shared == self._key_trigrams[ordinal]
+        ]
+        # Dice similarity over trigram sets, ties broken by index order
+        candidates.sort(
+            key=lambda o: (
+                -2 * overlap[o] / (len(grams) + self._key_trigrams[o]),
+                o,
+            )
+        )
+        for ordinal in candidates[: self.FUZZY_CANDIDATES]:
+            lowered = self._keys[ordinal].lower()
+            if needle in lowered or lowered in needle:
+                return self._keys[ordinal]
         return None
 
     def get_coverage_stats(self) -> Dict[str, int]:
@@ -120,131 +238,119 @@ class AssetLibrary:
 class ProceduralAssetGenerator:
     """Generates procedural assets following the brand style guide."""
 
-    def __init__(self, brand_style: BrandStyle, seed: int = 42):
+    # Filename prefix for each generated asset type
+    FILE_PREFIXES = {"background": "bg", "prop": "prop", "character": "char"}
+
+    def __init__(
+        self,
+        brand_style: BrandStyle,
+        seed: int = 42,
+        cache_dir: Optional[str] = "render_cache",
+        max_workers: Optional[int] = None,
+    ):
         self.brand_style = brand_style
         self.seed = seed
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
         self.generated_dir = Path("assets/generated")
         self.generated_dir.mkdir(parents=True, exist_ok=True)
 
-    def generate_asset(self, requirement: AssetRequirement) -> Optional[str]:
-        """Generate a procedural asset for the given requirement."""
-        try:
-            if requirement.asset_type == "background":
-                return self._generate_background(requirement)
-            elif requirement.asset_type == "prop":
-                return self._generate_prop(requirement)
-            elif requirement.asset_type == "character":
-                return self._generate_character(requirement)
-            else:
-                log.warning(
-                    f"Unsupported asset type for generation: {requirement.asset_type}"
-                )
-                return None
-        except Exception as e:
-            log.error(f"Failed to generate asset for {requirement}: {e}")
-            return None
+    def _scene_seed(self, scene_id: str) -> int:
+        """Scene-specific seed, stable across processes."""
+        return self.seed + zlib.crc32(scene_id.encode("utf-8")) % 10000
 
-    def _generate_background(self, requirement: AssetRequirement) -> Optional[str]:
-        """Generate a procedural background asset."""
-        # Use scene-specific seed for deterministic generation
-        scene_seed = self.seed + hash(requirement.scene_id) % 10000
-
-        # Pick colors from brand palette
+    def _palette(self) -> List[str]:
+        """Pick colors from brand palette."""
         colors = (
             list(self.brand_style.colors.values())
             if hasattr(self.brand_style.colors, "values")
             else []
         )
-        if not colors:
-            colors = ["#2563eb", "#7c3aed", "#f59e0b"]  # Fallback colors
+        return colors or ["#2563eb", "#7c3aed", "#f59e0b"]  # Fallback colors
 
-        # Generate background motif
-        svg_content = generate_background_motif(
-            requirement.identifier, colors, seed=scene_seed
+    def _build_request(self, requirement: AssetRequirement) -> Optional[MotifRequest]:
+        if requirement.asset_type not in self.FILE_PREFIXES:
+            log.warning(
+                f"Unsupported asset type for generation: {requirement.asset_type}"
+            )
+            return None
+        # Use scene-specific seed for deterministic generation
+        return MotifRequest(
+            kind=requirement.asset_type,
+            motif_type=requirement.identifier,
+            colors=self._palette(),
+            seed=self._scene_seed(requirement.scene_id),
         )
 
-        if svg_content:
-            # Save to generated assets directory
-            timestamp = int(time.time())
-            filename = f"bg_{requirement.identifier}_{timestamp}_{scene_seed}.svg"
-            filepath = self.generated_dir / filename
+    def _write_asset(self, request: MotifRequest, svg_content: str) -> str:
+        """Save generated SVG to the generated assets directory."""
+        prefix = self.FILE_PREFIXES[request.kind]
+        filename = f"{prefix}_{request.motif_type}_{request.seed}.svg"
+        filepath = self.generated_dir / filename
 
-            with open(filepath, "w") as f:
-                f.write(svg_content)
+        with open(filepath, "w") as f:
+            f.write(svg_content)
 
-            log.info(f"Generated background asset: {filepath}")
-            return str(filepath)
-
-        return None
+        log.info(f"Generated {request.kind} asset: {filepath}")
+        return str(filepath)
 
-    def _generate_prop(self, requirement: AssetRequirement) -> Optional[str]:
-        """Generate a procedural prop asset."""
-        # Use scene-specific seed for deterministic generation
-        scene_seed = self.seed + hash(requirement.scene_id) % 10000
+    def generate_asset(self, requirement: AssetRequirement) -> Optional[str]:
+        """Generate a procedural asset for the given requirement."""
+        return self.generate_assets([requirement])[0]
 
-        # Pick colors from brand palette
-        colors = (
-            list(self.brand_style.colors.values())
-            if hasattr(self.brand_style.colors, "values")
-            else []
-        )
-        if not colors:
-            colors = ["#2563eb", "#7c3aed", "#f59e0b"]  # Fallback colors
+    def generate_assets(
+        self, requirements: List[AssetRequirement]
+    ) -> List[Optional[str]]:
+        """
+        Generate procedural assets for many requirements in parallel.
 
-        # Generate prop motif
-        svg_content = generate_prop_motif(
-            requirement.identifier, colors, seed=scene_seed
-        )
+        Args:
+            requirements: Requirements to fill
 
-        if svg_content:
-            # Save to generated assets directory
-            timestamp = int(time.time())
-            filename = f"prop_{requirement.identifier}_{timestamp}_{scene_seed}.svg"
-            filepath = self.generated_dir / filename
+        Returns:
+            Generated file paths in requirement order (None where generation failed)
+        """
+        requests = [self._build_request(r) for r in requirements]
+        jobs = [(i, req) for i, req in enumerate(requests) if req is not None]
+        paths: List[Optional[str]] = [None] * len(requirements)
 
-            with open(filepath, "w") as f:
-                f.write(svg_content)
+        try:
+            svgs = generate_motifs_batch(
+                [req for _, req in jobs],
+                max_workers=self.max_workers,
+                cache_dir=self.cache_dir,
+            )
+        except Exception as e:
+            log.error(f"Failed to generate assets: {e}")
+            return paths
+
+        for (i, request), svg_content in zip(jobs, svgs):
+            if not svg_content:
+                continue
+            try:
+                paths[i] = self._write_asset(request, svg_content)
+            except Exception as e:
+                log.error(f"Failed to save asset for {requirements[i]}: {e}")
+        return paths
 
-            log.info(f"Generated prop asset: {filepath}")
-            return str(filepath)
+    def _generate_background(self, requirement: AssetRequirement) -> Optional[str]:
+        """Generate a procedural background asset."""
+        return self.generate_asset(requirement)
 
-        return None
+    def _generate_prop(self, requirement: AssetRequirement) -> Optional[str]:
+        """Generate a procedural prop asset."""
+        return self.generate_asset(requirement)
 
     def _generate_character(self, requirement: AssetRequirement) -> Optional[str]:
         """Generate a procedural character asset."""
-        # Use scene-specific seed for deterministic generation
-        scene_seed = self.seed + hash(requirement.scene_id) % 10000
-
-        # Pick colors from brand palette
-        colors = (
-            list(self.brand_style.colors.values())
-            if hasattr(self.brand_style.colors, "values")
-            else []
-        )
-        if not colors:
-            colors = ["#2563eb", "#7c3aed", "#f59e0b"]  # Fallback colors
-
-        # Generate character motif
-        svg_content = generate_character_motif(
-            requirement.identifier, colors, seed=scene_seed
-        )
-
-        if svg_content:
-            # Save to generated assets directory
-            timestamp = int(time.time())
-            filename = f"char_{requirement.identifier}_{timestamp}_{scene_seed}.svg"
-            filepath = self.generated_dir / filename
-
-            with open(filepath, "w") as f:
-                f.write(svg_content)
-
-            log.info(f"Generated character asset: {filepath}")
-            return str(filepath)
-
-        return None
+        return self.generate_asset(requirement)
 
     def generate_variants(
-        self, base_svg_path: str, motif_type: str, count: int = 5
+        self,
+        base_svg_path: str,
+        motif_type: str,
+        count: int = 5,
+        asset_type: str = "background",
     ) -> List[str]:
         """Generate procedural variants of a base SVG motif using advanced path operations."""
         try:
@@ -257,11 +363,28 @@ class ProceduralAssetGenerator:
                     str(self.generated_dir),
                     seed=self.seed,
                 )
-            else:
-                log.warning(
-                    "Variant generator not available, falling back to basic generation"
-                )
+
+            # Otherwise fill the gap with seeded procedural variants, in parallel
+            if asset_type not in self.FILE_PREFIXES:
+                log.warning(f"Unsupported asset type for variants: {asset_type}")
                 return []
+            requests = [
+                MotifRequest(
+                    kind=asset_type,
+                    motif_type=motif_type,
+                    colors=self._palette(),
+                    seed=self.seed + i,
+                )
+                for i in range(count)
+            ]
+            svgs = generate_motifs_batch(
+                requests, max_workers=self.max_workers, cache_dir=self.cache_dir
+            )
+            return [
+                self._write_asset(request, svg)
+                for request, svg in zip(requests, svgs)
+                if svg
+            ]
         except Exception as e:
             log.error(f"Failed to generate variants: {e}")
             return []
@@ -350,8 +473,9 @@ class StoryboardAssetLoop:
             self.path_processor = None
             self.variant_generator = None
 
-        for requirement in missing:
-            generated_path = self.asset_generator.generate_asset(requirement)
+        # Generate all gaps in one parallel batch
+        generated_paths = self.asset_generator.generate_assets(missing)
+        for requirement, generated_path in zip(missing, generated_paths):
             if generated_path:
                 requirement.generated_path = generated_path
                 requirement.coverage_status = "generated"
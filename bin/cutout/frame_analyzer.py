@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+Frame Analyzer for Rendered Legibility QA
+
+Vectorized WCAG contrast analysis over rendered frames and whole videos.
+
+Each frame is converted to relative luminance once (only under the text
+boxes when they are known). Contrast is then measured per region from luminance histograms: each region is split into
+foreground and background classes (Otsu threshold) and the WCAG ratio is
+computed between the class medians, so anti-aliased glyph edges do not
+drag the result down.
+
+Public API:
+- luminance_map(frame) -> np.ndarray
+- estimate_text_regions(scene, font_sizes, fonts) -> List[TextRegion]
+- iter_video_frames(path, sample_fps, max_width) -> Iterator[(t_sec, frame)]
+- FrameAnalyzer.analyze_frame(frame, regions) -> Dict
+- FrameAnalyzer.analyze_video(path, regions, sample_fps) -> Dict
+"""
+
+import subprocess
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from bin.core import get_logger
+
+from .sdk import VIDEO_H, VIDEO_W
+from .text_render import font_for_kind, text_block_size
+
+log = get_logger("frame_analyzer")
+
+# Histogram bins are spaced in gamma-encoded space so dark tones keep
+# resolution; the table maps each bin back to linear luminance.
+HIST_BINS = 256
+_BIN_GAMMA = 2.2
+_BIN_LUMINANCE = (np.arange(HIST_BINS, dtype=np.float64) / (HIST_BINS - 1)) ** _BIN_GAMMA
+
+# sRGB -> linear lookup (WCAG 2.1 transfer function)
+_SRGB = np.arange(256, dtype=np.float64) / 255.0
+_SRGB_TO_LINEAR = np.where(
+    _SRGB <= 0.03928, _SRGB / 12.92, ((_SRGB + 0.055) / 1.055) ** 2.4
+).astype(np.float32)
+_LUMA_WEIGHTS = (0.2126, 0.7152, 0.0722)
+
+# Element types rendered as text by animatics_generate.create_element_clip
+TEXT_ELEMENT_TYPES = {"text", "list_step", "lower_third", "counter"}
+
+DEFAULT_FONT_SIZES = {"hook": 48, "body": 24, "lower_third": 32, "caption": 18}
+
+
+def luminance_map(frame: Union[np.ndarray, "PIL.Image.Image"]) -> np.ndarray:
+    """
+    Compute the WCAG relative luminance of every pixel.
+
+    Args:
+        frame: HxWx3 uint8 array or PIL Image
+
+    Returns:
+        HxW float32 array of relative luminance in [0, 1]
+    """
+    if not isinstance(frame, np.ndarray):
+        if frame.mode != "RGB":
+            frame = frame.convert("RGB")
+        frame = np.asarray(frame)
+
+    if frame.ndim == 2:
+        return _SRGB_TO_LINEAR[frame]
+
+    rgb = frame[..., :3]
+    lum = _SRGB_TO_LINEAR[rgb[..., 0]] * _LUMA_WEIGHTS[0]
+    lum += _SRGB_TO_LINEAR[rgb[..., 1]] * _LUMA_WEIGHTS[1]
+    lum += _SRGB_TO_LINEAR[rgb[..., 2]] * _LUMA_WEIGHTS[2]
+    return lum
+
+
+# 16-bit linear luminance -> bin index, so quantizing is a table lookup
+_QUANT_STEPS = 65535
+_LUM_TO_BIN = (
+    np.power(np.arange(_QUANT_STEPS + 1) / _QUANT_STEPS, 1.0 / _BIN_GAMMA)
+    * (HIST_BINS - 1)
+    + 0.5
+).astype(np.intp)
+
+
+def _quantize(lum: np.ndarray) -> np.ndarray:
+    """Map linear luminance to histogram bin indices."""
+    return _LUM_TO_BIN[(lum * _QUANT_STEPS + 0.5).astype(np.uint16)]
+
+
+def _contrast_ratio(l1: np.ndarray, l2: np.ndarray) -> np.ndarray:
+    """WCAG contrast ratio between two luminance arrays."""
+    return (np.maximum(l1, l2) + 0.05) / (np.minimum(l1, l2) + 0.05)
+
+
+def histogram_contrast(hists: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Split each histogram into two classes and measure their contrast.
+
+    Works on a stack of histograms at once so tile grids and region lists
+    are evaluated without a Python loop.
+
+    Args:
+        hists: (N, HIST_BINS) array of pixel counts
+
+    Returns:
+        Dict of (N,) arrays: contrast_ratio, fg_luminance, bg_luminance,
+        fg_fraction and separation (between-class / total variance)
+    """
+    hists = np.atleast_2d(hists).astype(np.float64)
+    totals = hists.sum(axis=1)
+    safe_totals = np.where(totals > 0, totals, 1.0)
+    bins = np.arange(HIST_BINS, dtype=np.float64)
+
+    # Otsu threshold per histogram
+    p = hists / safe_totals[:, None]
+    omega = np.cumsum(p, axis=1)
+    mu = np.cumsum(p * bins, axis=1)
+    mu_t = mu[:, -1:]
+    denom = omega * (1.0 - omega)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma_b = np.where(denom > 0, (mu_t * omega - mu) ** 2 / denom, 0.0)
+    k = np.argmax(sigma_b, axis=1)
+    rows = np.arange(hists.shape[0])
+
+    sigma_total = (p * (bins - mu_t) ** 2).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        separation = np.where(sigma_total > 0, sigma_b[rows, k] / sigma_total, 0.0)
+
+    # Class medians from the cumulative histogram
+    cum = np.cumsum(hists, axis=1)
+    n_low = cum[rows, k]
+    n_high = totals - n_low
+    low_median = np.argmax(cum >= (n_low / 2.0)[:, None], axis=1)
+    high_median = np.argmax(cum >= (n_low + n_high / 2.0)[:, None], axis=1)
+    low_lum = _BIN_LUMINANCE[low_median]
+    high_lum = _BIN_LUMINANCE[high_median]
+
+    # Foreground is the minority class (glyph ink covers less area)
+    low_is_fg = n_low <= n_high
+    fg_lum = np.where(low_is_fg, low_lum, high_lum)
+    bg_lum = np.where(low_is_fg, high_lum, low_lum)
+    fg_fraction = np.minimum(n_low, n_high) / safe_totals
+
+    return {
+        "contrast_ratio": _contrast_ratio(fg_lum, bg_lum),
+        "fg_luminance": fg_lum,
+        "bg_luminance": bg_lum,
+        "fg_fraction": fg_fraction,
+        "separation": separation,
+    }
+
+
+@dataclass
+class TextRegion:
+    """Text element bounding box in canvas coordinates with its timing tracks."""
+
+    element_id: str
+    bbox: Tuple[float, float, float, float]
+    scene_id: str = ""
+    # (t_ms, value) samples; empty means constant
+    opacity_track: List[Tuple[float, float]] = field(default_factory=list)
+    x_track: List[Tuple[float, float]] = field(default_factory=list)
+    y_track: List[Tuple[float, float]] = field(default_factory=list)
+
+    def opacity_at(self, t_ms: float) -> float:
+        if not self.opacity_track:
+            return 1.0
+        ts, vs = zip(*self.opacity_track)
+        return float(np.interp(t_ms, ts, vs))
+
+    def bbox_at(self, t_ms: float) -> Tuple[float, float, float, float]:
+        x1, y1, x2, y2 = self.bbox
+        if self.x_track:
+            ts, vs = zip(*self.x_track)
+            dx = float(np.interp(t_ms, ts, vs)) - x1
+            x1, x2 = x1 + dx, x2 + dx
+        if self.y_track:
+            ts, vs = zip(*self.y_track)
+            dy = float(np.interp(t_ms, ts, vs)) - y1
+            y1, y2 = y1 + dy, y2 + dy
+        return (x1, y1, x2, y2)
+
+
+def _kf_value(keyframe: Any, attr: str) -> Any:
+    if isinstance(keyframe, dict):
+        return keyframe.get(attr)
+    return getattr(keyframe, attr, None)
+
+
+def _keyframe_track(keyframes: Sequence[Any], attr: str) -> List[Tuple[float, float]]:
+    track = []
+    for kf in keyframes or []:
+        value = _kf_value(kf, attr)
+        if value is not None:
+            track.append((float(_kf_value(kf, "t") or 0), float(value)))
+    return sorted(track)
+
+
+def estimate_text_regions(
+    scene: Dict[str, Any],
+    font_sizes: Optional[Dict[str, int]] = None,
+    fonts: Optional[Dict[str, str]] = None,
+) -> List[TextRegion]:
+    """
+    Estimate text element boxes for a SceneScript scene.
+
+    Uses the same text metrics as anim_fx.make_text_clip, where element x/y
+    is the top-left corner of the clip.
+
+    Args:
+        scene: Scene dictionary from a SceneScript
+        font_sizes: Font size mapping (BrandStyle.font_sizes)
+        fonts: Font family mapping (BrandStyle.fonts)
+
+    Returns:
+        List of TextRegion in canvas (VIDEO_W x VIDEO_H) coordinates
+    """
+    sizes = dict(DEFAULT_FONT_SIZES)
+    sizes.update(font_sizes or {})
+    scene_id = scene.get("id") or scene.get("scene_id") or ""
+    regions = []
+
+    for idx, element in enumerate(scene.get("elements", [])):
+        element_type = element.get("type")
+        if element_type not in TEXT_ELEMENT_TYPES:
+            continue
+
+        style = element.get("style") or {}
+        if element_type == "lower_third":
+            kind = "lower_third"
+        elif element_type == "text":
+            kind = style.get("font_size", "body")
+        else:
+            kind = "body"
+        font_size = sizes.get(kind, sizes["body"])
+
+        content = element.get("content") or ""
+        if element_type == "list_step":
+            content = f"• {content}"
+        elif element_type == "counter":
+            content = f"#{content or '0'}"
+
+        width, height = element.get("width"), element.get("height")
+        if not (width and height):
+            measured = text_block_size(content, font_size, font_for_kind(fonts, kind))
+            width, height = width or measured[0], height or measured[1]
+        x = element.get("x") or 0.0
+        y = element.get("y") or 0.0
+
+        keyframes = element.get("keyframes") or []
+        regions.append(
+            TextRegion(
+                element_id=element.get("id")
+                or element.get("element_id")
+                or f"{scene_id}_element_{idx}",
+                bbox=(float(x), float(y), float(x + width), float(y + height)),
+                scene_id=scene_id,
+                opacity_track=_keyframe_track(keyframes, "opacity"),
+                x_track=_keyframe_track(keyframes, "x"),
+                y_track=_keyframe_track(keyframes, "y"),
+            )
+        )
+
+    return regions
+
+
+def _probe_video(path: str) -> Tuple[int, int, float]:
+    """Return (width, height, fps) of the first video stream."""
+    from pathlib import Path
+
+    from bin.utils.media import ffprobe_json
+
+    info = ffprobe_json(Path(path))
+    for stream in info.get("streams", []):
+        if stream.get("codec_type") == "video":
+            num, _, den = (stream.get("r_frame_rate") or "30/1").partition("/")
+            fps = float(num) / float(den or 1) if float(den or 1) else 30.0
+            return int(stream["width"]), int(stream["height"]), fps
+    raise RuntimeError(f"No video stream found in {path}")
+
+
+def iter_video_frames(
+    path: str, sample_fps: Optional[float] = None, max_width: Optional[int] = 640
+) -> Iterator[Tuple[float, np.ndarray]]:
+    """
+    Decode a video through an ffmpeg rawvideo pipe.
+
+    Args:
+        path: Video file path
+        sample_fps: Frames per second to sample (None = every frame)
+        max_width: Downscale frames wider than this (None = native size)
+
+    Yields:
+        (timestamp_sec, HxWx3 uint8 frame)
+    """
+    src_w, src_h, src_fps = _probe_video(path)
+    out_w, out_h = src_w, src_h
+    if max_width and src_w > max_width:
+        out_w = max_width - (max_width % 2)
+        out_h = max(2, int(round(src_h * out_w / src_w / 2.0)) * 2)
+
+    filters = []
+    if sample_fps:
+        filters.append(f"fps={sample_fps}")
+    if (out_w, out_h) != (src_w, src_h):
+        filters.append(f"scale={out_w}:{out_h}")
+
+    cmd = ["ffmpeg", "-v", "error", "-i", str(path)]
+    if filters:
+        cmd += ["-vf", ",".join(filters)]
+    cmd += ["-f", "rawvideo", "-pix_fmt", "rgb24", "pipe:1"]
+
+    frame_bytes = out_w * out_h * 3
+    step = 1.0 / (sample_fps or src_fps or 30.0)
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=frame_bytes
+    )
+    try:
+        index = 0
+        while True:
+            buf = proc.stdout.read(frame_bytes)
+            if len(buf) < frame_bytes:
+                break
+            frame = np.frombuffer(buf, dtype=np.uint8).reshape(out_h, out_w, 3)
+            yield index * step, frame
+            index += 1
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+
+
+class FrameAnalyzer:
+    """Histogram-based legibility analysis for frames and rendered videos."""
+
+    def __init__(
+        self,
+        min_contrast_ratio: float = 4.5,
+        padding_px: int = 8,
+        tile_px: int = 64,
+        min_fg_fraction: float = 0.02,
+        min_separation: float = 0.75,
+        min_opacity: float = 0.95,
+    ):
+        self.min_contrast_ratio = min_contrast_ratio
+        self.padding_px = padding_px
+        self.tile_px = tile_px
+        self.min_fg_fraction = min_fg_fraction
+        self.min_separation = min_separation
+        self.min_opacity = min_opacity
+
+    def _region_histograms(
+        self, frame: np.ndarray, boxes: Sequence[Tuple[int, int, int, int]]
+    ) -> np.ndarray:
+        # Only the pixels under text boxes are converted to luminance
+        hists = np.zeros((len(boxes), HIST_BINS), dtype=np.int64)
+        for i, (x1, y1, x2, y2) in enumerate(boxes):
+            patch = frame[y1:y2, x1:x2]
+            if patch.size:
+                q = _quantize(luminance_map(patch))
+                hists[i] = np.bincount(q.ravel(), minlength=HIST_BINS)
+        return hists
+
+    def _tile_histograms(self, q: np.ndarray) -> Tuple[np.ndarray, List[Tuple]]:
+        h, w = q.shape
+        tile = max(8, min(self.tile_px, h, w))
+        rows, cols = h // tile, w // tile
+        tiles = (
+            q[: rows * tile, : cols * tile]
+            .reshape(rows, tile, cols, tile)
+            .transpose(0, 2, 1, 3)
+            .reshape(rows * cols, tile * tile)
+        )
+        offsets = (np.arange(rows * cols) * HIST_BINS)[:, None]
+        hists = np.bincount(
+            (tiles + offsets).ravel(), minlength=rows * cols * HIST_BINS
+        ).reshape(rows * cols, HIST_BINS)
+        boxes = [
+            (c * tile, r * tile, (c + 1) * tile, (r + 1) * tile)
+            for r in range(rows)
+            for c in range(cols)
+        ]
+        return hists, boxes
+
+    def _pixel_boxes(
+        self,
+        regions: Sequence[TextRegion],
+        t_ms: float,
+        frame_w: int,
+        frame_h: int,
+        canvas: Tuple[int, int],
+    ) -> List[Tuple[int, int, int, int]]:
+        sx = frame_w / float(canvas[0])
+        sy = frame_h / float(canvas[1])
+        pad = self.padding_px
+        boxes = []
+        for region in regions:
+            x1, y1, x2, y2 = region.bbox_at(t_ms)
+            boxes.append(
+                (
+                    int(np.clip(x1 * sx - pad, 0, frame_w)),
+                    int(np.clip(y1 * sy - pad, 0, frame_h)),
+                    int(np.clip(x2 * sx + pad, 0, frame_w)),
+                    int(np.clip(y2 * sy + pad, 0, frame_h)),
+                )
+            )
+        return boxes
+
+    def analyze_frame(
+        self,
+        frame: Union[np.ndarray, "PIL.Image.Image"],
+        regions: Optional[Sequence[TextRegion]] = None,
+        t_ms: float = 0.0,
+        canvas: Tuple[int, int] = (VIDEO_W, VIDEO_H),
+    ) -> Dict[str, Any]:
+        """
+        Measure contrast for the text regions of one frame.
+
+        Without regions, the frame is divided into tiles and every tile whose
+        histogram is clearly bimodal (text-like) is measured instead.
+
+        Args:
+            frame: HxWx3 uint8 array or PIL Image
+            regions: Text regions in canvas coordinates
+            t_ms: Frame time, used for opacity/position tracks
+            canvas: Coordinate space of the regions
+
+        Returns:
+            Dict with per-region measurements and summary statistics
+        """
+        if not isinstance(frame, np.ndarray):
+            frame = np.asarray(frame.convert("RGB") if frame.mode != "RGB" else frame)
+        frame_h, frame_w = frame.shape[:2]
+
+        if regions is not None:
+            visible = [r for r in regions if r.opacity_at(t_ms) >= self.min_opacity]
+            boxes = self._pixel_boxes(visible, t_ms, frame_w, frame_h, canvas)
+            stats = histogram_contrast(self._region_histograms(frame, boxes))
+            # A text box without a distinguishable foreground is illegible
+            contrast = np.where(
+                stats["fg_fraction"] >= self.min_fg_fraction,
+                stats["contrast_ratio"],
+                1.0,
+            )
+            ids = [r.element_id for r in visible]
+            mode = "regions"
+        else:
+            hists, boxes = self._tile_histograms(_quantize(luminance_map(frame)))
+            stats = histogram_contrast(hists)
+            text_like = (stats["fg_fraction"] >= self.min_fg_fraction) & (
+                stats["separation"] >= self.min_separation
+            )
+            keep = np.flatnonzero(text_like)
+            boxes = [boxes[i] for i in keep]
+            stats = {key: value[keep] for key, value in stats.items()}
+            contrast = stats["contrast_ratio"]
+            ids = [f"tile_{x1}_{y1}" for x1, y1, _, _ in boxes]
+            mode = "tiles"
+
+        measurements = [
+            {
+                "element_id": ids[i],
+                "bbox": list(boxes[i]),
+                "contrast_ratio": round(float(contrast[i]), 3),
+                "fg_luminance": round(float(stats["fg_luminance"][i]), 4),
+                "bg_luminance": round(float(stats["bg_luminance"][i]), 4),
+                "fg_fraction": round(float(stats["fg_fraction"][i]), 4),
+                "passes": bool(contrast[i] >= self.min_contrast_ratio),
+            }
+            for i in range(len(ids))
+        ]
+
+        return {
+            "mode": mode,
+            "frame_size": [frame_w, frame_h],
+            "region_count": len(measurements),
+            "min_contrast": float(contrast.min()) if len(contrast) else None,
+            "max_contrast": float(contrast.max()) if len(contrast) else None,
+            "avg_contrast": float(contrast.mean()) if len(contrast) else None,
+            "regions": measurements,
+        }
+
+    def analyze_video(
+        self,
+        video_path: str,
+        regions: Optional[Sequence[TextRegion]] = None,
+        sample_fps: Optional[float] = None,
+        max_width: Optional[int] = 640,
+        canvas: Tuple[int, int] = (VIDEO_W, VIDEO_H),
+    ) -> Dict[str, Any]:
+        """
+        Measure text contrast across every sampled frame of a video.
+
+        Args:
+            video_path: Rendered video file
+            regions: Text regions in canvas coordinates (None = tile mode)
+            sample_fps: Frames per second to sample (None = every frame)
+            max_width: Downscale width for analysis
+            canvas: Coordinate space of the regions
+
+        Returns:
+            Dict with per-element worst-case contrast and throughput stats
+        """
+        start = time.time()
+        frames = 0
+        worst: Dict[str, Dict[str, Any]] = {}
+
+        for t_sec, frame in iter_video_frames(video_path, sample_fps, max_width):
+            frames += 1
+            result = self.analyze_frame(frame, regions, t_sec * 1000.0, canvas)
+            for measurement in result["regions"]:
+                key = measurement["element_id"]
+                entry = worst.setdefault(
+                    key,
+                    {
+                        "element_id": key,
+                        "frames_measured": 0,
+                        "frames_failed": 0,
+                        "min_contrast": float("inf"),
+                        "worst_time_sec": None,
+                    },
+                )
+                entry["frames_measured"] += 1
+                if not measurement["passes"]:
+                    entry["frames_failed"] += 1
+                if measurement["contrast_ratio"] < entry["min_contrast"]:
+                    entry["min_contrast"] = measurement["contrast_ratio"]
+                    entry["worst_time_sec"] = round(t_sec, 3)
+
+        elapsed = time.time() - start
+        elements = sorted(worst.values(), key=lambda e: e["min_contrast"])
+        failing = [e for e in elements if e["frames_failed"] > 0]
+
+        log.info(
+            f"[frame-qa] {video_path}: {frames} frames in {elapsed:.2f}s, "
+            f"{len(failing)}/{len(elements)} regions below {self.min_contrast_ratio}"
+        )
+
+        return {
+            "video": str(video_path),
+            "valid": not failing,
+            "frames_analyzed": frames,
+            "elapsed_sec": round(elapsed, 3),
+            "frames_per_sec": round(frames / elapsed, 1) if elapsed > 0 else None,
+            "min_contrast": elements[0]["min_contrast"] if elements else None,
+            "threshold": self.min_contrast_ratio,
+            "elements": elements,
+            "failing_elements": [e["element_id"] for e in failing],
+        }
@@ -5,13 +5,21 @@ Procedural Motif Generators for Mid-Century Design System
 This module generates SVG motifs programmatically for backgrounds and props,
 respecting brand palette and safe margins. All functions are deterministic
 given the same seed parameters.
+
+Randomness comes from a ``random.Random`` instance created per call, never
+from the global ``random`` state, so generators can run concurrently in a
+worker pool (see ``generate_motifs_batch``) without disturbing each other.
 """
 
 import hashlib
 import json
 import math
+import os
 import random
-from typing import List, Optional, Tuple
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 from pathlib import Path
 
@@ -52,23 +60,19 @@ def _load_design_colors() -> dict:
 
 
 def pick_scene_colors(
-    palette: List[str], n: int = 3, seed: Optional[int] = None
+    palette: List[str],
+    n: int = 3,
+    seed: Optional[int] = None,
+    rng: Optional[random.Random] = None,
 ) -> List[str]:
     """Select n colors from palette for a scene, respecting max_colors_per_scene rule."""
-    if seed is not None:
-        random.seed(seed)
+    rng = rng or random.Random(seed)
 
     # Ensure we don't exceed palette size
     n = min(n, len(palette))
 
     # Random selection without replacement
-    selected = random.sample(palette, n)
-
-    # Reset seed to avoid affecting other functions
-    if seed is not None:
-        random.seed()
-
-    return selected
+    return rng.sample(palette, n)
 
 
 # ============================================================================
@@ -77,19 +81,23 @@ def pick_scene_colors(
 
 
 def _add_jitter(
-    value: float, max_jitter: float = 2.0, seed: Optional[int] = None
+    value: float,
+    max_jitter: float = 2.0,
+    seed: Optional[int] = None,
+    rng: Optional[random.Random] = None,
 ) -> float:
-    """Add slight jitter for hand-cut aesthetic."""
-    if seed is not None:
-        random.seed(seed)
-
-    jitter = random.uniform(-max_jitter, max_jitter)
-    result = value + jitter
+    """
+    Add slight jitter for hand-cut aesthetic.
 
+    A given ``seed`` always yields the same jitter; without one the caller's
+    ``rng`` (or a fresh unseeded generator) is used.
+    """
     if seed is not None:
-        random.seed()
+        rng = random.Random(seed)
+    elif rng is None:
+        rng = random.Random()
 
-    return result
+    return value + rng.uniform(-max_jitter, max_jitter)
 
 
 def _validate_color(color: str, allowed_colors: dict) -> bool:
@@ -143,8 +151,7 @@ def make_starburst(
     Returns:
         SVG string with starburst pattern
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = random.Random(seed)
 
     # Validate colors against design palette
     allowed_colors = _load_design_colors()
@@ -163,7 +170,9 @@ def make_starburst(
 
     # Add spokes
     for i in range(spokes):
-        angle = (i * 360 / spokes) + _add_jitter(0, 1.0, seed + i if seed else None)
+        angle = (i * 360 / spokes) + _add_jitter(
+            0, 1.0, seed + i if seed else None, rng
+        )
         angle_rad = math.radians(angle)
 
         # Inner point
@@ -175,8 +184,8 @@ def make_starburst(
         y2 = cy + outer * math.sin(angle_rad)
 
         # Add slight jitter to end points
-        x2 = _add_jitter(x2, 1.5, seed + i * 100 if seed else None)
-        y2 = _add_jitter(y2, 1.5, seed + i * 100 if seed else None)
+        x2 = _add_jitter(x2, 1.5, seed + i * 100 if seed else None, rng)
+        y2 = _add_jitter(y2, 1.5, seed + i * 100 if seed else None, rng)
 
         svg_elements.append(
             f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}" '
@@ -193,10 +202,6 @@ def make_starburst(
         f'<circle cx="{cx}" cy="{cy}" r="{inner//2}" fill="{color_knobs}"/>'
     )
 
-    # Reset seed
-    if seed is not None:
-        random.seed()
-
     # Assemble SVG
     svg_content = "\n  ".join(svg_elements)
 
@@ -229,8 +234,7 @@ def make_boomerang(
     Returns:
         SVG string with boomerang shape
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = random.Random(seed)
 
     # Validate color
     allowed_colors = _load_design_colors()
@@ -245,8 +249,8 @@ def make_boomerang(
     half_h = h // 2
 
     # Add slight jitter for organic feel
-    jitter_w = _add_jitter(half_w, 3.0, seed)
-    jitter_h = _add_jitter(half_h, 3.0, seed)
+    jitter_w = _add_jitter(half_w, 3.0, seed, rng)
+    jitter_h = _add_jitter(half_h, 3.0, seed, rng)
 
     # Define boomerang path
     path_data = [
@@ -263,10 +267,6 @@ def make_boomerang(
     viewbox_w = margin * 2
     viewbox_h = margin * 2
 
-    # Reset seed
-    if seed is not None:
-        random.seed()
-
     return f"""<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {viewbox_w} {viewbox_h}">
   <desc>Boomerang shape with mid-century organic curves</desc>
@@ -298,8 +298,7 @@ def make_cutout_collage(
     Returns:
         SVG string with organic cutout collage
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = random.Random(seed)
 
     # Validate colors
     allowed_colors = _load_design_colors()
@@ -324,16 +323,17 @@ def make_cutout_collage(
         base_y = (row + 0.5) * (h / grid_size)
 
         # Add jitter
-        x = _add_jitter(base_x, w // (grid_size * 4), seed + i * 10)
-        y = _add_jitter(base_y, h // (grid_size * 4), seed + i * 10)
+        jitter_seed = seed + i * 10 if seed is not None else None
+        x = _add_jitter(base_x, w // (grid_size * 4), jitter_seed, rng)
+        y = _add_jitter(base_y, h // (grid_size * 4), jitter_seed, rng)
 
         # Ensure within bounds
         x = max(SAFE_MARGINS_PX, min(w - SAFE_MARGINS_PX, x))
         y = max(SAFE_MARGINS_PX, min(h - SAFE_MARGINS_PX, y))
 
         # Random size and color
-        size = random.uniform(20, 60)
-        color = random.choice(palette)
+        size = rng.uniform(20, 60)
+        color = rng.choice(palette)
 
         cutouts.append(
             {
@@ -341,8 +341,8 @@ def make_cutout_collage(
                 "y": y,
                 "size": size,
                 "color": color,
-                "rotation": random.uniform(0, 360),
-                "shape_type": random.choice(["leaf", "coral", "blob"]),
+                "rotation": rng.uniform(0, 360),
+                "shape_type": rng.choice(["leaf", "coral", "blob"]),
             }
         )
 
@@ -357,12 +357,13 @@ def make_cutout_collage(
         shape_type = cutout["shape_type"]
 
         # Generate organic shape path
+        shape_seed = seed + i * 100 if seed is not None else rng.getrandbits(32)
         if shape_type == "leaf":
-            path = _generate_leaf_path(x, y, size, seed + i * 100)
+            path = _generate_leaf_path(x, y, size, shape_seed)
         elif shape_type == "coral":
-            path = _generate_coral_path(x, y, size, seed + i * 100)
+            path = _generate_coral_path(x, y, size, shape_seed)
         else:  # blob
-            path = _generate_blob_path(x, y, size, seed + i * 100)
+            path = _generate_blob_path(x, y, size, shape_seed)
 
         svg_elements.append(
             f'<g transform="translate({x} {y}) rotate({rotation})">'
@@ -370,10 +371,6 @@ def make_cutout_collage(
             f"</g>"
         )
 
-    # Reset seed
-    if seed is not None:
-        random.seed()
-
     # Assemble SVG
     svg_content = "\n  ".join(svg_elements)
 
@@ -386,8 +383,6 @@ def make_cutout_collage(
 
 def _generate_leaf_path(x: float, y: float, size: float, seed: int) -> str:
     """Generate leaf-shaped path."""
-    random.seed(seed)
-
     # Leaf parameters
     length = size
     width = size * 0.6
@@ -406,26 +401,25 @@ def _generate_leaf_path(x: float, y: float, size: float, seed: int) -> str:
         f"Q {x - width * 0.3} {y + width * 0.5} {x} {y}",  # Back to stem
     ]
 
-    random.seed()
     return " ".join(path)
 
 
 def _generate_coral_path(x: float, y: float, size: float, seed: int) -> str:
     """Generate coral-shaped path."""
-    random.seed(seed)
+    rng = random.Random(seed)
 
     # Coral parameters
     height = size
     width = size * 0.8
 
     # Generate branching structure
-    branches = random.randint(3, 6)
+    branches = rng.randint(3, 6)
     path = [f"M {x} {y + height}"]  # Start at base
 
     for i in range(branches):
-        angle = (i * 360 / branches) + random.uniform(-15, 15)
+        angle = (i * 360 / branches) + rng.uniform(-15, 15)
         angle_rad = math.radians(angle)
-        branch_length = random.uniform(height * 0.3, height * 0.7)
+        branch_length = rng.uniform(height * 0.3, height * 0.7)
 
         end_x = x + math.cos(angle_rad) * branch_length
         end_y = y + height - math.sin(angle_rad) * branch_length
@@ -438,19 +432,18 @@ def _generate_coral_path(x: float, y: float, size: float, seed: int) -> str:
 
     path.append(f"L {x} {y + height} Z")  # Close back to base
 
-    random.seed()
     return " ".join(path)
 
 
 def _generate_blob_path(x: float, y: float, size: float, seed: int) -> str:
     """Generate organic blob path."""
-    random.seed(seed)
+    rng = random.Random(seed)
 
     # Blob parameters
     radius = size * 0.5
 
     # Generate irregular circle with multiple control points
-    points = random.randint(6, 10)
+    points = rng.randint(6, 10)
     path = []
 
     for i in range(points):
@@ -458,7 +451,7 @@ def _generate_blob_path(x: float, y: float, size: float, seed: int) -> str:
         angle_rad = math.radians(angle)
 
         # Vary radius for organic feel
-        r = radius + random.uniform(-radius * 0.3, radius * 0.3)
+        r = radius + rng.uniform(-radius * 0.3, radius * 0.3)
 
         px = x + r * math.cos(angle_rad)
         py = y + r * math.sin(angle_rad)
@@ -469,7 +462,7 @@ def _generate_blob_path(x: float, y: float, size: float, seed: int) -> str:
             # Add control point for smooth curves
             prev_angle = (i - 1) * 360 / points
             prev_angle_rad = math.radians(prev_angle)
-            prev_r = radius + random.uniform(-radius * 0.3, radius * 0.3)
+            prev_r = radius + rng.uniform(-radius * 0.3, radius * 0.3)
 
             cp_x = x + (prev_r + r) * 0.5 * math.cos((prev_angle + angle) * 0.5)
             cp_y = y + (prev_r + r) * 0.5 * math.sin((prev_angle + angle) * 0.5)
@@ -478,7 +471,6 @@ def _generate_blob_path(x: float, y: float, size: float, seed: int) -> str:
 
     path.append("Z")  # Close path
 
-    random.seed()
     return " ".join(path)
 
 
@@ -516,11 +508,43 @@ def save_to_cache(svg_str: str, params: dict, cache_dir: str = "render_cache") -
     """
     cache_key = _generate_cache_key(params)
     cache_path = Path(cache_dir) / f"{cache_key}.svg"
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-    save_svg(svg_str, str(cache_path))
+    # Write to a temp file and rename so concurrent writers of the same key
+    # never expose a partially written SVG to readers
+    fd, tmp_path = tempfile.mkstemp(
+        dir=str(cache_path.parent), prefix=f".{cache_key}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(svg_str)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
     return str(cache_path)
 
 
+def load_from_cache(params: dict, cache_dir: str = "render_cache") -> Optional[str]:
+    """
+    Load a previously cached SVG for the given parameters.
+
+    Args:
+        params: Function parameters used for cache key generation
+        cache_dir: Cache directory path
+
+    Returns:
+        SVG content string, or None on cache miss
+    """
+    cache_path = Path(cache_dir) / f"{_generate_cache_key(params)}.svg"
+    try:
+        with open(cache_path, "r") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
 def generate_background_motif(
     motif_type: str,
     colors: List[str],
@@ -541,9 +565,6 @@ def generate_background_motif(
     Returns:
         SVG string or None if generation fails
     """
-    if seed is not None:
-        random.seed(seed)
-
     try:
         if motif_type == "starburst":
             # Use first two colors for spokes and knobs
@@ -568,10 +589,13 @@ def generate_background_motif(
                 seed=seed,
             )
         elif motif_type == "cutout_collage":
-            # Use first color for cutouts
-            color = colors[0] if colors else "#1C4FA1"
+            # Up to three palette colors for the cutouts
             return make_cutout_collage(
-                width=width, height=height, color=color, seed=seed
+                w=width,
+                h=height,
+                n=12,
+                palette=colors[:3] or ["#1C4FA1"],
+                seed=seed,
             )
         else:
             # Default to starburst
@@ -587,9 +611,6 @@ def generate_background_motif(
     except Exception as e:
         print(f"Failed to generate background motif: {e}")
         return None
-    finally:
-        if seed is not None:
-            random.seed()
 
 
 def generate_prop_motif(
@@ -612,9 +633,6 @@ def generate_prop_motif(
     Returns:
         SVG string or None if generation fails
     """
-    if seed is not None:
-        random.seed(seed)
-
     try:
         # Pick primary color for the prop
         primary_color = colors[0] if colors else "#1C4FA1"
@@ -637,9 +655,6 @@ def generate_prop_motif(
     except Exception as e:
         print(f"Failed to generate prop motif: {e}")
         return None
-    finally:
-        if seed is not None:
-            random.seed()
 
 
 def generate_character_motif(
@@ -662,9 +677,6 @@ def generate_character_motif(
     Returns:
         SVG string or None if generation fails
     """
-    if seed is not None:
-        random.seed(seed)
-
     try:
         # Pick primary color for the character
         primary_color = colors[0] if colors else "#1C4FA1"
@@ -691,9 +703,6 @@ def generate_character_motif(
     except Exception as e:
         print(f"Failed to generate character motif: {e}")
         return None
-    finally:
-        if seed is not None:
-            random.seed()
 
 
 def _make_phone_prop(
@@ -834,6 +843,128 @@ def _make_generic_character(
     return svg
 
 
+# ============================================================================
+# CACHED AND BATCH GENERATION
+# ============================================================================
+
+_MOTIF_GENERATORS = {
+    "background": generate_background_motif,
+    "prop": generate_prop_motif,
+    "character": generate_character_motif,
+}
+
+
+@dataclass
+class MotifRequest:
+    """A single motif to generate: kind is background, prop or character."""
+
+    kind: str
+    motif_type: str
+    colors: List[str] = field(default_factory=list)
+    seed: Optional[int] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+
+    def params(self) -> dict:
+        """Parameters identifying this motif for cache keys."""
+        return {
+            "kind": self.kind,
+            "motif_type": self.motif_type,
+            "colors": list(self.colors),
+            "seed": self.seed,
+            "width": self.width,
+            "height": self.height,
+        }
+
+
+def generate_motif_cached(
+    request: MotifRequest, cache_dir: Optional[str] = "render_cache"
+) -> Optional[str]:
+    """
+    Generate a motif, reading through the SVG cache.
+
+    Only seeded requests are cached, since unseeded output is not
+    reproducible.
+
+    Args:
+        request: Motif to generate
+        cache_dir: Cache directory path (None disables caching)
+
+    Returns:
+        SVG string or None if generation fails
+    """
+    generator = _MOTIF_GENERATORS.get(request.kind)
+    if generator is None:
+        raise ValueError(f"Unknown motif kind: {request.kind}")
+
+    cacheable = cache_dir is not None and request.seed is not None
+    params = request.params()
+    if cacheable:
+        cached = load_from_cache(params, cache_dir)
+        if cached is not None:
+            return cached
+
+    kwargs = {"seed": request.seed}
+    if request.width is not None:
+        kwargs["width"] = request.width
+    if request.height is not None:
+        kwargs["height"] = request.height
+    svg = generator(request.motif_type, list(request.colors), **kwargs)
+
+    if svg is not None and cacheable:
+        save_to_cache(svg, params, cache_dir)
+    return svg
+
+
+def generate_motifs_batch(
+    requests: List[MotifRequest],
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[str] = "render_cache",
+) -> List[Optional[str]]:
+    """
+    Generate many motifs in a worker pool.
+
+    Identical seeded requests are generated once; results are returned in
+    request order and match what sequential calls would produce.
+
+    Args:
+        requests: Motifs to generate
+        max_workers: Pool size (defaults to CPU count, capped at 8)
+        cache_dir: Cache directory path (None disables caching)
+
+    Returns:
+        List of SVG strings (None where generation failed)
+    """
+    if not requests:
+        return []
+
+    unique: Dict[str, MotifRequest] = {}
+    keys = []
+    for i, request in enumerate(requests):
+        if request.seed is None:
+            key = f"unseeded:{i}"
+        else:
+            key = _generate_cache_key(request.params())
+        unique.setdefault(key, request)
+        keys.append(key)
+
+    workers = max_workers or min(8, os.cpu_count() or 1)
+    workers = max(1, min(workers, len(unique)))
+    if workers == 1:
+        results = {
+            key: generate_motif_cached(req, cache_dir) for key, req in unique.items()
+        }
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                key: pool.submit(generate_motif_cached, req, cache_dir)
+                for key, req in unique.items()
+            }
+            results = {key: future.result() for key, future in futures.items()}
+
+    return [results[key] for key in keys]
+
+
 # ============================================================================
 # EXPORTS
 # ============================================================================
@@ -844,6 +975,10 @@ __all__ = [
     "make_cutout_collage",
     "save_svg",
     "save_to_cache",
+    "load_from_cache",
+    "MotifRequest",
+    "generate_motif_cached",
+    "generate_motifs_batch",
     "pick_scene_colors",
     "generate_background_motif",
     "generate_prop_motif",
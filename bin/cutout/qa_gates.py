@@ -338,75 +338,59 @@ def check_asset_quality(
 
 
 def check_frame_contrast(
-    img: "PIL.Image.Image", min_contrast_ratio: float = 4.5
+    img: "PIL.Image.Image",
+    min_contrast_ratio: float = 4.5,
+    text_regions: Optional[List["TextRegion"]] = None,
+    t_ms: float = 0.0,
+    tile_px: int = 64,
 ) -> QAResult:
     """
     Check contrast and legibility of a single image frame.
 
+    The frame's luminance map is computed once and contrast is measured per
+    text region from foreground/background luminance histograms. Without
+    text regions, every text-like (bimodal) tile of the frame is measured.
+
     Args:
-        img: PIL Image to check
+        img: PIL Image (or HxWx3 uint8 array) to check
         min_contrast_ratio: Minimum acceptable contrast ratio (WCAG AA = 4.5)
+        text_regions: Optional text element boxes (see frame_analyzer)
+        t_ms: Frame time for keyframed regions
+        tile_px: Tile size for tile mode (scale it down with the frame)
 
     Returns:
         QAResult with contrast validation results
     """
+    from .frame_analyzer import FrameAnalyzer
+
     fails = []
     warnings = []
     details = {"contrast_checks": [], "overall_contrast": 0.0}
 
     try:
-        # Convert to RGB if needed
-        if img.mode != "RGB":
-            img = img.convert("RGB")
-
-        # Get image dimensions
-        width, height = img.size
-
-        # Sample points across the image for contrast analysis
-        sample_points = []
-        step = max(1, min(width, height) // 20)  # Sample every 20th pixel
-
-        for y in range(0, height, step):
-            for x in range(0, width, step):
-                sample_points.append((x, y))
-
-        # Limit samples to reasonable number
-        if len(sample_points) > 100:
-            sample_points = sample_points[:: len(sample_points) // 100]
-
-        # Analyze contrast between adjacent samples
-        contrast_ratios = []
-        for i in range(len(sample_points) - 1):
-            x1, y1 = sample_points[i]
-            x2, y2 = sample_points[i + 1]
-
-            # Get colors at sample points
-            color1 = img.getpixel((x1, y1))
-            color2 = img.getpixel((x2, y2))
-
-            # Calculate luminance for each color
-            lum1 = calculate_luminance(*color1)
-            lum2 = calculate_luminance(*color2)
+        analyzer = FrameAnalyzer(min_contrast_ratio=min_contrast_ratio, tile_px=tile_px)
+        analysis = analyzer.analyze_frame(img, text_regions, t_ms)
 
-            # Calculate contrast ratio
-            contrast = calculate_contrast_ratio(lum1, lum2)
-            contrast_ratios.append(contrast)
+        details["mode"] = analysis["mode"]
+        details["sample_count"] = analysis["region_count"]
+        details["regions"] = analysis["regions"]
 
-        if contrast_ratios:
-            # Calculate overall contrast metrics
-            avg_contrast = sum(contrast_ratios) / len(contrast_ratios)
-            min_contrast = min(contrast_ratios)
-            max_contrast = max(contrast_ratios)
+        if analysis["region_count"]:
+            avg_contrast = analysis["avg_contrast"]
+            min_contrast = analysis["min_contrast"]
+            max_contrast = analysis["max_contrast"]
 
             details["overall_contrast"] = avg_contrast
             details["min_contrast"] = min_contrast
             details["max_contrast"] = max_contrast
-            details["sample_count"] = len(contrast_ratios)
 
             # Check if minimum contrast is met
-            if min_contrast < min_contrast_ratio:
+            failing = [r for r in analysis["regions"] if not r["passes"]]
+            if failing:
+                worst = min(failing, key=lambda r: r["contrast_ratio"])
                 fails.append(
-                    f"Minimum contrast ratio {min_contrast:.2f} below threshold {min_contrast_ratio}"
+                    f"Minimum contrast ratio {min_contrast:.2f} below threshold {min_contrast_ratio} "
+                    f"({len(failing)} region(s), worst: {worst['element_id']})"
                 )
 
             # Warn if average contrast is low
@@ -424,8 +408,10 @@ def check_frame_contrast(
                     "threshold": min_contrast_ratio,
                 }
             )
+        elif text_regions:
+            warnings.append("No text regions visible at this frame time")
         else:
-            fails.append("Unable to sample image for contrast analysis")
+            warnings.append("No text-like regions detected for contrast analysis")
 
     except Exception as e:
         fails.append(f"Contrast analysis failed: {e}")
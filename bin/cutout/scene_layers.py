@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Static-Layer Flattening and Hold Frames
+
+Most animatics scenes are a background plus a handful of elements, of which
+few move. This module splits a scene's layers into static and animated sets,
+flattens each run of consecutive static layers into one raster (so z-order is
+preserved), and only composites the animated layers per frame. Frames where
+no animated layer changes are emitted as held copies of the previous frame.
+
+Layer motion comes from the keyframe tables the renderer itself uses
+(keyframe_engine.KeyframeTrack), including micro-animation keyframes written
+by MicroAnimationGenerator.generate_scene_animations.
+
+Public API:
+- keyframe_motion(keyframes, duration, fps) -> Optional[np.ndarray]
+- flatten_scene(clips, motion, duration, fps, size) -> (VideoClip, LayerPlan)
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from bin.core import get_logger
+
+from .keyframe_engine import PROPERTIES, KeyframeTrack
+from .sdk import FPS, VIDEO_H, VIDEO_W, Keyframe
+
+log = get_logger("scene_layers")
+
+
+@dataclass
+class LayerPlan:
+    """How a scene's layers were split and how many frames need compositing."""
+
+    total_frames: int
+    rendered_frames: int
+    static_layers: int
+    animated_layers: int
+    static_groups: int
+
+    @property
+    def held_frames(self) -> int:
+        return self.total_frames - self.rendered_frames
+
+    @property
+    def speedup(self) -> float:
+        """
+        Estimated compositing speed-up from layer blits per scene.
+
+        Unflattened, every layer is blitted on every frame. Flattened, static
+        layers are blitted once, and each rendered frame blits the animated
+        layers plus one raster per static group; held frames cost nothing.
+        """
+        layers = self.static_layers + self.animated_layers
+        before = layers * self.total_frames
+        after = self.static_layers + self.rendered_frames * (
+            self.animated_layers + self.static_groups
+        )
+        return before / after if after else 1.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["held_frames"] = self.held_frames
+        data["speedup"] = round(self.speedup, 2)
+        return data
+
+
+def keyframe_motion(
+    keyframes: Optional[Sequence[Keyframe]], duration: float, fps: float = FPS
+) -> Optional[np.ndarray]:
+    """
+    Frames at which a keyframed layer differs from the previous frame.
+
+    Args:
+        keyframes: Element keyframes (None or empty for a static element)
+        duration: Scene duration in seconds
+        fps: Output frame rate
+
+    Returns:
+        Boolean array, one entry per frame (entry 0 is False), or None when
+        the layer never changes
+    """
+    if not keyframes:
+        return None
+    track = KeyframeTrack.compile(keyframes, duration, fps)
+    tables = np.vstack([getattr(track, prop) for prop in PROPERTIES])
+    changed = np.zeros(len(track), dtype=bool)
+    changed[1:] = np.any(np.diff(tables, axis=1) != 0, axis=0)
+    return changed if changed.any() else None
+
+
+def _flatten(clips: Sequence, size: Tuple[int, int]):
+    """
+    Composite static clips at t=0 into one ImageClip with an exact "over".
+
+    The result is cropped to the covered area. A fully opaque result has no
+    mask, so compositing it is a plain copy.
+    """
+    from moviepy.editor import ImageClip
+
+    w, h = size
+    premultiplied = np.zeros((h, w, 3))
+    alpha = np.zeros((h, w))
+    for clip in clips:
+        # Blitting onto black accumulates colour * alpha; blitting the mask
+        # onto zeros gives the clip's placed alpha
+        premultiplied = clip.blit_on(premultiplied, 0)
+        mask = clip.mask if clip.mask is not None else clip.add_mask().mask
+        placed = mask.set_position(clip.pos).blit_on(np.zeros((h, w)), 0)
+        alpha = placed + (1.0 - placed) * alpha
+
+    if alpha.min() >= 1.0:
+        return ImageClip(premultiplied)
+    rows, cols = np.nonzero(alpha)
+    if not len(rows):
+        return None
+    y0, y1, x0, x1 = rows.min(), rows.max() + 1, cols.min(), cols.max() + 1
+    alpha = alpha[y0:y1, x0:x1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rgb = premultiplied[y0:y1, x0:x1] / alpha[..., None]
+    rgb[alpha == 0] = 0.0
+    flat = ImageClip(rgb).set_mask(ImageClip(alpha, ismask=True))
+    return flat.set_position((int(x0), int(y0)))
+
+
+def flatten_scene(
+    clips: Sequence,
+    motion: Sequence[Optional[np.ndarray]],
+    duration: float,
+    fps: float = FPS,
+    size: Tuple[int, int] = (VIDEO_W, VIDEO_H),
+):
+    """
+    Build a scene clip with static layers pre-flattened and held frames.
+
+    Args:
+        clips: Layer clips, bottom to top
+        motion: Per layer, None if static for the whole scene, otherwise a
+            boolean array of frames where it differs from the previous frame
+        duration: Scene duration in seconds
+        fps: Output frame rate
+        size: Output frame size
+
+    Returns:
+        (clip, plan): the scene clip and its LayerPlan
+    """
+    from moviepy.editor import ColorClip, CompositeVideoClip, VideoClip
+
+    total_frames = max(1, int(round(duration * fps)))
+    changed = np.zeros(total_frames, dtype=bool)
+
+    layers: List = []
+    pending_static: List = []
+    static_layers = animated_layers = static_groups = 0
+    opaque_bottom = False
+
+    def flush():
+        nonlocal static_groups, opaque_bottom
+        flat = _flatten(pending_static, size) if pending_static else None
+        if flat is not None:
+            # An opaque bottom raster becomes the composite's background
+            opaque_bottom = opaque_bottom or (not layers and flat.mask is None)
+            layers.append(flat)
+            static_groups += 1
+        pending_static.clear()
+
+    for clip, moves in zip(clips, motion):
+        if moves is None or not moves.any():
+            pending_static.append(clip)
+            static_layers += 1
+            continue
+        flush()
+        layers.append(clip)
+        animated_layers += 1
+        n = min(len(moves), total_frames)
+        changed[:n] |= moves[:n]
+    flush()
+
+    changed[0] = True
+    # Each frame shows the most recent frame at which something changed
+    source_frame = np.maximum.accumulate(
+        np.where(changed, np.arange(total_frames), 0)
+    )
+    plan = LayerPlan(
+        total_frames=total_frames,
+        rendered_frames=int(changed.sum()),
+        static_layers=static_layers,
+        animated_layers=animated_layers,
+        static_groups=static_groups,
+    )
+
+    layers = [layer.set_duration(duration) for layer in layers] or [
+        ColorClip(size, color=(0, 0, 0), duration=duration)
+    ]
+    if opaque_bottom and len(layers) == 1:
+        composite = layers[0]
+    else:
+        composite = CompositeVideoClip(layers, size=size, use_bgclip=opaque_bottom)
+    last: Dict[str, Any] = {"frame": None, "image": None}
+
+    def make_frame(t: float) -> np.ndarray:
+        i = min(max(int(round(t * fps)), 0), total_frames - 1)
+        frame = int(source_frame[i])
+        if last["frame"] != frame:
+            last["frame"] = frame
+            last["image"] = composite.get_frame(frame / fps)
+        return last["image"]
+
+    return VideoClip(make_frame, duration=duration), plan
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Text Renderer and Text Block Cache
+
+Pillow/FreeType text rendering for animatics text elements (hooks, body
+text, lower thirds). Glyphs are rasterized once per font and size into a
+shelf-packed glyph atlas; lines are laid out from the atlas with real
+advances and pair kerning, wrapped to a target width and composited into
+an RGBA block.
+
+Whole rendered blocks are cached on disk (render_cache/text) and in memory,
+keyed by text, resolved font, size, colour, kind and wrap width, so the same
+hook or lower third across scenes and jobs costs a cache lookup.
+
+Fonts are resolved by family name from the brand font directory and the
+usual system font directories. When no usable TrueType/OpenType file is
+found, Pillow's built-in bitmap font is scaled to the requested size.
+
+Public API:
+- render_text_block(text, style, kind, max_width) -> PIL.Image (RGBA)
+- text_block_size(text, font_size, font_path, max_width) -> (width, height)
+- font_for_kind(fonts, kind) -> Optional[str]
+- get_atlas(font_path, size) -> GlyphAtlas
+"""
+
+import hashlib
+import json
+import math
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pathlib import Path
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from bin.core import get_logger
+
+from .sdk import LINE_HEIGHT, SAFE_MARGINS_PX, VIDEO_W, BrandStyle
+
+log = get_logger("text_render")
+
+CACHE_DIR = Path("render_cache") / "text"
+RENDER_VERSION = 1
+MEMORY_CACHE_SIZE = 128
+
+FONT_DIRS = [
+    Path("assets/brand/fonts"),
+    Path("assets/fonts"),
+    Path.home() / ".fonts",
+    Path("/usr/share/fonts"),
+    Path("/usr/local/share/fonts"),
+    Path("/Library/Fonts"),
+    Path("/System/Library/Fonts"),
+    Path("C:/Windows/Fonts"),
+]
+FONT_EXTENSIONS = (".ttf", ".otf", ".ttc")
+
+# Padding around the text in a rendered block
+PADDING_PX = 10
+# Default wrap width: the frame minus the safe margins
+DEFAULT_MAX_WIDTH = VIDEO_W - 2 * SAFE_MARGINS_PX
+# Pixel height of Pillow's built-in bitmap font
+BITMAP_FONT_PX = 11
+ATLAS_PAGE_PX = 1024
+
+_blocks: "OrderedDict[str, Image.Image]" = OrderedDict()
+
+
+def _normalize(name: str) -> str:
+    return "".join(ch for ch in name.lower() if ch.isalnum())
+
+
+@lru_cache(maxsize=64)
+def resolve_font(family: str) -> Optional[str]:
+    """
+    Find a loadable font file for a family name.
+
+    Args:
+        family: Family name, font file path, or comma-separated fallbacks
+            (e.g. "Arial, sans-serif")
+
+    Returns:
+        Path to a TrueType/OpenType file, or None if none is usable
+    """
+    for name in (part.strip() for part in family.split(",")):
+        if not name:
+            continue
+        if name.lower().endswith(FONT_EXTENSIONS) and os.path.isfile(name):
+            candidates = [Path(name)]
+        else:
+            target = _normalize(name)
+            candidates = []
+            for font_dir in FONT_DIRS:
+                if not font_dir.is_dir():
+                    continue
+                for path in font_dir.rglob("*"):
+                    if path.suffix.lower() not in FONT_EXTENSIONS:
+                        continue
+                    stem = _normalize(path.stem)
+                    if stem in (target, f"{target}regular"):
+                        candidates.insert(0, path)
+                    elif stem.startswith(target):
+                        candidates.append(path)
+        for path in candidates:
+            try:
+                ImageFont.truetype(str(path), 12)
+            except OSError:
+                log.debug(f"Skipping unreadable font file {path}")
+                continue
+            return str(path)
+    return None
+
+
+def font_for_kind(fonts: Optional[Dict[str, str]], kind: str) -> Optional[str]:
+    """
+    Resolve the font file for a text kind from a BrandStyle font mapping.
+
+    Hooks prefer the display family; everything else uses the primary
+    family. The fallback family is tried last.
+
+    Args:
+        fonts: BrandStyle.fonts mapping (may be None)
+        kind: Text kind ("hook", "body", "lower_third", ...)
+
+    Returns:
+        Font file path, or None to use the built-in bitmap font
+    """
+    fonts = fonts or {}
+    roles = ["display", "primary", "fallback"] if kind == "hook" else []
+    roles += ["primary", "fallback"]
+    for role in dict.fromkeys(roles):
+        family = fonts.get(role)
+        if family:
+            path = resolve_font(family)
+            if path:
+                return path
+    return None
+
+
+@dataclass(frozen=True)
+class Glyph:
+    """Location of one glyph in the atlas and its placement metrics."""
+
+    page: int
+    x: int
+    y: int
+    w: int
+    h: int
+    left: int
+    top: int
+    advance: float
+
+
+class GlyphAtlas:
+    """
+    Coverage masks for one font at one pixel size, packed into shelf pages.
+
+    Args:
+        font_path: TrueType/OpenType file, or None for the bitmap font
+        size: Font size in pixels
+    """
+
+    def __init__(self, font_path: Optional[str], size: int):
+        self.font_path = font_path
+        self.size = size
+        if font_path:
+            self.font = ImageFont.truetype(font_path, size)
+            self.scale = 1.0
+            ascent, descent = self.font.getmetrics()
+            self.line_height = max(ascent + descent, round(size * LINE_HEIGHT))
+        else:
+            self.font = ImageFont.load_default()
+            self.scale = size / BITMAP_FONT_PX
+            self.line_height = round(size * LINE_HEIGHT)
+        self.pages: List[np.ndarray] = []
+        self.glyphs: Dict[str, Glyph] = {}
+        self._kerning: Dict[str, float] = {}
+        self._cursor = (0, 0, 0)  # x, y, shelf height on the current page
+
+    def _allocate(self, w: int, h: int) -> Tuple[int, int, int]:
+        x, y, shelf = self._cursor
+        if not self.pages:
+            self.pages.append(np.zeros((ATLAS_PAGE_PX, ATLAS_PAGE_PX), np.uint8))
+        if x + w > ATLAS_PAGE_PX:
+            x, y, shelf = 0, y + shelf, 0
+        if y + h > ATLAS_PAGE_PX:
+            self.pages.append(np.zeros((ATLAS_PAGE_PX, ATLAS_PAGE_PX), np.uint8))
+            x, y, shelf = 0, 0, 0
+        self._cursor = (x + w, y, max(shelf, h))
+        return len(self.pages) - 1, x, y
+
+    def glyph(self, ch: str) -> Glyph:
+        """Atlas entry for ``ch``, rasterizing it on first use."""
+        cached = self.glyphs.get(ch)
+        if cached is not None:
+            return cached
+
+        advance = self.font.getlength(ch) * self.scale
+        left, top, right, bottom = self.font.getbbox(ch)
+        w, h = right - left, bottom - top
+        if w <= 0 or h <= 0:
+            glyph = Glyph(0, 0, 0, 0, 0, 0, 0, advance)
+        else:
+            mask = Image.new("L", (w, h))
+            ImageDraw.Draw(mask).text((-left, -top), ch, font=self.font, fill=255)
+            if self.scale != 1.0:
+                w = max(1, round(w * self.scale))
+                h = max(1, round(h * self.scale))
+                mask = mask.resize((w, h), Image.LANCZOS)
+                left, top = round(left * self.scale), round(top * self.scale)
+            w, h = min(w, ATLAS_PAGE_PX), min(h, ATLAS_PAGE_PX)
+            page, x, y = self._allocate(w, h)
+            self.pages[page][y : y + h, x : x + w] = np.asarray(mask)[:h, :w]
+            glyph = Glyph(page, x, y, w, h, left, top, advance)
+        self.glyphs[ch] = glyph
+        return glyph
+
+    def kerning(self, left: str, right: str) -> float:
+        """Pair adjustment between two characters, in pixels."""
+        if self.font_path is None:
+            return 0.0
+        pair = left + right
+        value = self._kerning.get(pair)
+        if value is None:
+            value = (
+                self.font.getlength(pair)
+                - self.glyph(left).advance
+                - self.glyph(right).advance
+            )
+            self._kerning[pair] = value
+        return value
+
+    def measure(self, line: str) -> float:
+        """Advance width of a single line, including kerning."""
+        width = 0.0
+        prev = None
+        for ch in line:
+            if prev is not None:
+                width += self.kerning(prev, ch)
+            width += self.glyph(ch).advance
+            prev = ch
+        return width
+
+    def draw(self, canvas: np.ndarray, line: str, x: float, y: int) -> None:
+        """Composite a line's coverage into ``canvas`` with its top-left at x, y."""
+        pen = x
+        prev = None
+        canvas_h, canvas_w = canvas.shape
+        for ch in line:
+            if prev is not None:
+                pen += self.kerning(prev, ch)
+            g = self.glyph(ch)
+            prev = ch
+            if g.w:
+                gx, gy = round(pen) + g.left, y + g.top
+                x0, y0 = max(gx, 0), max(gy, 0)
+                x1, y1 = min(gx + g.w, canvas_w), min(gy + g.h, canvas_h)
+                if x1 > x0 and y1 > y0:
+                    src = self.pages[g.page][
+                        g.y + y0 - gy : g.y + y1 - gy, g.x + x0 - gx : g.x + x1 - gx
+                    ]
+                    region = canvas[y0:y1, x0:x1]
+                    np.maximum(region, src, out=region)
+            pen += g.advance
+
+    def wrap(self, text: str, max_width: Optional[float]) -> List[str]:
+        """Greedy word wrap; explicit newlines are kept, long words overflow."""
+        lines = []
+        for paragraph in text.split("\n"):
+            current = ""
+            for word in paragraph.split():
+                candidate = f"{current} {word}" if current else word
+                if current and max_width and self.measure(candidate) > max_width:
+                    lines.append(current)
+                    current = word
+                else:
+                    current = candidate
+            lines.append(current)
+        return lines
+
+
+@lru_cache(maxsize=32)
+def get_atlas(font_path: Optional[str], size: int) -> GlyphAtlas:
+    """Shared atlas for a font file (None for the bitmap font) at a size."""
+    return GlyphAtlas(font_path, size)
+
+
+def _layout(
+    text: str, font_size: int, font_path: Optional[str], max_width: Optional[int]
+) -> Tuple[GlyphAtlas, List[str], Tuple[int, int]]:
+    atlas = get_atlas(font_path, font_size)
+    wrap_width = max_width - 2 * PADDING_PX if max_width else None
+    lines = atlas.wrap(text, wrap_width)
+    width = math.ceil(max(atlas.measure(line) for line in lines)) + 2 * PADDING_PX
+    height = len(lines) * atlas.line_height + 2 * PADDING_PX
+    return atlas, lines, (max(width, 1), height)
+
+
+def text_block_size(
+    text: str,
+    font_size: int,
+    font_path: Optional[str] = None,
+    max_width: Optional[int] = DEFAULT_MAX_WIDTH,
+) -> Tuple[int, int]:
+    """
+    Size of the block render_text_block would produce, without rendering it.
+
+    Args:
+        text: Text content
+        font_size: Font size in pixels
+        font_path: Font file (None for the bitmap font)
+        max_width: Block width to wrap to, padding included (None: no wrap)
+
+    Returns:
+        (width, height) in pixels
+    """
+    return _layout(text, font_size, font_path, max_width)[2]
+
+
+def _text_color(style: BrandStyle) -> Tuple[int, int, int]:
+    color = style.colors.get("text_primary", "#111827")
+    try:
+        return ImageColor.getrgb(color)[:3]
+    except ValueError:
+        log.warning(f"Unknown text colour {color!r}, using black")
+        return (0, 0, 0)
+
+
+def _cache_key(
+    text: str,
+    kind: str,
+    max_width: Optional[int],
+    font_size: int,
+    font_path: Optional[str],
+    color: Tuple[int, int, int],
+) -> str:
+    try:
+        font_mtime = os.path.getmtime(font_path) if font_path else 0
+    except OSError:
+        font_mtime = 0
+    key_data = json.dumps(
+        [RENDER_VERSION, text, kind, max_width, font_size, font_path, font_mtime, color]
+    )
+    return hashlib.sha1(key_data.encode()).hexdigest()
+
+
+def _remember(key: str, image: Image.Image) -> Image.Image:
+    _blocks[key] = image
+    _blocks.move_to_end(key)
+    while len(_blocks) > MEMORY_CACHE_SIZE:
+        _blocks.popitem(last=False)
+    return image
+
+
+def render_text_block(
+    text: str,
+    style: BrandStyle,
+    kind: str = "body",
+    max_width: Optional[int] = DEFAULT_MAX_WIDTH,
+) -> Image.Image:
+    """
+    Render wrapped text in the brand style as an RGBA block.
+
+    Args:
+        text: Text content
+        style: BrandStyle (fonts, font_sizes and text_primary colour are used)
+        kind: Text kind selecting font size and family
+        max_width: Block width to wrap to, padding included (None: no wrap)
+
+    Returns:
+        RGBA image; callers must not modify it (it is shared by the cache)
+    """
+    font_size = style.font_sizes.get(kind, style.font_sizes["body"])
+    font_path = font_for_kind(style.fonts, kind)
+    color = _text_color(style)
+    key = _cache_key(text, kind, max_width, font_size, font_path, color)
+
+    cached = _blocks.get(key)
+    if cached is not None:
+        _blocks.move_to_end(key)
+        return cached
+
+    cache_path = CACHE_DIR / f"{key}.png"
+    if cache_path.exists():
+        try:
+            with Image.open(cache_path) as img:
+                log.debug(f"Text cache hit for {text[:32]!r} ({kind})")
+                return _remember(key, img.convert("RGBA"))
+        except OSError as e:
+            log.warning(f"Unreadable text cache entry {cache_path}: {e}")
+
+    atlas, lines, (width, height) = _layout(text, font_size, font_path, max_width)
+    coverage = np.zeros((height, width), np.uint8)
+    for i, line in enumerate(lines):
+        atlas.draw(coverage, line, PADDING_PX, PADDING_PX + i * atlas.line_height)
+    rgba = np.empty((height, width, 4), np.uint8)
+    rgba[..., :3] = color
+    rgba[..., 3] = coverage
+    image = Image.fromarray(rgba, "RGBA")
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        image.save(tmp_path, format="PNG")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        log.warning(f"Could not write text cache entry {cache_path}: {e}")
+    return _remember(key, image)
+
+
+def clear_cache() -> None:
+    """Drop in-memory text blocks and remove the on-disk text cache."""
+    _blocks.clear()
+    if CACHE_DIR.exists():
+        for cache_file in CACHE_DIR.glob("*.png"):
+            cache_file.unlink()
+        log.info(f"Cleared text cache ({CACHE_DIR})")
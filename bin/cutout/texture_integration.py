@@ -6,15 +6,24 @@ This module provides functions to integrate texture overlays with the existing
 rasterization system, maintaining backward compatibility while adding texture support.
 """
 
+import math
 import os
 from typing import Dict, Optional
 
+import numpy as np
 from pathlib import Path
 
 from bin.core import get_logger
 
 log = get_logger("texture_integration")
 
+# Longest side of the downsampled image the strength search runs QA on
+PROXY_MAX_SIDE = 512
+# Strength bisection steps on the proxy (resolution 1/32)
+BISECT_STEPS = 5
+# Contrast check tile size at full resolution (FrameAnalyzer default)
+QA_TILE_PX = 64
+
 # Try to import texture engine
 try:
     from .texture_engine import apply_textures_to_frame, texture_signature
@@ -137,22 +146,58 @@ def check_texture_cache(
     return None
 
 
+def _decimate(arr: np.ndarray, factor: int) -> np.ndarray:
+    """
+    Keep every ``factor``-th pixel in each direction.
+
+    Unlike averaging, decimation keeps per-pixel grain, so the proxy's
+    luminance histograms (what the contrast check measures) track the full
+    image; it also commutes with the strength blend.
+    """
+    return arr[::factor, ::factor] if factor > 1 else arr
+
+
+def _blend(base: np.ndarray, delta: np.ndarray, strength: float, mode: str):
+    """Image at ``strength`` along the base -> full-texture blend."""
+    from PIL import Image
+
+    blended = np.clip(base + delta * strength + 0.5, 0, 255).astype(np.uint8)
+    return Image.fromarray(blended, mode)
+
+
 def apply_texture_with_qa_loop(
     img: "PIL.Image.Image",
     texture_config: Dict,
     seed: int,
     max_retries: int = 2,
     min_contrast_ratio: float = 4.5,
+    search: str = "bisect",
+    bisect_steps: int = BISECT_STEPS,
+    proxy_max_side: int = PROXY_MAX_SIDE,
 ) -> tuple["PIL.Image.Image", Dict]:
     """
     Apply texture with QA loop that auto-dials back on contrast/legibility failures.
 
+    The texture stack is applied once at full strength; dialing back blends
+    between the untextured and fully textured image, so a retry is a linear
+    blend rather than a new texture pass. Strength is searched on a
+    decimated proxy (every n-th pixel, see ``_decimate``) and only the chosen
+    strength is checked at full resolution (falling back further, up to
+    ``max_retries`` times, if it fails there). If no strength passes at full
+    resolution the image is returned untextured. If the untextured image is
+    already below ``min_contrast_ratio``, texture must not reduce contrast
+    below the image's own.
+
     Args:
         img: Input PIL Image
         texture_config: Texture configuration dictionary
         seed: Random seed for deterministic output
-        max_retries: Maximum number of retry attempts
+        max_retries: Maximum full-resolution retries after the first check
         min_contrast_ratio: Minimum acceptable contrast ratio
+        search: "bisect" for the strongest passing strength, or "dialback"
+            for fixed 30% steps (1.0, 0.7, 0.49, ...)
+        bisect_steps: Proxy bisection steps (resolution 2**-bisect_steps)
+        proxy_max_side: Longest side of the QA proxy in pixels
 
     Returns:
         Tuple of (processed_image, metadata_dict)
@@ -160,137 +205,129 @@ def apply_texture_with_qa_loop(
     from .qa_gates import check_frame_contrast
 
     original_config = texture_config.copy()
-    current_config = texture_config.copy()
-    attempts = 0
     qa_results = []
 
-    log.info(
-        f"[texture-qa] Starting texture application with QA loop (max retries: {max_retries})"
-    )
+    def failed(reason: str, error: Optional[str] = None):
+        textures = {
+            "applied": False,
+            "attempts": len(qa_results),
+            "final_params": original_config,
+            "qa_results": qa_results,
+            "fallback_reason": reason,
+        }
+        if error:
+            textures["error"] = error
+        return img, {"textures": textures}
 
-    while attempts <= max_retries:
-        attempts += 1
-        log.info(
-            f"[texture-qa] Attempt {attempts}: applying textures with config {current_config}"
+    try:
+        textured = apply_textures_to_frame(img, texture_config, seed)
+    except Exception as e:
+        log.error(f"[texture-qa] Texture application failed: {e}")
+        return failed("all_attempts_failed", str(e))
+
+    base = np.asarray(img.convert(textured.mode), dtype=np.float32)
+    delta = np.asarray(textured, dtype=np.float32) - base
+    if base.shape != delta.shape:
+        log.warning("[texture-qa] Texture changed the image size, not blending")
+        return failed("shape_mismatch")
+
+    factor = max(1, math.ceil(max(img.size) / proxy_max_side))
+    proxy_base = _decimate(base, factor)
+    proxy_delta = _decimate(delta, factor)
+    # Proxy tiles cover the same image area as full-resolution tiles
+    proxy_tile = max(8, QA_TILE_PX // factor)
+
+    checked: Dict[tuple, bool] = {}
+
+    def check(strength: float, proxy: bool, threshold: float) -> bool:
+        # Without downsampling the proxy is the full image; don't check twice
+        key = (strength, proxy and factor > 1)
+        if key in checked:
+            return checked[key]
+        arrays = (proxy_base, proxy_delta) if key[1] else (base, delta)
+        result = check_frame_contrast(
+            _blend(*arrays, strength, textured.mode),
+            threshold,
+            tile_px=proxy_tile if key[1] else QA_TILE_PX,
+        )
+        qa_results.append(
+            {
+                "attempt": len(qa_results) + 1,
+                "config": {**original_config, "strength": round(strength, 4)},
+                "strength": strength,
+                "scale": f"1/{factor}" if key[1] else "full",
+                "contrast_result": result,
+            }
         )
+        checked[key] = result.ok
+        return result.ok
 
-        try:
-            # Apply textures using current configuration
-            processed_img = apply_textures_to_frame(img, current_config, seed)
-
-            # Run contrast/legibility check
-            contrast_result = check_frame_contrast(processed_img, min_contrast_ratio)
-            qa_results.append(
-                {
-                    "attempt": attempts,
-                    "config": current_config.copy(),
-                    "contrast_result": contrast_result,
-                }
-            )
+    # Never demand more contrast than the untextured image has
+    threshold = min_contrast_ratio
+    untextured = check_frame_contrast(
+        _blend(proxy_base, proxy_delta, 0.0, textured.mode), tile_px=proxy_tile
+    )
+    source_min = untextured.details.get("min_contrast")
+    if source_min is not None and source_min < min_contrast_ratio:
+        threshold = source_min
+        log.warning(
+            f"[texture-qa] Untextured image is already at {source_min:.2f}:1; "
+            f"texture may not reduce it further"
+        )
 
-            if contrast_result.ok:
-                log.info(f"[texture-qa] QA passed on attempt {attempts}")
+    # Proxy search for the strongest passing strength
+    if search == "dialback":
+        strength = 1.0
+        for step in range(max_retries + 1):
+            strength = 0.7**step
+            if check(strength, True, threshold):
                 break
+    elif check(1.0, True, threshold):
+        strength = 1.0
+    else:
+        lo, hi = 0.0, 1.0
+        for _ in range(bisect_steps):
+            mid = (lo + hi) / 2
+            if check(mid, True, threshold):
+                lo = mid
             else:
-                log.warning(
-                    f"[texture-qa] QA failed on attempt {attempts}: {contrast_result.fails}"
-                )
-
-                if attempts <= max_retries:
-                    # Auto-dial back texture strength
-                    current_config = _dial_back_texture_strength(current_config)
-                    log.info(
-                        f"[texture-qa] Dialing back texture strength for retry: {current_config}"
-                    )
-                else:
-                    log.warning(
-                        "[texture-qa] Max retries reached, using last processed image"
-                    )
-
-        except Exception as e:
-            log.error(
-                f"[texture-qa] Texture application failed on attempt {attempts}: {e}"
-            )
-            qa_results.append(
-                {"attempt": attempts, "config": current_config.copy(), "error": str(e)}
-            )
+                hi = mid
+        strength = lo
+
+    # Verify the chosen strength at full resolution, bisecting below it
+    passed = None
+    lo, hi = 0.0, strength
+    for retry in range(max_retries + 1):
+        if check(strength, False, threshold):
+            passed = strength
+            if retry == 0:
+                break
+            lo = strength
+        else:
+            hi = strength
+        strength = (lo + hi) / 2
+    if passed is None:
+        log.warning("[texture-qa] Max retries reached, using original image")
+        return failed("all_attempts_failed")
+    strength = passed
 
-            if attempts <= max_retries:
-                # Dial back on error too
-                current_config = _dial_back_texture_strength(current_config)
-            else:
-                # Return original image on final failure
-                log.error("[texture-qa] All attempts failed, returning original image")
-                return img, {
-                    "textures": {
-                        "applied": False,
-                        "attempts": attempts,
-                        "final_params": current_config,
-                        "qa_results": qa_results,
-                        "fallback_reason": "all_attempts_failed",
-                    }
-                }
-
-    # Prepare metadata
     metadata = {
         "textures": {
             "applied": True,
-            "attempts": attempts,
-            "final_params": current_config,
+            "attempts": len(qa_results),
+            "strength": strength,
+            "final_params": {**original_config, "strength": round(strength, 4)},
             "qa_results": qa_results,
             "original_config": original_config,
-            "dialback_applied": attempts > 1,
+            "dialback_applied": strength < 1.0,
         }
     }
 
     log.info(
-        f"[texture-qa] Texture application completed successfully after {attempts} attempts"
+        f"[texture-qa] Texture applied at strength {strength:.3f} after "
+        f"{len(qa_results)} QA checks (proxy 1/{factor})"
     )
-    return processed_img, metadata
-
-
-def _dial_back_texture_strength(config: Dict) -> Dict:
-    """
-    Automatically reduce texture strength for retry.
-
-    Args:
-        config: Current texture configuration
-
-    Returns:
-        Modified configuration with reduced strength
-    """
-    dialed_config = config.copy()
-
-    # Reduce grain strength by 30%
-    if "grain_strength" in dialed_config:
-        current_strength = dialed_config["grain_strength"]
-        dialed_config["grain_strength"] = max(0.0, current_strength * 0.7)
-        log.info(
-            f"[texture-qa] Reduced grain_strength from {current_strength:.3f} to {dialed_config['grain_strength']:.3f}"
-        )
-
-    # Increase posterize levels (softer effect)
-    if "posterize_levels" in dialed_config:
-        current_levels = dialed_config["posterize_levels"]
-        dialed_config["posterize_levels"] = min(16, current_levels + 1)
-        log.info(
-            f"[texture-qa] Increased posterize_levels from {current_levels} to {dialed_config['posterize_levels']}"
-        )
-
-    # Disable halftone if enabled
-    if "halftone" in dialed_config and dialed_config["halftone"].get("enable", False):
-        dialed_config["halftone"]["enable"] = False
-        log.info("[texture-qa] Disabled halftone effect")
-
-    # Reduce feather effect
-    if "feather_px" in dialed_config:
-        current_feather = dialed_config["feather_px"]
-        dialed_config["feather_px"] = max(0.5, current_feather * 0.8)
-        log.info(
-            f"[texture-qa] Reduced feather_px from {current_feather:.1f} to {dialed_config['feather_px']:.1f}"
-        )
-
-    return dialed_config
+    return _blend(base, delta, strength, textured.mode), metadata
 
 
 def process_rasterized_with_texture_qa(
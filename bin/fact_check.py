@@ -79,7 +79,7 @@ def call_fact_checker(content: str, cfg, models_config=None) -> Dict:
         full_prompt = f"{prompt_template}\n\nCONTENT TO CHECK:\n{content}"
 
         # Use model session for deterministic load/unload
-        with model_session(model_name) as session:
+        with model_session(model_name, role="research") as session:
             # Load fact-checking prompt template
             prompt_path = os.path.join(BASE, "prompts", "fact_check.txt")
             with open(prompt_path, "r", encoding="utf-8") as f:
@@ -10,12 +10,14 @@ identify claims requiring citations, and ensure content quality.
 """
 
 import argparse
+import bisect
 import json
 import os
 import re
 import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 # Ensure repo root on path
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -68,38 +70,207 @@ def load_references(run_dir: str) -> List[Dict]:
         return []
 
 
+def keyword_pattern(words: Iterable[str]) -> str:
+    """
+    Regex alternation for a keyword list, shaped as a prefix trie.
+
+    Matches the same strings as ``(?:w1|w2|...)``, but shared prefixes are
+    tested once, so the regex engine walks the keyword trie the way an
+    Aho-Corasick matcher would instead of retrying every keyword in turn.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(ch) + build(node[ch]) for ch in sorted(node) if ch]
+        if "" in node:
+            return f"(?:{'|'.join(branches)})?" if branches else ""
+        if len(branches) == 1:
+            return branches[0]
+        return f"(?:{'|'.join(branches)})"
+
+    return build(trie)
+
+
+# Whitespace that does not cross a line break, so a scan of the whole script
+# finds exactly what a line-by-line scan would
+_GAP = r"[^\S\n]+"
+_MONTHS = keyword_pattern(
+    [
+        "January",
+        "February",
+        "March",
+        "April",
+        "May",
+        "June",
+        "July",
+        "August",
+        "September",
+        "October",
+        "November",
+        "December",
+    ]
+)
+_SUPERLATIVES = keyword_pattern(
+    "first last only most least best worst biggest smallest oldest newest "
+    "fastest slowest never always every all none unique original primary "
+    "secondary".split()
+)
+_EXPERTS = keyword_pattern(
+    "expert specialist professional authority researcher scientist professor "
+    "doctor".split()
+)
+_VERBS = keyword_pattern("says said believes thinks argues claims".split())
+_ATTRIBUTIONS = keyword_pattern(
+    ["according to", "as stated by", "as claimed by", "as reported by"]
+)
+_FACTUAL = keyword_pattern(
+    "is was are were has had have discovered invented created founded "
+    "established built designed".split()
+)
+
+# One pattern per claim type; alternatives are tried longest first, so
+# overlapping matches of one type collapse to a single claim
+CLAIM_PATTERNS = {
+    "proper_nouns": r"\b[A-Z][a-z]+(?: [A-Z][a-z]+){1,3}\b",
+    "dates": (
+        rf"\b(?:(?:{_MONTHS}){_GAP}\d{{1,2}},?{_GAP}\d{{4}}"
+        r"|\d{1,2}/\d{1,2}/\d{4}|\d{1,2}-\d{1,2}-\d{4}|\d{4})\b"
+    ),
+    "superlatives": rf"(?i:\b{_SUPERLATIVES}\b)",
+    "statistics": (
+        rf"(?i:\b(?:\d+(?:\.\d+)?%|\d+(?:\.\d+)?{_GAP}(?:million|billion|trillion)"
+        rf"|(?:over|under|more than|less than){_GAP}\d+)\b)"
+    ),
+    "expert_opinions": (
+        rf"(?i:\b(?:{_EXPERTS}{_GAP}{_VERBS}|{_ATTRIBUTIONS})\b)"
+    ),
+    "general_statements": rf"(?i:\b{_FACTUAL}\b)",
+}
+CLAIM_TYPES = tuple(CLAIM_PATTERNS)
+
+# Every claim pattern starts at a word start. The first group rejects a
+# position unless some pattern matches there; the optional lookaheads then
+# capture every type that does, so one pass yields overlapping matches of
+# different types.
+_CLAIM_SCANNER = re.compile(
+    r"\b(?=\w)(?:"
+    + "|".join(f"(?={pattern})" for pattern in CLAIM_PATTERNS.values())
+    + ")"
+    + "".join(f"(?=(?P<{name}>{p}))?" for name, p in CLAIM_PATTERNS.items())
+)
+
+_DEFAULT_RATIONALES = {
+    "proper_nouns": "Proper nouns often represent specific facts requiring verification",
+    "dates": "Specific dates are factual claims needing source verification",
+    "superlatives": "Superlatives (first, most, best) are factual claims needing evidence",
+    "statistics": "Statistics without sources are unreliable and should be removed",
+    "expert_opinions": "Expert opinions need attribution to maintain credibility",
+    "general_statements": "General observations don't require specific citations",
+}
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class ClaimMatch:
+    """A claim pattern match within the scanned text."""
+
+    claim_type: str
+    start: int
+    end: int
+    text: str
+
+
+def scan_claims(text: str) -> List[ClaimMatch]:
+    """
+    Find every claim pattern match in ``text`` in a single pass.
+
+    Matches of different types may overlap; matches of one type do not (the
+    longest match at the leftmost position wins).
+
+    Returns:
+        Matches in order of start offset
+    """
+    last_end = dict.fromkeys(CLAIM_TYPES, 0)
+    matches = []
+    for m in _CLAIM_SCANNER.finditer(text):
+        for claim_type in CLAIM_TYPES:
+            start = m.start(claim_type)
+            if start >= last_end[claim_type]:
+                end = m.end(claim_type)
+                last_end[claim_type] = end
+                matches.append(ClaimMatch(claim_type, start, end, text[start:end]))
+    return matches
+
+
+def scan_script(script_lines: List[str]) -> Dict[int, List[ClaimMatch]]:
+    """
+    Scan a whole script once and group the claim matches by line.
+
+    Match offsets are mapped to 1-based line numbers through a table of line
+    start offsets; offsets in the returned matches are relative to the line.
+    """
+    line_starts = []
+    offset = 0
+    for line in script_lines:
+        line_starts.append(offset)
+        offset += len(line) + 1
+
+    by_line: Dict[int, List[ClaimMatch]] = {}
+    for match in scan_claims("\n".join(script_lines)):
+        line_num = bisect.bisect_right(line_starts, match.start)
+        base = line_starts[line_num - 1]
+        by_line.setdefault(line_num, []).append(
+            ClaimMatch(
+                match.claim_type, match.start - base, match.end - base, match.text
+            )
+        )
+    return by_line
+
+
 def map_script_to_beats(
     script_lines: List[str], grounded_beats: List[Dict]
 ) -> Dict[int, Dict]:
-    """Map script lines to corresponding grounded beats for citation checking."""
-    line_to_beat = {}
+    """
+    Map script lines to corresponding grounded beats for citation checking.
 
-    # Simple heuristic: map script content to beat content
+    Each line goes to the first beat with the best word-overlap score (above
+    0.1). Beat word sets and a word -> beats index are built once, so a line
+    is only scored against beats that share a word with it.
+    """
+    beat_sizes = []
+    beats_by_word: Dict[str, List[int]] = {}
+    for i, beat in enumerate(grounded_beats):
+        beat_words = set(_WORD_RE.findall(beat.get("content", "").lower()))
+        beat_sizes.append(len(beat_words))
+        for word in beat_words:
+            beats_by_word.setdefault(word, []).append(i)
+
+    line_to_beat = {}
     for line_num, line in enumerate(script_lines, 1):
         line_lower = line.lower().strip()
         if not line_lower or line_lower.startswith("[") or line_lower.startswith("**"):
             continue
 
+        line_words = set(_WORD_RE.findall(line_lower))
+        overlaps: Dict[int, int] = {}
+        for word in line_words:
+            for i in beats_by_word.get(word, ()):
+                overlaps[i] = overlaps.get(i, 0) + 1
+
         # Find the beat that best matches this line
         best_match = None
         best_score = 0
-
-        for beat in grounded_beats:
-            beat_content = beat.get("content", "").lower()
-            if not beat_content:
-                continue
-
-            # Simple word overlap scoring
-            line_words = set(re.findall(r"\w+", line_lower))
-            beat_words = set(re.findall(r"\w+", beat_content))
-
-            if line_words and beat_words:
-                overlap = len(line_words.intersection(beat_words))
-                score = overlap / max(len(line_words), len(beat_words))
-
-                if score > best_score and score > 0.1:  # Minimum threshold
-                    best_score = score
-                    best_match = beat
+        for i in sorted(overlaps):
+            score = overlaps[i] / max(len(line_words), beat_sizes[i])
+            if score > best_score and score > 0.1:  # Minimum threshold
+                best_score = score
+                best_match = grounded_beats[i]
 
         if best_match:
             line_to_beat[line_num] = best_match
@@ -142,8 +313,9 @@ def analyze_factual_claims(
     # Get claim policies
     claim_policies = fact_guard_config.get("claim_policies", {})
 
-    # Map script lines to beats
+    # Map script lines to beats and find every claim in one pass
     line_to_beat = map_script_to_beats(script_lines, grounded_beats)
+    matches_by_line = scan_script(script_lines)
 
     claims = []
 
@@ -157,7 +329,9 @@ def analyze_factual_claims(
         has_citations = beat and beat.get("citations")
 
         # Analyze line for factual claims
-        line_claims = analyze_line_for_claims(line, claim_policies, has_citations)
+        line_claims = claims_from_matches(
+            line, matches_by_line.get(line_num, []), claim_policies, has_citations
+        )
 
         for claim in line_claims:
             claim["line"] = line_num
@@ -199,159 +373,50 @@ def analyze_factual_claims(
     }
 
 
-def analyze_line_for_claims(
-    line: str, claim_policies: Dict, has_citations: bool
-) -> List[Dict]:
-    """Analyze a single line for factual claims."""
-    claims = []
-
-    # Check for proper nouns (names, places, organizations)
-    proper_noun_patterns = [
-        r"\b[A-Z][a-z]+ [A-Z][a-z]+\b",  # Full names
-        r"\b[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+\b",  # Three-part names
-        r"\b[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+\b",  # Four-part names
-    ]
-
-    for pattern in proper_noun_patterns:
-        matches = re.finditer(pattern, line)
-        for match in matches:
-            claims.append(
-                {
-                    "claim_type": "proper_nouns",
-                    "claim_text": match.group(),
-                    "requires_citation": claim_policies.get("proper_nouns", {}).get(
-                        "requires_citation", True
-                    ),
-                    "rationale": claim_policies.get("proper_nouns", {}).get(
-                        "rationale",
-                        "Proper nouns often represent specific facts requiring verification",
-                    ),
-                }
-            )
-
-    # Check for dates
-    date_patterns = [
-        r"\b\d{4}\b",  # Year
-        r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b",  # Full date
-        r"\b\d{1,2}/\d{1,2}/\d{4}\b",  # MM/DD/YYYY
-        r"\b\d{1,2}-\d{1,2}-\d{4}\b",  # MM-DD-YYYY
-    ]
-
-    for pattern in date_patterns:
-        matches = re.finditer(pattern, line)
-        for match in matches:
-            claims.append(
-                {
-                    "claim_type": "dates",
-                    "claim_text": match.group(),
-                    "requires_citation": claim_policies.get("dates", {}).get(
-                        "requires_citation", True
-                    ),
-                    "rationale": claim_policies.get("dates", {}).get(
-                        "rationale",
-                        "Specific dates are factual claims needing source verification",
-                    ),
-                }
-            )
-
-    # Check for superlatives
-    superlative_patterns = [
-        r"\b(?:first|last|only|most|least|best|worst|biggest|smallest|oldest|newest|fastest|slowest)\b",
-        r"\b(?:never|always|every|all|none|unique|original|primary|secondary)\b",
-    ]
-
-    for pattern in superlative_patterns:
-        matches = re.finditer(pattern, line, re.IGNORECASE)
-        for match in matches:
-            claims.append(
-                {
-                    "claim_type": "superlatives",
-                    "claim_text": match.group(),
-                    "requires_citation": claim_policies.get("superlatives", {}).get(
-                        "requires_citation", True
-                    ),
-                    "rationale": claim_policies.get("superlatives", {}).get(
-                        "rationale",
-                        "Superlatives (first, most, best) are factual claims needing evidence",
-                    ),
-                }
-            )
+def _claim(claim_type: str, claim_text: str, claim_policies: Dict) -> Dict:
+    policy = claim_policies.get(claim_type, {})
+    return {
+        "claim_type": claim_type,
+        "claim_text": claim_text,
+        "requires_citation": policy.get(
+            "requires_citation", claim_type != "general_statements"
+        ),
+        "rationale": policy.get("rationale", _DEFAULT_RATIONALES[claim_type]),
+    }
 
-    # Check for statistics
-    stat_patterns = [
-        r"\b\d+(?:\.\d+)?%\b",  # Percentages
-        r"\b\d+(?:\.\d+)?\s+(?:million|billion|trillion)\b",  # Large numbers
-        r"\b(?:over|under|more than|less than)\s+\d+\b",  # Comparative numbers
-    ]
 
-    for pattern in stat_patterns:
-        matches = re.finditer(pattern, line, re.IGNORECASE)
-        for match in matches:
-            claims.append(
-                {
-                    "claim_type": "statistics",
-                    "claim_text": match.group(),
-                    "requires_citation": claim_policies.get("statistics", {}).get(
-                        "requires_citation", True
-                    ),
-                    "rationale": claim_policies.get("statistics", {}).get(
-                        "rationale",
-                        "Statistics without sources are unreliable and should be removed",
-                    ),
-                }
-            )
+def claims_from_matches(
+    line: str, matches: List[ClaimMatch], claim_policies: Dict, has_citations: bool
+) -> List[Dict]:
+    """
+    Turn the claim matches found on one line into claims.
 
-    # Check for expert opinions
-    opinion_patterns = [
-        r"\b(?:expert|specialist|professional|authority|researcher|scientist|professor|doctor)\s+(?:says|said|believes|thinks|argues|claims)\b",
-        r"\b(?:according to|as stated by|as claimed by|as reported by)\b",
+    Claims are grouped by type in CLAIM_TYPES order. A line with no specific
+    claim and no citation yields one general statement if it reads as
+    factual.
+    """
+    rank = {claim_type: i for i, claim_type in enumerate(CLAIM_TYPES)}
+    claims = [
+        _claim(match.claim_type, match.text, claim_policies)
+        for match in sorted(matches, key=lambda m: rank[m.claim_type])
+        if match.claim_type != "general_statements"
     ]
 
-    for pattern in opinion_patterns:
-        matches = re.finditer(pattern, line, re.IGNORECASE)
-        for match in matches:
-            claims.append(
-                {
-                    "claim_type": "expert_opinions",
-                    "claim_text": match.group(),
-                    "requires_citation": claim_policies.get("expert_opinions", {}).get(
-                        "requires_citation", True
-                    ),
-                    "rationale": claim_policies.get("expert_opinions", {}).get(
-                        "rationale",
-                        "Expert opinions need attribution to maintain credibility",
-                    ),
-                }
-            )
-
     # If no specific claims found, check if line contains general factual statements
     if not claims and not has_citations:
-        # Look for statements that might be factual
-        factual_indicators = [
-            r"\b(?:is|was|are|were|has|had|have|had)\b",
-            r"\b(?:discovered|invented|created|founded|established|built|designed)\b",
-        ]
-
-        for pattern in factual_indicators:
-            if re.search(pattern, line, re.IGNORECASE):
-                claims.append(
-                    {
-                        "claim_type": "general_statements",
-                        "claim_text": line,
-                        "requires_citation": claim_policies.get(
-                            "general_statements", {}
-                        ).get("requires_citation", False),
-                        "rationale": claim_policies.get("general_statements", {}).get(
-                            "rationale",
-                            "General observations don't require specific citations",
-                        ),
-                    }
-                )
-                break
+        if any(match.claim_type == "general_statements" for match in matches):
+            claims.append(_claim("general_statements", line, claim_policies))
 
     return claims
 
 
+def analyze_line_for_claims(
+    line: str, claim_policies: Dict, has_citations: bool
+) -> List[Dict]:
+    """Analyze a single line for factual claims."""
+    return claims_from_matches(line, scan_claims(line), claim_policies, has_citations)
+
+
 def determine_claim_action(
     claim: Dict, strictness_level: Dict, claim_policies: Dict
 ) -> str:
@@ -6,6 +6,7 @@ import re
 import shlex
 import subprocess
 import sys
+import time
 
 # Ensure repo root is on sys.path for `import bin.core`
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -22,6 +23,7 @@ from bin.core import (
     log_state,
     single_lock,
 )
+from bin.utils.whisper_server import WhisperServer, server_binary
 
 log = get_logger("generate_captions")
 
@@ -44,6 +46,68 @@ def whisper_cpp_cmd(binary, model_path, audio_path, srt_out):
     return cmd, wav_tmp
 
 
+def resolve_model_path(cfg):
+    return (
+        cfg.asr.model
+        if os.path.isabs(cfg.asr.model)
+        else os.path.join(
+            os.path.expanduser("~"), "whisper.cpp", "models", cfg.asr.model
+        )
+    )
+
+
+def whisper_server(cfg, model_path):
+    """The persistent whisper-server for this config, or None if unavailable."""
+    if not getattr(cfg.asr, "server", False) or not os.path.exists(model_path):
+        return None
+    binary = server_binary(cfg.asr.whisper_cpp_path)
+    if not binary:
+        return None
+    return WhisperServer(
+        binary,
+        model_path,
+        port=cfg.asr.server_port,
+        threads=cfg.asr.server_threads,
+    )
+
+
+def transcribe_with_server(server, jobs):
+    """
+    Transcribe ``(audio, srt)`` pairs on the resident server.
+
+    Returns False (after logging why) when the server cannot be used, so the
+    caller can fall back to whisper-cli.
+    """
+    if server is None:
+        return False
+    try:
+        server.ensure()
+        start = time.monotonic()
+        server.transcribe_files(jobs)
+    except Exception as e:
+        log.warning(f"whisper-server unavailable, falling back to whisper-cli: {e}")
+        return False
+    log.info(
+        f"whisper-server transcribed {len(jobs)} file(s) in "
+        f"{time.monotonic() - start:.1f}s"
+    )
+    return True
+
+
+def caption_files(audio_paths):
+    """Caption several audio files in one whisper-server session."""
+    cfg = load_config()
+    server = whisper_server(cfg, resolve_model_path(cfg))
+    jobs = [(path, os.path.splitext(path)[0] + ".srt") for path in audio_paths]
+    if transcribe_with_server(server, jobs):
+        for _, srt in jobs:
+            log_state("generate_captions", "OK", os.path.basename(srt))
+            print(f"Generated SRT via whisper-server: {srt}")
+        return
+    for audio, srt in jobs:
+        main(None, audio, srt)
+
+
 def main(brief=None, input_file=None, output_file=None):
     """Main function for caption generation with optional brief context"""
     cfg = load_config()
@@ -81,14 +145,11 @@ def main(brief=None, input_file=None, output_file=None):
         srt = os.path.join(vdir, key + ".srt")
 
     bin_path = cfg.asr.whisper_cpp_path
-    model_path = (
-        cfg.asr.model
-        if os.path.isabs(cfg.asr.model)
-        else os.path.join(
-            os.path.expanduser("~"), "whisper.cpp", "models", cfg.asr.model
-        )
-    )
-    if not os.path.exists(bin_path) or not os.path.exists(model_path):
+    model_path = resolve_model_path(cfg)
+    server = whisper_server(cfg, model_path)
+    if server is None and (
+        not os.path.exists(bin_path) or not os.path.exists(model_path)
+    ):
         # Optional OpenAI Whisper fallback
         if getattr(cfg.asr, "openai_enabled", False) and env.get("OPENAI_API_KEY"):
             try:
@@ -130,27 +191,31 @@ def main(brief=None, input_file=None, output_file=None):
         print("Skipping captions: whisper.cpp binary or model missing")
         return
 
-    cmd, wav_tmp = whisper_cpp_cmd(bin_path, model_path, mp3, srt)
-    code, out, err = run(cmd)
-    # whisper.cpp writes <out_base>.srt; attempt to compute simple confidence heuristic
-    if os.path.exists(srt):
+    if transcribe_with_server(server, [(mp3, srt)]):
         log_state("generate_captions", "OK", os.path.basename(srt))
-        print(f"Generated SRT via whisper.cpp: {srt}")
+        print(f"Generated SRT via whisper-server: {srt}")
     else:
-        # Try alternative out path
-        alt = srt.replace(".srt", ".wav.srt")
-        if os.path.exists(alt):
-            os.rename(alt, srt)
+        cmd, wav_tmp = whisper_cpp_cmd(bin_path, model_path, mp3, srt)
+        code, out, err = run(cmd)
+        # whisper.cpp writes <out_base>.srt; attempt to compute simple confidence heuristic
+        if os.path.exists(srt):
             log_state("generate_captions", "OK", os.path.basename(srt))
             print(f"Generated SRT via whisper.cpp: {srt}")
         else:
-            log_state("generate_captions", "FAIL", err[:200])
-            raise SystemExit(f"whisper.cpp failed: {err[:200]}")
+            # Try alternative out path
+            alt = srt.replace(".srt", ".wav.srt")
+            if os.path.exists(alt):
+                os.rename(alt, srt)
+                log_state("generate_captions", "OK", os.path.basename(srt))
+                print(f"Generated SRT via whisper.cpp: {srt}")
+            else:
+                log_state("generate_captions", "FAIL", err[:200])
+                raise SystemExit(f"whisper.cpp failed: {err[:200]}")
 
-    try:
-        os.remove(wav_tmp)
-    except Exception:
-        pass
+        try:
+            os.remove(wav_tmp)
+        except Exception:
+            pass
 
     # Metrics: duration, WPM, rough "confidence" (proxy = % of non-empty lines)
     try:
@@ -218,6 +283,15 @@ if __name__ == "__main__":
     parser.add_argument("-i", "--input", help="Input MP3 file path")
     parser.add_argument("-o", "--output", help="Output SRT file path")
     parser.add_argument("--slug", help="Content slug to generate captions for")
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="AUDIO",
+        help="Caption several audio files in one whisper-server session",
+    )
+    parser.add_argument(
+        "--stop-server", action="store_true", help="Stop the resident whisper-server"
+    )
 
     args = parser.parse_args()
 
@@ -230,6 +304,18 @@ if __name__ == "__main__":
         except (json.JSONDecodeError, TypeError) as e:
             log.warning(f"Failed to parse brief data: {e}")
 
+    if args.stop_server:
+        cfg = load_config()
+        server = whisper_server(cfg, resolve_model_path(cfg))
+        if server is not None:
+            server.stop()
+        sys.exit(0)
+
+    if args.batch:
+        with single_lock():
+            caption_files(args.batch)
+        sys.exit(0)
+
     # If slug provided and no explicit input, set input/output based on slug
     if args.slug and not args.input:
         mp3 = os.path.join(BASE, "voiceovers", f"{args.slug}.mp3")
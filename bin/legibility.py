@@ -486,6 +486,98 @@ class LegibilityValidator:
                 "error_type": "validation_error",
             }
 
+    def validate_rendered_legibility(
+        self,
+        scenescript_data: Dict[str, Any],
+        animatics_dir: str,
+        sample_fps: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Validate text contrast on rendered animatics, frame by frame.
+
+        Each scene is checked against its own render, ``<scene id>.mp4`` in
+        ``animatics_dir``; scenes without one are skipped. Each video is
+        decoded once and every sampled frame is measured against the text
+        boxes of its scene, so fades, moves and textured backgrounds are
+        covered.
+
+        Args:
+            scenescript_data: SceneScript data structure
+            animatics_dir: Directory holding the rendered scene videos
+            sample_fps: Frames per second to analyse (None = every frame)
+
+        Returns:
+            Dict with per-scene frame analysis results
+        """
+        log.info(f"[legibility-frames] Analysing rendered scenes in {animatics_dir}")
+
+        try:
+            from bin.cutout.frame_analyzer import FrameAnalyzer, estimate_text_regions
+
+            try:
+                from bin.cutout.sdk import load_style
+
+                style = load_style()
+                font_sizes, fonts = style.font_sizes, style.fonts
+            except Exception:
+                font_sizes, fonts = None, None
+
+            analyzer = FrameAnalyzer(min_contrast_ratio=self.wcag_aa_threshold)
+            scenes = scenescript_data.get("scenes", [])
+
+            results = {
+                "valid": True,
+                "scenes_analyzed": 0,
+                "frames_analyzed": 0,
+                "elapsed_sec": 0.0,
+                "failed_elements": [],
+                "scene_results": [],
+                "missing_videos": [],
+            }
+
+            for scene_idx, scene in enumerate(scenes):
+                scene_id = scene.get("id", scene.get("scene_id", f"scene_{scene_idx}"))
+                video_path = os.path.join(animatics_dir, f"{scene_id}.mp4")
+                if not os.path.exists(video_path):
+                    results["missing_videos"].append(scene_id)
+                    continue
+                regions = estimate_text_regions(scene, font_sizes, fonts)
+                if not regions:
+                    continue
+
+                scene_result = analyzer.analyze_video(
+                    video_path, regions, sample_fps=sample_fps
+                )
+                scene_result["scene_id"] = scene_id
+                results["scene_results"].append(scene_result)
+                results["scenes_analyzed"] += 1
+                results["frames_analyzed"] += scene_result["frames_analyzed"]
+                results["elapsed_sec"] += scene_result["elapsed_sec"]
+
+                if not scene_result["valid"]:
+                    results["valid"] = False
+                    results["failed_elements"].extend(
+                        scene_result["failing_elements"]
+                    )
+
+            results["elapsed_sec"] = round(results["elapsed_sec"], 3)
+            results["summary"] = (
+                f"{len(results['failed_elements'])} text element(s) below "
+                f"{self.wcag_aa_threshold}:1 across {results['frames_analyzed']} frames "
+                f"in {results['scenes_analyzed']} scene(s)"
+            )
+
+            log.info(f"[legibility-frames] {results['summary']}")
+            return results
+
+        except Exception as e:
+            log.error(f"[legibility-frames] Frame analysis error: {str(e)}")
+            return {
+                "valid": False,
+                "error": f"Frame analysis error: {str(e)}",
+                "error_type": "frame_analysis_error",
+            }
+
 
 def validate_contrast_for_acceptance(
     text_color: str, background_color: str, element_id: str = "unknown"
@@ -511,6 +603,18 @@ def validate_scenescript_legibility(scenescript_data: Dict[str, Any]) -> Dict[st
     return validator.validate_scenescript_legibility(scenescript_data)
 
 
+def validate_rendered_legibility(
+    scenescript_data: Dict[str, Any],
+    animatics_dir: str,
+    sample_fps: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Convenience function for acceptance pipeline"""
+    validator = LegibilityValidator()
+    return validator.validate_rendered_legibility(
+        scenescript_data, animatics_dir, sample_fps
+    )
+
+
 if __name__ == "__main__":
     # Command line interface for testing
     import argparse
@@ -47,7 +47,7 @@ def call_ollama(prompt, cfg, models_config=None):
             model_name = cfg["llm"]["model"]
 
         # Use model session for deterministic load/unload
-        with model_session(model_name) as session:
+        with model_session(model_name, role="cluster") as session:
             # Load clustering prompt template
             prompt_path = os.path.join(BASE, "prompts", "cluster_topics.txt")
             with open(prompt_path, "r", encoding="utf-8") as f:
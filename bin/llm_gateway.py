@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Local LLM Gateway
+
+A small proxy in front of the Ollama server that every ModelRunner can share
+(set ``ollama.gateway_url`` in conf/models.yaml, or LLM_GATEWAY_URL). It:
+
+- coalesces identical in-flight requests (singleflight): the same endpoint
+  and JSON body goes upstream once and every waiting caller gets the reply
+- schedules by priority class, taken from the X-Priority header
+  (interactive, normal, batch), so UI requests overtake queued batch work
+- within a priority class, prefers requests for the model it ran last, so
+  the server swaps models as rarely as possible (bounded by
+  max_model_streak so other models are not starved)
+
+POST /api/chat, /api/generate and /api/embeddings are queued; every other
+path (tags, pull, ...) is forwarded unchanged. GET /gateway/stats reports
+counters and queue depth.
+
+Usage:
+    python bin/llm_gateway.py --port 11435 --concurrency 1
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+# Ensure repo root on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from bin.core import get_logger
+
+log = get_logger("llm_gateway")
+
+PRIORITIES = {"interactive": 0, "normal": 1, "batch": 2}
+QUEUED_PATHS = ("/api/chat", "/api/generate", "/api/embeddings")
+DEFAULT_PORT = 11435
+MAX_MODEL_STREAK = 8
+
+
+@dataclass
+class UpstreamResponse:
+    status: int
+    body: bytes
+    content_type: str = "application/json"
+
+
+@dataclass
+class _Job:
+    key: str
+    path: str
+    body: bytes
+    model: str
+    priority: int
+    future: Future
+
+
+def request_key(path: str, payload: Dict) -> str:
+    """Identity of a request for coalescing: endpoint plus canonical JSON."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{path}\0{canonical}".encode("utf-8")).hexdigest()
+
+
+class LLMGateway:
+    """
+    Priority scheduler with singleflight in front of one upstream server.
+
+    Args:
+        upstream: Ollama base URL
+        concurrency: Requests sent upstream at once (match the server's
+            OLLAMA_NUM_PARALLEL)
+        timeout_s: Upstream request timeout
+        max_model_streak: Consecutive picks of the current model allowed
+            while another model waits at the same priority
+    """
+
+    def __init__(
+        self,
+        upstream: str,
+        concurrency: int = 1,
+        timeout_s: float = 600.0,
+        max_model_streak: int = MAX_MODEL_STREAK,
+    ):
+        self.upstream = upstream.rstrip("/")
+        self.timeout_s = timeout_s
+        self.max_model_streak = max_model_streak
+        self.sess = requests.Session()
+        self.stats = {
+            "requests": 0,
+            "coalesced": 0,
+            "upstream": 0,
+            "model_switches": 0,
+        }
+        self._cond = threading.Condition()
+        self._queue: List[_Job] = []
+        self._inflight: Dict[str, _Job] = {}
+        self._model: Optional[str] = None
+        self._streak = 0
+        self._closed = False
+        self._workers = [
+            threading.Thread(target=self._work, name=f"llm-gateway-{i}", daemon=True)
+            for i in range(max(1, concurrency))
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, path: str, body: bytes, priority: str = "normal") -> Future:
+        """
+        Queue a request, or join an identical one already queued or running.
+
+        Joining a queued request with a more urgent priority raises its
+        priority.
+
+        Raises:
+            ValueError: If ``body`` is not JSON
+        """
+        payload = json.loads(body or b"{}")
+        key = request_key(path, payload)
+        rank = PRIORITIES.get(priority, PRIORITIES["normal"])
+        with self._cond:
+            self.stats["requests"] += 1
+            job = self._inflight.get(key)
+            if job is not None:
+                self.stats["coalesced"] += 1
+                job.priority = min(job.priority, rank)
+                return job.future
+            job = _Job(key, path, body, str(payload.get("model", "")), rank, Future())
+            self._inflight[key] = job
+            self._queue.append(job)
+            self._cond.notify()
+        return job.future
+
+    def _next_job(self) -> _Job:
+        """Pop the next job: most urgent class, current model first, FIFO."""
+        top = min(job.priority for job in self._queue)
+        candidates = [job for job in self._queue if job.priority == top]
+        same = [job for job in candidates if job.model == self._model]
+        if same and (
+            self._streak < self.max_model_streak or len(same) == len(candidates)
+        ):
+            job = same[0]
+        else:
+            job = next(j for j in candidates if j.model != self._model)
+        self._queue.remove(job)
+
+        if job.model == self._model:
+            self._streak += 1
+        else:
+            if self._model is not None:
+                self.stats["model_switches"] += 1
+            self._model = job.model
+            self._streak = 1
+        return job
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                job = self._next_job()
+                self.stats["upstream"] += 1
+            try:
+                result = self.forward("POST", job.path, job.body)
+            except Exception as e:
+                with self._cond:
+                    self._inflight.pop(job.key, None)
+                job.future.set_exception(e)
+                continue
+            with self._cond:
+                self._inflight.pop(job.key, None)
+            job.future.set_result(result)
+
+    def forward(
+        self, method: str, path: str, body: Optional[bytes] = None
+    ) -> UpstreamResponse:
+        """Send one request upstream as-is."""
+        resp = self.sess.request(
+            method,
+            self.upstream + path,
+            data=body,
+            headers={"Content-Type": "application/json"} if body else None,
+            timeout=self.timeout_s,
+        )
+        return UpstreamResponse(
+            resp.status_code,
+            resp.content,
+            resp.headers.get("Content-Type", "application/json"),
+        )
+
+    def snapshot(self) -> Dict:
+        with self._cond:
+            return {
+                **self.stats,
+                "queued": len(self._queue),
+                "inflight": len(self._inflight),
+                "model": self._model,
+            }
+
+    def close(self):
+        """Stop the workers and fail any requests still queued."""
+        with self._cond:
+            self._closed = True
+            abandoned, self._queue = self._queue, []
+            for job in abandoned:
+                self._inflight.pop(job.key, None)
+            self._cond.notify_all()
+        for job in abandoned:
+            job.future.set_exception(RuntimeError("LLM gateway closed"))
+        for worker in self._workers:
+            worker.join()
+
+
+def _json_response(status: int, data: Dict) -> UpstreamResponse:
+    return UpstreamResponse(status, json.dumps(data).encode("utf-8"))
+
+
+class _GatewayHandler(BaseHTTPRequestHandler):
+    gateway: LLMGateway
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, resp: UpstreamResponse):
+        self.send_response(resp.status)
+        self.send_header("Content-Type", resp.content_type)
+        self.send_header("Content-Length", str(len(resp.body)))
+        self.end_headers()
+        self.wfile.write(resp.body)
+
+    def _proxy(self, method: str, body: Optional[bytes] = None):
+        try:
+            self._send(self.gateway.forward(method, self.path, body))
+        except requests.RequestException as e:
+            self._send(_json_response(502, {"error": str(e)}))
+
+    def do_GET(self):
+        if urlsplit(self.path).path == "/gateway/stats":
+            self._send(_json_response(200, self.gateway.snapshot()))
+        else:
+            self._proxy("GET")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path = urlsplit(self.path).path
+        if path not in QUEUED_PATHS:
+            self._proxy("POST", body)
+            return
+        try:
+            future = self.gateway.submit(
+                path, body, self.headers.get("X-Priority", "normal")
+            )
+        except ValueError as e:
+            self._send(_json_response(400, {"error": f"invalid JSON body: {e}"}))
+            return
+        try:
+            self._send(future.result())
+        except Exception as e:
+            self._send(_json_response(502, {"error": str(e)}))
+
+    def log_message(self, format, *args):
+        log.debug(format % args)
+
+
+def make_server(
+    gateway: LLMGateway, host: str = "127.0.0.1", port: int = DEFAULT_PORT
+) -> ThreadingHTTPServer:
+    """HTTP server for ``gateway``; call serve_forever() to run it."""
+    handler = type("GatewayHandler", (_GatewayHandler,), {"gateway": gateway})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local LLM gateway for Ollama")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--upstream", help="Ollama URL (default: models.yaml)")
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="Upstream requests at once"
+    )
+    args = parser.parse_args()
+
+    upstream = args.upstream
+    if not upstream:
+        from bin.utils.config import load_all_configs
+
+        upstream = load_all_configs().models.ollama.base_url
+
+    gateway = LLMGateway(upstream, concurrency=args.concurrency)
+    server = make_server(gateway, args.host, args.port)
+    log.info(f"LLM gateway on {args.host}:{args.port} -> {upstream}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        gateway.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -184,7 +184,7 @@ def generate_outline(
         user_prompt = user_prompt_template.format(topic=topic)
 
         # Generate outline using LLM
-        with model_session(model_name) as session:
+        with model_session(model_name, role="outline") as session:
             response = session.chat(
                 system=system_prompt, user=user_prompt, temperature=0.3
             )
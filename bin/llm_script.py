@@ -10,7 +10,9 @@ import json
 import os
 import re
 import sys
-from typing import Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from pathlib import Path
 
@@ -29,6 +31,11 @@ from bin.model_runner import model_session
 
 log = get_logger("llm_script")
 
+# Concurrent section requests; keep at or below the server's OLLAMA_NUM_PARALLEL
+SECTION_CONCURRENCY = 2
+SECTION_RETRIES = 2
+WORDS_PER_SECOND = 2.5
+
 
 def enforce_cta_policy(script_text, cta_policy, intent):
     """Enforce CTA policy based on intent template."""
@@ -80,6 +87,8 @@ def generate_script(
     target_len_sec: int = 60,
     brief: Dict = None,
     models_config: Dict = None,
+    parallel_sections: bool = False,
+    max_concurrency: int = SECTION_CONCURRENCY,
 ) -> Dict:
     """
     Generate a video script using LLM.
@@ -89,6 +98,9 @@ def generate_script(
         target_len_sec: Target duration in seconds
         brief: Brief configuration
         models_config: Models configuration
+        parallel_sections: Expand each outline section in its own request
+            (see generate_sections) instead of one whole-script call
+        max_concurrency: Section requests in flight at once
 
     Returns:
         Generated script data
@@ -200,21 +212,31 @@ def generate_script(
         )
 
         # Generate script using LLM
-        with model_session(model_name) as session:
-            response = session.chat(
-                system=system_prompt, user=user_prompt, temperature=0.3
+        if parallel_sections and outline_data.get("sections"):
+            data = generate_sections(
+                model_name,
+                system_prompt,
+                user_prompt,
+                outline_data,
+                target_len_sec,
+                max_concurrency=max_concurrency,
             )
-
-            # Parse response
-            try:
-                data = json.loads(response.strip())
-            except json.JSONDecodeError:
-                log.error("Failed to parse LLM response as JSON")
-                # Create fallback script
-                data = create_fallback_script(
-                    outline_data, target_len_sec, outline_intent
+        else:
+            with model_session(model_name, role="scriptwriter") as session:
+                response = session.chat(
+                    system=system_prompt, user=user_prompt, temperature=0.3
                 )
 
+                # Parse response
+                try:
+                    data = json.loads(response.strip())
+                except json.JSONDecodeError:
+                    log.error("Failed to parse LLM response as JSON")
+                    # Create fallback script
+                    data = create_fallback_script(
+                        outline_data, target_len_sec, outline_intent
+                    )
+
         # Validate and enhance script
         data = validate_and_enhance_script(data, outline_data, target_len_sec)
 
@@ -256,6 +278,142 @@ def generate_script(
         raise
 
 
+def _section_title(section: Dict, number: int) -> str:
+    return section.get("title") or section.get("label") or f"Section {number}"
+
+
+def parse_section_response(
+    response: str, section: Dict, number: int
+) -> Optional[Dict]:
+    """
+    Parse one section reply, or return None if it is not usable.
+
+    The outline's id and title replace whatever the model echoed, so the
+    section still lines up with its outline entry for citation placement.
+    """
+    try:
+        data = json.loads(response.strip())
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    content = data.get("content")
+    if not isinstance(content, str) or not content.strip():
+        return None
+    data["content"] = content.strip()
+    data["id"] = section.get("id", f"section_{number}")
+    data["title"] = _section_title(section, number)
+    return data
+
+
+def _placeholder_section(section: Dict, number: int) -> Dict:
+    title = _section_title(section, number)
+    needs_citations = section.get("needs_citations", True)
+    content = f"[{title} content will be generated]"
+    if needs_citations:
+        content += " [CITATION NEEDED]"
+    return {
+        "id": section.get("id", f"section_{number}"),
+        "title": title,
+        "content": content,
+        "needs_citations": needs_citations,
+    }
+
+
+def generate_sections(
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    outline_data: Dict,
+    target_len_sec: int,
+    max_concurrency: int = SECTION_CONCURRENCY,
+    retries: int = SECTION_RETRIES,
+) -> Dict:
+    """
+    Expand each outline section in its own request and stitch the results.
+
+    Every request sends the same system prompt (instructions plus the whole
+    outline) and opens its user message with the same topic line, so the
+    model server can reuse the cached prompt prefix; only the short section
+    instruction differs. A section whose reply is not valid section JSON is
+    retried on its own, then replaced by a placeholder.
+
+    Args:
+        model_name: Model to use
+        system_prompt: Formatted script_generation prompt
+        user_prompt: Formatted user_script prompt
+        outline_data: Outline with a non-empty "sections" list
+        target_len_sec: Target duration, split across sections by beat count
+        max_concurrency: Section requests in flight at once
+        retries: Extra attempts per malformed or failed section
+
+    Returns:
+        Script data in the same shape as the whole-script response
+    """
+    sections = outline_data["sections"]
+    prompt_path = os.path.join(BASE, "prompts", "user_script_section.txt")
+    with open(prompt_path, "r", encoding="utf-8") as f:
+        template = f.read()
+
+    weights = [max(1, len(s.get("beats") or [])) for s in sections]
+    total_words = target_len_sec * WORDS_PER_SECOND
+    sessions = threading.local()
+
+    def expand(number: int, section: Dict, weight: int):
+        if not hasattr(sessions, "session"):
+            sessions.session = model_session(model_name, role="scriptwriter")
+        prompt = user_prompt + "\n\n" + template.format(
+            section_number=number,
+            section_count=len(sections),
+            section_data=json.dumps(section, indent=2),
+            section_words=max(10, round(total_words * weight / sum(weights))),
+            section_id=section.get("id", f"section_{number}"),
+        )
+        for attempt in range(1, retries + 2):
+            try:
+                response = sessions.session.chat(
+                    system=system_prompt, user=prompt, temperature=0.3
+                )
+            except Exception as e:
+                log.warning(f"[script] Section {number} request failed: {e}")
+                continue
+            parsed = parse_section_response(response, section, number)
+            if parsed is not None:
+                return parsed, True
+            log.warning(
+                f"[script] Section {number} reply malformed "
+                f"(attempt {attempt}/{retries + 1})"
+            )
+        log.error(f"[script] Section {number} failed; using placeholder")
+        return _placeholder_section(section, number), False
+
+    workers = max(1, min(max_concurrency, len(sections)))
+    log.info(f"[script] Expanding {len(sections)} sections, {workers} at a time")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(expand, number, section, weight)
+            for number, (section, weight) in enumerate(zip(sections, weights), 1)
+        ]
+        results = [future.result() for future in futures]
+
+    script_sections = [section for section, _ in results]
+    failed = sum(1 for _, ok in results if not ok)
+    script_text = "\n\n".join(section["content"] for section in script_sections)
+    title_options = outline_data.get("title_options") or []
+    return {
+        "title": (
+            title_options[0] if title_options else outline_data.get("topic", "Topic")
+        ),
+        "script": script_text,
+        "sections": script_sections,
+        "metadata": {
+            "word_count": len(script_text.split()),
+            "estimated_duration_sec": target_len_sec,
+            "sections_failed": failed,
+        },
+    }
+
+
 def create_fallback_script(
     outline_data: Dict, target_len_sec: int, intent: str
 ) -> Dict:
@@ -404,6 +562,17 @@ def main(brief=None, models_config=None, outline_path=None, slug=None):
     parser.add_argument(
         "--slug", required=True, help="Topic slug for script generation"
     )
+    parser.add_argument(
+        "--parallel-sections",
+        action="store_true",
+        help="Generate each outline section in its own request",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=SECTION_CONCURRENCY,
+        help="Section requests in flight at once (with --parallel-sections)",
+    )
     args = parser.parse_args()
 
     # Load brief data
@@ -428,7 +597,14 @@ def main(brief=None, models_config=None, outline_path=None, slug=None):
     )
 
     # Generate script
-    script_data = generate_script(outline_path, args.duration, brief, models_config)
+    script_data = generate_script(
+        outline_path,
+        args.duration,
+        brief,
+        models_config,
+        parallel_sections=args.parallel_sections,
+        max_concurrency=args.max_concurrency,
+    )
 
     # Save script
     if args.output:
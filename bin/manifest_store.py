@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+SQLite asset manifest store.
+
+Source of truth for the asset library manifest. Assets are keyed by file
+content hash, with tags, palette colors and quality scores in side tables so
+consumers can filter with indexed queries instead of parsing the whole
+library_manifest.json (which is still exported for backward compatibility).
+
+Rebuilds call sync(), which upserts only rows whose metadata changed and
+removes vanished assets in a single transaction. Every change bumps a
+generation counter so readers can cheaply detect that they are stale.
+"""
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Columns stored directly on the assets table (JSON-encoded where noted)
+_ASSET_COLUMNS = [
+    "path",
+    "w",
+    "h",
+    "viewBox",
+    "provenance",  # JSON
+    "palette_ok",
+    "delta_e_violations",  # JSON
+    "created_at",
+    "license",
+]
+_JSON_COLUMNS = {"provenance", "delta_e_violations"}
+
+
+def _row_values(asset: Dict[str, Any]) -> Tuple:
+    """Column values for an asset, in _ASSET_COLUMNS order."""
+    values = []
+    for column in _ASSET_COLUMNS:
+        value = asset.get(column)
+        if column in _JSON_COLUMNS:
+            value = json.dumps(value, sort_keys=True)
+        elif column == "palette_ok":
+            value = 1 if value else 0
+        values.append(value)
+    return tuple(values)
+
+
+class ManifestStore:
+    """SQLite-backed asset manifest with incremental upserts."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def _init_database(self):
+        """Create tables and indexes."""
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS assets (
+                    hash TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    w REAL,
+                    h REAL,
+                    viewBox TEXT,
+                    provenance TEXT,
+                    palette_ok INTEGER NOT NULL DEFAULT 0,
+                    delta_e_violations TEXT,
+                    created_at TEXT,
+                    license TEXT,
+                    usage_count INTEGER NOT NULL DEFAULT 0,
+                    last_used TEXT,
+                    file_mtime_ns INTEGER,
+                    file_size INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS idx_assets_path ON assets(path);
+                CREATE INDEX IF NOT EXISTS idx_assets_palette_ok
+                    ON assets(palette_ok);
+
+                CREATE TABLE IF NOT EXISTS asset_tags (
+                    hash TEXT NOT NULL REFERENCES assets(hash) ON DELETE CASCADE,
+                    position INTEGER NOT NULL,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY (hash, position)
+                );
+                CREATE INDEX IF NOT EXISTS idx_asset_tags_tag ON asset_tags(tag);
+
+                CREATE TABLE IF NOT EXISTS asset_colors (
+                    hash TEXT NOT NULL REFERENCES assets(hash) ON DELETE CASCADE,
+                    position INTEGER NOT NULL,
+                    color TEXT NOT NULL,
+                    PRIMARY KEY (hash, position)
+                );
+                CREATE INDEX IF NOT EXISTS idx_asset_colors_color
+                    ON asset_colors(color);
+
+                CREATE TABLE IF NOT EXISTS asset_quality (
+                    hash TEXT NOT NULL REFERENCES assets(hash) ON DELETE CASCADE,
+                    metric TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    PRIMARY KEY (hash, metric)
+                );
+                CREATE INDEX IF NOT EXISTS idx_asset_quality_metric
+                    ON asset_quality(metric, score);
+
+                CREATE TABLE IF NOT EXISTS manifest_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                """
+            )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def sync(
+        self,
+        assets: Dict[str, Dict[str, Any]],
+        keep: Optional[Iterable[str]] = None,
+        file_stats: Optional[Dict[str, Tuple[int, int]]] = None,
+    ) -> Dict[str, int]:
+        """Upsert changed assets and delete vanished ones in one transaction.
+
+        Args:
+            assets: Metadata keyed by content hash for assets that were
+                (re-)extracted. Rows whose stored metadata is identical are
+                left untouched. Usage counters are taken from ``assets`` for
+                new rows and preserved for existing ones.
+            keep: Hashes of unchanged assets that are still present. Any hash
+                in neither ``assets`` nor ``keep`` is deleted. If None, no
+                rows are deleted.
+            file_stats: Optional (mtime_ns, size) per hash, used by
+                file_states() to skip re-extracting unchanged files.
+
+        Returns:
+            Counts of inserted, updated, unchanged and deleted rows.
+        """
+        file_stats = file_stats or {}
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+
+        with self._lock, self._connect() as conn:
+            placeholders = ",".join("?" * len(_ASSET_COLUMNS))
+            updates = ",".join(f"{c}=excluded.{c}" for c in _ASSET_COLUMNS)
+            columns = ",".join(_ASSET_COLUMNS)
+
+            for asset_hash, asset in assets.items():
+                values = _row_values(asset)
+                tags = list(asset.get("tags", []))
+                colors = list(asset.get("palette", []))
+                stat = file_stats.get(asset_hash, (None, None))
+
+                existing = conn.execute(
+                    f"SELECT {columns} FROM assets WHERE hash = ?", (asset_hash,)
+                ).fetchone()
+                if existing is not None and tuple(existing) == values:
+                    same_tags = tags == self._list(
+                        conn, "asset_tags", "tag", asset_hash
+                    )
+                    same_colors = colors == self._list(
+                        conn, "asset_colors", "color", asset_hash
+                    )
+                    if same_tags and same_colors:
+                        conn.execute(
+                            "UPDATE assets SET file_mtime_ns = ?, file_size = ? "
+                            "WHERE hash = ?",
+                            (*stat, asset_hash),
+                        )
+                        counts["unchanged"] += 1
+                        continue
+
+                conn.execute(
+                    f"""
+                    INSERT INTO assets (
+                        hash, {columns}, usage_count, last_used,
+                        file_mtime_ns, file_size
+                    )
+                    VALUES (?, {placeholders}, ?, ?, ?, ?)
+                    ON CONFLICT(hash) DO UPDATE SET {updates},
+                        file_mtime_ns = excluded.file_mtime_ns,
+                        file_size = excluded.file_size
+                    """,
+                    (
+                        asset_hash,
+                        *values,
+                        asset.get("usage_count") or 0,
+                        asset.get("last_used"),
+                        *stat,
+                    ),
+                )
+                conn.execute("DELETE FROM asset_tags WHERE hash = ?", (asset_hash,))
+                conn.executemany(
+                    "INSERT INTO asset_tags (hash, position, tag) VALUES (?, ?, ?)",
+                    [(asset_hash, i, tag) for i, tag in enumerate(tags)],
+                )
+                conn.execute("DELETE FROM asset_colors WHERE hash = ?", (asset_hash,))
+                conn.executemany(
+                    "INSERT INTO asset_colors (hash, position, color) VALUES (?, ?, ?)",
+                    [(asset_hash, i, color) for i, color in enumerate(colors)],
+                )
+                counts["updated" if existing is not None else "inserted"] += 1
+
+            if keep is not None:
+                present = set(assets) | set(keep)
+                stale = [
+                    (h,)
+                    for (h,) in conn.execute("SELECT hash FROM assets")
+                    if h not in present
+                ]
+                conn.executemany("DELETE FROM assets WHERE hash = ?", stale)
+                counts["deleted"] = len(stale)
+
+            if counts["inserted"] or counts["updated"] or counts["deleted"]:
+                self._bump_generation(conn)
+
+        return counts
+
+    def set_meta(self, **values: Any):
+        """Store manifest-level fields (version, generated_at, ...)."""
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO manifest_meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                [(k, json.dumps(v)) for k, v in values.items()],
+            )
+
+    def record_usage(self, hashes: Iterable[str], timestamp: str):
+        """Increment usage counters for the given assets."""
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "UPDATE assets SET usage_count = usage_count + 1, last_used = ? "
+                "WHERE hash = ?",
+                [(timestamp, h) for h in hashes],
+            )
+            self._bump_generation(conn)
+
+    def set_quality(self, asset_hash: str, scores: Dict[str, float]):
+        """Store quality scores (metric -> score) for an asset."""
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO asset_quality (hash, metric, score) VALUES (?, ?, ?) "
+                "ON CONFLICT(hash, metric) DO UPDATE SET score = excluded.score",
+                [(asset_hash, m, float(s)) for m, s in scores.items()],
+            )
+            self._bump_generation(conn)
+
+    def _bump_generation(self, conn: sqlite3.Connection):
+        conn.execute(
+            "INSERT INTO manifest_meta (key, value) VALUES ('generation', '1') "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+        )
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _list(
+        conn: sqlite3.Connection, table: str, column: str, asset_hash: str
+    ) -> List[str]:
+        return [
+            r[0]
+            for r in conn.execute(
+                f"SELECT {column} FROM {table} WHERE hash = ? ORDER BY position",
+                (asset_hash,),
+            )
+        ]
+
+    def generation(self) -> int:
+        """Counter bumped on every change to the asset rows."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM manifest_meta WHERE key = 'generation'"
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def get_meta(self) -> Dict[str, Any]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, value FROM manifest_meta WHERE key != 'generation'"
+            ).fetchall()
+        return {k: json.loads(v) for k, v in rows}
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+
+    def file_states(self) -> Dict[str, Tuple[int, int, str]]:
+        """Map asset path -> (mtime_ns, size, hash) as of the last sync."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT path, file_mtime_ns, file_size, hash FROM assets"
+            ).fetchall()
+        return {path: (mtime, size, h) for path, mtime, size, h in rows}
+
+    def query(
+        self,
+        tag: Optional[str] = None,
+        palette_ok: Optional[bool] = None,
+        color: Optional[str] = None,
+        hashes: Optional[Iterable[str]] = None,
+        min_quality: Optional[Tuple[str, float]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return assets (keyed by hash, manifest layout) matching all filters."""
+        clauses, params = [], []
+        if tag is not None:
+            clauses.append("hash IN (SELECT hash FROM asset_tags WHERE tag = ?)")
+            params.append(tag)
+        if palette_ok is not None:
+            clauses.append("palette_ok = ?")
+            params.append(1 if palette_ok else 0)
+        if color is not None:
+            clauses.append("hash IN (SELECT hash FROM asset_colors WHERE color = ?)")
+            params.append(color)
+        if min_quality is not None:
+            clauses.append(
+                "hash IN (SELECT hash FROM asset_quality "
+                "WHERE metric = ? AND score >= ?)"
+            )
+            params.extend(min_quality)
+        if hashes is not None:
+            hashes = list(hashes)
+            if not hashes:
+                return {}
+            clauses.append(f"hash IN ({','.join('?' * len(hashes))})")
+            params.extend(hashes)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._fetch_assets(where, params)
+
+    def _fetch_assets(self, where: str, params: List[Any]) -> Dict[str, Dict[str, Any]]:
+        columns = ["hash"] + _ASSET_COLUMNS + ["usage_count", "last_used"]
+        with self._connect() as conn:
+            conn.execute("DROP TABLE IF EXISTS temp.selected")
+            conn.execute(
+                f"CREATE TEMP TABLE selected AS SELECT {','.join(columns)} "
+                f"FROM assets {where} ORDER BY path",
+                params,
+            )
+            rows = conn.execute(f"SELECT {','.join(columns)} FROM selected").fetchall()
+
+            tags: Dict[str, List[str]] = {}
+            for h, tag in conn.execute(
+                "SELECT hash, tag FROM asset_tags WHERE hash IN "
+                "(SELECT hash FROM selected) ORDER BY hash, position"
+            ):
+                tags.setdefault(h, []).append(tag)
+            colors: Dict[str, List[str]] = {}
+            for h, color in conn.execute(
+                "SELECT hash, color FROM asset_colors WHERE hash IN "
+                "(SELECT hash FROM selected) ORDER BY hash, position"
+            ):
+                colors.setdefault(h, []).append(color)
+            quality: Dict[str, Dict[str, float]] = {}
+            for h, metric, score in conn.execute(
+                "SELECT hash, metric, score FROM asset_quality WHERE hash IN "
+                "(SELECT hash FROM selected)"
+            ):
+                quality.setdefault(h, {})[metric] = score
+            conn.execute("DROP TABLE temp.selected")
+
+        assets = {}
+        for row in rows:
+            record = dict(zip(columns, row))
+            asset_hash = record["hash"]
+            for column in _JSON_COLUMNS:
+                record[column] = json.loads(record[column] or "null")
+            record["palette_ok"] = bool(record["palette_ok"])
+            record["tags"] = tags.get(asset_hash, [])
+            record["palette"] = colors.get(asset_hash, [])
+            if asset_hash in quality:
+                record["quality"] = quality[asset_hash]
+            assets[asset_hash] = record
+        return assets
+
+    def tag_counts(self) -> Dict[str, int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT tag, COUNT(*) FROM asset_tags GROUP BY tag ORDER BY MIN(rowid)"
+            ).fetchall()
+        return dict(rows)
+
+    def source_counts(self) -> Dict[str, int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT json_extract(provenance, '$.source'), COUNT(*) "
+                "FROM assets GROUP BY 1"
+            ).fetchall()
+        return {source: n for source, n in rows if source}
+
+    def palette_summary(self) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """Violations list and palette stats, as stored in the JSON manifest."""
+        with self._connect() as conn:
+            violations = [
+                {
+                    "asset": path,
+                    "violations": json.loads(raw or "[]"),
+                    "type": "palette_violation",
+                }
+                for path, raw in conn.execute(
+                    "SELECT path, delta_e_violations FROM assets "
+                    "WHERE palette_ok = 0 ORDER BY path"
+                )
+            ]
+            total_colors, compliant_colors = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(a.palette_ok), 0) "
+                "FROM asset_colors c JOIN assets a ON a.hash = c.hash"
+            ).fetchone()
+            delta_e = sum(
+                len(json.loads(raw or "[]"))
+                for (raw,) in conn.execute(
+                    "SELECT delta_e_violations FROM assets WHERE palette_ok = 0"
+                )
+            )
+        stats = {
+            "total_colors": total_colors,
+            "compliant_colors": compliant_colors,
+            "violation_count": delta_e,
+            "delta_e_violations": delta_e,
+        }
+        return violations, stats
+
+    def to_manifest(self) -> Dict[str, Any]:
+        """Materialize the full manifest in the library_manifest.json layout."""
+        meta = self.get_meta()
+        assets = self.query()
+        violations, palette_stats = self.palette_summary()
+        return {
+            "version": meta.get("version", "1.0"),
+            "generated_at": meta.get("generated_at"),
+            "total_assets": len(assets),
+            "assets": assets,
+            "violations": violations,
+            "palette_stats": palette_stats,
+        }
+
+    def export_json(self, path: str) -> Dict[str, Any]:
+        """Write the manifest to ``path`` atomically and return it."""
+        manifest = self.to_manifest()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, path)
+        return manifest
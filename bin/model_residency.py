@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Model Residency Planner
+
+On memory-constrained profiles (8 GB M2, Pi 5) a pipeline that alternates
+between the cluster, outline, script and research models makes Ollama load
+and evict models over and over. Before shared ingestion runs, the planner
+looks at the upcoming step list and the memory budget and decides:
+
+- the step order: independent LLM steps are pulled next to steps using the
+  same model (STEP_REQUIRES keeps data dependencies; steps without a model
+  are barriers nothing moves across)
+- which models stay resident: models fit the budget and, when one must go,
+  the one needed furthest in the future is evicted (Belady). Ollama starts a
+  new runner when num_ctx changes, so a model is planned per context size
+- what to preload: the next step's model is loaded while the current step
+  runs when both fit in the budget
+
+ResidencyManager carries the plan out through ModelRunner: it unloads
+evicted models, loads (or waits for the preload of) each step's model with
+the request options of the step's role (as model_session(role=...) sends), and
+passes keep_alive to the step via LLM_KEEP_ALIVE so the step's own requests
+keep the model resident. It reports loads, swaps and load time per run.
+
+Public API:
+- plan_residency(steps, step_models, sizes_gb, budget_gb) -> ResidencyPlan
+- ResidencyManager.from_config(steps, models_config) -> ResidencyManager
+- model_key(model, num_ctx) -> str
+"""
+
+import math
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set
+
+from bin.core import get_logger, log_state
+
+log = get_logger("model_residency")
+
+# models.yaml role used by each LLM step
+STEP_ROLES = {
+    "llm_cluster": "cluster",
+    "llm_outline": "outline",
+    "llm_script": "scriptwriter",
+    "script_refinement": "scriptwriter",
+    "research_ground": "research",
+    "fact_check": "research",
+}
+
+# Data dependencies between LLM steps (only steps in the run are enforced)
+STEP_REQUIRES: Dict[str, Set[str]] = {
+    "llm_outline": {"llm_cluster"},
+    "llm_script": {"llm_outline"},
+    "script_refinement": {"llm_script"},
+    "research_collect": {"llm_cluster"},
+    "research_ground": {"llm_script", "research_collect"},
+    "fact_check": {"llm_script", "research_ground"},
+}
+
+DEFAULT_KEEP_ALIVE = "30m"
+# Share of system RAM used for models when no budget is configured
+DEFAULT_BUDGET_SHARE = 0.5
+# Rough q4 weight size per billion parameters, plus runtime overhead
+GB_PER_BILLION_PARAMS = 0.6
+MODEL_OVERHEAD_GB = 0.3
+
+
+def model_key(model: str, num_ctx: Optional[int] = None) -> str:
+    """Residency identity of ``model`` loaded with a ``num_ctx`` context."""
+    return f"{model}@{num_ctx}" if num_ctx else model
+
+
+def model_name(key: str) -> str:
+    """The model a model_key() loads."""
+    model, _, num_ctx = key.rpartition("@")
+    return model if model and num_ctx.isdigit() else key
+
+
+def estimate_size_gb(model: str) -> float:
+    """Guess a model's resident size from the parameter count in its tag."""
+    match = re.search(r"(\d+(?:\.\d+)?)b\b", model.lower())
+    params = float(match.group(1)) if match else 3.0
+    return params * GB_PER_BILLION_PARAMS + MODEL_OVERHEAD_GB
+
+
+def order_steps(
+    steps: Sequence[str],
+    step_models: Dict[str, Optional[str]],
+    requires: Optional[Dict[str, Set[str]]] = None,
+) -> List[str]:
+    """
+    Reorder steps so same-model work runs back to back where allowed.
+
+    A step is ready once the steps it requires (that are part of this run)
+    have run. Steps without a model keep their position relative to every
+    other step. Among ready steps the one using the current model wins,
+    otherwise the earliest in the original order.
+    """
+    requires = STEP_REQUIRES if requires is None else requires
+    remaining = list(steps)
+    ordered: List[str] = []
+    current = None
+    while remaining:
+        ready = []
+        for i, step in enumerate(remaining):
+            if step_models.get(step) is None:
+                # A barrier is only ready first, and blocks everything after it
+                if i == 0:
+                    ready.append(step)
+                break
+            earlier = set(remaining[:i])
+            if not (requires.get(step, set()) & earlier):
+                ready.append(step)
+        step = next((s for s in ready if step_models.get(s) == current), ready[0])
+        remaining.remove(step)
+        ordered.append(step)
+        current = step_models.get(step) or current
+    return ordered
+
+
+@dataclass
+class ResidencyPlan:
+    """
+    Step order and per-step model actions.
+
+    Before a step runs, ``release`` lists models no later step needs and
+    ``evict`` lists models unloaded to make room although they are needed
+    again (each is a swap). ``preload`` names the model to load during it.
+    """
+
+    order: List[str]
+    models: Dict[str, Optional[str]]
+    budget_gb: float
+    sizes_gb: Dict[str, float]
+    release: Dict[str, List[str]] = field(default_factory=dict)
+    evict: Dict[str, List[str]] = field(default_factory=dict)
+    preload: Dict[str, str] = field(default_factory=dict)
+    loads: int = 0
+    swaps: int = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "order": self.order,
+            "budget_gb": self.budget_gb,
+            "release": self.release,
+            "evict": self.evict,
+            "preload": self.preload,
+            "loads": self.loads,
+            "swaps": self.swaps,
+        }
+
+
+def plan_residency(
+    steps: Sequence[str],
+    step_models: Dict[str, Optional[str]],
+    sizes_gb: Dict[str, float],
+    budget_gb: float,
+    requires: Optional[Dict[str, Set[str]]] = None,
+) -> ResidencyPlan:
+    """
+    Plan step order, evictions and preloads for one run.
+
+    Args:
+        steps: Upcoming steps in pipeline order
+        step_models: Model (or model_key()) per step, None for no model
+        sizes_gb: Resident size per model name or key
+        budget_gb: Memory available for resident models
+        requires: Step dependencies (defaults to STEP_REQUIRES)
+
+    Returns:
+        ResidencyPlan; loads and swaps are the planned counts
+    """
+    order = order_steps(steps, step_models, requires)
+    plan = ResidencyPlan(order, dict(step_models), budget_gb, dict(sizes_gb))
+    uses = [(step, step_models.get(step)) for step in order]
+    uses = [(step, model) for step, model in uses if model]
+
+    def size(model: str) -> float:
+        return (
+            sizes_gb.get(model)
+            or sizes_gb.get(model_name(model))
+            or estimate_size_gb(model)
+        )
+
+    def next_use(model: str, after: int) -> float:
+        for j in range(after + 1, len(uses)):
+            if uses[j][1] == model:
+                return j
+        return math.inf
+
+    resident: List[str] = []
+    for i, (step, model) in enumerate(uses):
+        # Models with no use from here on are released before anything loads
+        released = [m for m in resident if next_use(m, i - 1) == math.inf]
+        if released:
+            plan.release[step] = released
+            resident = [m for m in resident if m not in released]
+
+        if model not in resident:
+            evicted = []
+            while resident and sum(map(size, resident)) + size(model) > budget_gb:
+                victim = max(resident, key=lambda m: next_use(m, i))
+                resident.remove(victim)
+                evicted.append(victim)
+            if evicted:
+                plan.evict[step] = evicted
+                plan.swaps += len(evicted)
+            resident.append(model)
+            plan.loads += 1
+
+        # Preload the next model during this step if it fits beside the rest
+        if i + 1 < len(uses):
+            upcoming = uses[i + 1][1]
+            fits = sum(map(size, resident)) + size(upcoming) <= budget_gb
+            if upcoming not in resident and fits:
+                plan.preload[step] = upcoming
+                resident.append(upcoming)
+                plan.loads += 1
+    return plan
+
+
+def memory_budget_gb(models_config: Optional[Dict] = None) -> float:
+    """Budget from LLM_MEMORY_BUDGET_GB, models.yaml, or a share of RAM."""
+    env = os.getenv("LLM_MEMORY_BUDGET_GB")
+    if env:
+        return float(env)
+    residency = (models_config or {}).get("residency") or {}
+    if residency.get("memory_budget_gb"):
+        return float(residency["memory_budget_gb"])
+    try:
+        import psutil
+
+        total_gb = psutil.virtual_memory().total / 1024**3
+    except ImportError:  # pragma: no cover - psutil is in requirements
+        total_gb = 8.0
+    return round(total_gb * DEFAULT_BUDGET_SHARE, 1)
+
+
+def step_models_from_config(
+    steps: Sequence[str], models_config: Optional[Dict]
+) -> Dict[str, Optional[str]]:
+    """Model name per step from models.yaml roles (None for steps without)."""
+    roles = (models_config or {}).get("models", {})
+    default = ((models_config or {}).get("defaults") or {}).get(
+        "chat_model", "llama3.2:3b"
+    )
+    out: Dict[str, Optional[str]] = {}
+    for step in steps:
+        role = STEP_ROLES.get(step)
+        out[step] = (roles.get(role) or {}).get("name", default) if role else None
+    return out
+
+
+class ResidencyManager:
+    """
+    Execute a ResidencyPlan against the model server and measure it.
+
+    Args:
+        plan: The plan to follow
+        runner: ModelRunner used for load/unload requests
+        keep_alive: Residency passed to steps via LLM_KEEP_ALIVE
+        preload: Load the next model in the background during a step
+        active: Send load/unload requests (False only follows the order)
+        options: Request options per planned model, sent with its load
+    """
+
+    def __init__(
+        self,
+        plan: ResidencyPlan,
+        runner,
+        keep_alive: str = DEFAULT_KEEP_ALIVE,
+        preload: bool = True,
+        active: bool = True,
+        options: Optional[Dict[str, Dict]] = None,
+    ):
+        self.plan = plan
+        self.runner = runner
+        self.options = options or {}
+        self.keep_alive = keep_alive
+        self.preload_enabled = preload
+        self.active = active
+        self.resident: Set[str] = set()
+        self.load_s: Dict[str, float] = {}
+        self.loads = 0
+        self.swaps = 0
+        self._lock = threading.Lock()
+        self._preload: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(
+        cls, steps: Sequence[str], models_config: Optional[Dict], runner=None
+    ) -> "ResidencyManager":
+        """Plan ``steps`` with sizes from the server and the configured budget."""
+        if runner is None:
+            from bin.model_runner import ModelRunner
+
+            runner = ModelRunner()
+        # Plan what the steps will actually load: the model at its role's
+        # num_ctx, preloaded with the same options the step's requests send
+        step_models = step_models_from_config(steps, models_config)
+        options = {}
+        for step, model in step_models.items():
+            if model:
+                step_options = runner.role_options(STEP_ROLES[step])
+                key = model_key(model, step_options.get("num_ctx"))
+                step_models[step] = key
+                options[key] = step_options
+        sizes = {}
+        reachable = True
+        try:
+            for tag in runner.list_tags().get("models", []):
+                name = tag.get("name") or tag.get("model")
+                if name and tag.get("size"):
+                    sizes[name] = tag["size"] / 1024**3
+        except Exception as e:
+            # Still reorder the steps, but leave loading to the steps themselves
+            log.warning(f"Model server unreachable, planning order only: {e}")
+            reachable = False
+        residency = (models_config or {}).get("residency") or {}
+        plan = plan_residency(
+            steps, step_models, sizes, memory_budget_gb(models_config)
+        )
+        log.info(f"Residency plan: {plan.to_dict()}")
+        return cls(
+            plan,
+            runner,
+            keep_alive=str(residency.get("keep_alive", DEFAULT_KEEP_ALIVE)),
+            preload=residency.get("preload", True),
+            active=reachable,
+            options=options,
+        )
+
+    @property
+    def order(self) -> List[str]:
+        return self.plan.order
+
+    def _load(self, model: str):
+        with self._lock:
+            if model in self.resident:
+                return
+        start = time.perf_counter()
+        try:
+            reply = self.runner.load(
+                model_name(model),
+                keep_alive=self.keep_alive,
+                options=self.options.get(model),
+            )
+        except Exception as e:
+            log.warning(f"Could not load {model}: {e}")
+            return
+        # Ollama reports the load itself; fall back to wall time
+        seconds = reply.get("load_duration", 0) / 1e9 or time.perf_counter() - start
+        with self._lock:
+            self.resident.add(model)
+            self.loads += 1
+            self.load_s[model] = self.load_s.get(model, 0.0) + seconds
+        log.info(f"Loaded {model} in {seconds:.2f}s")
+
+    def _unload(self, model: str, swap: bool):
+        try:
+            self.runner.unload(model_name(model))
+        except Exception as e:
+            log.warning(f"Could not unload {model}: {e}")
+        with self._lock:
+            self.resident.discard(model)
+            self.swaps += int(swap)
+
+    def before_step(self, step: str, env: Optional[Dict[str, str]] = None):
+        """
+        Prepare the model for ``step`` and return the step's environment.
+
+        Waits for a pending preload, applies the plan's releases and
+        evictions, loads the step's model if needed and starts preloading the
+        next one.
+        """
+        env = dict(env or {})
+        model = self.plan.models.get(step)
+        if model is None or not self.active:
+            return env
+        if self._preload is not None:
+            self._preload.join()
+            self._preload = None
+        for idle in self.plan.release.get(step, []):
+            self._unload(idle, swap=False)
+        for victim in self.plan.evict.get(step, []):
+            self._unload(victim, swap=True)
+        self._load(model)
+
+        upcoming = self.plan.preload.get(step)
+        if upcoming and self.preload_enabled:
+            self._preload = threading.Thread(
+                target=self._load, args=(upcoming,), daemon=True
+            )
+            self._preload.start()
+        env["LLM_KEEP_ALIVE"] = self.keep_alive
+        return env
+
+    def report(self) -> Dict:
+        """Log and return this run's loads, swaps and load time."""
+        if self._preload is not None:
+            self._preload.join()
+            self._preload = None
+        total = sum(self.load_s.values())
+        summary = {
+            "loads": self.loads,
+            "swaps": self.swaps,
+            "load_s": round(total, 2),
+            "load_s_by_model": {m: round(s, 2) for m, s in self.load_s.items()},
+            "planned_swaps": self.plan.swaps,
+        }
+        log_state(
+            "model_residency",
+            "METRIC",
+            f"loads={self.loads};swaps={self.swaps};load_s={total:.2f}",
+        )
+        return summary
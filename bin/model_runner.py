@@ -6,6 +6,7 @@ Single client with robust timeouts, retries, and model lifecycle management.
 
 from __future__ import annotations
 
+import os
 import random
 import time
 from typing import Any, Dict, List, Optional
@@ -15,6 +16,9 @@ import requests
 
 from bin.utils.config import load_all_configs
 
+# models.yaml role keys that are not request options
+ROLE_FIELDS = ("name", "chat_model", "description", "timeout_s")
+
 
 class ModelRunner:
     def __init__(
@@ -22,15 +26,26 @@ class ModelRunner:
         base_url: Optional[str] = None,
         timeout_sec: Optional[float] = None,
         retries: int = 3,
+        priority: Optional[str] = None,
+        keep_alive: Optional[str] = None,
     ):
         bundle = load_all_configs()
         o = bundle.models.ollama
-        self.base = base_url or o.base_url
+        # Route through the shared gateway (bin/llm_gateway.py) when configured
+        self.base = base_url or getattr(o, "gateway_url", None) or o.base_url
         self.timeout = float(timeout_sec or o.timeout_sec)
         self.retries = retries
         self.sess = requests.Session()
+        # Scheduling class for the gateway: interactive, normal or batch
+        self.sess.headers["X-Priority"] = priority or os.getenv(
+            "LLM_PRIORITY", "normal"
+        )
+        # How long the server keeps a model resident after each request; the
+        # pipeline's residency planner sets LLM_KEEP_ALIVE per step
+        self.keep_alive = keep_alive or os.getenv("LLM_KEEP_ALIVE")
         self.defaults = bundle.models.defaults
         self.options = bundle.models.options
+        self.roles = bundle.models.models or {}
         self._ensured = set()
 
     @classmethod
@@ -85,6 +100,55 @@ class ModelRunner:
         # Should not reach here
         raise RuntimeError("Retry loop failed")
 
+    def list_tags(self) -> Dict[str, Any]:
+        """Models available on the server (/api/tags)."""
+        resp = self._retry_request("GET", urljoin(self.base, "/api/tags"))
+        resp.raise_for_status()
+        return resp.json()
+
+    def role_options(self, role: Optional[str]) -> Dict[str, Any]:
+        """Request options for a models.yaml role, on top of the shared ones."""
+        options = dict(self.options.__dict__)
+        role_cfg = (self.roles.get(role) or {}) if role else {}
+        options.update({k: v for k, v in role_cfg.items() if k not in ROLE_FIELDS})
+        return options
+
+    def load(
+        self,
+        model: str,
+        keep_alive: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Load ``model`` without generating anything.
+
+        Args:
+            model: Model to load
+            keep_alive: How long the server keeps it resident
+            options: Request options of the calls that will use the model;
+                Ollama starts a new runner when e.g. ``num_ctx`` differs
+
+        Returns:
+            Server reply; ``load_duration`` (ns) is the time spent loading
+        """
+        body = {"model": model, "keep_alive": keep_alive or self.keep_alive or "5m"}
+        if options:
+            body["options"] = options
+        resp = self._retry_request(
+            "POST", urljoin(self.base, "/api/generate"), json=body
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    def unload(self, model: str) -> None:
+        """Ask the server to release ``model`` now."""
+        resp = self._retry_request(
+            "POST",
+            urljoin(self.base, "/api/generate"),
+            json={"model": model, "keep_alive": 0},
+        )
+        resp.raise_for_status()
+
     def ensure_model(self, model: str) -> None:
         """Ensure model is available (optional preflight check)."""
         if model in self._ensured:
@@ -126,6 +190,8 @@ class ModelRunner:
         self.ensure_model(mdl)  # Optional preflight; never per-call pull
 
         body = {"model": mdl, "messages": messages, "stream": stream}
+        if self.keep_alive:
+            body["keep_alive"] = self.keep_alive
 
         # Merge options with defaults and task-specific config
         merged_options = dict(self.options.__dict__)
@@ -167,6 +233,8 @@ class ModelRunner:
         self.ensure_model(mdl)  # Optional preflight; never per-call pull
 
         body = {"model": mdl, "prompt": prompt, "stream": stream}
+        if self.keep_alive:
+            body["keep_alive"] = self.keep_alive
         if options or self.options:
             oo = dict(self.options.__dict__)
             oo.update(options or {})
@@ -185,6 +253,8 @@ class ModelRunner:
         self.ensure_model(mdl)  # Optional preflight; never per-call pull
 
         body = {"model": mdl, "input": input_texts}
+        if self.keep_alive:
+            body["keep_alive"] = self.keep_alive
         resp = self._retry_request(
             "POST", urljoin(self.base, "/api/embeddings"), json=body
         )
@@ -222,10 +292,18 @@ class ModelSession:
     Use ModelRunner directly for new code.
     """
 
-    def __init__(self, model_name: str, server: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        model_name: str,
+        server: Optional[str] = None,
+        priority: Optional[str] = None,
+        role: Optional[str] = None,
+    ):
         self.model_name = model_name
-        self.server = server
-        self._runner = ModelRunner(base_url=server)
+        self._runner = ModelRunner(base_url=server, priority=priority)
+        self.server = self._runner.base
+        # Role options go with every request, as the residency planner's load
+        self.role_options = self._runner.role_options(role) if role else {}
 
     def __enter__(self):
         return self
@@ -238,7 +316,7 @@ class ModelSession:
             {"role": "system", "content": system},
             {"role": "user", "content": user},
         ]
-        options = {}
+        options = dict(self.role_options)
         if opts:
             options.update(opts)
 
@@ -246,7 +324,7 @@ class ModelSession:
         return result.get("message", {}).get("content", "")
 
     def generate(self, prompt: str, **opts) -> str:
-        options = {}
+        options = dict(self.role_options)
         if opts:
             options.update(opts)
 
@@ -255,16 +333,21 @@ class ModelSession:
 
 
 def model_session(
-    model_name: str, server: str = "http://localhost:11434"
+    model_name: str,
+    server: Optional[str] = None,
+    priority: Optional[str] = None,
+    role: Optional[str] = None,
 ) -> ModelSession:
     """
     Create a model session context manager (legacy compatibility).
 
     Args:
         model_name: Name of the Ollama model to use
-        server: Ollama server URL
+        server: Ollama server URL (defaults to the gateway or models.yaml)
+        priority: Gateway scheduling class (defaults to LLM_PRIORITY)
+        role: models.yaml role whose options (num_ctx, ...) requests use
 
     Returns:
         ModelSession context manager
     """
-    return ModelSession(model_name, server)
+    return ModelSession(model_name, server, priority, role)
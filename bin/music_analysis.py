@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Music Feature Analysis
+
+Tempo, energy and loudness features for music beds, computed with NumPy over
+PCM decoded by ffmpeg. Tempo comes from a spectral-flux onset envelope whose
+autocorrelation is searched for the strongest beat period, weighted towards
+moderate tempos to avoid octave (half/double tempo) errors.
+"""
+
+import hashlib
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from bin.core import get_logger
+
+log = get_logger("music_analysis")
+
+# Bump when the feature definitions change so cached results are recomputed
+ANALYSIS_VERSION = 1
+
+SAMPLE_RATE = 11025
+N_FFT = 512
+HOP = 128
+MIN_BPM = 60
+MAX_BPM = 180
+# Log-normal tempo prior: centre and width (in octaves)
+PRIOR_BPM = 120.0
+PRIOR_OCTAVES = 1.0
+
+
+def file_hash(path: str) -> str:
+    """SHA-1 of a file's contents, used to key cached features."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def decode_pcm(path: str, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Decode an audio file to mono float32 PCM with ffmpeg."""
+    cmd = [
+        "ffmpeg",
+        "-v",
+        "error",
+        "-i",
+        path,
+        "-f",
+        "f32le",
+        "-ac",
+        "1",
+        "-ar",
+        str(sample_rate),
+        "-",
+    ]
+    proc = subprocess.run(cmd, capture_output=True, timeout=300)
+    if proc.returncode != 0:
+        stderr = proc.stderr.decode(errors="replace")[-500:]
+        raise RuntimeError(f"ffmpeg decode failed for {path}: {stderr}")
+    return np.frombuffer(proc.stdout, dtype=np.float32)
+
+
+def _frames(samples: np.ndarray, size: int, hop: int) -> np.ndarray:
+    if len(samples) < size:
+        samples = np.pad(samples, (0, size - len(samples)))
+    return np.lib.stride_tricks.sliding_window_view(samples, size)[::hop]
+
+
+def onset_envelope(samples: np.ndarray) -> np.ndarray:
+    """Half-wave rectified spectral flux of the log-magnitude spectrogram."""
+    frames = _frames(samples, N_FFT, HOP) * np.hanning(N_FFT).astype(np.float32)
+    spectrum = np.log1p(100.0 * np.abs(np.fft.rfft(frames, axis=1)))
+    flux = np.maximum(np.diff(spectrum, axis=0), 0.0).sum(axis=1)
+    if len(flux) == 0:
+        return flux
+    # Remove the slowly varying part so sustained loudness is not an onset
+    width = 16
+    kernel = np.ones(width) / width
+    local_mean = np.convolve(flux, kernel, mode="same")
+    envelope = np.maximum(flux - local_mean, 0.0)
+    # Light smoothing so a beat period between two frames still peaks cleanly
+    smooth = np.hanning(5)[1:-1]
+    return np.convolve(envelope, smooth / smooth.sum(), mode="same")
+
+
+def estimate_tempo(envelope: np.ndarray, frame_rate: float) -> Dict[str, float]:
+    """
+    Estimate tempo from an onset envelope via autocorrelation.
+
+    Args:
+        envelope: Onset strength per frame
+        frame_rate: Envelope frames per second
+
+    Returns:
+        Dict with ``bpm`` (0 when no periodicity is found) and ``confidence``
+        (interpolated autocorrelation peak at that period, 0..1)
+    """
+    min_lag = int(np.floor(60.0 * frame_rate / MAX_BPM))
+    max_lag = int(np.ceil(60.0 * frame_rate / MIN_BPM))
+    if len(envelope) <= max_lag + 1:
+        return {"bpm": 0.0, "confidence": 0.0}
+
+    env = envelope - envelope.mean()
+    size = 1 << int(np.ceil(np.log2(2 * len(env))))
+    spectrum = np.fft.rfft(env, size)
+    acf = np.fft.irfft(spectrum * np.conj(spectrum), size)[: len(env)]
+    if acf[0] <= 0:
+        return {"bpm": 0.0, "confidence": 0.0}
+    acf = acf / acf[0]
+
+    # Peak heights via parabolic interpolation: a beat period that falls
+    # between two lags would otherwise split its peak and lose to a multiple
+    lags = np.arange(max(min_lag, 1), max_lag + 1)
+    a, b, c = acf[lags - 1], acf[lags], acf[lags + 1]
+    curvature = a - 2 * b + c
+    is_peak = (b >= a) & (b >= c) & (curvature < 0)
+    safe = np.where(is_peak, curvature, -1.0)
+    height = np.where(is_peak, b - (a - c) ** 2 / (8 * safe), 0.0)
+
+    bpms = 60.0 * frame_rate / lags
+    prior = np.exp(-0.5 * (np.log2(bpms / PRIOR_BPM) / PRIOR_OCTAVES) ** 2)
+    best = int(np.argmax(np.maximum(height, 0.0) * prior))
+    if height[best] <= 0:
+        return {"bpm": 0.0, "confidence": 0.0}
+
+    lag = lags[best] + 0.5 * (a[best] - c[best]) / safe[best]
+    return {
+        "bpm": 60.0 * frame_rate / lag,
+        "confidence": float(min(1.0, height[best])),
+    }
+
+
+def analyze_samples(samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> Dict:
+    """Compute tempo, energy and loudness features from mono PCM."""
+    if len(samples) == 0:
+        raise ValueError("no audio samples to analyze")
+    duration = len(samples) / float(sample_rate)
+    tempo = estimate_tempo(onset_envelope(samples), sample_rate / HOP)
+
+    frame_rms = np.sqrt(np.mean(_frames(samples, N_FFT * 4, N_FFT) ** 2, axis=1))
+    overall_rms = float(np.sqrt(np.mean(samples.astype(np.float64) ** 2)))
+    eps = 1e-10
+    rms_db = 20 * np.log10(frame_rms + eps)
+
+    return {
+        "bpm": int(round(tempo["bpm"])) or None,
+        "tempo_confidence": round(tempo["confidence"], 4),
+        "duration": round(duration, 3),
+        "energy": round(float(frame_rms.mean()), 6),
+        "loudness_db": round(20 * np.log10(overall_rms + eps), 2),
+        "dynamic_range_db": round(
+            float(np.percentile(rms_db, 95) - np.percentile(rms_db, 10)), 2
+        ),
+    }
+
+
+def analyze_file(path: str) -> Dict:
+    """Decode ``path`` and compute its features."""
+    return analyze_samples(decode_pcm(path))
+
+
+def analyze_files(
+    paths: Iterable[str], max_workers: Optional[int] = None
+) -> Dict[str, Optional[Dict]]:
+    """
+    Analyze several files in parallel.
+
+    Decoding runs in ffmpeg subprocesses and the NumPy FFT work releases the
+    GIL, so a thread pool keeps all cores busy.
+
+    Args:
+        paths: Audio files to analyze
+        max_workers: Worker threads (defaults to the CPU count, capped at 8)
+
+    Returns:
+        Features per path, or None for files that could not be analyzed
+    """
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return {}
+    workers = max_workers or min(8, os.cpu_count() or 1)
+
+    def run(path: str) -> Optional[Dict]:
+        try:
+            return analyze_file(path)
+        except Exception as e:
+            log.warning(f"Feature analysis failed for {path}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return dict(zip(paths, pool.map(run, paths)))
@@ -230,38 +230,32 @@ class MusicIntegrationManager:
             # Supported audio formats
             audio_extensions = {".mp3", ".wav", ".m4a", ".flac", ".ogg"}
 
-            imported_count = 0
-            for audio_file in source_path.rglob("*"):
+            entries = []
+            for audio_file in sorted(source_path.rglob("*")):
                 if audio_file.suffix.lower() in audio_extensions:
-                    try:
-                        # Extract basic info from filename
-                        title = audio_file.stem
-                        artist = "Unknown Artist"  # Could be enhanced with metadata extraction
-
-                        # Add to library
-                        track_id = self.library.add_track(
-                            file_path=str(audio_file),
-                            title=title,
-                            artist=artist,
-                            license=(
+                    # Extract basic info from filename
+                    entries.append(
+                        {
+                            "file_path": str(audio_file),
+                            "title": audio_file.stem,
+                            # Could be enhanced with metadata extraction
+                            "artist": "Unknown Artist",
+                            "license": (
                                 license_info.get("license", "unknown")
                                 if license_info
                                 else None
                             ),
-                            source=(
+                            "source": (
                                 license_info.get("source", "local")
                                 if license_info
                                 else None
                             ),
-                        )
+                        }
+                    )
 
-                        if track_id:
-                            imported_count += 1
-                            log.info(f"Imported track: {title}")
-
-                    except Exception as e:
-                        log.warning(f"Failed to import {audio_file}: {e}")
-                        continue
+            # Audio analysis for the whole batch runs in parallel
+            track_ids = self.library.add_tracks(entries)
+            imported_count = len(track_ids)
 
             log.info(f"Successfully imported {imported_count} tracks")
             return imported_count
@@ -8,11 +8,13 @@ with the video pipeline according to the music bed policy.
 
 import json
 import os
+import sqlite3
 import subprocess
 
 # Ensure repo root on path
 import sys
-from dataclasses import asdict, dataclass
+import threading
+from dataclasses import asdict, dataclass, fields
 from typing import Any, Dict, List, Optional
 
 from pathlib import Path
@@ -22,6 +24,7 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 from bin.core import get_logger, load_config
+from bin.music_analysis import ANALYSIS_VERSION, analyze_files, file_hash
 
 log = get_logger("music_library")
 
@@ -40,6 +43,9 @@ class MusicTrack:
     license: Optional[str] = None
     source: Optional[str] = None
     tags: List[str] = None
+    energy: Optional[float] = None
+    loudness_db: Optional[float] = None
+    file_hash: Optional[str] = None
 
     def __post_init__(self):
         if self.tags is None:
@@ -49,39 +55,193 @@ class MusicTrack:
         return asdict(self)
 
 
+_TRACK_COLUMNS = [f.name for f in fields(MusicTrack)]
+
+
 class MusicLibrary:
-    """Manages music tracks with BPM analysis and mood tagging."""
+    """Manages music tracks with BPM analysis and mood tagging.
+
+    Tracks live in an indexed SQLite table (``library.db``) so selection by
+    mood, BPM and duration is a range query. Audio features are cached by
+    file hash, so re-importing the same file never decodes it again.
+    ``library.json`` is a readable snapshot written by ``export_json()``.
+    """
 
     def __init__(self, library_path: str = "assets/music"):
         self.library_path = Path(library_path)
         self.library_path.mkdir(parents=True, exist_ok=True)
         self.metadata_file = self.library_path / "library.json"
-        self.tracks: Dict[str, MusicTrack] = {}
-        self._load_library()
+        self.db_path = self.library_path / "library.db"
+        self._lock = threading.Lock()
+        is_new = not self.db_path.exists()
+        self._init_database()
+        if is_new:
+            self._load_library()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_database(self):
+        """Create tables and indexes."""
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS tracks (
+                    track_id TEXT PRIMARY KEY,
+                    file_path TEXT NOT NULL,
+                    title TEXT,
+                    artist TEXT,
+                    bpm INTEGER,
+                    mood TEXT COLLATE NOCASE,
+                    genre TEXT COLLATE NOCASE,
+                    duration REAL,
+                    license TEXT,
+                    source TEXT,
+                    tags TEXT,
+                    energy REAL,
+                    loudness_db REAL,
+                    file_hash TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_tracks_mood_bpm ON tracks(mood, bpm);
+                CREATE INDEX IF NOT EXISTS idx_tracks_bpm ON tracks(bpm);
+                CREATE INDEX IF NOT EXISTS idx_tracks_duration ON tracks(duration);
+                CREATE INDEX IF NOT EXISTS idx_tracks_genre ON tracks(genre);
+
+                CREATE TABLE IF NOT EXISTS features (
+                    file_hash TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    data TEXT NOT NULL
+                );
+                """
+            )
 
     def _load_library(self):
-        """Load existing music library metadata."""
-        if self.metadata_file.exists():
-            try:
-                with open(self.metadata_file, "r") as f:
-                    data = json.load(f)
-                    for track_id, track_data in data.items():
-                        self.tracks[track_id] = MusicTrack(**track_data)
-                log.info(f"Loaded {len(self.tracks)} tracks from music library")
-            except Exception as e:
-                log.warning(f"Failed to load music library: {e}")
-
-    def _save_library(self):
-        """Save music library metadata."""
+        """Import a JSON-only library into a newly created store."""
+        if not self.metadata_file.exists():
+            return
+        try:
+            with open(self.metadata_file, "r") as f:
+                data = json.load(f)
+            tracks = {
+                track_id: MusicTrack(**track_data)
+                for track_id, track_data in data.items()
+            }
+            self._upsert_tracks(tracks)
+            log.info(f"Loaded {len(tracks)} tracks from music library")
+        except Exception as e:
+            log.warning(f"Failed to load music library: {e}")
+
+    def export_json(self):
+        """Write all tracks to ``library.json`` (atomically)."""
         try:
             data = {
                 track_id: track.to_dict() for track_id, track in self.tracks.items()
             }
-            with open(self.metadata_file, "w") as f:
+            tmp_path = self.metadata_file.with_suffix(".json.tmp")
+            with open(tmp_path, "w") as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.metadata_file)
         except Exception as e:
             log.error(f"Failed to save music library: {e}")
 
+    @staticmethod
+    def _row_to_track(row: sqlite3.Row) -> MusicTrack:
+        data = {name: row[name] for name in _TRACK_COLUMNS}
+        data["tags"] = json.loads(data["tags"]) if data["tags"] else []
+        return MusicTrack(**data)
+
+    def _upsert_tracks(self, tracks: Dict[str, MusicTrack]):
+        rows = []
+        for track_id, track in tracks.items():
+            data = track.to_dict()
+            data["tags"] = json.dumps(data["tags"] or [])
+            rows.append([track_id] + [data[name] for name in _TRACK_COLUMNS])
+        columns = ", ".join(["track_id"] + _TRACK_COLUMNS)
+        placeholders = ", ".join("?" * (len(_TRACK_COLUMNS) + 1))
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO tracks ({columns}) VALUES ({placeholders})",
+                rows,
+            )
+
+    def _query(
+        self,
+        where: str = "1",
+        params: tuple = (),
+        order: str = "rowid",
+        limit: int = -1,
+    ) -> List[sqlite3.Row]:
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            return conn.execute(
+                f"SELECT rowid, * FROM tracks WHERE {where} "
+                f"ORDER BY {order} LIMIT {int(limit)}",
+                params,
+            ).fetchall()
+
+    @property
+    def tracks(self) -> Dict[str, MusicTrack]:
+        """All tracks keyed by track id, in insertion order."""
+        return {row["track_id"]: self._row_to_track(row) for row in self._query()}
+
+    def _cached_features(self, hashes: List[str]) -> Dict[str, Dict]:
+        if not hashes:
+            return {}
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT file_hash, data FROM features "
+                f"WHERE version = ? AND file_hash IN ({', '.join('?' * len(hashes))})",
+                (ANALYSIS_VERSION, *hashes),
+            ).fetchall()
+        return {h: json.loads(data) for h, data in rows}
+
+    def analyze_tracks(
+        self, file_paths: List[str], max_workers: Optional[int] = None
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Audio features for each file, analyzing only files not seen before.
+
+        Args:
+            file_paths: Audio files
+            max_workers: Parallel analysis workers
+
+        Returns:
+            Features (plus ``file_hash``) per path; None when analysis failed
+        """
+        hashes = {path: file_hash(path) for path in file_paths}
+        cached = self._cached_features(list(set(hashes.values())))
+
+        todo: Dict[str, str] = {}
+        for path, digest in hashes.items():
+            if digest not in cached:
+                todo.setdefault(digest, path)
+        if todo:
+            analyzed = analyze_files(todo.values(), max_workers)
+            fresh = {
+                digest: analyzed[path]
+                for digest, path in todo.items()
+                if analyzed.get(path)
+            }
+            with self._lock, self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO features (file_hash, version, data) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (digest, ANALYSIS_VERSION, json.dumps(features))
+                        for digest, features in fresh.items()
+                    ],
+                )
+            cached.update(fresh)
+
+        results = {}
+        for path, digest in hashes.items():
+            features = cached.get(digest)
+            results[path] = dict(features, file_hash=digest) if features else None
+        return results
+
     def add_track(
         self,
         file_path: str,
@@ -92,68 +252,95 @@ class MusicLibrary:
         license: Optional[str] = None,
         source: Optional[str] = None,
         tags: Optional[List[str]] = None,
+        bpm: Optional[int] = None,
+        duration: Optional[float] = None,
     ) -> str:
         """Add a new track to the library with automatic BPM detection."""
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Music file not found: {file_path}")
-
-        # Generate track ID from filename
-        track_id = Path(file_path).stem
-
-        # Detect BPM if not provided
-        bpm = None
-        if not mood:  # Only detect BPM if we need to analyze the track
-            bpm = self._detect_bpm(file_path)
-
-        # Get duration
-        duration = self._get_duration(file_path)
-
-        # Create track object
-        track = MusicTrack(
-            file_path=file_path,
-            title=title,
-            artist=artist,
-            bpm=bpm,
-            mood=mood,
-            genre=genre,
-            duration=duration,
-            license=license,
-            source=source,
-            tags=tags or [],
-        )
+        return self.add_tracks(
+            [
+                {
+                    "file_path": file_path,
+                    "title": title,
+                    "artist": artist,
+                    "mood": mood,
+                    "genre": genre,
+                    "license": license,
+                    "source": source,
+                    "tags": tags,
+                    "bpm": bpm,
+                    "duration": duration,
+                }
+            ]
+        )[0]
 
-        self.tracks[track_id] = track
-        self._save_library()
-        log.info(f"Added track: {title} by {artist} (BPM: {bpm})")
+    def add_tracks(
+        self,
+        entries: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        export: bool = True,
+    ) -> List[str]:
+        """
+        Add several tracks, analyzing their audio in parallel.
+
+        Each entry takes the keyword arguments of ``add_track``. An explicit
+        ``bpm`` or ``duration`` overrides the analyzed value.
+
+        Args:
+            entries: Track descriptions
+            max_workers: Parallel analysis workers
+            export: Refresh ``library.json`` once after the batch
+
+        Returns:
+            Track ids, in entry order
+        """
+        for entry in entries:
+            if not os.path.exists(entry["file_path"]):
+                raise FileNotFoundError(f"Music file not found: {entry['file_path']}")
+
+        features = self.analyze_tracks([e["file_path"] for e in entries], max_workers)
+
+        tracks: Dict[str, MusicTrack] = {}
+        for entry in entries:
+            file_path = entry["file_path"]
+            found = features.get(file_path) or {}
+
+            # Explicit values win; fall back to ffprobe when analysis failed
+            bpm = entry.get("bpm") or found.get("bpm")
+            duration = entry.get("duration") or found.get("duration")
+            if duration is None:
+                duration = self._get_duration(file_path)
+
+            # Generate track ID from filename
+            track_id = Path(file_path).stem
+            tracks[track_id] = MusicTrack(
+                file_path=file_path,
+                title=entry["title"],
+                artist=entry["artist"],
+                bpm=bpm,
+                mood=entry.get("mood"),
+                genre=entry.get("genre"),
+                duration=duration,
+                license=entry.get("license"),
+                source=entry.get("source"),
+                tags=entry.get("tags") or [],
+                energy=found.get("energy"),
+                loudness_db=found.get("loudness_db"),
+                file_hash=found.get("file_hash"),
+            )
+            log.info(f"Added track: {entry['title']} by {entry['artist']} (BPM: {bpm})")
 
-        return track_id
+        self._upsert_tracks(tracks)
+        if export:
+            self.export_json()
+        return list(tracks)
 
     def _detect_bpm(self, file_path: str) -> Optional[int]:
-        """Detect BPM using ffmpeg and audio analysis."""
-        try:
-            # Use ffmpeg to extract audio features for BPM detection
-            # This is a simplified approach - in production you might want
-            # a more sophisticated BPM detection library
-            cmd = [
-                "ffmpeg",
-                "-i",
-                file_path,
-                "-af",
-                "silencedetect=noise=-50dB:d=0.1",
-                "-f",
-                "null",
-                "-",
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            # For now, return a default BPM based on file analysis
-            # In a full implementation, you'd analyze the audio data
-            # This is a placeholder that would be replaced with actual BPM detection
-            return 120  # Default BPM
-
-        except Exception as e:
-            log.warning(f"BPM detection failed for {file_path}: {e}")
+        """Detect BPM from the onset envelope of the decoded audio."""
+        features = self.analyze_tracks([file_path]).get(file_path)
+        if not features:
+            log.warning(f"BPM detection failed for {file_path}")
             return None
+        return features["bpm"]
 
     def _get_duration(self, file_path: str) -> Optional[float]:
         """Get audio file duration using ffprobe."""
@@ -175,6 +362,41 @@ class MusicLibrary:
             log.warning(f"Duration detection failed for {file_path}: {e}")
         return None
 
+    @staticmethod
+    def _score(
+        track: MusicTrack,
+        target_bpm: Optional[int],
+        mood: Optional[str],
+        genre: Optional[str],
+        min_duration: Optional[float],
+        max_duration: Optional[float],
+    ) -> float:
+        score = 0
+
+        # BPM matching (closer is better)
+        if target_bpm and track.bpm:
+            bpm_diff = abs(track.bpm - target_bpm)
+            if bpm_diff <= 10:
+                score += 100 - bpm_diff * 5  # Higher score for closer BPM
+            elif bpm_diff <= 20:
+                score += 50 - bpm_diff * 2
+
+        # Mood matching
+        if mood and track.mood and mood.lower() == track.mood.lower():
+            score += 50
+
+        # Genre matching
+        if genre and track.genre and genre.lower() == track.genre.lower():
+            score += 30
+
+        # Prefer tracks that are close to target duration
+        if track.duration and min_duration and max_duration:
+            target_duration = (min_duration + max_duration) / 2
+            duration_diff = abs(track.duration - target_duration)
+            score += max(0, 20 - duration_diff)
+
+        return score
+
     def select_track(
         self,
         target_bpm: Optional[int] = None,
@@ -183,73 +405,86 @@ class MusicLibrary:
         min_duration: Optional[float] = None,
         max_duration: Optional[float] = None,
     ) -> Optional[MusicTrack]:
-        """Select the best matching track based on criteria."""
-        if not self.tracks:
-            log.warning("No tracks available in music library")
-            return None
-
-        # Score tracks based on criteria
-        scored_tracks = []
-        for track in self.tracks.values():
-            score = 0
-
-            # BPM matching (closer is better)
-            if target_bpm and track.bpm:
-                bpm_diff = abs(track.bpm - target_bpm)
-                if bpm_diff <= 10:
-                    score += 100 - bpm_diff * 5  # Higher score for closer BPM
-                elif bpm_diff <= 20:
-                    score += 50 - bpm_diff * 2
-
-            # Mood matching
-            if mood and track.mood and mood.lower() == track.mood.lower():
-                score += 50
-
-            # Genre matching
-            if genre and track.genre and genre.lower() == track.genre.lower():
-                score += 30
-
-            # Duration constraints
-            if track.duration:
-                if min_duration and track.duration < min_duration:
-                    continue  # Skip tracks that are too short
-                if max_duration and track.duration > max_duration:
-                    continue  # Skip tracks that are too long
-
-                # Prefer tracks that are close to target duration
-                if min_duration and max_duration:
-                    target_duration = (min_duration + max_duration) / 2
-                    duration_diff = abs(track.duration - target_duration)
-                    score += max(0, 20 - duration_diff)
-
-            scored_tracks.append((track, score))
-
-        if not scored_tracks:
+        """Select the best matching track based on criteria.
+
+        Only tracks matching the BPM window, mood or genre are scored, via
+        indexed range queries. The rest can score at most 20 (duration
+        closeness), so the closest of them is fetched only when no match
+        beats that. Ties go to the earlier track, as before.
+        """
+        # Tracks outside the duration range are skipped (unknown durations pass)
+        where = ["1"]
+        params: List[Any] = []
+        if min_duration:
+            where.append("(duration IS NULL OR duration = 0 OR duration >= ?)")
+            params.append(min_duration)
+        if max_duration:
+            where.append("(duration IS NULL OR duration = 0 OR duration <= ?)")
+            params.append(max_duration)
+        allowed = " AND ".join(where)
+
+        # Everything that can score on BPM, mood or genre (NULLs never match)
+        match = []
+        match_params: List[Any] = []
+        if target_bpm:
+            match.append("IFNULL(bpm BETWEEN ? AND ?, 0)")
+            match_params += [target_bpm - 20, target_bpm + 20]
+        if mood:
+            match.append("IFNULL(mood = ?, 0)")
+            match_params.append(mood)
+        if genre:
+            match.append("IFNULL(genre = ?, 0)")
+            match_params.append(genre)
+
+        args = (target_bpm, mood, genre, min_duration, max_duration)
+        best = None  # (score, -rowid, track)
+        matched = f"({' OR '.join(match)})" if match else "0"
+        for row in self._query(f"{allowed} AND {matched}", (*params, *match_params)):
+            track = self._row_to_track(row)
+            key = (self._score(track, *args), -row["rowid"])
+            if best is None or key > best[:2]:
+                best = (*key, track)
+
+        if best is None or best[0] <= 20:
+            # Best unmatched track: highest duration score (clamped at 0, as
+            # in _score), earliest on ties
+            order = "rowid"
+            order_params: tuple = ()
+            if min_duration and max_duration:
+                order = (
+                    "CASE WHEN duration IS NULL OR duration = 0 THEN 0 "
+                    "ELSE MAX(0, 20 - ABS(duration - ?)) END DESC, rowid"
+                )
+                order_params = ((min_duration + max_duration) / 2,)
+            rows = self._query(
+                f"{allowed} AND NOT {matched}",
+                (*params, *match_params, *order_params),
+                order,
+                limit=1,
+            )
+            if rows:
+                track = self._row_to_track(rows[0])
+                key = (self._score(track, *args), -rows[0]["rowid"])
+                if best is None or key > best[:2]:
+                    best = (*key, track)
+
+        if best is None:
+            if not self.tracks:
+                log.warning("No tracks available in music library")
             return None
 
-        # Sort by score and return the best match
-        scored_tracks.sort(key=lambda x: x[1], reverse=True)
-        best_track = scored_tracks[0][0]
-        best_score = scored_tracks[0][1]
-
+        best_score, _, best_track = best
         log.info(f"Selected track: {best_track.title} (score: {best_score})")
         return best_track
 
     def get_tracks_by_mood(self, mood: str) -> List[MusicTrack]:
         """Get all tracks matching a specific mood."""
-        return [
-            track
-            for track in self.tracks.values()
-            if track.mood and track.mood.lower() == mood.lower()
-        ]
+        return [self._row_to_track(row) for row in self._query("mood = ?", (mood,))]
 
     def get_tracks_by_bpm_range(self, min_bpm: int, max_bpm: int) -> List[MusicTrack]:
         """Get all tracks within a BPM range."""
-        return [
-            track
-            for track in self.tracks.values()
-            if track.bpm and min_bpm <= track.bpm <= max_bpm
-        ]
+        rows = self._query("bpm > 0 AND bpm BETWEEN ? AND ?", (min_bpm, max_bpm))
+        return [self._row_to_track(row) for row in rows]
 
     def list_tracks(self) -> List[Dict[str, Any]]:
         """List all tracks with metadata."""
@@ -257,10 +492,13 @@ class MusicLibrary:
 
     def remove_track(self, track_id: str) -> bool:
         """Remove a track from the library."""
-        if track_id in self.tracks:
-            del self.tracks[track_id]
-            self._save_library()
+        with self._lock, self._connect() as conn:
+            removed = conn.execute(
+                "DELETE FROM tracks WHERE track_id = ?", (track_id,)
+            ).rowcount
+        if removed:
             log.info(f"Removed track: {track_id}")
+            self.export_json()
             return True
         return False
 
@@ -12,6 +12,7 @@ import subprocess
 # Ensure repo root on path
 import sys
 import tempfile
+from typing import List, Optional
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
@@ -22,6 +23,18 @@ from bin.core import get_logger, load_config
 log = get_logger("music_mixer")
 
 
+def _audio_codec_args(output_path: str) -> List[str]:
+    """Encoder arguments for the mix output, chosen by file extension."""
+    ext = os.path.splitext(output_path)[1].lower()
+    if ext == ".wav":
+        return ["-c:a", "pcm_s16le"]
+    if ext == ".flac":
+        return ["-c:a", "flac"]
+    if ext in (".m4a", ".aac"):
+        return ["-c:a", "aac", "-b:a", "192k"]
+    return ["-c:a", "libmp3lame", "-q:a", "2"]
+
+
 class MusicMixer:
     """Professional audio mixing with ducking, fading, and volume control."""
 
@@ -48,10 +61,15 @@ class MusicMixer:
         fade_in_ms: int = 500,
         fade_out_ms: int = 500,
         enable_ducking: bool = True,
+        target_lufs: Optional[float] = None,
     ) -> bool:
         """
         Mix voiceover with background music using professional techniques.
 
+        The whole mix (loop/trim, fades, ducking, amix and optional loudness
+        normalization) runs as one ffmpeg filter graph, so each input is
+        decoded once and the result is encoded once.
+
         Args:
             voiceover_path: Path to voiceover audio file
             music_path: Path to background music file
@@ -61,6 +79,7 @@ class MusicMixer:
             fade_in_ms: Fade-in duration in milliseconds
             fade_out_ms: Fade-out duration in milliseconds
             enable_ducking: Whether to enable sidechain ducking
+            target_lufs: Loudness-normalize the mix to this target (optional)
 
         Returns:
             bool: True if successful, False otherwise
@@ -68,70 +87,76 @@ class MusicMixer:
         try:
             log.info(f"Mixing audio: VO={voiceover_path}, Music={music_path}")
 
-            if enable_ducking:
-                return self._mix_with_ducking(
-                    voiceover_path,
-                    music_path,
-                    output_path,
-                    music_db,
-                    duck_db,
-                    fade_in_ms,
-                    fade_out_ms,
-                )
-            else:
-                return self._mix_simple(
-                    voiceover_path,
-                    music_path,
-                    output_path,
-                    music_db,
-                    fade_in_ms,
-                    fade_out_ms,
-                )
+            return self._run_mix(
+                voiceover_path,
+                music_path,
+                output_path,
+                music_db,
+                fade_in_ms,
+                fade_out_ms,
+                enable_ducking,
+                target_lufs,
+            )
 
         except Exception as e:
             log.error(f"Audio mixing failed: {e}")
             return False
 
-    def _mix_with_ducking(
+    def build_mix_graph(
         self,
-        voiceover_path: str,
-        music_path: str,
-        output_path: str,
+        duration: float,
         music_db: float,
-        duck_db: float,
         fade_in_ms: int,
         fade_out_ms: int,
-    ) -> bool:
-        """Mix audio with professional sidechain ducking."""
-        try:
-            # Create temporary files for processing
-            temp_music = os.path.join(self.temp_dir, "temp_music.mp3")
-            temp_ducked = os.path.join(self.temp_dir, "temp_ducked.mp3")
-
-            # Step 1: Prepare music with fades
-            if not self._prepare_music_with_fades(
-                music_path, temp_music, fade_in_ms, fade_out_ms
-            ):
-                return False
+        enable_ducking: bool = True,
+        target_lufs: Optional[float] = None,
+    ) -> str:
+        """
+        Build the ``-filter_complex`` graph for a single-pass mix.
 
-            # Step 2: Apply sidechain compression for ducking
-            if not self._apply_sidechain_ducking(
-                temp_music, voiceover_path, temp_ducked, music_db, duck_db
-            ):
-                return False
+        Input 0 is the voiceover, input 1 the (looped) music. The bed is
+        trimmed to the voiceover length, faded, ducked against the voiceover
+        and mixed, all without intermediate files.
 
-            # Step 3: Mix voiceover and ducked music
-            if not self._final_mix(voiceover_path, temp_ducked, output_path):
-                return False
+        Args:
+            duration: Voiceover duration in seconds (the mix length)
+            music_db: Music volume in dB
+            fade_in_ms: Fade-in duration in milliseconds
+            fade_out_ms: Fade-out duration in milliseconds
+            enable_ducking: Whether to sidechain-compress the music under the VO
+            target_lufs: Optional loudnorm target applied to the final mix
 
-            log.info("Successfully applied sidechain ducking and mixing")
-            return True
+        Returns:
+            str: Filter graph with the mixed stream labelled ``[out]``
+        """
+        fade_in = max(0.0, min(fade_in_ms / 1000, duration))
+        fade_out = max(0.0, min(fade_out_ms / 1000, duration))
+        bed = (
+            f"[1:a]atrim=0:{duration:.3f},asetpts=N/SR/TB,"
+            f"afade=t=in:st=0:d={fade_in:.3f},"
+            f"afade=t=out:st={duration - fade_out:.3f}:d={fade_out:.3f}"
+        )
 
-        except Exception as e:
-            log.error(f"Ducking-based mixing failed: {e}")
-            return False
+        if enable_ducking:
+            chains = [
+                f"{bed}[bed]",
+                "[0:a]asplit=2[vo][key]",
+                "[bed][key]sidechaincompress=threshold=0.1:ratio=4:attack=5:release=50,"
+                f"volume={music_db}dB[music]",
+            ]
+        else:
+            chains = [
+                f"{bed},volume={pow(10, music_db/20):.6f}[music]",
+                "[0:a]volume=1.0[vo]",
+            ]
+
+        mix = "[vo][music]amix=inputs=2:duration=first"
+        if target_lufs is not None:
+            mix += f",loudnorm=I={target_lufs}:TP=-1.5:LRA=11"
+        chains.append(f"{mix}[out]")
+        return "; ".join(chains)
 
-    def _mix_simple(
+    def _run_mix(
         self,
         voiceover_path: str,
         music_path: str,
@@ -139,177 +164,53 @@ class MusicMixer:
         music_db: float,
         fade_in_ms: int,
         fade_out_ms: int,
+        enable_ducking: bool,
+        target_lufs: Optional[float],
     ) -> bool:
-        """Simple mixing without ducking."""
-        try:
-            # Create temporary music file with fades
-            temp_music = os.path.join(self.temp_dir, "temp_music.mp3")
-
-            if not self._prepare_music_with_fades(
-                music_path, temp_music, fade_in_ms, fade_out_ms
-            ):
-                return False
-
-            # Simple volume mixing
-            if not self._simple_volume_mix(
-                voiceover_path, temp_music, output_path, music_db
-            ):
-                return False
-
-            log.info("Successfully applied simple volume mixing")
-            return True
-
-        except Exception as e:
-            log.error(f"Simple mixing failed: {e}")
-            return False
-
-    def _prepare_music_with_fades(
-        self, music_path: str, output_path: str, fade_in_ms: int, fade_out_ms: int
-    ) -> bool:
-        """Prepare music with fade-in and fade-out effects."""
-        try:
-            # Use ffmpeg to apply fades
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-i",
-                music_path,
-                "-af",
-                f"afade=t=in:st=0:d={fade_in_ms/1000:.3f},afade=t=out:st={self._get_music_duration(music_path)-fade_out_ms/1000:.3f}:d={fade_out_ms/1000:.3f}",
-                "-c:a",
-                "libmp3lame",
-                "-q:a",
-                "2",
-                output_path,
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-
-            if result.returncode != 0:
-                log.error(f"Fade application failed: {result.stderr}")
-                return False
-
-            return True
-
-        except Exception as e:
-            log.error(f"Failed to prepare music with fades: {e}")
+        """Decode each input once and encode the finished mix once."""
+        # The bed is trimmed to this length, so a guessed duration would cut
+        # the music short under a longer voiceover
+        duration = self._get_duration(voiceover_path, default=None)
+        if duration is None:
+            log.error(f"Music mix failed: unknown duration of {voiceover_path}")
             return False
-
-    def _apply_sidechain_ducking(
-        self,
-        music_path: str,
-        voiceover_path: str,
-        output_path: str,
-        music_db: float,
-        duck_db: float,
-    ) -> bool:
-        """Apply sidechain compression for automatic ducking."""
-        try:
-            # Use ffmpeg's sidechaincompress filter for professional ducking
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-i",
-                music_path,
-                "-i",
-                voiceover_path,
-                "-filter_complex",
-                f"[0:a][1:a]sidechaincompress=threshold=0.1:ratio=4:attack=5:release=50[music]; [music]volume={music_db}dB[final]",
-                "-map",
-                "[final]",
-                "-c:a",
-                "libmp3lame",
-                "-q:a",
-                "2",
-                output_path,
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-
-            if result.returncode != 0:
-                log.error(f"Sidechain ducking failed: {result.stderr}")
-                return False
-
-            return True
-
-        except Exception as e:
-            log.error(f"Failed to apply sidechain ducking: {e}")
-            return False
-
-    def _simple_volume_mix(
-        self, voiceover_path: str, music_path: str, output_path: str, music_db: float
-    ) -> bool:
-        """Simple volume-based mixing without ducking."""
-        try:
-            # Mix voiceover and music with volume control
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-i",
-                voiceover_path,
-                "-i",
-                music_path,
-                "-filter_complex",
-                f"[0:a]volume=1.0[vo]; [1:a]volume={pow(10, music_db/20):.6f}[music]; [vo][music]amix=inputs=2:duration=first[out]",
-                "-map",
-                "[out]",
-                "-c:a",
-                "libmp3lame",
-                "-q:a",
-                "2",
-                output_path,
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-
-            if result.returncode != 0:
-                log.error(f"Simple volume mixing failed: {result.stderr}")
-                return False
-
-            return True
-
-        except Exception as e:
-            log.error(f"Failed to apply simple volume mixing: {e}")
+        graph = self.build_mix_graph(
+            duration, music_db, fade_in_ms, fade_out_ms, enable_ducking, target_lufs
+        )
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-i",
+            voiceover_path,
+            # Loop the bed indefinitely; atrim in the graph ends it with the VO
+            "-stream_loop",
+            "-1",
+            "-i",
+            music_path,
+            "-filter_complex",
+            graph,
+            "-map",
+            "[out]",
+            *_audio_codec_args(output_path),
+            output_path,
+        ]
+
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+
+        if result.returncode != 0:
+            log.error(f"Music mix failed: {result.stderr}")
             return False
 
-    def _final_mix(
-        self, voiceover_path: str, music_path: str, output_path: str
-    ) -> bool:
-        """Final mixing of voiceover and processed music."""
-        try:
-            # Simple concatenation since music is already processed
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-i",
-                voiceover_path,
-                "-i",
-                music_path,
-                "-filter_complex",
-                "[0:a][1:a]amix=inputs=2:duration=first[out]",
-                "-map",
-                "[out]",
-                "-c:a",
-                "libmp3lame",
-                "-q:a",
-                "2",
-                output_path,
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-
-            if result.returncode != 0:
-                log.error(f"Final mixing failed: {result.stderr}")
-                return False
-
-            return True
-
-        except Exception as e:
-            log.error(f"Failed to apply final mixing: {e}")
-            return False
+        log.info(
+            f"Mixed {duration:.1f}s of audio in one pass "
+            f"({'ducked' if enable_ducking else 'simple volume'})"
+        )
+        return True
 
-    def _get_music_duration(self, music_path: str) -> float:
-        """Get duration of music file in seconds."""
+    def _get_duration(
+        self, path: str, default: Optional[float] = 30.0
+    ) -> Optional[float]:
+        """Get duration of an audio file in seconds, or ``default`` if unknown."""
         try:
             cmd = [
                 "ffprobe",
@@ -319,18 +220,18 @@ class MusicMixer:
                 "format=duration",
                 "-of",
                 "default=noprint_wrappers=1:nokey=1",
-                music_path,
+                path,
             ]
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
 
             if result.returncode == 0:
                 return float(result.stdout.strip())
             else:
-                return 30.0  # Default fallback duration
+                return default
 
         except Exception as e:
-            log.warning(f"Failed to get music duration: {e}")
-            return 30.0  # Default fallback duration
+            log.warning(f"Failed to get duration of {path}: {e}")
+            return default
 
     def normalize_audio(
         self, input_path: str, output_path: str, target_lufs: float = -16.0
@@ -370,7 +271,7 @@ class MusicMixer:
         """Create a seamless loop of music to match target duration."""
         try:
             # Get music duration
-            music_duration = self._get_music_duration(music_path)
+            music_duration = self._get_duration(music_path)
 
             if music_duration >= target_duration:
                 # Music is long enough, just trim
@@ -19,12 +19,14 @@ from typing import Dict, List, Optional, Tuple
 
 try:
     from .core import get_logger, load_brief, load_config, load_modules_cfg
+    from .utils.subtitles import load_srt
 except ImportError:
     # Handle direct execution
     import sys
 
     sys.path.append(os.path.dirname(__file__))
     from core import get_logger, load_brief, load_config, load_modules_cfg
+    from utils.subtitles import load_srt
 
 log = get_logger("pacing-kpi")
 
@@ -44,32 +46,7 @@ def parse_srt_timing(srt_path: str) -> Tuple[float, int]:
         return 0.0, 0
 
     try:
-        with open(srt_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Parse SRT timing blocks
-        timing_pattern = r"(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})"
-        matches = re.findall(timing_pattern, content)
-
-        total_speech_ms = 0
-        total_words = 0
-
-        for start_str, end_str in matches:
-            # Convert HH:MM:SS,mmm to milliseconds
-            start_parts = start_str.replace(",", ".").split(":")
-            end_parts = end_str.replace(",", ".").split(":")
-
-            start_ms = (
-                int(start_parts[0]) * 3600
-                + int(start_parts[1]) * 60
-                + float(start_parts[2])
-            ) * 1000
-            end_ms = (
-                int(end_parts[0]) * 3600 + int(end_parts[1]) * 60 + float(end_parts[2])
-            ) * 1000
-
-            duration_ms = end_ms - start_ms
-            total_speech_ms += duration_ms
+        total_speech_ms = float(sum(c.duration_ms for c in load_srt(srt_path)))
 
         # For SRT files, we don't count words from captions as they may contain full script
         # Instead, we'll use the script text for word count and SRT only for timing
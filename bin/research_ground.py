@@ -403,7 +403,7 @@ Enhanced Content:"""
 
             user_prompt = user_prompt_template.strip()
 
-            with model_session(model_name) as session:
+            with model_session(model_name, role="research") as session:
                 grounded_content = session.chat(
                     system=system_prompt, user=user_prompt, temperature=0.3
                 )
@@ -7,6 +7,7 @@ replacing the fragmented cron jobs with lock-aware sequential execution.
 """
 
 import argparse
+import itertools
 import os
 import subprocess
 import sys
@@ -1040,6 +1041,29 @@ def run_shared_ingestion(
         else:
             log.warning("No script files found, research steps may fail")
 
+    # Plan model residency: reorder independent steps to batch same-model
+    # work, and decide what stays loaded and what is preloaded
+    residency = None
+    try:
+        from bin.model_residency import ResidencyManager
+
+        required_by_step = {name: req for b in batches for name, req in b["steps"]}
+        residency = ResidencyManager.from_config(list(required_by_step), models_config)
+        models_by_step = residency.plan.models
+        batches = []
+        for model, group in itertools.groupby(residency.order, key=models_by_step.get):
+            steps = [(name, required_by_step[name]) for name in group]
+            names = ", ".join(name for name, _ in steps)
+            batches.append(
+                {
+                    "name": f"{model or 'No model'} ({names})",
+                    "model": model or "none",
+                    "steps": steps,
+                }
+            )
+    except Exception as e:
+        log.warning(f"Model residency planning failed, running steps as listed: {e}")
+
     # Execute batches sequentially with explicit model lifecycle management
     for batch_idx, batch in enumerate(batches):
         log.info(
@@ -1050,6 +1074,9 @@ def run_shared_ingestion(
         # Execute all steps in this batch using the same model session
         batch_success = True
         for step_name, required in batch["steps"]:
+            step_env = (
+                residency.before_step(step_name, brief_env) if residency else brief_env
+            )
             if step_name == "script_refinement":
                 # Handle script refinement specially
                 log.info("Running script refinement with scriptwriter model")
@@ -1077,7 +1104,7 @@ def run_shared_ingestion(
                         step_name,
                         args=[latest_script, "--slug", slug],
                         required=required,
-                        brief_env=brief_env,
+                        brief_env=step_env,
                         brief_data=brief_data,
                         models_config=models_config,
                     )
@@ -1093,7 +1120,7 @@ def run_shared_ingestion(
                     step_name,
                     args=["--slug", slug],
                     required=required,
-                    brief_env=brief_env,
+                    brief_env=step_env,
                     brief_data=brief_data,
                     models_config=models_config,
                 )
@@ -1103,7 +1130,7 @@ def run_shared_ingestion(
                     step_name,
                     args=["--slug", slug],
                     required=required,
-                    brief_env=brief_env,
+                    brief_env=step_env,
                     brief_data=brief_data,
                     models_config=models_config,
                 )
@@ -1113,7 +1140,7 @@ def run_shared_ingestion(
                     step_name,
                     args=["--slug", slug],
                     required=required,
-                    brief_env=brief_env,
+                    brief_env=step_env,
                     brief_data=brief_data,
                     models_config=models_config,
                 )
@@ -1133,7 +1160,7 @@ def run_shared_ingestion(
                         step_name,
                         args=[script_path],
                         required=required,
-                        brief_env=brief_env,
+                        brief_env=step_env,
                         brief_data=None,  # fact_check doesn't use brief_data
                         models_config=models_config,
                     )
@@ -1146,7 +1173,7 @@ def run_shared_ingestion(
                 step_success = run_step_legacy(
                     step_name,
                     required=required,
-                    brief_env=brief_env,
+                    brief_env=step_env,
                     brief_data=brief_data,
                     models_config=models_config,
                 )
@@ -1165,6 +1192,9 @@ def run_shared_ingestion(
         # Explicit model unloading happens automatically when the model_session context exits
         # This ensures memory is freed before the next batch starts
 
+    if residency:
+        log.info(f"Model residency: {residency.report()}")
+
     # Phase 3: Asset pipeline routing (animatics vs legacy)
     if success:
         # Load pipeline configuration for storyboard pipeline
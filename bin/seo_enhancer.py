@@ -17,6 +17,7 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 from bin.core import BASE, get_logger, slugify
+from bin.term_index import TermIndex
 
 log = get_logger("seo_enhancer")
 
@@ -78,8 +79,12 @@ class SEOMetadata:
 class SEOEnhancer:
     """Enhanced SEO metadata generation and optimization."""
 
-    def __init__(self, site_config: Dict[str, Any] = None):
+    def __init__(
+        self, site_config: Dict[str, Any] = None, term_index: TermIndex = None
+    ):
         self.site_config = site_config or {}
+        # Channel-wide term statistics (data/term_index.json, if built)
+        self.term_index = term_index if term_index is not None else TermIndex()
 
         # Default configuration
         self.default_config = {
@@ -100,94 +105,24 @@ class SEOEnhancer:
         self.config = {**self.default_config, **self.site_config}
 
     def extract_keywords(self, content: str, max_keywords: int = 10) -> List[str]:
-        """Extract relevant keywords from content."""
-        # Remove markdown formatting
-        clean_content = re.sub(r"[#*_`\[\]()]+", " ", content)
-        clean_content = re.sub(r"https?://\S+", "", clean_content)  # Remove URLs
-
-        # Extract words (3+ characters, alphabetic)
-        words = re.findall(r"\b[a-zA-Z]{3,}\b", clean_content.lower())
-
-        # Common stop words to filter out
-        stop_words = {
-            "the",
-            "and",
-            "for",
-            "are",
-            "but",
-            "not",
-            "you",
-            "all",
-            "can",
-            "had",
-            "her",
-            "was",
-            "one",
-            "our",
-            "out",
-            "day",
-            "get",
-            "has",
-            "him",
-            "his",
-            "how",
-            "its",
-            "may",
-            "new",
-            "now",
-            "old",
-            "see",
-            "two",
-            "who",
-            "boy",
-            "did",
-            "has",
-            "let",
-            "put",
-            "say",
-            "she",
-            "too",
-            "use",
-            "this",
-            "that",
-            "with",
-            "have",
-            "from",
-            "they",
-            "know",
-            "want",
-            "been",
-            "good",
-            "much",
-            "some",
-            "time",
-            "very",
-            "when",
-            "come",
-            "here",
-            "just",
-            "like",
-            "long",
-            "make",
-            "many",
-            "over",
-            "such",
-            "take",
-            "than",
-            "them",
-            "well",
-            "were",
-        }
-
-        # Filter and count
-        filtered_words = [w for w in words if w not in stop_words and len(w) > 3]
-        word_freq = {}
-        for word in filtered_words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-
-        # Sort by frequency and return top keywords
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, freq in sorted_words[:max_keywords] if freq > 1]
+        """
+        Extract keywords distinctive for this content against the channel's
+        back catalogue (BM25 over the term index; words and bigrams seen at
+        least twice).
+        """
+        return self.term_index.keywords(content, max_keywords)
+
+    def related_videos(
+        self, content: str, k: int = 5, slug: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """Past videos most similar to this content, for internal linking."""
+        return self.term_index.similar(content, k, exclude=slug)
+
+    def suggest_tags(
+        self, content: str, max_tags: int = 10, slug: Optional[str] = None
+    ) -> List[str]:
+        """Tags used on the most similar past videos."""
+        return self.term_index.suggest_tags(content, max_tags, exclude=slug)
 
     def calculate_reading_time(self, content: str) -> int:
         """Calculate estimated reading time in minutes."""
@@ -467,7 +402,7 @@ class SEOEnhancer:
             twitter_site=self.config["twitter_site"],
             twitter_creator=self.config["twitter_creator"],
             keywords=keywords,
-            tags=post_metadata.get("tags", []),
+            tags=post_metadata.get("tags") or self.suggest_tags(content, slug=slug),
             category=post_metadata.get("category", "AI Tools"),
             fact_check_score=fact_check_score,
             content_quality_score=quality_analysis.get("overall"),
@@ -15,7 +15,7 @@ import json
 import os
 import re
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 import yaml
 
@@ -25,6 +25,7 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 from bin.core import get_logger, load_config
+from bin.utils.subtitles import Cue, load_srt, parse_srt, seconds_to_ms, write_srt
 
 log = get_logger("srt_generate")
 
@@ -120,19 +121,19 @@ class SRTGenerator:
 
             if asr_timings:
                 log.info("[srt-gen] Using ASR timings for SRT generation")
-                srt_content = self._generate_srt_from_timings(
+                srt_cues = self._generate_srt_from_timings(
                     script_content, asr_timings, "asr"
                 )
                 source = "asr"
             elif tts_timings:
                 log.info("[srt-gen] Using TTS timings for SRT generation")
-                srt_content = self._generate_srt_from_timings(
+                srt_cues = self._generate_srt_from_timings(
                     script_content, tts_timings, "tts"
                 )
                 source = "tts"
             else:
                 log.info("[srt-gen] No timings found, using heuristic generation")
-                srt_content = self._generate_srt_heuristic(
+                srt_cues = self._generate_srt_heuristic(
                     script_content, intent_type, target_duration_sec
                 )
                 source = "heuristic"
@@ -142,8 +143,7 @@ class SRTGenerator:
                 output_path = script_path.replace(".txt", ".srt")
 
             # Write SRT file
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(srt_content)
+            write_srt(output_path, srt_cues)
 
             # Validate generated SRT
             validation = self._validate_generated_srt(output_path, script_content)
@@ -232,100 +232,37 @@ class SRTGenerator:
 
     def _generate_srt_from_timings(
         self, script_content: str, timings: Dict[str, Any], source: str
-    ) -> str:
-        """Generate SRT from ASR or TTS word timings"""
+    ) -> List[Cue]:
+        """Generate captions from ASR or TTS word timings"""
         words = script_content.split()
-        srt_lines = []
-        caption_index = 1
-
-        if source == "asr":
-            # ASR provides word-level timings
-            word_timings = timings.get("words", [])
-            if len(word_timings) == len(words):
-                # Group words into captions (max 8 words per caption)
-                max_words_per_caption = 8
-                current_caption = []
-                start_time = None
-
-                for i, (word, timing) in enumerate(zip(words, word_timings)):
-                    if not current_caption:
-                        start_time = timing.get("start", 0)
-
-                    current_caption.append(word)
-
-                    # End caption if max words reached or end of script
-                    if (
-                        len(current_caption) >= max_words_per_caption
-                        or i == len(words) - 1
-                    ):
-                        end_time = timing.get("end", start_time + 2.0)
-
-                        caption_text = " ".join(current_caption)
-                        srt_lines.extend(
-                            [
-                                str(caption_index),
-                                self._format_timestamp(start_time),
-                                self._format_timestamp(end_time),
-                                caption_text,
-                                "",
-                            ]
-                        )
-
-                        caption_index += 1
-                        current_caption = []
-                        start_time = None
-            else:
-                log.warning(
-                    f"[srt-gen] ASR word count mismatch: {len(word_timings)} vs {len(words)}"
-                )
-                return self._generate_srt_heuristic(script_content, "default", None)
-
-        elif source == "tts":
-            # TTS provides word-level timings
-            word_timings = timings.get("words", [])
-            if len(word_timings) == len(words):
-                # Similar grouping logic for TTS
-                max_words_per_caption = 8
-                current_caption = []
-                start_time = None
-
-                for i, (word, timing) in enumerate(zip(words, word_timings)):
-                    if not current_caption:
-                        start_time = timing.get("start", 0)
-
-                    current_caption.append(word)
-
-                    if (
-                        len(current_caption) >= max_words_per_caption
-                        or i == len(words) - 1
-                    ):
-                        end_time = timing.get("end", start_time + 2.0)
-
-                        caption_text = " ".join(current_caption)
-                        srt_lines.extend(
-                            [
-                                str(caption_index),
-                                self._format_timestamp(start_time),
-                                self._format_timestamp(end_time),
-                                caption_text,
-                                "",
-                            ]
-                        )
-
-                        caption_index += 1
-                        current_caption = []
-                        start_time = None
-            else:
-                log.warning(
-                    f"[srt-gen] TTS word count mismatch: {len(word_timings)} vs {len(words)}"
+        word_timings = timings.get("words", [])
+        if len(word_timings) != len(words):
+            log.warning(
+                f"[srt-gen] {source.upper()} word count mismatch: "
+                f"{len(word_timings)} vs {len(words)}"
+            )
+            return self._generate_srt_heuristic(script_content, "default", None)
+
+        # Group words into captions (max 8 words per caption)
+        max_words_per_caption = 8
+        cues = []
+        for first in range(0, len(words), max_words_per_caption):
+            group = slice(first, first + max_words_per_caption)
+            group_timings = word_timings[group]
+            start_time = group_timings[0].get("start", 0)
+            end_time = group_timings[-1].get("end", start_time + 2.0)
+            cues.append(
+                Cue(
+                    seconds_to_ms(start_time),
+                    seconds_to_ms(end_time),
+                    " ".join(words[group]),
                 )
-                return self._generate_srt_heuristic(script_content, "default", None)
-
-        return "\n".join(srt_lines)
+            )
+        return cues
 
     def _generate_srt_heuristic(
         self, script_content: str, intent_type: str, target_duration_sec: float
-    ) -> str:
+    ) -> List[Cue]:
         """Generate SRT using heuristic timing based on intent profiles"""
         log.info(f"[srt-gen] Generating heuristic SRT for intent: {intent_type}")
 
@@ -350,8 +287,7 @@ class SRTGenerator:
             )
 
         # Generate captions
-        srt_lines = []
-        caption_index = 1
+        cues = []
         current_time = 0.0
 
         for sentence in sentences:
@@ -367,24 +303,18 @@ class SRTGenerator:
             if sentence_duration < min_caption_duration:
                 sentence_duration = min_caption_duration
 
-            # Format timestamps
             start_time = current_time
             end_time = current_time + sentence_duration
-
-            srt_lines.extend(
-                [
-                    str(caption_index),
-                    self._format_timestamp(start_time),
-                    self._format_timestamp(end_time),
+            cues.append(
+                Cue(
+                    seconds_to_ms(start_time),
+                    seconds_to_ms(end_time),
                     sentence.strip(),
-                    "",
-                ]
+                )
             )
-
-            caption_index += 1
             current_time = end_time
 
-        return "\n".join(srt_lines)
+        return cues
 
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences for caption grouping"""
@@ -392,25 +322,13 @@ class SRTGenerator:
         sentences = re.split(r"[.!?]+", text)
         return [s.strip() for s in sentences if s.strip()]
 
-    def _format_timestamp(self, seconds: float) -> str:
-        """Format seconds into SRT timestamp format (HH:MM:SS,mmm)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
-
     def _validate_generated_srt(
         self, srt_path: str, script_content: str
     ) -> Dict[str, Any]:
         """Validate generated SRT file"""
         try:
-            with open(srt_path, "r", encoding="utf-8") as f:
-                srt_content = f.read()
-
             # Parse SRT to validate structure
-            captions = self._parse_srt(srt_content)
+            captions = self._captions(load_srt(srt_path))
 
             # Calculate metrics
             total_captions = len(captions)
@@ -450,94 +368,26 @@ class SRTGenerator:
 
     def _parse_srt(self, srt_content: str) -> List[Dict[str, Any]]:
         """Parse SRT content into structured format"""
-        captions = []
-        lines = srt_content.strip().split("\n")
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                i += 1
-                continue
-
-            # Parse caption block
-            try:
-                # Caption number
-                caption_num = int(line)
-                i += 1
-
-                if i >= len(lines):
-                    break
-
-                # Timestamp line
-                timestamp_line = lines[i].strip()
-                start_time, end_time = self._parse_timestamp_line(timestamp_line)
-                i += 1
-
-                # Caption text
-                caption_text = []
-                while i < len(lines) and lines[i].strip():
-                    caption_text.append(lines[i].strip())
-                    i += 1
-
-                captions.append(
-                    {
-                        "number": caption_num,
-                        "start_time": start_time,
-                        "end_time": end_time,
-                        "text": " ".join(caption_text),
-                    }
-                )
-
-            except (ValueError, IndexError) as e:
-                log.warning(f"[srt-gen] Failed to parse caption at line {i}: {e}")
-                i += 1
-
-        return captions
-
-    def _parse_timestamp_line(self, timestamp_line: str) -> Tuple[float, float]:
-        """Parse SRT timestamp line into start and end times in seconds"""
-        try:
-            # Format: HH:MM:SS,mmm --> HH:MM:SS,mmm
-            parts = timestamp_line.split(" --> ")
-            if len(parts) != 2:
-                raise ValueError("Invalid timestamp format")
-
-            start_time = self._timestamp_to_seconds(parts[0].strip())
-            end_time = self._timestamp_to_seconds(parts[1].strip())
-
-            return start_time, end_time
-
-        except Exception as e:
-            log.warning(
-                f"[srt-gen] Failed to parse timestamp: {timestamp_line}, error: {e}"
-            )
-            return 0.0, 2.0  # Fallback
-
-    def _timestamp_to_seconds(self, timestamp: str) -> float:
-        """Convert SRT timestamp to seconds"""
-        try:
-            # Format: HH:MM:SS,mmm
-            time_part, millisec_part = timestamp.split(",")
-            hours, minutes, seconds = map(int, time_part.split(":"))
-            millisecs = int(millisec_part)
-
-            total_seconds = hours * 3600 + minutes * 60 + seconds + millisecs / 1000.0
-            return total_seconds
-
-        except Exception as e:
-            log.warning(f"[srt-gen] Failed to convert timestamp {timestamp}: {e}")
-            return 0.0
+        return self._captions(parse_srt(srt_content))
+
+    @staticmethod
+    def _captions(cues) -> List[Dict[str, Any]]:
+        return [
+            {
+                "number": number,
+                "start_time": cue.start_ms / 1000.0,
+                "end_time": cue.end_ms / 1000.0,
+                "text": " ".join(cue.text.splitlines()),
+            }
+            for number, cue in enumerate(cues, 1)
+        ]
 
     def _estimate_duration_from_srt(self, srt_path: str) -> float:
         """Estimate duration from existing SRT file"""
         try:
-            with open(srt_path, "r", encoding="utf-8") as f:
-                srt_content = f.read()
-
-            captions = self._parse_srt(srt_content)
-            if captions:
-                return captions[-1]["end_time"]
+            cues = load_srt(srt_path)
+            if cues:
+                return cues[-1].end_ms / 1000.0
             return 0.0
 
         except Exception as e:
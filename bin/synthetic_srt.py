@@ -19,6 +19,13 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 from bin.core import get_logger
+from bin.utils.subtitles import (
+    cues_from_timings,
+    format_timestamp,
+    seconds_to_ms,
+    to_srt,
+    write_srt,
+)
 
 log = get_logger("synthetic_srt")
 
@@ -162,12 +169,7 @@ def format_srt_timestamp(seconds: float) -> str:
     Returns:
         SRT timestamp string
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = seconds % 60
-    milliseconds = int((secs % 1) * 1000)
-
-    return f"{hours:02d}:{minutes:02d}:{int(secs):02d},{milliseconds:03d}"
+    return format_timestamp(seconds_to_ms(seconds))
 
 
 def generate_srt_content(caption_timings: List[Tuple[float, float, str]]) -> str:
@@ -180,18 +182,7 @@ def generate_srt_content(caption_timings: List[Tuple[float, float, str]]) -> str
     Returns:
         SRT file content as string
     """
-    srt_lines = []
-
-    for i, (start_sec, end_sec, text) in enumerate(caption_timings, 1):
-        start_timestamp = format_srt_timestamp(start_sec)
-        end_timestamp = format_srt_timestamp(end_sec)
-
-        srt_lines.append(str(i))
-        srt_lines.append(f"{start_timestamp} --> {end_timestamp}")
-        srt_lines.append(text)
-        srt_lines.append("")  # Empty line between captions
-
-    return "\n".join(srt_lines)
+    return to_srt(cues_from_timings(caption_timings))
 
 
 def generate_synthetic_srt(
@@ -233,16 +224,12 @@ def generate_synthetic_srt(
     # Calculate timing
     caption_timings = calculate_caption_timing(captions, audio_duration_sec, wpm, seed)
 
-    # Generate SRT content
-    srt_content = generate_srt_content(caption_timings)
-
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
     # Write SRT file
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(srt_content)
+        write_srt(output_path, cues_from_timings(caption_timings))
         log.info(f"Generated synthetic SRT: {output_path}")
         log.info(
             f"Captions: {len(captions)}, Duration: {audio_duration_sec:.1f}s, WPM: {wpm}"
@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Channel Term Index
+
+A persisted term index over the channel's back catalogue: every past script
+(scripts/<slug>.txt) and video metadata file (videos/<slug>.metadata.json),
+one document per slug. It keeps per-document term counts and corpus document
+frequencies for words and adjacent-word bigrams, so keyword extraction can
+weight a term by how distinctive it is for this channel (BM25) rather than by
+raw frequency, and videos can be compared for internal linking and tag
+suggestions.
+
+The index is stored in data/term_index.json. sync() re-reads only sources
+whose mtime changed, and index_video() updates one video as it is published.
+
+Public API:
+- tokenize(text) -> List[str]
+- term_counts(text) -> (Dict[str, int], int)
+- TermIndex(path) with sync(), index_video(), add_document(),
+  remove_document(), save(), keywords(), similar(), related() and
+  suggest_tags()
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Ensure repo root on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from bin.core import BASE, get_logger
+
+log = get_logger("term_index")
+
+INDEX_PATH = os.path.join(BASE, "data", "term_index.json")
+SCRIPTS_DIR = os.path.join(BASE, "scripts")
+VIDEOS_DIR = os.path.join(BASE, "videos")
+INDEX_VERSION = 1
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+QUERY_TERMS = 32  # Highest-weighted terms of a text used for similarity
+
+STOP_WORDS = frozenset(
+    "the and for are but not you all can had her was one our out day get has "
+    "him his how its may new now old see two who boy did let put say she too "
+    "use this that with have from they know want been good much some time very "
+    "when come here just like long make many over such take than them well "
+    "were".split()
+)
+
+_MARKDOWN_RE = re.compile(r"[#*_`\[\]()]+")
+_URL_RE = re.compile(r"https?://\S+")
+# Words, and punctuation that ends a phrase (no bigram spans it)
+_TOKEN_RE = re.compile(r"\w+|[.!?;:,\"]")
+_WORD_RE = re.compile(r"[a-z]{3,}")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index terms in one pass: words and adjacent-word bigrams.
+
+    Markdown syntax and URLs are dropped. A word is a term if it is at least
+    four ASCII letters and not a stop word; a bigram joins two adjacent
+    non-stop words of three or more letters within a phrase.
+    """
+    clean = _URL_RE.sub("", _MARKDOWN_RE.sub(" ", text)).lower()
+    terms = []
+    prev = None
+    for token in _TOKEN_RE.findall(clean):
+        if not _WORD_RE.fullmatch(token) or token in STOP_WORDS:
+            prev = None
+            continue
+        if len(token) > 3:
+            terms.append(token)
+        if prev:
+            terms.append(f"{prev} {token}")
+        prev = token
+    return terms
+
+
+@lru_cache(maxsize=32)
+def term_counts(text: str) -> Tuple[Dict[str, int], int]:
+    """
+    Term frequencies of ``text`` and its length in words (cached; callers
+    must not modify the returned dict).
+    """
+    counts: Dict[str, int] = {}
+    length = 0
+    for term in tokenize(text):
+        counts[term] = counts.get(term, 0) + 1
+        if " " not in term:
+            length += 1
+    return counts, length
+
+
+def _metadata_text(metadata: Dict) -> str:
+    """Searchable text of a video metadata file."""
+    seo = metadata.get("seo") or {}
+    parts = [metadata.get("title") or "", metadata.get("description") or ""]
+    parts.append(seo.get("description") or "")
+    parts += [str(tag) for tag in metadata.get("tags") or []]
+    for scene in metadata.get("scene_map") or []:
+        parts.append(scene.get("title") or scene.get("summary") or "")
+    return "\n".join(part for part in parts if part)
+
+
+class TermIndex:
+    """
+    Term index over past videos, persisted as JSON.
+
+    Args:
+        path: Index file; None keeps the index in memory only
+        scripts_dir: Directory of <slug>.txt scripts
+        videos_dir: Directory of <slug>.metadata.json files
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = INDEX_PATH,
+        scripts_dir: str = SCRIPTS_DIR,
+        videos_dir: str = VIDEOS_DIR,
+    ):
+        self.path = path
+        self.scripts_dir = scripts_dir
+        self.videos_dir = videos_dir
+        self.docs: Dict[str, Dict] = {}
+        self.df: Dict[str, int] = {}
+        self.total_length = 0
+        self._postings: Optional[Dict[str, List[Tuple[str, int]]]] = None
+        self._norms: Dict[str, float] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable term index {self.path}: {e}")
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        for doc_id, doc in data.get("docs", {}).items():
+            self._insert(doc_id, doc)
+
+    def save(self):
+        """Write the index atomically (no-op for an in-memory index)."""
+        if not self.path:
+            return
+        data = {"version": INDEX_VERSION, "docs": self.docs}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log.warning(f"Could not save term index {self.path}: {e}")
+
+    def _insert(self, doc_id: str, doc: Dict):
+        self.docs[doc_id] = doc
+        for term in doc["terms"]:
+            self.df[term] = self.df.get(term, 0) + 1
+        self.total_length += doc["length"]
+        self._postings = None
+        self._norms = {}
+
+    def remove_document(self, doc_id: str) -> bool:
+        """Drop a document. Returns True if it was indexed."""
+        doc = self.docs.pop(doc_id, None)
+        if doc is None:
+            return False
+        for term in doc["terms"]:
+            self.df[term] -= 1
+            if not self.df[term]:
+                del self.df[term]
+        self.total_length -= doc["length"]
+        self._postings = None
+        self._norms = {}
+        return True
+
+    def add_document(
+        self,
+        doc_id: str,
+        text: str,
+        title: str = "",
+        tags: Iterable[str] = (),
+        sources: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Index (or re-index) one document.
+
+        Args:
+            doc_id: Video slug
+            text: Script and metadata text
+            title: Video title, for similar-video listings
+            tags: Published tags, offered by suggest_tags()
+            sources: Source file -> mtime_ns, used by sync()
+        """
+        counts, length = term_counts(text)
+        self.remove_document(doc_id)
+        self._insert(
+            doc_id,
+            {
+                "title": title,
+                "tags": list(tags),
+                "sources": sources or {},
+                "length": length,
+                "terms": dict(counts),
+            },
+        )
+
+    def _sources(self, slug: str) -> Dict[str, int]:
+        sources = {}
+        for path in (
+            os.path.join(self.scripts_dir, f"{slug}.txt"),
+            os.path.join(self.videos_dir, f"{slug}.metadata.json"),
+        ):
+            try:
+                sources[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                pass
+        return sources
+
+    def index_video(self, slug: str, metadata: Optional[Dict] = None):
+        """
+        Index one video from its script and metadata.
+
+        Args:
+            slug: Video slug
+            metadata: Metadata to index instead of videos/<slug>.metadata.json
+                (e.g. the title and tags actually published)
+        """
+        sources = self._sources(slug)
+        parts = []
+        script_path = os.path.join(self.scripts_dir, f"{slug}.txt")
+        if script_path in sources:
+            with open(script_path, "r", encoding="utf-8") as f:
+                parts.append(f.read())
+        if metadata is None:
+            meta_path = os.path.join(self.videos_dir, f"{slug}.metadata.json")
+            metadata = {}
+            if meta_path in sources:
+                try:
+                    with open(meta_path, "r", encoding="utf-8") as f:
+                        metadata = json.load(f)
+                except ValueError as e:
+                    log.warning(f"Skipping unreadable metadata {meta_path}: {e}")
+        parts.append(_metadata_text(metadata))
+        tags = metadata.get("tags") or (metadata.get("seo") or {}).get("tags") or []
+        self.add_document(
+            slug,
+            "\n".join(parts),
+            title=metadata.get("title") or slug,
+            tags=tags,
+            sources=sources,
+        )
+
+    def _slugs_on_disk(self) -> List[str]:
+        slugs = set()
+        for directory, suffix in (
+            (self.scripts_dir, ".txt"),
+            (self.videos_dir, ".metadata.json"),
+        ):
+            if os.path.isdir(directory):
+                slugs.update(
+                    name[: -len(suffix)]
+                    for name in os.listdir(directory)
+                    if name.endswith(suffix)
+                )
+        return sorted(slugs)
+
+    def sync(self) -> int:
+        """
+        Bring the index up to date with the scripts and metadata on disk.
+
+        Only videos whose source files changed are re-read; videos whose
+        sources are gone are dropped. The index is saved if anything changed.
+
+        Returns:
+            Number of documents added, updated or removed
+        """
+        slugs = self._slugs_on_disk()
+        changed = 0
+        for slug in slugs:
+            doc = self.docs.get(slug)
+            if doc is None or doc.get("sources") != self._sources(slug):
+                self.index_video(slug)
+                changed += 1
+        for slug in set(self.docs) - set(slugs):
+            self.remove_document(slug)
+            changed += 1
+        if changed:
+            self.save()
+            log.info(f"Term index: {changed} documents updated, {len(self)} total")
+        return changed
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (never negative)."""
+        n = len(self.docs)
+        df = self.df.get(term, 0)
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def keywords(
+        self, text: str, max_keywords: int = 10, min_count: int = 2
+    ) -> List[str]:
+        """
+        Terms of ``text`` ranked by BM25 weight against the indexed corpus.
+
+        With an empty index every term has the same IDF, so the ranking falls
+        back to term frequency.
+
+        Args:
+            text: Content to extract keywords from
+            max_keywords: Maximum number of keywords
+            min_count: Minimum occurrences of a term in ``text``
+        """
+        counts, length = term_counts(text)
+        if not counts:
+            return []
+        avg_length = self.total_length / len(self.docs) if self.docs else length
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / max(avg_length, 1))
+        scored = [
+            (self.idf(term) * tf * (BM25_K1 + 1) / (tf + norm), term)
+            for term, tf in counts.items()
+            if tf >= min_count
+        ]
+        scored.sort(key=lambda item: -item[0])
+        return [term for _, term in scored[:max_keywords]]
+
+    def _weight(self, term: str, tf: int) -> float:
+        return (1.0 + math.log(tf)) * self.idf(term)
+
+    def _build_postings(self):
+        self._postings = {}
+        for doc_id, doc in self.docs.items():
+            for term, tf in doc["terms"].items():
+                self._postings.setdefault(term, []).append((doc_id, tf))
+
+    def _norm(self, doc_id: str) -> float:
+        norm = self._norms.get(doc_id)
+        if norm is None:
+            terms = self.docs[doc_id]["terms"]
+            norm = math.sqrt(
+                sum(self._weight(term, tf) ** 2 for term, tf in terms.items())
+            )
+            self._norms[doc_id] = norm
+        return norm
+
+    def similar(
+        self, text: str, k: int = 5, exclude: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Indexed videos most similar to ``text`` (TF-IDF cosine similarity).
+
+        Only the query's QUERY_TERMS highest-weighted terms are looked up in
+        the postings, so a lookup touches the videos sharing those terms
+        rather than the whole catalogue.
+
+        Args:
+            text: Script or description of the video to match
+            k: Maximum number of results
+            exclude: Document to leave out (usually the video itself)
+
+        Returns:
+            (slug, similarity) pairs, most similar first
+        """
+        return self._similar(term_counts(text)[0], k, exclude)
+
+    def related(self, slug: str, k: int = 5) -> List[Tuple[str, float]]:
+        """Indexed videos most similar to the indexed video ``slug``."""
+        doc = self.docs.get(slug)
+        return self._similar(doc["terms"], k, exclude=slug) if doc else []
+
+    def _similar(
+        self, counts: Dict[str, int], k: int, exclude: Optional[str]
+    ) -> List[Tuple[str, float]]:
+        query = sorted(
+            ((self._weight(term, tf), term) for term, tf in counts.items()),
+            reverse=True,
+        )[:QUERY_TERMS]
+        query_norm = math.sqrt(sum(weight**2 for weight, _ in query))
+        if not query_norm:
+            return []
+        if self._postings is None:
+            self._build_postings()
+
+        dots: Dict[str, float] = {}
+        for weight, term in query:
+            for doc_id, tf in self._postings.get(term, ()):
+                if doc_id != exclude:
+                    dot = weight * self._weight(term, tf)
+                    dots[doc_id] = dots.get(doc_id, 0.0) + dot
+        scored = [
+            (doc_id, dot / (query_norm * self._norm(doc_id)))
+            for doc_id, dot in dots.items()
+            if dot > 0
+        ]
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:k]
+
+    def suggest_tags(
+        self, text: str, max_tags: int = 10, exclude: Optional[str] = None
+    ) -> List[str]:
+        """
+        Tags of the most similar videos, weighted by their similarity.
+
+        Args:
+            text: Script or description of the video to tag
+            max_tags: Maximum number of tags
+            exclude: Document to leave out (usually the video itself)
+        """
+        scores: Dict[str, float] = {}
+        for doc_id, similarity in self.similar(text, exclude=exclude):
+            for tag in self.docs[doc_id]["tags"]:
+                scores[tag] = scores.get(tag, 0.0) + similarity
+        ranked = sorted(scores, key=lambda tag: -scores[tag])
+        return ranked[:max_tags]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Channel term index")
+    parser.add_argument("--path", default=INDEX_PATH, help="Index file")
+    parser.add_argument("--similar", metavar="SLUG", help="List videos like SLUG")
+    parser.add_argument("-k", type=int, default=5, help="Results to show")
+    args = parser.parse_args()
+
+    index = TermIndex(args.path)
+    changed = index.sync()
+    print(f"Indexed {len(index)} videos ({changed} updated)")
+
+    if args.similar:
+        if args.similar not in index.docs:
+            print(f"Unknown video: {args.similar}")
+            return 1
+        for slug, score in index.related(args.similar, args.k):
+            print(f"  {score:.3f}  {slug}  {index.docs[slug]['title']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
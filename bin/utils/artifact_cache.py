@@ -0,0 +1,175 @@
+"""
+Per-run artifact cache shared by concurrently running validators.
+
+Each artifact is loaded at most once per run: the first caller for a path
+reads it while later (or concurrent) callers wait for and share that result.
+Parsed values are keyed by path and content hash, so the same content seen
+under another path is parsed once too. Callers that rewrite a file call
+invalidate() so later readers see the new content.
+
+JSON values are handed out as deep copies, so validators may mutate what
+they receive without affecting each other.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from pathlib import Path
+
+# Files above this size are fingerprinted by size, mtime and their first and
+# last blocks instead of a full content hash (media files can be gigabytes).
+FULL_HASH_MAX_BYTES = 8 * 1024 * 1024
+EDGE_BLOCK_BYTES = 1024 * 1024
+
+
+def _fingerprint(path: str) -> Tuple[str, Optional[bytes]]:
+    """Content hash of a file, plus its bytes when it is small enough to keep.
+
+    Large files (media) get a sampled fingerprint instead of a full hash.
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if st.st_size <= FULL_HASH_MAX_BYTES:
+            data = f.read()
+            digest.update(data)
+            return digest.hexdigest(), data
+        digest.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+        digest.update(f.read(EDGE_BLOCK_BYTES))
+        f.seek(-EDGE_BLOCK_BYTES, os.SEEK_END)
+        digest.update(f.read(EDGE_BLOCK_BYTES))
+    return digest.hexdigest(), None
+
+
+def _universal_newlines(text: str) -> str:
+    """Translate newlines the way text-mode open() does."""
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class _Slot:
+    """A single cached value, filled exactly once."""
+
+    __slots__ = ("ready", "value", "error")
+
+    def __init__(self):
+        self.ready = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ArtifactCache:
+    """Thread-safe load-once cache for run artifacts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._files: Dict[str, _Slot] = {}  # path -> (content hash, small bytes)
+        self._values: Dict[Tuple[str, str], _Slot] = {}  # (kind, hash) -> value
+        self.loads = 0  # number of loader invocations (for diagnostics)
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.abspath(os.fspath(path))
+
+    def _once(self, table: Dict, key: Any, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            slot = table.get(key)
+            owner = slot is None
+            if owner:
+                slot = table[key] = _Slot()
+
+        if owner:
+            try:
+                slot.value = loader()
+            except BaseException as e:
+                slot.error = e
+                with self._lock:
+                    # Failed loads are not cached; the next caller retries
+                    if table.get(key) is slot:
+                        del table[key]
+            finally:
+                slot.ready.set()
+        else:
+            slot.ready.wait()
+
+        if slot.error is not None:
+            raise slot.error
+        return slot.value
+
+    def _file(self, path: str) -> Tuple[str, Optional[bytes]]:
+        # Open the path as given so errors read exactly like a plain open()
+        return self._once(self._files, self._key(path), lambda: _fingerprint(path))
+
+    def content_hash(self, path: str) -> str:
+        """Content hash of ``path`` as first seen in this run."""
+        return self._file(path)[0]
+
+    def get(self, kind: str, path: str, loader: Callable[[str], Any]) -> Any:
+        """Return ``loader(path)``, computed once per kind and content.
+
+        Args:
+            kind: Namespace for the derived value (e.g. "json", "ffprobe")
+            path: Artifact path
+            loader: Called with ``path`` on a cache miss
+
+        Returns:
+            The cached value (shared; callers must not mutate it)
+        """
+        return self._derive(kind, path, lambda key, data: loader(key))
+
+    def _derive(
+        self, kind: str, path: str, fn: Callable[[str, Optional[bytes]], Any]
+    ) -> Any:
+        digest, data = self._file(path)
+
+        def load():
+            with self._lock:
+                self.loads += 1
+            return fn(path, data)
+
+        return self._once(self._values, (kind, digest), load)
+
+    @staticmethod
+    def _bytes(path: str, data: Optional[bytes]) -> bytes:
+        if data is None:
+            with open(path, "rb") as f:
+                data = f.read()
+        return data
+
+    def read_text(self, path: str, encoding: str = "utf-8") -> str:
+        return self._derive(
+            f"text:{encoding}",
+            path,
+            lambda p, data: _universal_newlines(self._bytes(p, data).decode(encoding)),
+        )
+
+    def read_json(self, path: str) -> Any:
+        value = self._derive(
+            "json", path, lambda p, data: json.loads(self._bytes(p, data))
+        )
+        return copy.deepcopy(value)
+
+    def ffprobe(self, path: str) -> Dict[str, Any]:
+        """ffprobe streams/format JSON for a media file."""
+        from bin.utils.media import ffprobe_json
+
+        value = self.get("ffprobe", path, lambda p: ffprobe_json(Path(p)))
+        return copy.deepcopy(value)
+
+    def memo(self, kind: str, path: str, loader: Callable[[str], Any]) -> Any:
+        """Like get(), but hands out a deep copy of the cached value."""
+        return copy.deepcopy(self.get(kind, path, loader))
+
+    def invalidate(self, path: str):
+        """Forget ``path`` after it has been rewritten."""
+        with self._lock:
+            self._files.pop(self._key(path), None)
+
+    def clear(self):
+        with self._lock:
+            self._files.clear()
+            self._values.clear()
+            self.loads = 0
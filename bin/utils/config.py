@@ -184,6 +184,10 @@ def _env_overlay() -> Dict[str, Any]:
         out.setdefault("models", {}).setdefault("ollama", {})["base_url"] = os.getenv(
             "OLLAMA_BASE_URL"
         )
+    if os.getenv("LLM_GATEWAY_URL"):
+        out.setdefault("models", {}).setdefault("ollama", {})["gateway_url"] = (
+            os.getenv("LLM_GATEWAY_URL")
+        )
     if os.getenv("OLLAMA_TIMEOUT_SEC"):
         try:
             out.setdefault("models", {}).setdefault("ollama", {})["timeout_sec"] = (
@@ -0,0 +1,309 @@
+# bin/utils/logtail.py
+"""
+Incremental log tailing.
+
+Readers of append-only logs (jobs/state.jsonl, logs/pipeline.log) only ever
+need the last few lines or the lines appended since they last looked.  This
+module provides both without reading the whole file:
+
+* ``tail_lines`` seeks backwards from EOF in fixed-size blocks until it has
+  collected ``n`` lines.
+* ``read_from`` reads complete lines appended after a byte offset and returns
+  the new offset, so callers can keep their own cursor (e.g. a browser tab).
+* ``read_cursor`` does the same for a ``LogCursor`` (offset plus file
+  identity), detecting rotation as well as truncation.
+* ``LogFollower`` tracks a cursor per subscriber and detects rotation
+  (inode change) and truncation (file shrank) so a restart of the log does
+  not stall or replay garbage.
+
+Only complete, newline-terminated lines are returned by the incremental
+readers; a partially written trailing line is picked up on the next poll.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Tuple
+
+BLOCK_SIZE = 8192
+MAX_READ_BYTES = 4 * 1024 * 1024
+
+
+def _file_id(st: os.stat_result) -> Tuple[int, int]:
+    return (st.st_dev, st.st_ino)
+
+
+def _decode(chunk: bytes) -> List[str]:
+    text = chunk.decode("utf-8", errors="replace")
+    return [line.rstrip("\r") for line in text.split("\n")]
+
+
+def tail_lines(path: str, n: int = 200, block_size: int = BLOCK_SIZE) -> List[str]:
+    """
+    Return the last ``n`` lines of a file by reading backwards from EOF.
+
+    Cost is proportional to the size of the returned lines, not the file.
+
+    Args:
+        path: File to read
+        n: Maximum number of lines to return
+        block_size: Bytes read per backwards step
+
+    Returns:
+        Up to ``n`` lines (without line terminators), oldest first
+    """
+    if n <= 0 or not os.path.exists(path):
+        return []
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        if pos == 0:
+            return []
+
+        data = b""
+        # A trailing newline terminates the last line rather than starting an
+        # empty one, so we need n + 1 separators to be sure we have n lines.
+        f.seek(pos - 1)
+        needed = n + 1 if f.read(1) == b"\n" else n
+        while pos > 0 and data.count(b"\n") < needed:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+
+    lines = _decode(data)
+    if lines and lines[-1] == "":
+        lines.pop()
+    if pos > 0:
+        # First element may be a fragment of a longer line
+        lines = lines[1:]
+    return lines[-n:]
+
+
+def tail(path: str, n: int = 200) -> str:
+    """Return the last ``n`` lines of ``path`` joined with newlines."""
+    return "\n".join(tail_lines(path, n))
+
+
+def tail_with_offset(path: str, n: int = 200) -> Tuple[List[str], int]:
+    """
+    Return the last ``n`` complete lines and the offset to follow from.
+
+    A partially written final line is excluded and the offset points at its
+    start, so a subsequent ``read_from`` delivers it once it is finished.
+
+    Args:
+        path: File to read
+        n: Maximum number of lines to return
+
+    Returns:
+        Tuple of (lines, offset)
+    """
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return [], 0
+    offset = _last_line_end(path, size)
+    lines = tail_lines(path, n + 1) if n > 0 else []
+    if offset < size and lines:
+        lines.pop()
+    return lines[-n:] if n > 0 else [], offset
+
+
+def read_from(
+    path: str, offset: int, max_bytes: int = MAX_READ_BYTES
+) -> Tuple[List[str], int]:
+    """
+    Read complete lines appended after ``offset``.
+
+    If the file is shorter than ``offset`` it was truncated or replaced, and
+    reading restarts from the beginning.
+
+    Args:
+        path: File to read
+        offset: Byte offset returned by a previous call (0 for start)
+        max_bytes: Upper bound on bytes consumed per call
+
+    Returns:
+        Tuple of (new lines, next offset)
+    """
+    lines, offset, _, _ = _read_lines(path, offset, None, max_bytes)
+    return lines, offset
+
+
+def _read_lines(
+    path: str,
+    offset: int,
+    file_id: Optional[Tuple[int, int]],
+    max_bytes: int,
+) -> Tuple[List[str], int, Optional[Tuple[int, int]], bool]:
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return [], offset, file_id, False
+
+    with f:
+        st = os.fstat(f.fileno())
+        current_id = _file_id(st)
+        reset = (file_id is not None and current_id != file_id) or st.st_size < offset
+        if reset:
+            offset = 0
+        if st.st_size == offset:
+            return [], offset, current_id, reset
+
+        f.seek(offset)
+        chunk = f.read(min(st.st_size - offset, max_bytes))
+
+    end = chunk.rfind(b"\n")
+    if end < 0:
+        # No complete line yet; wait for the writer to finish it
+        return [], offset, current_id, reset
+
+    lines = _decode(chunk[:end])
+    return lines, offset + end + 1, current_id, reset
+
+
+def file_identity(path: str) -> Optional[Tuple[int, int]]:
+    """(device, inode) of ``path``, or None if it does not exist."""
+    try:
+        return _file_id(os.stat(path))
+    except OSError:
+        return None
+
+
+def read_cursor(
+    path: str, cursor: "LogCursor", max_bytes: int = MAX_READ_BYTES
+) -> Tuple[List[str], bool]:
+    """
+    Advance ``cursor`` past complete lines appended to ``path``.
+
+    Args:
+        path: File to read
+        cursor: Cursor to advance in place
+        max_bytes: Upper bound on bytes consumed per call
+
+    Returns:
+        Tuple of (new lines, reset) where ``reset`` is True when the file
+        was rotated or truncated and reading restarted from the top
+    """
+    lines, offset, file_id, reset = _read_lines(
+        path, cursor.offset, cursor.file_id, max_bytes
+    )
+    cursor.offset = offset
+    cursor.file_id = file_id
+    return lines, reset
+
+
+def _last_line_end(path: str, size: int) -> int:
+    """Offset just past the last newline at or before ``size``."""
+    try:
+        with open(path, "rb") as f:
+            pos = size
+            while pos > 0:
+                step = min(BLOCK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                idx = f.read(step).rfind(b"\n")
+                if idx >= 0:
+                    return pos + idx + 1
+    except OSError:
+        return size
+    return 0
+
+
+@dataclass
+class LogCursor:
+    """Read position of one subscriber in a followed file."""
+
+    offset: int = 0
+    file_id: Optional[Tuple[int, int]] = None
+
+
+class LogFollower:
+    """
+    Follow an append-only log on behalf of many subscribers.
+
+    Each subscriber has its own byte offset, so a client that subscribes late
+    gets a short backlog followed by only the lines written after it joined.
+    Subscribers at the same offset share a single read per poll.
+    """
+
+    def __init__(self, path: str, max_read_bytes: int = MAX_READ_BYTES):
+        self.path = path
+        self.max_read_bytes = max_read_bytes
+        self._cursors: Dict[Hashable, LogCursor] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, subscriber_id: Hashable) -> bool:
+        return subscriber_id in self._cursors
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def _end_cursor(self) -> LogCursor:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return LogCursor()
+        return LogCursor(offset=st.st_size, file_id=_file_id(st))
+
+    def subscribe(self, subscriber_id: Hashable, backlog: int = 50) -> List[str]:
+        """
+        Register a subscriber positioned at the current end of file.
+
+        Args:
+            subscriber_id: Opaque key (e.g. a socket session id)
+            backlog: Number of existing lines to return as initial content
+
+        Returns:
+            The last ``backlog`` complete lines of the file
+        """
+        with self._lock:
+            cursor = self._end_cursor()
+            lines, cursor.offset = tail_with_offset(self.path, backlog)
+            self._cursors[subscriber_id] = cursor
+        return lines
+
+    def unsubscribe(self, subscriber_id: Hashable) -> None:
+        """Forget a subscriber's cursor."""
+        with self._lock:
+            self._cursors.pop(subscriber_id, None)
+
+    def read_new(self, cursor: LogCursor) -> Tuple[List[str], bool]:
+        """
+        Advance a standalone cursor past newly appended lines.
+
+        Args:
+            cursor: Cursor to advance in place
+
+        Returns:
+            Tuple of (new lines, reset) where ``reset`` is True when the file
+            was rotated or truncated and reading restarted from the top
+        """
+        return read_cursor(self.path, cursor, self.max_read_bytes)
+
+    def poll(self) -> Dict[Hashable, List[str]]:
+        """
+        Read new lines for every subscriber.
+
+        Returns:
+            Mapping of subscriber id to its new lines; subscribers with
+            nothing new are omitted
+        """
+        updates: Dict[Hashable, List[str]] = {}
+        with self._lock:
+            groups: Dict[Tuple[int, Optional[Tuple[int, int]]], List[Hashable]] = {}
+            for sid, cursor in self._cursors.items():
+                groups.setdefault((cursor.offset, cursor.file_id), []).append(sid)
+
+            for (offset, file_id), sids in groups.items():
+                cursor = LogCursor(offset=offset, file_id=file_id)
+                lines, _ = self.read_new(cursor)
+                for sid in sids:
+                    self._cursors[sid] = LogCursor(cursor.offset, cursor.file_id)
+                    if lines:
+                        updates[sid] = lines
+        return updates
@@ -0,0 +1,440 @@
+"""
+SRT/ASS cue parsing, serialization and editing.
+
+Every caption consumer goes through this module so SRT files are parsed the
+same way everywhere and at most once per run. Times are integer milliseconds
+throughout; conversion to SRT (``HH:MM:SS,mmm``) and ASS (``H:MM:SS.cc``)
+happens only at the edges.
+
+The parser is a line-oriented state machine, so it streams over file objects
+without holding the raw text, tolerates CRLF/BOM input, missing or
+non-numeric indices, timing lines with trailing position settings, and
+stray blank lines. load_srt() caches the parsed cues per path, keyed by the
+file's size and mtime; writers should use write_srt() (or invalidate()) so
+readers in the same process see the new content.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+_TIMING_RE = re.compile(
+    r"^\s*(\d+):(\d{1,2}):(\d{1,2})(?:[,.](\d+))?\s*-->\s*"
+    r"(\d+):(\d{1,2}):(\d{1,2})(?:[,.](\d+))?"
+)
+_TIMESTAMP_RE = re.compile(r"^\s*(\d+):(\d{1,2}):(\d{1,2})(?:[,.](\d+))?\s*$")
+
+# Parsed files kept by load_srt(); caption files are small, this bounds memory
+CACHE_MAX_ENTRIES = 64
+
+
+@dataclass(frozen=True)
+class Cue:
+    """A single caption: integer-millisecond span and (possibly multi-line) text."""
+
+    start_ms: int
+    end_ms: int
+    text: str
+
+    @property
+    def duration_ms(self) -> int:
+        return self.end_ms - self.start_ms
+
+    @property
+    def words(self) -> int:
+        return len(self.text.split())
+
+    @property
+    def chars_per_sec(self) -> float:
+        """Reading speed, counting characters without line breaks."""
+        chars = len(" ".join(self.text.split()))
+        return chars * 1000.0 / max(self.duration_ms, 1)
+
+
+# --- Timestamps ---------------------------------------------------------------
+
+
+def _fraction_ms(digits: Optional[str]) -> int:
+    # ",5" is half a second, ",05" fifty milliseconds; extra digits are dropped
+    return int((digits or "0")[:3].ljust(3, "0"))
+
+
+def _to_ms(h: str, m: str, s: str, frac: Optional[str]) -> int:
+    return ((int(h) * 60 + int(m)) * 60 + int(s)) * 1000 + _fraction_ms(frac)
+
+
+def parse_timestamp(timestamp: str) -> int:
+    """
+    Parse an SRT timestamp (``HH:MM:SS,mmm``; ``.`` is accepted too).
+
+    Args:
+        timestamp: Timestamp string
+
+    Returns:
+        Time in milliseconds
+
+    Raises:
+        ValueError: If the string is not a timestamp
+    """
+    m = _TIMESTAMP_RE.match(timestamp)
+    if not m:
+        raise ValueError(f"Invalid SRT timestamp: {timestamp!r}")
+    return _to_ms(*m.groups())
+
+
+def format_timestamp(ms: int) -> str:
+    """Format milliseconds as an SRT timestamp (``HH:MM:SS,mmm``)."""
+    ms = max(0, int(ms))
+    seconds, millis = divmod(ms, 1000)
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+def format_ass_timestamp(ms: int) -> str:
+    """Format milliseconds as an ASS timestamp (``H:MM:SS.cc``, truncated)."""
+    ms = max(0, int(ms))
+    seconds, millis = divmod(ms, 1000)
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:01d}:{minutes:02d}:{secs:02d}.{millis // 10:02d}"
+
+
+def seconds_to_ms(seconds: float) -> int:
+    """Round a time in seconds to whole milliseconds."""
+    return int(round(seconds * 1000))
+
+
+# --- Parsing ------------------------------------------------------------------
+
+
+def iter_cues(lines: Iterable[str]) -> Iterator[Cue]:
+    """
+    Stream cues from SRT lines (a file object, or ``text.splitlines()``).
+
+    A cue starts at a timing line; its text runs until the next blank line
+    or the next timing line. Cues without text are skipped. Index lines are
+    not required and their values are ignored, since every serializer
+    renumbers cues anyway.
+    """
+    start = end = None
+    text: List[str] = []
+    for raw in lines:
+        line = raw.rstrip("\r\n").lstrip("\ufeff")
+        m = _TIMING_RE.match(line)
+        if m:
+            if start is not None:
+                # A timing line inside a pending cue starts the next cue; the
+                # line before it was that cue's index, not text
+                if text and text[-1].isdigit():
+                    text.pop()
+                if text:
+                    yield Cue(start, end, "\n".join(text))
+            g = m.groups()
+            start, end, text = _to_ms(*g[:4]), _to_ms(*g[4:]), []
+            continue
+        if start is None:
+            continue
+        if line.strip():
+            text.append(line.strip())
+            continue
+        if text:
+            yield Cue(start, end, "\n".join(text))
+            start = None
+        # A blank line straight after the timing line: keep waiting for text
+    if start is not None and text:
+        yield Cue(start, end, "\n".join(text))
+
+
+def parse_srt(text: str) -> List[Cue]:
+    """Parse SRT content into cues."""
+    return list(iter_cues(text.splitlines()))
+
+
+_cache_lock = threading.Lock()
+_cache: "OrderedDict[str, Tuple[Tuple[int, int, int], Tuple[Cue, ...]]]" = (
+    OrderedDict()
+)
+
+
+def _stat_key(path: str) -> Tuple[int, int, int]:
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def load_srt(path) -> Tuple[Cue, ...]:
+    """
+    Parse an SRT file, reusing the result while the file is unchanged.
+
+    Args:
+        path: SRT file path
+
+    Returns:
+        Tuple of cues (shared between callers, hence immutable)
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    key = os.path.abspath(os.fspath(path))
+    stamp = _stat_key(key)
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit and hit[0] == stamp:
+            _cache.move_to_end(key)
+            return hit[1]
+
+    with open(key, "r", encoding="utf-8", errors="ignore") as f:
+        cues = tuple(iter_cues(f))
+
+    with _cache_lock:
+        _cache[key] = (stamp, cues)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return cues
+
+
+def invalidate(path) -> None:
+    """Forget the cached parse of ``path``."""
+    with _cache_lock:
+        _cache.pop(os.path.abspath(os.fspath(path)), None)
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+# --- Serialization ------------------------------------------------------------
+
+
+def to_srt(cues: Iterable[Cue]) -> str:
+    """Serialize cues as SRT, numbered from 1."""
+    return "".join(
+        f"{i}\n{format_timestamp(c.start_ms)} --> {format_timestamp(c.end_ms)}\n"
+        f"{c.text}\n\n"
+        for i, c in enumerate(cues, 1)
+    )
+
+
+def write_srt(path, cues: Iterable[Cue]) -> str:
+    """Write cues to ``path`` as SRT and prime the parse cache."""
+    content = to_srt(cues)
+    path = os.fspath(path)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    key = os.path.abspath(path)
+    # Cache what a reader would parse back, not the cues as given
+    parsed = tuple(parse_srt(content))
+    with _cache_lock:
+        _cache[key] = (_stat_key(key), parsed)
+        _cache.move_to_end(key)
+    return path
+
+
+def _ass_colour(rgba: Sequence[int]) -> str:
+    return "&H{b:02X}{g:02X}{r:02X}&".format(r=rgba[0], g=rgba[1], b=rgba[2])
+
+
+def _ass_text(text: str) -> str:
+    return "\\N".join(text.splitlines())
+
+
+def to_ass(
+    cues: Iterable[Cue],
+    font: str,
+    font_size_px: int,
+    fill_rgba,
+    stroke_rgba,
+    bottom_margin_px: int,
+    play_res: Tuple[int, int] = (1080, 1920),
+) -> str:
+    """
+    Serialize cues as an ASS script with a single bottom-centred style.
+
+    Args:
+        cues: Cues to render
+        font: Font name or path for the style
+        font_size_px: Font size in script pixels
+        fill_rgba: Text colour (r, g, b[, a])
+        stroke_rgba: Outline colour (r, g, b[, a])
+        bottom_margin_px: Vertical margin from the bottom edge
+        play_res: Script resolution (width, height)
+
+    Returns:
+        ASS script text
+    """
+    header = (
+        "[Script Info]\nScriptType: v4.00+\n"
+        f"PlayResX: {play_res[0]}\nPlayResY: {play_res[1]}\n\n"
+        "[V4+ Styles]\n"
+        "Format: Name, Fontname, Fontsize, PrimaryColour, OutlineColour, "
+        "BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV\n"
+        f"Style: Default,{font},{font_size_px},{_ass_colour(fill_rgba)},"
+        f"{_ass_colour(stroke_rgba)},1,3,0,2,40,40,{bottom_margin_px}\n\n"
+        "[Events]\nFormat: Layer, Start, End, Style, Text\n"
+    )
+    body = [
+        f"Dialogue: 0,{format_ass_timestamp(c.start_ms)},"
+        f"{format_ass_timestamp(c.end_ms)},Default,{_ass_text(c.text)}"
+        for c in cues
+    ]
+    return header + "\n".join(body) + "\n"
+
+
+# --- Cue operations -----------------------------------------------------------
+
+
+def shift(cues: Iterable[Cue], offset_ms: int) -> List[Cue]:
+    """Move cues by ``offset_ms``, dropping any that end before zero."""
+    shifted = []
+    for c in cues:
+        end = c.end_ms + offset_ms
+        if end < 0:
+            continue
+        shifted.append(replace(c, start_ms=max(0, c.start_ms + offset_ms), end_ms=end))
+    return shifted
+
+
+def clip(cues: Iterable[Cue], start_ms: int, end_ms: int) -> List[Cue]:
+    """
+    Cues overlapping ``[start_ms, end_ms]``, clamped to it and rebased to zero.
+
+    Cues that merely touch the window edges are kept (with zero duration),
+    matching how clip windows have always been cut.
+    """
+    out = []
+    for c in cues:
+        if c.end_ms < start_ms or c.start_ms > end_ms:
+            continue
+        out.append(
+            Cue(
+                max(c.start_ms, start_ms) - start_ms,
+                min(c.end_ms, end_ms) - start_ms,
+                c.text,
+            )
+        )
+    return out
+
+
+def merge(first: Cue, second: Cue, sep: str = " ") -> Cue:
+    """Join two cues into one spanning both."""
+    return Cue(
+        min(first.start_ms, second.start_ms),
+        max(first.end_ms, second.end_ms),
+        f"{first.text}{sep}{second.text}",
+    )
+
+
+def _time_by_chars(cue: Cue, pieces: List[str]) -> List[Cue]:
+    # Share the cue's span between pieces in proportion to their length
+    weights = [max(len(p), 1) for p in pieces]
+    total = sum(weights)
+    out, acc = [], 0
+    start = cue.start_ms
+    for piece, weight in zip(pieces, weights):
+        acc += weight
+        end = cue.start_ms + round(cue.duration_ms * acc / total)
+        out.append(Cue(start, end, piece))
+        start = end
+    return out
+
+
+def split(cue: Cue, parts: int) -> List[Cue]:
+    """
+    Split a cue into up to ``parts`` cues at word boundaries.
+
+    Words are balanced by character count and time is shared in proportion
+    to each piece's length.
+    """
+    words = cue.text.split()
+    parts = max(1, min(parts, len(words)))
+    if parts == 1:
+        return [cue]
+    total = len(" ".join(words))
+    pieces: List[str] = []
+    current: List[str] = []
+    done = 0
+    for i, word in enumerate(words[:-1]):
+        current.append(word)
+        done += len(word) + 1
+        cuts_left = parts - len(pieces) - 1
+        if not cuts_left:
+            continue
+        # Cut here when taking the next word would land further from the target
+        target = total * (len(pieces) + 1) / parts
+        overshoot = done + len(words[i + 1]) + 1 - target
+        if abs(done - target) <= abs(overshoot) or len(words) - i - 1 == cuts_left:
+            pieces.append(" ".join(current))
+            current = []
+    current.append(words[-1])
+    pieces.append(" ".join(current))
+    return _time_by_chars(cue, pieces)
+
+
+def _wrap_words(text: str, max_chars: int) -> List[str]:
+    lines, current = [], ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if current and len(candidate) > max_chars:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines
+
+
+def resegment(
+    cues: Iterable[Cue],
+    max_chars: int = 42,
+    max_cps: float = 17.0,
+    min_duration_ms: int = 800,
+    max_gap_ms: int = 200,
+) -> List[Cue]:
+    """
+    Re-cut cues for comfortable reading.
+
+    Cues longer than ``max_chars`` are split at word boundaries. Neighbouring
+    cues are then merged while the result still fits ``max_chars`` and the
+    earlier cue is either shorter than ``min_duration_ms`` or reads faster
+    than ``max_cps`` characters per second, provided the gap between them is
+    at most ``max_gap_ms``.
+    """
+    pieces: List[Cue] = []
+    for cue in cues:
+        flat = " ".join(cue.text.split())
+        if len(flat) <= max_chars:
+            pieces.append(cue)
+        else:
+            pieces.extend(_time_by_chars(cue, _wrap_words(flat, max_chars)))
+
+    out: List[Cue] = []
+    for cue in pieces:
+        if out:
+            prev = out[-1]
+            joined = len(" ".join(prev.text.split())) + 1 + len(cue.text)
+            hurried = (
+                prev.duration_ms < min_duration_ms or prev.chars_per_sec > max_cps
+            )
+            if (
+                hurried
+                and joined <= max_chars
+                and cue.start_ms - prev.end_ms <= max_gap_ms
+            ):
+                out[-1] = merge(prev, cue)
+                continue
+        out.append(cue)
+    return out
+
+
+def cues_from_timings(timings: Iterable[Tuple[float, float, str]]) -> List[Cue]:
+    """Cues from ``(start_sec, end_sec, text)`` tuples."""
+    return [Cue(seconds_to_ms(s), seconds_to_ms(e), text) for s, e, text in timings]
+
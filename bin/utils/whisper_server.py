@@ -0,0 +1,286 @@
+# bin/utils/whisper_server.py
+"""
+Persistent whisper.cpp server for caption generation.
+
+whisper-cli loads the ggml model from disk for every file it transcribes.
+WhisperServer instead keeps one ``whisper-server`` process (shipped next to
+whisper-cli in a whisper.cpp build) running with the model resident, and
+records its pid, start time, port and model in jobs/whisper_server.json so
+later runs (shorts, re-renders, the next pipeline step) attach to it instead
+of loading the model again. A recorded pid is only trusted, or signalled, while
+it is still that process: after a reboot or crash it may belong to another.
+
+Audio goes in as 16 kHz mono 16-bit PCM: files are decoded by ffmpeg onto a
+pipe and posted as an in-memory WAV, so no temporary WAV is written. Several
+files, or segments of one buffer, can be transcribed against the same server.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import shutil
+import signal
+import subprocess
+import time
+import wave
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import psutil
+import requests
+
+from bin.core import BASE, get_logger
+from bin.utils.subtitles import parse_srt, shift, to_srt, write_srt
+
+log = get_logger("whisper_server")
+
+SAMPLE_RATE = 16000
+BYTES_PER_SAMPLE = 2
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8178
+STATE_PATH = os.path.join(BASE, "jobs", "whisper_server.json")
+SERVER_LOG = os.path.join(BASE, "logs", "whisper_server.log")
+START_TIMEOUT_S = 60.0
+REQUEST_TIMEOUT_S = 600.0
+LOUDNORM = "loudnorm=I=-16:TP=-1.5:LRA=11"
+
+
+def server_binary(cli_path: str) -> Optional[str]:
+    """Locate whisper-server next to the configured whisper-cli, or on PATH."""
+    sibling = os.path.join(os.path.dirname(cli_path), "whisper-server")
+    if os.path.exists(sibling):
+        return sibling
+    return shutil.which("whisper-server")
+
+
+def decode_pcm(audio_path: str, loudnorm: bool = True) -> bytes:
+    """
+    Decode any ffmpeg-readable audio to 16 kHz mono s16le PCM in memory.
+
+    Args:
+        audio_path: Input audio (MP3/WAV/...)
+        loudnorm: Apply the same loudness normalization as the CLI path
+
+    Returns:
+        Raw little-endian 16-bit PCM samples
+    """
+    cmd = ["ffmpeg", "-nostdin", "-v", "error", "-i", audio_path]
+    if loudnorm:
+        cmd += ["-af", LOUDNORM]
+    cmd += ["-ar", str(SAMPLE_RATE), "-ac", "1", "-f", "s16le", "-"]
+    proc = subprocess.run(cmd, capture_output=True)
+    if proc.returncode != 0:
+        err = proc.stderr.decode("utf-8", "replace")[:200]
+        raise RuntimeError(f"ffmpeg could not decode {audio_path}: {err}")
+    return proc.stdout
+
+
+def pcm_to_wav(pcm: bytes, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """Wrap mono s16le PCM in a WAV header, in memory."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(BYTES_PER_SAMPLE)
+        w.setframerate(sample_rate)
+        w.writeframes(pcm)
+    return buf.getvalue()
+
+
+def _is_recorded_server(state: dict) -> bool:
+    """True if the state's pid is still the server it recorded."""
+    try:
+        proc = psutil.Process(state["pid"])
+        if proc.create_time() != state["started"]:
+            return False  # The pid was reused
+        return state["model"] in proc.cmdline()
+    except (KeyError, TypeError, ValueError, psutil.Error):
+        return False
+
+
+class WhisperServer:
+    """
+    A whisper.cpp server with the model kept in memory across runs.
+
+    Args:
+        binary: Path to whisper-server
+        model: Path to the ggml model
+        host: Interface to bind
+        port: Port to bind
+        threads: Inference threads (whisper.cpp default when None)
+        state_path: Where the running server is recorded for reuse
+    """
+
+    def __init__(
+        self,
+        binary: str,
+        model: str,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        threads: Optional[int] = None,
+        state_path: str = STATE_PATH,
+    ):
+        self.binary = binary
+        self.model = os.path.abspath(model)
+        self.host = host
+        self.port = port
+        self.threads = threads
+        self.state_path = state_path
+        self.sess = requests.Session()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def healthy(self) -> bool:
+        try:
+            return self.sess.get(self.url, timeout=1.0).ok
+        except requests.RequestException:
+            return False
+
+    def _read_state(self) -> dict:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_state(self, pid: int) -> None:
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        state = {"pid": pid, "host": self.host, "port": self.port}
+        state["model"] = self.model
+        state["started"] = psutil.Process(pid).create_time()
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def running(self) -> bool:
+        """True if the recorded server is ours (same model and port) and up."""
+        state = self._read_state()
+        return (
+            state.get("model") == self.model
+            and state.get("port") == self.port
+            and _is_recorded_server(state)
+            and self.healthy()
+        )
+
+    def ensure(self, timeout_s: float = START_TIMEOUT_S) -> "WhisperServer":
+        """
+        Attach to the recorded server, or start one and wait until it serves.
+
+        A recorded server for a different model is stopped first. The new
+        process runs in its own session so it outlives this one.
+
+        Raises:
+            RuntimeError: If the server exits or does not come up in time
+        """
+        if self.running():
+            log.info(f"Reusing whisper-server at {self.url}")
+            return self
+        self.stop()
+
+        cmd = [self.binary, "-m", self.model, "--host", self.host]
+        cmd += ["--port", str(self.port)]
+        if self.threads:
+            cmd += ["-t", str(self.threads)]
+        os.makedirs(os.path.dirname(SERVER_LOG), exist_ok=True)
+        with open(SERVER_LOG, "a", encoding="utf-8") as log_fh:
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=log_fh,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
+
+        start = time.monotonic()
+        while time.monotonic() - start < timeout_s:
+            if proc.poll() is not None:
+                raise RuntimeError(
+                    f"whisper-server exited with code {proc.returncode}; "
+                    f"see {SERVER_LOG}"
+                )
+            if self.healthy():
+                self._write_state(proc.pid)
+                log.info(
+                    f"Started whisper-server pid={proc.pid} at {self.url} in "
+                    f"{time.monotonic() - start:.1f}s"
+                )
+                return self
+            time.sleep(0.25)
+        proc.terminate()
+        raise RuntimeError(f"whisper-server did not start within {timeout_s:.0f}s")
+
+    def stop(self) -> bool:
+        """
+        Stop the recorded server, if any, and forget it.
+
+        A pid that no longer belongs to the recorded server is not signalled;
+        only the stale state file is removed.
+
+        Returns:
+            True if a server was stopped
+        """
+        state = self._read_state()
+        pid = state.get("pid")
+        stopped = False
+        if _is_recorded_server(state):
+            try:
+                os.kill(pid, signal.SIGTERM)
+                stopped = True
+                log.info(f"Stopped whisper-server pid={pid}")
+            except OSError:
+                pass
+        try:
+            os.remove(self.state_path)
+        except OSError:
+            pass
+        return stopped
+
+    def transcribe_pcm(self, pcm: bytes, offset_ms: int = 0) -> str:
+        """
+        Transcribe 16 kHz mono s16le PCM and return SRT text.
+
+        Args:
+            pcm: Raw samples
+            offset_ms: Added to every cue, for segments cut from a longer take
+
+        Returns:
+            SRT text
+        """
+        r = self.sess.post(
+            f"{self.url}/inference",
+            files={"file": ("audio.wav", pcm_to_wav(pcm), "audio/wav")},
+            data={"response_format": "srt", "temperature": "0.0"},
+            timeout=REQUEST_TIMEOUT_S,
+        )
+        r.raise_for_status()
+        if not offset_ms:
+            return r.text
+        return to_srt(shift(parse_srt(r.text), offset_ms))
+
+    def transcribe_segments(
+        self, pcm: bytes, segments_ms: Iterable[Tuple[int, int]]
+    ) -> List[str]:
+        """
+        Transcribe ``[start_ms, end_ms)`` slices of one PCM buffer.
+
+        Cue times stay relative to the whole buffer.
+        """
+        bytes_per_ms = SAMPLE_RATE * BYTES_PER_SAMPLE // 1000
+        return [
+            self.transcribe_pcm(
+                pcm[start * bytes_per_ms : end * bytes_per_ms], offset_ms=start
+            )
+            for start, end in segments_ms
+        ]
+
+    def transcribe_file(self, audio_path: str, srt_out: str) -> str:
+        """Decode ``audio_path`` in memory, transcribe it and write ``srt_out``."""
+        srt = self.transcribe_pcm(decode_pcm(audio_path))
+        return write_srt(srt_out, parse_srt(srt))
+
+    def transcribe_files(self, jobs: Sequence[Tuple[str, str]]) -> List[str]:
+        """Transcribe ``(audio_path, srt_out)`` pairs in one session."""
+        return [self.transcribe_file(audio, srt) for audio, srt in jobs]
@@ -10,7 +10,7 @@ from typing import List, Tuple
 from pathlib import Path
 
 from bin.utils.assets_guard import ensure_font, ensure_overlay
-from bin.utils.captions import segment_srt, srt_to_ass
+from bin.utils.subtitles import clip, load_srt, seconds_to_ms, to_ass
 from bin.utils.config import read_or_die
 
 log = logging.getLogger("viral.shorts")
@@ -127,6 +127,7 @@ def main():
 
     src = Path("videos")/f"{slug}_cc.mp4"
     srt = Path("voiceovers")/f"{slug}.srt"
+    srt_cues = load_srt(srt) if srt.exists() else ()
     brief = _read_yaml(f"conf/briefs/{slug}.yaml") if Path(f"conf/briefs/{slug}.yaml").exists() else {}
 
     picks = _pick_segments(slug, cfg)
@@ -147,9 +148,9 @@ def main():
 
     for i,(start,end,why) in enumerate(picks, start=1):
         # prepare captions
-        srt_text = segment_srt(srt, start, end)
+        cues = clip(srt_cues, seconds_to_ms(start), seconds_to_ms(end))
         with tempfile.NamedTemporaryFile("w+", suffix=".ass", delete=False, encoding="utf-8") as tf:
-            ass_text = srt_to_ass(srt_text, font=font_path, font_size_px=font_px,
+            ass_text = to_ass(cues, font=font_path, font_size_px=font_px,
                                   fill_rgba=cfg["captions"]["fill_rgba"],
                                   stroke_rgba=cfg["captions"]["stroke_rgba"],
                                   bottom_margin_px=bottom_margin_px)
@@ -10,7 +10,6 @@ each scene section.
 import argparse
 import json
 import os
-import re
 import sys
 from typing import Dict, List, Tuple
 
@@ -20,6 +19,7 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 from bin.core import BASE, get_logger, guard_system, load_config, log_state, single_lock
+from bin.utils.subtitles import load_srt, parse_timestamp
 
 log = get_logger("voice_cues")
 
@@ -34,14 +34,7 @@ def parse_srt_timestamp(timestamp: str) -> int:
     Returns:
         Timestamp in milliseconds
     """
-    # Handle format: 00:00:00,000
-    time_parts = timestamp.replace(",", ".").split(":")
-    hours = int(time_parts[0])
-    minutes = int(time_parts[1])
-    seconds = float(time_parts[2])
-
-    total_ms = (hours * 3600 + minutes * 60 + seconds) * 1000
-    return int(total_ms)
+    return parse_timestamp(timestamp)
 
 
 def parse_srt_file(srt_path: str) -> List[Tuple[int, int, str]]:
@@ -58,21 +51,7 @@ def parse_srt_file(srt_path: str) -> List[Tuple[int, int, str]]:
         log.warning(f"SRT file not found: {srt_path}")
         return []
 
-    with open(srt_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    # SRT format: number, timestamp --> timestamp, text
-    pattern = r"(\d+)\s+(\d{2}:\d{2}:\d{2},\d{3})\s+-->\s+(\d{2}:\d{2}:\d{2},\d{3})\s+([\s\S]*?)(?=\n\d+\n|$)"
-    matches = re.findall(pattern, content)
-
-    cues = []
-    for match in matches:
-        number = int(match[0])
-        start_time = parse_srt_timestamp(match[1])
-        end_time = parse_srt_timestamp(match[2])
-        text = match[3].strip()
-
-        cues.append((start_time, end_time, text))
+    cues = [(c.start_ms, c.end_ms, c.text) for c in load_srt(srt_path)]
 
     log.info(f"Parsed {len(cues)} cues from SRT file")
     return cues
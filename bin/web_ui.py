@@ -7,6 +7,7 @@ import subprocess
 import sys
 import threading
 import time
+from collections import deque
 from functools import wraps
 
 from flask import Flask, jsonify, render_template_string, request, session
@@ -17,6 +18,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from bin.analytics_collector import MetricsCollector
 from bin.core import BASE, load_env
+from bin.utils.logtail import LogCursor, LogFollower
+from bin.utils.logtail import tail as tail_file
 
 app = Flask(__name__)
 app.secret_key = secrets.token_hex(32)  # Generate a secure secret key
@@ -36,6 +39,15 @@ log_watchers = set()
 metrics_watchers = set()
 broadcast_queue = queue.Queue()
 
+# Log sources exposed to the dashboard, each followed incrementally with a
+# byte offset per subscribed socket
+LOG_SOURCES = {
+    "state": os.path.join(BASE, "jobs", "state.jsonl"),
+    "pipeline": os.path.join(BASE, "logs", "pipeline.log"),
+}
+LOG_POLL_INTERVAL = 1.0
+log_followers = {name: LogFollower(path) for name, path in LOG_SOURCES.items()}
+
 
 def requires_auth(f):
     """Authentication decorator with session management."""
@@ -94,11 +106,66 @@ def rate_limit(calls_per_minute=30):
 
 
 def tail(path, n=200):
-    if not os.path.exists(path):
-        return ""
-    with open(path, "r", encoding="utf-8") as f:
-        lines = f.read().splitlines()
-    return "\n".join(lines[-n:])
+    return tail_file(path, n)
+
+
+class StateSummary:
+    """Running aggregate of jobs/state.jsonl, updated from new lines only."""
+
+    def __init__(self, path, recent_size=20):
+        self.path = path
+        self._follower = LogFollower(path)
+        self._cursor = LogCursor()
+        self._lock = threading.Lock()
+        self._recent_size = recent_size
+        self._reset()
+
+    def _reset(self):
+        self.count = 0
+        self.last = {}
+        self.recent = deque(maxlen=self._recent_size)
+        self.step_counts = {}
+
+    def _add(self, lines):
+        for raw in lines:
+            if not raw.strip():
+                continue
+            try:
+                entry = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            self.count += 1
+            self.last = entry
+            self.recent.append(entry)
+            key = f"{entry.get('step', 'unknown')}:{entry.get('status', 'unknown')}"
+            self.step_counts[key] = self.step_counts.get(key, 0) + 1
+
+    def refresh(self):
+        with self._lock:
+            # Each read is capped (MAX_READ_BYTES); keep reading until caught up
+            while True:
+                lines, reset = self._follower.read_new(self._cursor)
+                if reset:
+                    self._reset()
+                if not lines:
+                    break
+                self._add(lines)
+
+            return {
+                "count": self.count,
+                "last": self.last,
+                "recent": list(self.recent),
+                "step_counts": dict(self.step_counts),
+            }
+
+
+state_summary = StateSummary(LOG_SOURCES["state"])
+
+
+def _unsubscribe_logs(sid):
+    log_watchers.discard(sid)
+    for follower in log_followers.values():
+        follower.unsubscribe(sid)
 
 
 # WebSocket event handlers
@@ -114,7 +181,7 @@ def handle_connect():
 def handle_disconnect():
     """Handle client disconnection."""
     connected_clients.discard(request.sid)
-    log_watchers.discard(request.sid)
+    _unsubscribe_logs(request.sid)
     metrics_watchers.discard(request.sid)
     print(f"Client {request.sid} disconnected. Total clients: {len(connected_clients)}")
 
@@ -122,28 +189,30 @@ def handle_disconnect():
 @socketio.on("subscribe_logs")
 def handle_subscribe_logs(data):
     """Subscribe to real-time log updates."""
-    log_watchers.add(request.sid)
     source = data.get("source", "state")
+    # A client follows one source at a time; switching tabs moves its cursor
+    _unsubscribe_logs(request.sid)
+    log_watchers.add(request.sid)
     emit("log_subscription", {"status": "subscribed", "source": source})
 
-    # Send initial log data
-    log_sources = {
-        "state": os.path.join(BASE, "jobs", "state.jsonl"),
-        "pipeline": os.path.join(BASE, "logs", "pipeline.log"),
-    }
-
-    if source in log_sources:
-        content = tail(log_sources[source], 50)
+    if source in log_followers:
+        # Send initial log data; subsequent updates carry only new lines
+        lines = log_followers[source].subscribe(request.sid, backlog=50)
         emit(
             "log_update",
-            {"source": source, "content": content, "timestamp": time.time()},
+            {
+                "source": source,
+                "content": "\n".join(lines),
+                "timestamp": time.time(),
+                "type": "snapshot",
+            },
         )
 
 
 @socketio.on("unsubscribe_logs")
 def handle_unsubscribe_logs():
     """Unsubscribe from log updates."""
-    log_watchers.discard(request.sid)
+    _unsubscribe_logs(request.sid)
     emit("log_subscription", {"status": "unsubscribed"})
 
 
@@ -195,26 +264,7 @@ def handle_request_full_update():
 
 def get_pipeline_state():
     """Get current pipeline state for WebSocket broadcasting."""
-    p = os.path.join(BASE, "jobs", "state.jsonl")
-    lines = []
-    if os.path.exists(p):
-        with open(p, "r", encoding="utf-8") as f:
-            lines = [json.loads(x) for x in f.read().splitlines() if x.strip()]
-
-    recent_lines = lines[-20:] if lines else []
-    step_counts = {}
-    for line in lines:
-        step = line.get("step", "unknown")
-        status = line.get("status", "unknown")
-        key = f"{step}:{status}"
-        step_counts[key] = step_counts.get(key, 0) + 1
-
-    return {
-        "count": len(lines),
-        "last": (lines[-1] if lines else {}),
-        "recent": recent_lines,
-        "step_counts": step_counts,
-    }
+    return state_summary.refresh()
 
 
 def get_upload_queue():
@@ -241,29 +291,26 @@ def start_background_monitor():
     """Start background monitoring for real-time updates."""
 
     def monitor_logs():
-        """Monitor log files for changes."""
-        last_state_size = 0
-        state_file = os.path.join(BASE, "jobs", "state.jsonl")
-
+        """Push newly appended log lines to each subscribed client."""
         while True:
             try:
-                if os.path.exists(state_file):
-                    current_size = os.path.getsize(state_file)
-                    if current_size > last_state_size and log_watchers:
-                        # New log entries detected
-                        content = tail(state_file, 10)  # Get last 10 lines
-                        broadcast_update(
-                            "logs",
+                for source, follower in log_followers.items():
+                    if not len(follower):
+                        continue
+                    for sid, lines in follower.poll().items():
+                        socketio.emit(
+                            "log_update",
                             {
-                                "source": "state",
-                                "content": content,
+                                "source": source,
+                                "content": "\n".join(lines),
+                                "lines": lines,
                                 "timestamp": time.time(),
                                 "type": "incremental",
                             },
+                            to=sid,
                         )
-                        last_state_size = current_size
 
-                time.sleep(2)  # Check every 2 seconds
+                time.sleep(LOG_POLL_INTERVAL)
             except Exception as e:
                 print(f"Log monitoring error: {e}")
                 time.sleep(5)
@@ -324,29 +371,8 @@ def metrics_changed(old_metrics, new_metrics, threshold=5.0):
 @app.get("/api/state")
 @rate_limit(60)
 def api_state():
-    p = os.path.join(BASE, "jobs", "state.jsonl")
-    lines = []
-    if os.path.exists(p):
-        with open(p, "r", encoding="utf-8") as f:
-            lines = [json.loads(x) for x in f.read().splitlines() if x.strip()]
-
-    # Enhanced state information
-    recent_lines = lines[-20:] if lines else []
-    step_counts = {}
-    for line in lines:
-        step = line.get("step", "unknown")
-        status = line.get("status", "unknown")
-        key = f"{step}:{status}"
-        step_counts[key] = step_counts.get(key, 0) + 1
-
-    return jsonify(
-        {
-            "count": len(lines),
-            "last": (lines[-1] if lines else {}),
-            "recent": recent_lines,
-            "step_counts": step_counts,
-        }
-    )
+    # Enhanced state information, maintained incrementally
+    return jsonify(state_summary.refresh())
 
 
 @app.get("/api/topics")
@@ -363,18 +389,13 @@ def api_topics():
 @rate_limit(120)
 def api_logs():
     # Support multiple log sources
-    log_sources = {
-        "state": os.path.join(BASE, "jobs", "state.jsonl"),
-        "pipeline": os.path.join(BASE, "logs", "pipeline.log"),
-    }
-
     source = request.args.get("source", "state")
     lines = int(request.args.get("lines", 200))
 
-    if source not in log_sources:
+    if source not in LOG_SOURCES:
         return jsonify({"error": "invalid log source"}), 400
 
-    log_path = log_sources[source]
+    log_path = LOG_SOURCES[source]
     content = tail(log_path, lines)
 
     return jsonify(
@@ -1565,7 +1586,14 @@ function initBasicWebSocket() {
     
     socket.on('log_update', function(data) {
       if (data.source === currentLogSource) {
-        document.getElementById('logs').textContent = data.content;
+        const logsEl = document.getElementById('logs');
+        if (data.type === 'incremental') {
+          // Append only the new lines and keep the view bounded
+          const merged = (logsEl.textContent ? logsEl.textContent + '\\n' : '') + data.content;
+          logsEl.textContent = merged.split('\\n').slice(-500).join('\\n');
+        } else {
+          logsEl.textContent = data.content;
+        }
         document.getElementById('last-update').textContent = new Date().toLocaleTimeString();
       }
     });
@@ -21,6 +21,7 @@ from bin.core import (  # noqa: E402
     log_state,
     single_lock,
 )
+from bin.term_index import TermIndex  # noqa: E402
 
 log = get_logger("youtube_upload")
 
@@ -239,6 +240,17 @@ def load_video_metadata(file_path: str) -> dict:
     return {}
 
 
+def index_published_video(file_path: str, metadata: dict) -> None:
+    """Add a published video to the channel term index (best effort)."""
+    slug = os.path.splitext(os.path.basename(file_path))[0]
+    try:
+        index = TermIndex()
+        index.index_video(slug, metadata)
+        index.save()
+    except Exception as e:
+        log.warning(f"Could not update term index for {slug}: {e}")
+
+
 def find_thumbnail(video_path: str) -> str:
     """Find corresponding thumbnail for a video"""
     if not video_path:
@@ -397,6 +409,11 @@ def main(brief=None):
         print(f"Video ID: {vid}")
         print(f"URL: https://youtube.com/watch?v={vid}")
 
+        index_published_video(
+            file_path,
+            {**metadata, "title": title, "description": original_desc, "tags": tags},
+        )
+
         # Update queue item with video ID if it exists
         if item:
             item["youtube_id"] = vid
@@ -140,6 +140,13 @@ class OperatorConfig:
                 "events_retention_days": 30,
                 "max_events_per_job": 1000,
             },
+            "events": {
+                "sse_heartbeat_seconds": 5,
+                "sse_buffer_size": 256,
+                "sse_client_queue_size": 100,
+                "sse_slow_consumer_policy": "drop_oldest",
+                "sse_replay_limit": 1000,
+            },
             "pipeline": {
                 "max_concurrent_jobs": 1,
                 "job_timeout_hours": 24,
@@ -2,7 +2,7 @@ import json
 import logging
 import sqlite3
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .models import Artifact, Event, Gate, Job, JobStatus, Stage
 
@@ -82,6 +82,10 @@ class Database:
             """
             )
 
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_events_job_id ON events (job_id, id)"
+            )
+
             conn.commit()
             logger.info("Database initialized successfully")
 
@@ -254,11 +258,11 @@ class Database:
             logger.error(f"Failed to update job {job_id} status: {e}")
             return False
 
-    def add_event(self, job_id: str, event: Event) -> bool:
-        """Add an event to the job's event log"""
+    def add_event(self, job_id: str, event: Event):
+        """Add an event to the job's event log; returns the event id or False"""
         try:
             with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
+                cursor = conn.execute(
                     """
                     INSERT INTO events (job_id, timestamp, event_type, stage, message, metadata_json)
                     VALUES (?, ?, ?, ?, ?, ?)
@@ -278,7 +282,7 @@ class Database:
                 # Also append to events.jsonl file
                 self._append_event_to_jsonl(job_id, event)
 
-                return True
+                return cursor.lastrowid
         except Exception as e:
             logger.error(f"Failed to add event for job {job_id}: {e}")
             return False
@@ -367,6 +371,58 @@ class Database:
             logger.error(f"Failed to get events for job {job_id}: {e}")
             return []
 
+    def get_job_events_after(
+        self, job_id: str, after_id: int, limit: int = 1000
+    ) -> List[Tuple[int, Event]]:
+        """Get (event_id, event) pairs with id greater than after_id, oldest first"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.execute(
+                    """
+                    SELECT * FROM events
+                    WHERE job_id = ? AND id > ?
+                    ORDER BY id ASC
+                    LIMIT ?
+                """,
+                    (job_id, after_id, limit),
+                )
+
+                return [
+                    (
+                        row["id"],
+                        Event(
+                            timestamp=datetime.fromisoformat(row["timestamp"]),
+                            event_type=row["event_type"],
+                            stage=Stage(row["stage"]) if row["stage"] else None,
+                            message=row["message"],
+                            metadata=json.loads(row["metadata_json"]),
+                            job_id=job_id,
+                        ),
+                    )
+                    for row in cursor.fetchall()
+                ]
+
+        except Exception as e:
+            logger.error(f"Failed to get events after {after_id} for job {job_id}: {e}")
+            return []
+
+    def get_previous_event_id(self, job_id: str, before_id: int) -> Optional[int]:
+        """Id of the job's last event before before_id (0 if none, None on error)"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT MAX(id) FROM events WHERE job_id = ? AND id < ?",
+                    (job_id, before_id),
+                ).fetchone()
+                return row[0] or 0
+
+        except Exception as e:
+            logger.error(
+                f"Failed to get event before {before_id} for job {job_id}: {e}"
+            )
+            return None
+
     def list_jobs(self, limit: int = 100) -> List[Job]:
         """List all jobs with optional limit"""
         try:
@@ -6,28 +6,120 @@ Handles structured logging and event emission for the orchestrator.
 import asyncio
 import json
 import logging
+import threading
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Deque, Dict, List, Optional, Set
 
 from pathlib import Path
 
+from .config import operator_config
 from .db import db
 from .models import Event, Stage
 
 logger = logging.getLogger(__name__)
 
 
+class EventSubscriber:
+    """
+    A single SSE client with a bounded queue.
+
+    Replayed events are held separately and delivered before the queue, so a
+    replay longer than the queue is neither dropped nor treated as a slow
+    consumer.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        maxsize: int,
+        last_event_id: int = 0,
+        seen_window: int = 1024,
+    ):
+        self.job_id = job_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.replay: Deque[Dict[str, Any]] = deque()
+        self.last_event_id = last_event_id
+        self.dropped = 0
+        self.closed = False
+        # Recently delivered ids; worker-thread events can arrive out of order,
+        # so delivery is deduplicated by id rather than by the highest id
+        self._seen: Set[int] = set()
+        self._seen_order: Deque[int] = deque(maxlen=seen_window)
+
+    def first_delivery(self, event_id: int) -> bool:
+        """Record event_id as delivered; False if it already was"""
+        if event_id <= self.last_event_id or event_id in self._seen:
+            return False
+        if len(self._seen_order) == self._seen_order.maxlen:
+            self._seen.discard(self._seen_order[0])
+        self._seen_order.append(event_id)
+        self._seen.add(event_id)
+        return True
+
+    def empty(self) -> bool:
+        """True if no replayed or live event is waiting"""
+        return not self.replay and self.queue.empty()
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """Wait for the next event; None means the stream was closed"""
+        if self.replay:
+            return self.replay.popleft()
+        if self.closed and self.queue.empty():
+            return None
+        return await self.queue.get()
+
+
 class EventStreamManager:
-    """Manages real-time event streaming to SSE clients with heartbeat"""
+    """
+    Single push-based broadcaster for SSE clients.
 
-    def __init__(self):
-        self.active_streams: Dict[str, Set[asyncio.Queue]] = {}
+    Every published event gets a monotonic ID (the events table row id) and
+    is kept in a per-job ring buffer, so reconnecting clients can resume from
+    Last-Event-ID. IDs are global across jobs, so each buffer also tracks its
+    floor: the id of the job's last event it no longer holds. Clients get
+    bounded queues; one shared heartbeat task serves all of them.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 256,
+        client_queue_size: int = 100,
+        heartbeat_seconds: float = 5.0,
+        slow_consumer_policy: str = "drop_oldest",
+        replay_limit: int = 1000,
+        max_buffered_jobs: int = 64,
+    ):
+        self.active_streams: Dict[str, Set[EventSubscriber]] = {}
+        self.buffers: "OrderedDict[str, Deque[Dict[str, Any]]]" = OrderedDict()
+        # Per job: every event after this id is buffered (None: not known yet)
+        self.buffer_floors: Dict[str, Optional[int]] = {}
+        self.buffer_size = buffer_size
+        self.client_queue_size = client_queue_size
+        self.heartbeat_seconds = heartbeat_seconds
+        self.slow_consumer_policy = slow_consumer_policy
+        self.replay_limit = replay_limit
+        self.max_buffered_jobs = max_buffered_jobs
         self.log = logging.getLogger("event_stream")
         self.heartbeat_task: Optional[asyncio.Task] = None
-        # Don't start heartbeat during import - will be started when needed
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> "EventStreamManager":
+        """Create a broadcaster using the events section of operator.yaml"""
+        return cls(
+            buffer_size=operator_config.get("events.sse_buffer_size", 256),
+            client_queue_size=operator_config.get("events.sse_client_queue_size", 100),
+            heartbeat_seconds=operator_config.get("events.sse_heartbeat_seconds", 5),
+            slow_consumer_policy=operator_config.get(
+                "events.sse_slow_consumer_policy", "drop_oldest"
+            ),
+            replay_limit=operator_config.get("events.sse_replay_limit", 1000),
+        )
 
     def _start_heartbeat(self):
-        """Start heartbeat task for SSE clients"""
+        """Start the shared heartbeat task for SSE clients"""
         # Only start if not already running
         if self.heartbeat_task and not self.heartbeat_task.done():
             return
@@ -35,8 +127,8 @@ class EventStreamManager:
         async def heartbeat_loop():
             while True:
                 try:
-                    await asyncio.sleep(5)  # Heartbeat every 5 seconds
-                    await self._send_heartbeat()
+                    await asyncio.sleep(self.heartbeat_seconds)
+                    self._send_heartbeat()
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
@@ -54,41 +146,33 @@ class EventStreamManager:
         if not self.heartbeat_task or self.heartbeat_task.done():
             self._start_heartbeat()
 
-    async def _send_heartbeat(self):
-        """Send heartbeat to all active SSE clients"""
+    def _send_heartbeat(self):
+        """Send one heartbeat to every connected client"""
+        now = datetime.now(timezone.utc).isoformat()
         heartbeat_data = {
-            "ts": datetime.now(timezone.utc).isoformat(),
+            "id": None,
+            "ts": now,
             "type": "heartbeat",
+            "stage": None,
+            "status": None,
             "message": "Server alive",
-            "payload": {"timestamp": datetime.now(timezone.utc).isoformat()},
+            "payload": {"timestamp": now},
         }
 
-        # Send to all active streams
-        for job_id in list(self.active_streams.keys()):
-            await self.broadcast_event(job_id, Event(**heartbeat_data, job_id=job_id))
-
-    async def subscribe(self, job_id: str, queue: asyncio.Queue):
-        """Subscribe to events for a specific job"""
-        if job_id not in self.active_streams:
-            self.active_streams[job_id] = set()
-        self.active_streams[job_id].add(queue)
-        self.log.info(f"[events] Client subscribed to job {job_id} events")
-
-    async def unsubscribe(self, job_id: str, queue: asyncio.Queue):
-        """Unsubscribe from events for a specific job"""
-        if job_id in self.active_streams:
-            self.active_streams[job_id].discard(queue)
-            if not self.active_streams[job_id]:
-                del self.active_streams[job_id]
-        self.log.info(f"[events] Client unsubscribed from job {job_id} events")
+        for subscribers in list(self.active_streams.values()):
+            for subscriber in list(subscribers):
+                # Heartbeats are only useful on an idle connection
+                if subscriber.empty():
+                    subscriber.queue.put_nowait(heartbeat_data)
 
-    async def broadcast_event(self, job_id: str, event: Event):
-        """Broadcast an event to all subscribed clients for a job"""
-        if job_id not in self.active_streams:
-            return
+        if not self.active_streams and self.heartbeat_task:
+            self.heartbeat_task.cancel()
 
-        # Convert event to SSE format
-        event_data = {
+    @staticmethod
+    def _event_data(event: Event, event_id: Optional[int]) -> Dict[str, Any]:
+        """Convert an event to its SSE payload"""
+        return {
+            "id": event_id,
             "ts": event.ts.isoformat(),
             "type": event.type,
             "stage": event.stage.value if event.stage else None,
@@ -97,23 +181,167 @@ class EventStreamManager:
             "payload": event.payload,
         }
 
-        # Broadcast to all subscribers
-        disconnected_queues = set()
-        for queue in self.active_streams[job_id]:
-            try:
-                await queue.put(event_data)
-            except Exception as e:
-                self.log.warning(f"[events] Failed to send event to client: {e}")
-                disconnected_queues.add(queue)
-
-        # Clean up disconnected clients
-        for queue in disconnected_queues:
-            await self.unsubscribe(job_id, queue)
-
-        if self.active_streams[job_id]:
-            self.log.debug(
-                f"[events] Broadcasted event {event.type} to {len(self.active_streams[job_id])} clients for job {job_id}"
-            )
+    def _buffer_for(self, job_id: str) -> Deque[Dict[str, Any]]:
+        buffer = self.buffers.get(job_id)
+        if buffer is None:
+            buffer = deque(maxlen=self.buffer_size)
+            self.buffers[job_id] = buffer
+            self.buffer_floors[job_id] = None
+            while len(self.buffers) > self.max_buffered_jobs:
+                evicted_job, _ = self.buffers.popitem(last=False)
+                self.buffer_floors.pop(evicted_job, None)
+        else:
+            self.buffers.move_to_end(job_id)
+        return buffer
+
+    def _buffer_covers(
+        self, job_id: str, buffered: List[Dict[str, Any]], last_event_id: int
+    ) -> bool:
+        """True if the buffer holds every event of the job after last_event_id"""
+        if not buffered:
+            return False
+        with self._lock:
+            floor = self.buffer_floors.get(job_id)
+        if floor is None:
+            # Nothing evicted yet: the job may have events from before the
+            # buffer was created
+            oldest = min(e["id"] for e in buffered)
+            if last_event_id >= oldest:
+                return True
+            floor = db.get_previous_event_id(job_id, oldest)
+            if floor is None:
+                return False
+            with self._lock:
+                if self.buffer_floors.get(job_id, floor) is None:
+                    self.buffer_floors[job_id] = floor
+        return last_event_id >= floor
+
+    async def subscribe(
+        self, job_id: str, last_event_id: Optional[int] = None
+    ) -> EventSubscriber:
+        """
+        Subscribe to events for a specific job.
+
+        Events newer than last_event_id are replayed from the ring buffer, or
+        from the database when the buffer no longer covers the gap.
+        """
+        self._loop = asyncio.get_running_loop()
+        subscriber = EventSubscriber(
+            job_id,
+            self.client_queue_size,
+            last_event_id or 0,
+            seen_window=self.buffer_size + self.replay_limit,
+        )
+
+        with self._lock:
+            buffered = list(self.buffers.get(job_id, ()))
+            self.active_streams.setdefault(job_id, set()).add(subscriber)
+
+        if last_event_id is not None:
+            replay = [e for e in buffered if e["id"] > last_event_id]
+            if not self._buffer_covers(job_id, buffered, last_event_id):
+                # Buffer does not reach back far enough; fill the gap from the DB
+                stored = [
+                    self._event_data(event, event_id)
+                    for event_id, event in db.get_job_events_after(
+                        job_id, last_event_id, self.replay_limit
+                    )
+                ]
+                newest = stored[-1]["id"] if stored else last_event_id
+                replay = stored + [e for e in replay if e["id"] > newest]
+
+            # Replay bypasses the bounded queue; live events already in it
+            # are newer and follow once the replay is drained
+            for event_data in replay:
+                if subscriber.first_delivery(event_data["id"]):
+                    subscriber.replay.append(event_data)
+            if replay:
+                self.log.info(
+                    f"[events] Replayed {len(replay)} event(s) for job {job_id} after id {last_event_id}"
+                )
+
+        self.ensure_heartbeat_started()
+        self.log.info(f"[events] Client subscribed to job {job_id} events")
+        return subscriber
+
+    def _remove(self, subscriber: EventSubscriber):
+        with self._lock:
+            subscribers = self.active_streams.get(subscriber.job_id)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self.active_streams[subscriber.job_id]
+        subscriber.closed = True
+
+    async def unsubscribe(self, job_id: str, subscriber: EventSubscriber):
+        """Unsubscribe from events for a specific job"""
+        self._remove(subscriber)
+        self.log.info(f"[events] Client unsubscribed from job {job_id} events")
+
+    def _enqueue(self, subscriber: EventSubscriber, event_data: Dict[str, Any]):
+        """Put an event on a client queue, applying the slow-consumer policy"""
+        event_id = event_data.get("id")
+        if event_id is not None and not subscriber.first_delivery(event_id):
+            return  # Already delivered via replay
+
+        if subscriber.queue.full():
+            if self.slow_consumer_policy == "disconnect":
+                self.log.warning(
+                    f"[events] Disconnecting slow client for job {subscriber.job_id}"
+                )
+                self._remove(subscriber)
+                while not subscriber.queue.empty():
+                    subscriber.queue.get_nowait()
+                subscriber.queue.put_nowait(None)
+                return
+            # drop_oldest: live events only, so the client's Last-Event-ID
+            # stays behind the gap and a reconnect can recover it
+            subscriber.queue.get_nowait()
+            subscriber.dropped += 1
+
+        subscriber.queue.put_nowait(event_data)
+
+    def _fanout(self, job_id: str, event_data: Dict[str, Any]):
+        """Deliver an event to all subscribers (runs on the event loop)"""
+        for subscriber in list(self.active_streams.get(job_id, ())):
+            if not subscriber.closed:
+                self._enqueue(subscriber, event_data)
+
+    def publish(self, job_id: str, event: Event, event_id: Optional[int] = None):
+        """
+        Buffer an event and push it to connected clients.
+
+        Safe to call from worker threads; delivery is scheduled on the loop
+        that owns the client queues.
+        """
+        event_data = self._event_data(event, event_id)
+        with self._lock:
+            if event_id is not None:
+                buffer = self._buffer_for(job_id)
+                if len(buffer) == buffer.maxlen:
+                    floor = self.buffer_floors.get(job_id) or 0
+                    self.buffer_floors[job_id] = max(floor, buffer[0]["id"])
+                buffer.append(event_data)
+            has_clients = job_id in self.active_streams
+
+        if not has_clients or self._loop is None or self._loop.is_closed():
+            return
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is self._loop:
+            self._fanout(job_id, event_data)
+        else:
+            self._loop.call_soon_threadsafe(self._fanout, job_id, event_data)
+
+    async def broadcast_event(
+        self, job_id: str, event: Event, event_id: Optional[int] = None
+    ):
+        """Broadcast an event to all subscribed clients for a job"""
+        self.publish(job_id, event, event_id)
 
     def stop(self):
         """Stop the event stream manager"""
@@ -126,14 +354,12 @@ class EventLogger:
 
     def __init__(self):
         self.log = logging.getLogger("events")
-        self.stream_manager = None  # Will be created when needed
+        self.stream_manager = EventStreamManager.from_config()
         self._setup_logging()
         self._ensure_runs_dir()
 
     def _get_stream_manager(self):
-        """Get or create the stream manager"""
-        if self.stream_manager is None:
-            self.stream_manager = EventStreamManager()
+        """Get the stream manager"""
         return self.stream_manager
 
     def _setup_logging(self):
@@ -211,13 +437,14 @@ class EventLogger:
             self._write_event_to_jsonl(job_id, event)
 
             # Add to database
-            if db.add_event(job_id, event):
+            event_id = db.add_event(job_id, event)
+            if event_id:
                 # Log to console with [events] tag
                 self._log_event_to_console(job_id, event)
 
                 # Broadcast to SSE clients
                 stream_manager = self._get_stream_manager()
-                await stream_manager.broadcast_event(job_id, event)
+                await stream_manager.broadcast_event(job_id, event, event_id)
 
                 return event
             else:
@@ -256,9 +483,13 @@ class EventLogger:
             self._write_event_to_jsonl(job_id, event)
 
             # Add to database
-            if db.add_event(job_id, event):
+            event_id = db.add_event(job_id, event)
+            if event_id:
                 # Log to console with [events] tag
                 self._log_event_to_console(job_id, event)
+
+                # Push to SSE clients (thread-safe)
+                self._get_stream_manager().publish(job_id, event, event_id)
                 return event
             else:
                 self.log.error(
@@ -913,11 +913,80 @@ async def get_job_events(
         )
 
 
+# Pipeline logs followed by offset; clients pass back the returned offset and
+# file_id to receive only lines appended since their previous request
+LOG_SOURCES = {
+    "state": Path("jobs") / "state.jsonl",
+    "pipeline": Path("logs") / "pipeline.log",
+}
+
+
+@router.get("/logs/{source}")
+async def get_log_lines(
+    source: str,
+    offset: Optional[int] = None,
+    lines: int = 200,
+    file_id: Optional[str] = None,
+    current_operator: str = Depends(get_current_operator),
+):
+    """Get new lines from a pipeline log after a byte offset"""
+    from bin.utils.logtail import (
+        LogCursor,
+        file_identity,
+        read_cursor,
+        tail_with_offset,
+    )
+
+    if source not in LOG_SOURCES:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown log source: {source}",
+        )
+
+    log_path = str(LOG_SOURCES[source])
+    if offset is None:
+        # First request: backlog from the end, then follow from there
+        current_id = file_identity(log_path)
+        new_lines, next_offset = tail_with_offset(log_path, lines)
+        reset = False
+    else:
+        # file_id ("device:inode") from the previous response detects rotation
+        previous_id = None
+        if file_id:
+            try:
+                dev, ino = file_id.split(":")
+                previous_id = (int(dev), int(ino))
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid file_id: {file_id}",
+                )
+        cursor = LogCursor(offset=max(offset, 0), file_id=previous_id)
+        new_lines, reset = read_cursor(log_path, cursor)
+        next_offset, current_id = cursor.offset, cursor.file_id
+
+    return {
+        "source": source,
+        "lines": new_lines[-lines:],
+        "offset": next_offset,
+        "file_id": f"{current_id[0]}:{current_id[1]}" if current_id else None,
+        "reset": reset,
+    }
+
+
 @router.get("/jobs/{job_id}/events/stream")
 async def stream_job_events(
-    job_id: str, current_operator: str = Depends(get_current_operator)
+    job_id: str,
+    request: Request,
+    last_event_id: Optional[int] = None,
+    current_operator: str = Depends(get_current_operator),
 ):
-    """Stream job events via Server-Sent Events (SSE) with heartbeat"""
+    """
+    Stream job events via Server-Sent Events (SSE).
+
+    Events carry monotonic ids; reconnecting clients send Last-Event-ID (or
+    ?last_event_id=) and missed events are replayed before live ones.
+    """
     try:
         # Verify job exists
         job = db.get_job(job_id)
@@ -926,69 +995,62 @@ async def stream_job_events(
                 status_code=status.HTTP_404_NOT_FOUND, detail=f"Job {job_id} not found"
             )
 
-        async def event_stream():
-            """Stream events for the job with 5-second heartbeat"""
+        header_id = request.headers.get("last-event-id")
+        if header_id:
             try:
-                # Create a queue for this client
-                queue = asyncio.Queue()
+                last_event_id = int(header_id)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid Last-Event-ID header",
+                )
 
-                # Subscribe to events
-                await event_logger.stream_manager.subscribe(job_id, queue)
+        stream_manager = event_logger.stream_manager
 
+        def format_sse(event_data: Dict[str, Any]) -> str:
+            event_id = event_data.get("id")
+            prefix = f"id: {event_id}\n" if event_id is not None else ""
+            return f"{prefix}data: {json.dumps(event_data)}\n\n"
+
+        async def event_stream():
+            """Stream replayed and live events pushed by the broadcaster"""
+            subscriber = await stream_manager.subscribe(job_id, last_event_id)
+            try:
                 logger.info(
                     f"[api] SSE stream started for job {job_id} by {current_operator}"
                 )
 
                 # Send initial connection event
                 initial_event = {
+                    "id": None,
                     "ts": datetime.now(timezone.utc).isoformat(),
                     "type": "connected",
                     "stage": None,
                     "status": None,
                     "message": f"Connected to job {job_id} event stream",
-                    "payload": {"job_id": job_id, "operator": current_operator},
+                    "payload": {
+                        "job_id": job_id,
+                        "operator": current_operator,
+                        "last_event_id": last_event_id,
+                    },
                 }
-                yield f"data: {json.dumps(initial_event)}\n\n"
-
-                # Send heartbeat every 5 seconds as required
-                last_heartbeat = time.time()
+                yield format_sse(initial_event)
 
                 while True:
-                    current_time = time.time()
-
-                    # Send heartbeat every 5 seconds
-                    if current_time - last_heartbeat >= 5:
-                        heartbeat_event = {
-                            "ts": datetime.now(timezone.utc).isoformat(),
-                            "type": "heartbeat",
-                            "stage": None,
-                            "status": None,
-                            "message": "Server alive",
-                            "payload": {
-                                "timestamp": datetime.now(timezone.utc).isoformat()
-                            },
-                        }
-                        yield f"data: {json.dumps(heartbeat_event)}\n\n"
-                        last_heartbeat = current_time
-
-                    # Check for new events (non-blocking)
-                    try:
-                        # Wait for events with timeout
-                        event_data = await asyncio.wait_for(queue.get(), timeout=1.0)
-                        yield f"data: {json.dumps(event_data)}\n\n"
-                    except asyncio.TimeoutError:
-                        # No events, continue to next heartbeat check
-                        continue
+                    event_data = await subscriber.get()
+                    if event_data is None:
+                        # Disconnected by the slow-consumer policy
+                        break
+                    yield format_sse(event_data)
 
             except asyncio.CancelledError:
                 # Client disconnected
                 logger.info(f"[api] SSE stream ended for job {job_id}")
-                # Unsubscribe from events
-                await event_logger.stream_manager.unsubscribe(job_id, queue)
                 return
             except Exception as e:
                 logger.error(f"[api] Error in SSE stream for job {job_id}: {e}")
                 error_event = {
+                    "id": None,
                     "ts": datetime.now(timezone.utc).isoformat(),
                     "type": "error",
                     "stage": None,
@@ -996,11 +1058,11 @@ async def stream_job_events(
                     "message": str(e),
                     "payload": {"error": str(e)},
                 }
-                yield f"data: {json.dumps(error_event)}\n\n"
+                yield format_sse(error_event)
             finally:
                 # Ensure cleanup
                 try:
-                    await event_logger.stream_manager.unsubscribe(job_id, queue)
+                    await stream_manager.unsubscribe(job_id, subscriber)
                 except Exception as cleanup_error:
                     logger.warning(
                         f"[api] Cleanup error in SSE stream: {cleanup_error}"
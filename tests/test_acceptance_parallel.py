@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent acceptance validators and the shared artifact cache.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from bin.acceptance import AcceptanceValidator
+from bin.utils.artifact_cache import ArtifactCache
+
+DELAY = 0.2
+
+
+def test_cache_loads_each_artifact_once(tmp_path):
+    path = tmp_path / "outline.json"
+    path.write_text(json.dumps({"intent": "narrative_history"}), encoding="utf-8")
+    copy_path = tmp_path / "copy.json"
+    copy_path.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
+
+    cache = ArtifactCache()
+    calls = []
+
+    def slow_loader(p):
+        calls.append(p)
+        time.sleep(0.05)
+        return {"probe": p}
+
+    def load(_):
+        return cache.get("probe", str(path), slow_loader)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(load, range(8)))
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+    # Same content under another path shares the parsed value
+    first = cache.read_json(str(path))
+    assert cache.read_json(str(copy_path)) == first
+    first["intent"] = "mutated"
+    assert cache.read_json(str(path))["intent"] == "narrative_history"
+
+    # Rewritten files are re-read only after invalidation
+    path.write_text(json.dumps({"intent": "changed"}), encoding="utf-8")
+    assert cache.read_json(str(path))["intent"] == "narrative_history"
+    cache.invalidate(str(path))
+    assert cache.read_json(str(path))["intent"] == "changed"
+
+
+def test_cache_matches_plain_reads(tmp_path):
+    script = tmp_path / "script.txt"
+    script.write_bytes(b"line one\r\nline two\rthree\n")
+    with open(script, "r", encoding="utf-8") as f:
+        expected = f.read()
+    assert ArtifactCache().read_text(str(script)) == expected
+
+    missing = str(tmp_path / "missing.json")
+    with pytest.raises(FileNotFoundError) as plain:
+        open(missing)
+    with pytest.raises(FileNotFoundError) as cached:
+        ArtifactCache().read_json(missing)
+    assert str(cached.value) == str(plain.value)
+
+
+def _make_validator(monkeypatch, calls, audio_valid=True):
+    validator = AcceptanceValidator(SimpleNamespace())
+    validator.modules_cfg = {}
+    validator.render_cfg = {"acceptance": {"require_deterministic_runs": False}}
+
+    artifacts = {
+        "outline": "demo.outline.json",
+        "script": "demo.txt",
+        "scenescript": None,
+        "animatics": [],
+        "assets": [f"a{i}.png" for i in range(12)],
+        "voiceover": "demo.mp3",
+        "captions": "demo.srt",
+        "video": "demo.mp4",
+        "video_metadata": None,
+        "thumbnail": "demo.png",
+    }
+    monkeypatch.setattr(validator, "_find_youtube_artifacts", lambda: dict(artifacts))
+    monkeypatch.setattr(validator, "_extract_slug_from_artifacts", lambda a: None)
+
+    lock = threading.Lock()
+
+    def fake(name, result):
+        def run(artifacts):
+            with lock:
+                calls.append(name)
+            time.sleep(DELAY)
+            return json.loads(json.dumps(result))
+
+        return run
+
+    fakes = {
+        "_validate_youtube_quality": {"script_score": 90, "script_words": 900},
+        "_validate_youtube_audio": {"valid": audio_valid},
+        "_validate_assets_quality": {"status": "PASS", "errors": []},
+        "_validate_legibility": {"valid": True},
+        "_validate_visual_polish": {"status": "PASS", "errors": []},
+        "_validate_pacing": {
+            "status": "PASS",
+            "kpi_metrics": {"words_per_sec": 2.5},
+            "comparison": {"overall_status": "ok"},
+            "errors": [],
+        },
+        "_validate_evidence_quality": {"status": "PASS", "errors": []},
+    }
+    for attr, result in fakes.items():
+        monkeypatch.setattr(validator, attr, fake(attr, result))
+    return validator
+
+
+def _comparable(results):
+    return {k: v for k, v in results.items() if k != "timestamp"}
+
+
+def test_parallel_run_matches_sequential_run(monkeypatch):
+    sequential_calls = []
+    sequential = _make_validator(monkeypatch, sequential_calls)
+    expected = sequential._run_validation_steps()
+
+    parallel_calls = []
+    parallel = _make_validator(monkeypatch, parallel_calls)
+    start = time.perf_counter()
+    results = parallel.run_validation()
+    elapsed = time.perf_counter() - start
+
+    assert _comparable(results) == _comparable(expected)
+    assert results["overall_status"] == "PASS"
+
+    # Pacing is requested by the lane and by the run but executes once
+    assert sequential_calls.count("_validate_pacing") == 2
+    assert sorted(parallel_calls) == sorted(set(sequential_calls))
+
+    # Validators start in three waves between the lane's gates, rather than
+    # running one after another
+    assert elapsed < DELAY * 4
+
+
+def test_failing_lane_does_not_start_later_validators(monkeypatch):
+    calls = []
+    validator = _make_validator(monkeypatch, calls, audio_valid=False)
+    results = validator.run_validation()
+
+    assert results["lanes"]["youtube"]["status"] == "FAIL"
+    assert "_validate_legibility" not in calls
+    assert "_validate_visual_polish" not in calls
+    assert results["pacing"]["status"] == "PASS"
+
+
+def test_metadata_rewrites_wait_for_running_validators(monkeypatch):
+    validator = _make_validator(monkeypatch, [])
+    finished = []
+
+    def slow(artifacts):
+        time.sleep(DELAY)
+        finished.append("pacing")
+        return {}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        validator._executor = executor
+        validator._submit("pacing", slow, {})
+        validator._update_video_metadata_with_pacing("no-such-slug", {})
+        assert finished == ["pacing"]
+        validator._executor = None
+
+
+def test_validator_mutations_do_not_leak_between_consumers(monkeypatch):
+    validator = _make_validator(monkeypatch, [])
+    results = validator.run_validation()
+
+    # The run's integrity guard mutates its pacing copy; the lane keeps its own
+    results["pacing"]["errors"].append("extra")
+    assert results["lanes"]["youtube"]["quality"]["pacing"]["errors"] == []
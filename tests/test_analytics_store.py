@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental analytics store behind MetricsCollector.
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from bin.analytics_collector import MetricsCollector
+
+
+def _write_state(path, entries, mode="a"):
+    with open(path, mode, encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+@pytest.fixture
+def collector(tmp_path):
+    state_file = tmp_path / "jobs" / "state.jsonl"
+    state_file.parent.mkdir()
+    assets_dir = tmp_path / "assets"
+    assets_dir.mkdir()
+    return MetricsCollector(
+        data_dir=str(tmp_path / "analytics"),
+        state_file=str(state_file),
+        assets_dir=str(assets_dir),
+    )
+
+
+def test_state_log_ingested_incrementally(collector):
+    now = time.time()
+    _write_state(
+        collector.state_file,
+        [
+            {"ts": now - 60, "step": "script", "status": "OK"},
+            {"ts": now - 30, "step": "script", "status": "FAIL", "notes": "boom"},
+            {"ts": now - 48 * 3600, "step": "script", "status": "OK"},
+        ],
+    )
+
+    result = collector.parse_state_logs(hours=24)
+    perf = result["performance"]["script"]
+    assert perf["total_runs"] == 2
+    assert perf["success_rate"] == 50.0
+    assert [e["notes"] for e in result["errors"]] == ["boom"]
+    assert len(result["recent_activity"]) == 2
+
+    # Second call reads only the appended line
+    _write_state(
+        collector.state_file,
+        [{"ts": "2999-01-01T00:00:00Z", "step": "assets", "status": "OK"}],
+    )
+    assert collector.store.ingest_state_log(collector.state_file) == 1
+    assert collector.store.ingest_state_log(collector.state_file) == 0
+
+    result = collector.parse_state_logs(hours=72)
+    assert result["performance"]["script"]["total_runs"] == 3
+    assert result["performance"]["assets"]["total_runs"] == 1
+
+
+def test_partial_hour_window_is_exact(collector):
+    now = time.time()
+    _write_state(
+        collector.state_file,
+        [{"ts": now - 3600 * 2 - 5, "step": "tts", "status": "OK"}]
+        + [{"ts": now - 3600 * 2 + 5, "step": "tts", "status": "OK"}],
+    )
+    result = collector.parse_state_logs(hours=2)
+    assert result["performance"]["tts"]["total_runs"] == 1
+
+
+def test_truncated_state_log_is_reingested(collector):
+    now = time.time()
+    _write_state(
+        collector.state_file,
+        [{"ts": now, "step": "a", "status": "OK"}] * 3,
+    )
+    assert collector.parse_state_logs()["performance"]["a"]["total_runs"] == 3
+
+    _write_state(collector.state_file, [{"ts": now, "step": "b", "status": "OK"}], "w")
+    perf = collector.parse_state_logs()["performance"]
+    assert "a" not in perf
+    assert perf["b"]["total_runs"] == 1
+
+
+def test_asset_metrics_follow_changes(collector):
+    folder = os.path.join(collector.assets_dir, "topic-a")
+    os.makedirs(folder)
+    with open(os.path.join(folder, "one.png"), "wb") as f:
+        f.write(b"x" * 100)
+    with open(os.path.join(folder, "license.json"), "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "items": [
+                    {"provider": "pexels", "quality": {"overall_score": 0.8}},
+                    {"provider": "pixabay", "quality": {"overall_score": 0.6}},
+                ]
+            },
+            f,
+        )
+
+    metrics = collector.collect_asset_metrics()
+    assert metrics["total_assets"] == 1
+    assert metrics["by_type"] == {"image": 1}
+    assert metrics["by_provider"] == {"pexels": 1, "pixabay": 1}
+    assert metrics["license_compliance"] == {"with_license": 1, "total": 1}
+    assert metrics["quality_metrics"]["avg_overall_score"] == pytest.approx(0.7)
+
+    # Unchanged folders are not re-scanned
+    assert collector.store.refresh_assets(collector.assets_dir) == 0
+
+    other = os.path.join(collector.assets_dir, "topic-b")
+    os.makedirs(other)
+    with open(os.path.join(other, "clip.mp4"), "wb") as f:
+        f.write(b"y" * 300)
+    metrics = collector.collect_asset_metrics()
+    assert metrics["total_assets"] == 2
+    assert metrics["avg_file_size"] == 200
+    assert metrics["license_compliance"] == {"with_license": 1, "total": 2}
+
+    os.remove(os.path.join(other, "clip.mp4"))
+    os.rmdir(other)
+    assert collector.collect_asset_metrics()["total_assets"] == 1
+
+
+def test_trend_data_from_stored_samples(collector):
+    now = time.time()
+    for offset, cpu in ((7200, 10.0), (60, 20.0)):
+        collector.store_metrics(
+            {
+                "timestamp": now - offset,
+                "system": {
+                    "cpu": {"percent": cpu},
+                    "memory": {"percent": 50.0},
+                    "disk": {"percent": 70.0},
+                },
+                "pipeline": {"performance": {"a": {"success_rate": 80.0}}},
+            }
+        )
+
+    trends = collector.get_trend_data(hours=1)
+    assert trends["cpu"] == [20.0]
+    assert trends["pipeline_success"] == [80.0]
+    assert len(collector.get_trend_data(hours=3)["timestamps"]) == 2
+
+
+def test_daily_json_history_is_imported_once(tmp_path):
+    data_dir = tmp_path / "analytics"
+    (data_dir / "metrics").mkdir(parents=True)
+    now = time.time()
+    history = [
+        {
+            "timestamp": now - offset,
+            "system": {"cpu": {"percent": cpu}},
+            "pipeline": {"performance": {"a": {"success_rate": 90.0}}},
+        }
+        for offset, cpu in ((600, 30.0), (300, 40.0))
+    ]
+    (data_dir / "metrics" / "2026-10-18.json").write_text(json.dumps(history))
+    (data_dir / "metrics" / "2026-10-19.json").write_text("not json")
+
+    def open_collector():
+        return MetricsCollector(
+            data_dir=str(data_dir),
+            state_file=str(tmp_path / "state.jsonl"),
+            assets_dir=str(tmp_path / "assets"),
+        )
+
+    trends = open_collector().get_trend_data(hours=1)
+    assert trends["cpu"] == [30.0, 40.0]
+    assert trends["pipeline_success"] == [90.0, 90.0]
+    # Reopening an existing store does not import the files again
+    assert open_collector().get_trend_data(hours=1)["cpu"] == [30.0, 40.0]
@@ -12,11 +12,13 @@ import os
 import sys
 import tempfile
 import unittest
+from unittest import mock
 
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from bin.cutout import text_render
 from bin.cutout.anim_fx import (
     apply_keyframes,
     bg_gradient,
@@ -27,6 +29,7 @@ from bin.cutout.anim_fx import (
     make_text_clip,
 )
 from bin.cutout.sdk import AnimType, BrandStyle, Keyframe
+from bin.cutout.text_render import font_for_kind, text_block_size
 
 
 class TestAnimFx(unittest.TestCase):
@@ -49,6 +52,13 @@ class TestAnimFx(unittest.TestCase):
         # Create a temporary directory for test outputs
         self.test_dir = tempfile.mkdtemp(prefix="anim_fx_test_")
 
+        # Keep rendered text blocks out of the repo's render_cache
+        cache = mock.patch.object(
+            text_render, "CACHE_DIR", Path(self.test_dir) / "text"
+        )
+        cache.start()
+        self.addCleanup(cache.stop)
+
     def tearDown(self):
         """Clean up test fixtures."""
         # Remove test directory and contents
@@ -58,24 +68,27 @@ class TestAnimFx(unittest.TestCase):
 
     def test_make_text_clip(self):
         """Test text clip creation with different types."""
-        # Test hook text
-        hook_clip = make_text_clip("Test Hook", self.test_style, "hook")
-        self.assertIsNotNone(hook_clip)
-        # Check that it's a ColorClip with expected properties
-        self.assertEqual(hook_clip.size[0], len("Test Hook") * 48 // 2)
-        self.assertEqual(hook_clip.size[1], 48 + 20)
-
-        # Test body text
-        body_clip = make_text_clip("Test Body", self.test_style, "body")
-        self.assertIsNotNone(body_clip)
-        self.assertEqual(body_clip.size[0], len("Test Body") * 24 // 2)
-        self.assertEqual(body_clip.size[1], 24 + 20)
-
-        # Test lower third
-        lower_clip = make_text_clip("Lower Third", self.test_style, "lower_third")
-        self.assertIsNotNone(lower_clip)
-        self.assertEqual(lower_clip.size[0], len("Lower Third") * 32 // 2)
-        self.assertEqual(lower_clip.size[1], 32 + 20)
+        cases = [
+            ("Test Hook", "hook"),
+            ("Test Body", "body"),
+            ("Lower Third", "lower_third"),
+        ]
+        for text, kind in cases:
+            clip = make_text_clip(text, self.test_style, kind)
+            self.assertIsNotNone(clip)
+            # Sized from real glyph metrics, with an alpha mask over the text
+            font_size = self.test_style.font_sizes[kind]
+            font_path = font_for_kind(self.test_style.fonts, kind)
+            self.assertEqual(
+                tuple(clip.size), text_block_size(text, font_size, font_path)
+            )
+            self.assertGreater(clip.size[1], font_size)
+            self.assertGreater(clip.mask.get_frame(0).max(), 0.9)
+
+        # Larger kinds render larger text
+        hook = make_text_clip("Same", self.test_style, "hook")
+        body = make_text_clip("Same", self.test_style, "body")
+        self.assertGreater(hook.size[0], body.size[0])
 
     def test_bg_gradient(self):
         """Test background gradient creation."""
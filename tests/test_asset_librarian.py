@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Tests for the asset librarian's inverted index.
+"""
+
+import json
+import os
+import random
+import time
+
+from bin.asset_librarian import AssetIndex, AssetLibrarian
+
+PALETTE = {"blue": "#1C4FA1", "red": "#D62828", "yellow": "#F6BE00"}
+KINDS = ["background", "prop", "character"]
+WORDS = ["atomic", "starburst", "eames", "nelson", "gradient", "paper", "clock", "sofa"]
+
+
+def _asset(i, rng):
+    kind = rng.choice(KINDS)
+    words = rng.sample(WORDS, 2)
+    colors = rng.sample(list(PALETTE.values()) + ["#123456"], 2)
+    return {
+        "path": f"assets\\library\\{kind}s\\{words[0]}_{words[1]}_{i}.svg",
+        "tags": [kind, rng.choice(["brand", "generated"])],
+        "palette": colors,
+        "w": rng.choice([1920.0, 200.0]),
+        "h": rng.choice([1080.0, 200.0]),
+        "usage_count": rng.randint(0, 3),
+    }
+
+
+def _manifest(n, seed=0):
+    rng = random.Random(seed)
+    return {"version": "1.0", "assets": {f"h{i:06d}": _asset(i, rng) for i in range(n)}}
+
+
+def _linear_matches(librarian, asset_type, category, style=None, palette=None):
+    """Reference implementation: the original linear scan."""
+    approved = set(PALETTE.values())
+    out = []
+    for asset_hash, asset in librarian.manifest["assets"].items():
+        if asset_type not in asset.get("tags", []):
+            continue
+        path = asset.get("path", "").lower()
+        if category.lower() not in path and category.lower() not in str(
+            asset.get("tags", [])
+        ).lower():
+            continue
+        if style and style.lower() not in path:
+            continue
+        if palette and not all(c in approved for c in asset.get("palette", [])):
+            continue
+        out.append(asset_hash)
+    return out
+
+
+def _librarian(tmp_path, manifest):
+    (tmp_path / "data").mkdir(exist_ok=True)
+    (tmp_path / "design").mkdir(exist_ok=True)
+    with open(tmp_path / "data" / "library_manifest.json", "w") as f:
+        json.dump(manifest, f)
+    with open(tmp_path / "design" / "design_language.json", "w") as f:
+        json.dump({"colors": PALETTE}, f)
+    return AssetLibrarian(base_dir=str(tmp_path))
+
+
+def test_index_matches_linear_scan(tmp_path):
+    librarian = _librarian(tmp_path, _manifest(2000))
+
+    queries = [
+        ("background", "background", None, None),
+        ("prop", "clock", None, None),
+        ("prop", "prop", "eames", None),
+        ("character", "brand", None, ["x"]),
+        ("background", "star", "atomic_", None),
+        ("prop", "ock_so", None, None),
+        ("character", "", None, None),
+        ("prop", "missing", None, None),
+    ]
+    for asset_type, category, style, palette in queries:
+        expected = _linear_matches(librarian, asset_type, category, style, palette)
+        got = [
+            h
+            for h, _ in librarian._find_matching_assets(
+                asset_type, category, style, palette
+            )
+        ]
+        assert sorted(got) == sorted(expected), (asset_type, category, style)
+
+
+def test_ranking_is_deterministic_and_prefers_unused(tmp_path):
+    manifest = _manifest(500, seed=3)
+    first = _librarian(tmp_path, manifest)
+    first.set_seed(99)
+    a = first._find_matching_assets("prop", "prop")
+
+    second = _librarian(tmp_path, manifest)
+    second.set_seed(99)
+    b = second._find_matching_assets("prop", "prop")
+
+    assert [h for h, _ in a] == [h for h, _ in b]
+    usage = [asset["usage_count"] for _, asset in a]
+    assert usage == sorted(usage)
+
+    # Top-1 lookups track usage changes exactly like a full ranking
+    for _ in range(20):
+        full = first._find_matching_assets("prop", "prop")
+        best = first._find_matching_assets("prop", "prop", limit=1)
+        assert best[0][0] == full[0][0]
+        best[0][1]["usage_count"] += 1
+
+
+def test_index_rebuilds_when_manifest_changes(tmp_path):
+    librarian = _librarian(tmp_path, _manifest(50))
+    assert not librarian._find_matching_assets("prop", "zebra")
+    first_index = librarian._get_index()
+    assert librarian._get_index() is first_index
+
+    manifest = _manifest(50)
+    manifest["assets"]["zz"] = {
+        "path": "assets/props/zebra.svg",
+        "tags": ["prop"],
+        "palette": [],
+    }
+    path = tmp_path / "data" / "library_manifest.json"
+    with open(path, "w") as f:
+        json.dump(manifest, f)
+    later = time.time() + 5
+    os.utime(path, (later, later))
+
+    assert [h for h, _ in librarian._find_matching_assets("prop", "zebra")] == ["zz"]
+    assert librarian._get_index() is not first_index
+
+
+def test_resolve_large_library_is_fast(tmp_path):
+    librarian = _librarian(tmp_path, _manifest(20000, seed=1))
+    scenes = [
+        {
+            "id": f"s{i}",
+            "bg": random.Random(i).choice(WORDS),
+            "elements": [{"id": f"e{i}", "type": "prop", "style": "eames"}],
+        }
+        for i in range(200)
+    ]
+
+    librarian._get_index()  # build once, as on manifest load
+    start = time.perf_counter()
+    plan = librarian.resolve_assets({"slug": "bench", "scenes": scenes}, seed=1)
+    elapsed = time.perf_counter() - start
+
+    assert plan["total_placeholders"] == 400
+    assert plan["resolved_count"] > 0
+    assert elapsed < 5.0
+
+
+def test_asset_index_facets():
+    index = AssetIndex(
+        {
+            "a": {"path": "x/atomic.svg", "tags": ["background"], "palette": ["#1"]},
+            "b": {"path": "x/paper.svg", "tags": ["background"], "palette": ["#2"]},
+        },
+        approved_colors=["#1"],
+    )
+    assert index.query("background") == ["a", "b"]
+    assert index.query("background", ["tom"]) == ["a"]
+    assert index.query("background", palette_compliant=True) == ["a"]
+    assert index.query("prop") == []
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the persisted trigram index behind cutout AssetLibrary.find_asset.
+"""
+
+import os
+
+import pytest
+
+from bin.cutout import asset_loop
+from bin.cutout.asset_loop import AssetLibrary
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("<svg/>", encoding="utf-8")
+
+
+def _bump_mtime(path, seconds):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10**9))
+
+
+def _linear_fuzzy(library, identifier):
+    """Reference: the original fuzzy scan, returning all valid matches."""
+    needle = identifier.lower()
+    return {
+        path
+        for key, path in library.asset_cache.items()
+        if needle in key.lower() or key.lower() in needle
+    }
+
+
+@pytest.fixture
+def asset_root(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for name in ["atomic_clock", "starburst", "sofa_eames"]:
+        _touch(tmp_path / "assets" / "brand" / "props" / f"{name}.svg")
+    _touch(tmp_path / "assets" / "brand" / "backgrounds" / "gradient1.svg")
+    _touch(tmp_path / "assets" / "generated" / "prop_phone_42.svg")
+    return tmp_path
+
+
+def test_fuzzy_lookup_agrees_with_linear_scan(asset_root):
+    library = AssetLibrary(brand_style=None)
+
+    assert library.find_asset("props", "starburst").endswith("starburst.svg")
+    assert library.find_asset("prop", "clock").endswith("atomic_clock.svg")
+    assert library.find_asset("background", "gradient").endswith("gradient1.svg")
+    assert library.find_asset("prop", "phone").endswith("prop_phone_42.svg")
+    # Key contained in the identifier
+    assert library.find_asset("x", "old props:starburst v2").endswith(
+        "starburst.svg"
+    )
+    assert library.find_asset("prop", "zebra") is None
+
+    for identifier in ["clock", "eames", "ar", "o", "props:sofa_eames!", "nothing"]:
+        found = library.find_asset("none", identifier)
+        expected = _linear_fuzzy(library, identifier)
+        assert (found in expected) if expected else found is None, identifier
+
+
+def test_index_is_reused_across_processes(asset_root, monkeypatch):
+    AssetLibrary(brand_style=None)
+    assert (asset_root / "render_cache" / "asset_index.json").exists()
+
+    def no_glob(*args, **kwargs):
+        raise AssertionError("unchanged directories must not be globbed")
+
+    monkeypatch.setattr(asset_loop.Path, "glob", no_glob)
+    library = AssetLibrary(brand_style=None)
+    assert library.get_coverage_stats()["total"] == 5
+    assert library.find_asset("prop", "clock").endswith("atomic_clock.svg")
+
+
+def test_only_changed_directories_are_rescanned(asset_root, monkeypatch):
+    AssetLibrary(brand_style=None)
+
+    generated = asset_root / "assets" / "generated"
+    _touch(generated / "char_narrator_7.svg")
+    _bump_mtime(generated, 5)
+
+    globbed = []
+    original_glob = asset_loop.Path.glob
+
+    def tracking_glob(self, pattern):
+        globbed.append(self.as_posix())
+        return original_glob(self, pattern)
+
+    monkeypatch.setattr(asset_loop.Path, "glob", tracking_glob)
+    library = AssetLibrary(brand_style=None)
+    assert globbed == ["assets/generated"]
+    assert library.find_asset("character", "narrator").endswith(
+        "char_narrator_7.svg"
+    )
+
+
+def test_corrupt_index_is_rebuilt(asset_root):
+    index = asset_root / "render_cache" / "asset_index.json"
+    index.parent.mkdir()
+    index.write_text("{not json", encoding="utf-8")
+
+    library = AssetLibrary(brand_style=None)
+    assert library.get_coverage_stats()["total"] == 5
+    assert AssetLibrary(brand_style=None, index_path=None).asset_cache == (
+        library.asset_cache
+    )
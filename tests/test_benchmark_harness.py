@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the benchmark harness: measurement, result files and comparison.
+"""
+
+import json
+
+import numpy as np
+
+from benchmarks import compare
+from benchmarks.harness import (
+    BenchmarkFixture,
+    compare_results,
+    load_results,
+    save_results,
+)
+
+
+def _run(name, seconds, rss_mb=0.0):
+    return {
+        "name": name,
+        "group": "g",
+        "rounds": 3,
+        "min_s": seconds,
+        "median_s": seconds,
+        "mean_s": seconds,
+        "stddev_s": 0.0,
+        "max_s": seconds,
+        "peak_rss_mb": rss_mb,
+    }
+
+
+def _doc(*runs):
+    return {"version": 1, "benchmarks": {r["name"]: r for r in runs}}
+
+
+def test_fixture_records_time_memory_and_throughput(tmp_path):
+    bench = BenchmarkFixture("test_alloc", "demo", rounds=3)
+    bench.set_throughput(10, "items")
+    calls = []
+
+    def work(n):
+        calls.append(n)
+        block = np.ones(n, dtype=np.uint8)  # touch ~64 MB
+        return int(block.sum())
+
+    assert bench(work, 64 * 1024 * 1024) == 64 * 1024 * 1024
+    bench.extra_info["note"] = "added after the run"
+    result = bench.result
+    assert len(calls) == 4  # one warmup round + three timed rounds
+    assert result.rounds == 3 and result.min_s <= result.median_s <= result.max_s
+    assert result.throughput == 10 / result.median_s
+    assert result.peak_rss_mb > 32
+
+    path = tmp_path / "run.json"
+    save_results(str(path), [result])
+    saved = load_results(str(path))["benchmarks"]["test_alloc"]
+    assert saved["unit"] == "items" and saved["extra_info"]["note"]
+
+
+def test_comparison_flags_regressions_beyond_threshold(tmp_path, capsys):
+    baseline = _doc(_run("fast", 1.0), _run("mem", 1.0, 100.0), _run("gone", 1.0))
+    current = _doc(_run("fast", 1.1), _run("mem", 0.9, 140.0), _run("new", 5.0))
+
+    rows = {(r.name, r.metric): r for r in compare_results(baseline, current, 0.15)}
+    assert set(rows) == {
+        ("fast", "median_s"),
+        ("mem", "median_s"),
+        ("mem", "peak_rss_mb"),
+    }
+    assert not rows["fast", "median_s"].regressed
+    assert rows["mem", "peak_rss_mb"].regressed
+    assert not compare_results(baseline, current, 0.05, rss_threshold=0.5)[-1].regressed
+
+    base_path, cur_path = tmp_path / "base.json", tmp_path / "cur.json"
+    base_path.write_text(json.dumps(baseline))
+    cur_path.write_text(json.dumps(current))
+    assert compare.main([str(base_path), str(cur_path)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+    assert compare.main([str(base_path), str(cur_path), "--rss-threshold", "1"]) == 0
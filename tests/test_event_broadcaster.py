@@ -0,0 +1,223 @@
+"""
+Tests for the push-based SSE broadcaster (ring buffer, Last-Event-ID replay,
+bounded client queues, shared heartbeat).
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+import fastapi_app.events as events_module
+from fastapi_app.db import Database
+from fastapi_app.events import EventStreamManager
+from fastapi_app.models import Event
+
+
+def _event(job_id: str, n: int) -> Event:
+    return Event(event_type=f"step_{n}", message=f"event {n}", job_id=job_id)
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # add_event mirrors to runs/<job_id>/events.jsonl
+    database = Database(str(tmp_path / "jobs.db"))
+    monkeypatch.setattr(events_module, "db", database)
+    return database
+
+
+def test_live_events_are_pushed_in_order():
+    async def scenario():
+        manager = EventStreamManager(heartbeat_seconds=60)
+        subscriber = await manager.subscribe("job-1")
+        for n in range(1, 4):
+            manager.publish("job-1", _event("job-1", n), n)
+        received = [await subscriber.get() for _ in range(3)]
+        manager.stop()
+        return received
+
+    received = asyncio.run(scenario())
+    assert [e["id"] for e in received] == [1, 2, 3]
+    assert received[0]["type"] == "step_1"
+
+
+def test_replay_from_ring_buffer():
+    async def scenario():
+        manager = EventStreamManager(heartbeat_seconds=60)
+        for n in range(1, 6):
+            manager.publish("job-1", _event("job-1", n), n)
+        subscriber = await manager.subscribe("job-1", last_event_id=3)
+        received = [await subscriber.get() for _ in range(2)]
+        manager.stop()
+        return received, subscriber.empty()
+
+    received, drained = asyncio.run(scenario())
+    assert [e["id"] for e in received] == [4, 5]
+    assert drained
+
+
+def test_replay_falls_back_to_database(temp_db):
+    async def scenario():
+        manager = EventStreamManager(buffer_size=2, heartbeat_seconds=60)
+        for n in range(1, 6):
+            event = _event("job-1", n)
+            manager.publish("job-1", event, temp_db.add_event("job-1", event))
+        subscriber = await manager.subscribe("job-1", last_event_id=1)
+        received = []
+        while not subscriber.empty():
+            received.append(await subscriber.get())
+        manager.stop()
+        return received
+
+    received = asyncio.run(scenario())
+    assert [e["type"] for e in received] == ["step_2", "step_3", "step_4", "step_5"]
+
+
+def test_slow_consumer_drop_oldest():
+    async def scenario():
+        manager = EventStreamManager(client_queue_size=3, heartbeat_seconds=60)
+        subscriber = await manager.subscribe("job-1")
+        for n in range(1, 11):
+            manager.publish("job-1", _event("job-1", n), n)
+        received = []
+        while not subscriber.queue.empty():
+            received.append(await subscriber.get())
+        manager.stop()
+        return received, subscriber.dropped
+
+    received, dropped = asyncio.run(scenario())
+    assert [e["id"] for e in received] == [8, 9, 10]
+    assert dropped == 7
+
+
+@pytest.mark.parametrize("policy", ["drop_oldest", "disconnect"])
+def test_replay_longer_than_the_client_queue(policy):
+    async def scenario():
+        manager = EventStreamManager(
+            client_queue_size=100, heartbeat_seconds=60, slow_consumer_policy=policy
+        )
+        for n in range(1, 201):
+            manager.publish("job-1", _event("job-1", n), n)
+        subscriber = await manager.subscribe("job-1", last_event_id=0)
+        manager.publish("job-1", _event("job-1", 201), 201)
+        received = []
+        while not subscriber.empty():
+            received.append(await subscriber.get())
+        manager.stop()
+        return received, subscriber
+
+    received, subscriber = asyncio.run(scenario())
+    assert [e["id"] for e in received] == list(range(1, 202))
+    assert subscriber.dropped == 0 and not subscriber.closed
+
+
+def test_slow_consumer_disconnect():
+    async def scenario():
+        manager = EventStreamManager(
+            client_queue_size=2, heartbeat_seconds=60, slow_consumer_policy="disconnect"
+        )
+        subscriber = await manager.subscribe("job-1")
+        for n in range(1, 5):
+            manager.publish("job-1", _event("job-1", n), n)
+        manager.stop()
+        return await subscriber.get(), manager.active_streams
+
+    sentinel, active = asyncio.run(scenario())
+    assert sentinel is None
+    assert "job-1" not in active
+
+
+def test_publish_from_worker_thread():
+    async def scenario():
+        manager = EventStreamManager(heartbeat_seconds=60)
+        subscriber = await manager.subscribe("job-1")
+        worker = threading.Thread(
+            target=manager.publish, args=("job-1", _event("job-1", 1), 1)
+        )
+        worker.start()
+        worker.join()
+        received = await asyncio.wait_for(subscriber.get(), timeout=1.0)
+        manager.stop()
+        return received
+
+    assert asyncio.run(scenario())["id"] == 1
+
+
+def test_single_heartbeat_serves_all_clients():
+    async def scenario():
+        manager = EventStreamManager(heartbeat_seconds=0.05)
+        subscribers = [await manager.subscribe(f"job-{i}") for i in range(5)]
+        heartbeat_task = manager.heartbeat_task
+        beats = [await asyncio.wait_for(s.get(), timeout=1.0) for s in subscribers]
+        manager.stop()
+        return beats, heartbeat_task, manager.heartbeat_task
+
+    beats, first_task, task = asyncio.run(scenario())
+    assert all(b["type"] == "heartbeat" and b["id"] is None for b in beats)
+    assert first_task is task
+
+
+def test_out_of_order_events_are_not_dropped():
+    async def scenario():
+        manager = EventStreamManager(heartbeat_seconds=60)
+        subscriber = await manager.subscribe("job-1")
+        # Worker threads can deliver a later id first
+        for n in (2, 1, 2):
+            manager.publish("job-1", _event("job-1", n), n)
+        received = []
+        while not subscriber.queue.empty():
+            received.append(await subscriber.get())
+        manager.stop()
+        return received
+
+    assert [e["id"] for e in asyncio.run(scenario())] == [2, 1]
+
+
+class _RecordingDB:
+    """Stands in for the database; job-1's events before id 4 end at id 2"""
+
+    def __init__(self):
+        self.replays = []
+
+    def get_previous_event_id(self, job_id, before_id):
+        return 2 if before_id == 4 else 0
+
+    def get_job_events_after(self, job_id, after_id, limit):
+        self.replays.append(after_id)
+        return []
+
+
+def test_replay_uses_the_buffer_despite_interleaved_jobs(monkeypatch):
+    database = _RecordingDB()
+    monkeypatch.setattr(events_module, "db", database)
+
+    async def replayed(manager, last_event_id):
+        subscriber = await manager.subscribe("job-1", last_event_id=last_event_id)
+        received = []
+        while not subscriber.empty():
+            received.append((await subscriber.get())["id"])
+        return received
+
+    async def scenario():
+        # Event ids are global: job-1 owns the even ones here
+        unknown = EventStreamManager(buffer_size=3, heartbeat_seconds=60)
+        evicted = EventStreamManager(buffer_size=2, heartbeat_seconds=60)
+        for manager, ids in ((unknown, (4, 6)), (evicted, (2, 4, 6))):
+            for n in ids:
+                manager.publish("job-1", _event("job-1", n), n)
+        results = [
+            await replayed(unknown, 2),
+            await replayed(evicted, 2),
+            database.replays[:],
+            await replayed(evicted, 1),
+        ]
+        unknown.stop()
+        evicted.stop()
+        return results
+
+    from_floor, from_eviction, db_replays, gap = asyncio.run(scenario())
+    assert from_floor == [4, 6] and from_eviction == [4, 6]
+    assert db_replays == []
+    # Event 2 is no longer buffered, so the gap is filled from the database
+    assert database.replays == [1]
+    assert gap == [4, 6]
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for fact-guard claim detection and script-to-beat mapping.
+"""
+
+import re
+
+from bin.fact_guard import (
+    analyze_line_for_claims,
+    keyword_pattern,
+    map_script_to_beats,
+    scan_claims,
+    scan_script,
+)
+
+
+def _found(line):
+    return [
+        (c["claim_type"], c["claim_text"])
+        for c in analyze_line_for_claims(line, {}, has_citations=False)
+    ]
+
+
+def test_keyword_pattern_matches_exactly_the_keywords():
+    pattern = re.compile(rf"\b{keyword_pattern(['as', 'ask', 'asked', 'by'])}\b")
+    assert [m.group() for m in pattern.finditer("as ask asked asks by b")] == [
+        "as",
+        "ask",
+        "asked",
+        "by",
+    ]
+
+
+def test_line_claims_grouped_by_type():
+    line = (
+        "Charles Eames said on March 5, 1956 that over 40 million chairs, "
+        "the most ever, sold according to the archive."
+    )
+    assert _found(line) == [
+        ("proper_nouns", "Charles Eames"),
+        ("dates", "March 5, 1956"),
+        ("superlatives", "most"),
+        ("statistics", "over 40"),
+        ("expert_opinions", "according to"),
+    ]
+
+
+def test_overlapping_matches_of_one_type_collapse():
+    # The year inside the full date and the two-part name inside the
+    # three-part name are not reported again
+    assert _found("Ray Kaiser Eames married on June 20, 1941") == [
+        ("proper_nouns", "Ray Kaiser Eames"),
+        ("dates", "June 20, 1941"),
+    ]
+
+
+def test_general_statement_only_without_other_claims():
+    line = "The shell was molded from fiberglass."
+    assert _found(line) == [("general_statements", line)]
+    assert analyze_line_for_claims(line, {}, has_citations=True) == []
+
+
+def test_scan_script_maps_offsets_to_lines():
+    script = ["Intro line here.", "Built in 1956.", "", "Charles Eames spoke"]
+    by_line = scan_script(script)
+    assert sorted(by_line) == [2, 4]
+    year = [m for m in by_line[2] if m.claim_type == "dates"][0]
+    assert script[1][year.start : year.end] == "1956"
+    assert [m.text for m in by_line[4]] == ["Charles Eames"]
+    # A match never spans a line break
+    assert not any(m.text == "1956 Charles" for m in scan_claims("\n".join(script)))
+
+
+def test_map_script_to_beats_picks_best_overlap():
+    beats = [
+        {"content": "plywood chair molded by hand", "citations": []},
+        {"content": "the lounge chair was designed in 1956", "citations": ["r1"]},
+        {"content": "", "citations": ["r2"]},
+    ]
+    script = [
+        "[B-ROLL: workshop]",
+        "The lounge chair was designed in 1956.",
+        "Plywood was molded by hand.",
+        "Nothing shared here.",
+    ]
+    mapped = map_script_to_beats(script, beats)
+    assert mapped == {2: beats[1], 3: beats[0]}
@@ -0,0 +1,174 @@
+"""
+Unit tests for the histogram-based frame analyzer and check_frame_contrast.
+"""
+
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from bin.cutout import frame_analyzer
+from bin.cutout.frame_analyzer import (
+    FrameAnalyzer,
+    TextRegion,
+    estimate_text_regions,
+    histogram_contrast,
+    luminance_map,
+)
+from bin.cutout.qa_gates import check_frame_contrast
+from bin.cutout.text_render import text_block_size
+from bin.legibility import validate_rendered_legibility
+
+
+def _text_frame(bg: str, fg: str, size=(1280, 720)) -> Image.Image:
+    img = Image.new("RGB", size, color=bg)
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((100, 300, 400, 320), fill=bg)
+    for x in range(104, 396, 12):
+        draw.rectangle((x, 304, x + 6, 316), fill=fg)
+    return img
+
+
+class TestLuminance:
+    """Test luminance map and histogram contrast."""
+
+    def test_luminance_extremes(self):
+        frame = np.array([[[0, 0, 0], [255, 255, 255]]], dtype=np.uint8)
+        lum = luminance_map(frame)
+        assert lum.shape == (1, 2)
+        assert lum[0, 0] == pytest.approx(0.0)
+        assert lum[0, 1] == pytest.approx(1.0, abs=1e-4)
+
+    def test_histogram_contrast_black_on_white(self):
+        hist = np.zeros(256)
+        hist[0] = 100  # ink
+        hist[255] = 900  # paper
+        stats = histogram_contrast(hist)
+        assert stats["contrast_ratio"][0] == pytest.approx(21.0, rel=1e-3)
+        assert stats["fg_fraction"][0] == pytest.approx(0.1)
+
+
+class TestCheckFrameContrast:
+    """Test frame-level contrast QA."""
+
+    def test_poor_contrast_fails(self):
+        result = check_frame_contrast(_text_frame("#1C4FA1", "#000000"))
+        assert not result.ok
+        assert result.details["min_contrast"] < 4.5
+
+    def test_good_contrast_passes(self):
+        result = check_frame_contrast(_text_frame("#FFFFFF", "#111827"))
+        assert result.ok
+        assert result.details["min_contrast"] > 4.5
+
+    def test_flat_frame_has_no_text_regions(self):
+        result = check_frame_contrast(Image.new("RGB", (320, 240), "#F8F1E5"))
+        assert result.ok
+        assert result.details["sample_count"] == 0
+
+    def test_text_regions_measured(self):
+        img = _text_frame("#F8F1E5", "#F6BE00")
+        region = TextRegion("title", (100, 300, 400, 320))
+        result = check_frame_contrast(img, text_regions=[region])
+        assert not result.ok
+        assert result.details["regions"][0]["element_id"] == "title"
+
+    def test_invisible_region_skipped(self):
+        img = _text_frame("#F8F1E5", "#F6BE00")
+        region = TextRegion(
+            "title", (100, 300, 400, 320), opacity_track=[(0, 0.0), (500, 1.0)]
+        )
+        result = check_frame_contrast(img, text_regions=[region], t_ms=0)
+        assert result.ok
+        assert result.details["sample_count"] == 0
+
+
+class TestTextRegions:
+    """Test SceneScript text box estimation."""
+
+    def test_estimate_text_regions(self):
+        scene = {
+            "id": "scene_000",
+            "elements": [
+                {"id": "t1", "type": "text", "content": "Hello", "x": 10, "y": 20},
+                {"id": "p1", "type": "prop", "x": 0, "y": 0},
+                {
+                    "id": "l1",
+                    "type": "lower_third",
+                    "content": "Lower",
+                    "x": 0,
+                    "y": 600,
+                    "keyframes": [{"t": 0, "opacity": 0.0}, {"t": 300, "opacity": 1}],
+                },
+            ],
+        }
+        regions = estimate_text_regions(scene, {"body": 24, "lower_third": 32})
+        assert [r.element_id for r in regions] == ["t1", "l1"]
+        width, height = text_block_size("Hello", 24)
+        assert regions[0].bbox == (10.0, 20.0, 10.0 + width, 20.0 + height)
+        assert regions[1].opacity_at(150) == pytest.approx(0.5)
+
+
+@pytest.mark.skipif(
+    not (shutil.which("ffmpeg") and shutil.which("ffprobe")),
+    reason="ffmpeg/ffprobe not available",
+)
+def test_analyze_video(tmp_path):
+    video = tmp_path / "scene.mp4"
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-v",
+            "error",
+            "-y",
+            "-f",
+            "lavfi",
+            "-i",
+            "color=c=0x1C4FA1:s=1280x720:d=1,"
+            "drawbox=x=100:y=300:w=300:h=20:c=black:t=fill",
+            "-pix_fmt",
+            "yuv420p",
+            str(video),
+        ],
+        check=True,
+    )
+    regions = [TextRegion("title", (90, 290, 410, 330))]
+    result = FrameAnalyzer().analyze_video(str(video), regions, sample_fps=5)
+    assert result["frames_analyzed"] == 5
+    assert not result["valid"]
+    assert result["failing_elements"] == ["title"]
+
+
+def test_rendered_legibility_pairs_scenes_with_their_own_video(
+    tmp_path, monkeypatch
+):
+    for scene_id in ("s1", "s2", "s10"):
+        (tmp_path / f"{scene_id}.mp4").write_bytes(b"")
+    analysed = []
+
+    def fake_analyze(self, video_path, regions, sample_fps=None):
+        analysed.append((video_path, [r.element_id for r in regions]))
+        return {
+            "valid": True,
+            "frames_analyzed": 1,
+            "elapsed_sec": 0.0,
+            "failing_elements": [],
+        }
+
+    monkeypatch.setattr(
+        frame_analyzer,
+        "estimate_text_regions",
+        lambda scene, *args: [TextRegion(scene["id"], (0, 0, 10, 10))],
+    )
+    monkeypatch.setattr(FrameAnalyzer, "analyze_video", fake_analyze)
+    scenes = [{"id": scene_id} for scene_id in ("s1", "s2", "s3", "s10")]
+    result = validate_rendered_legibility({"scenes": scenes}, str(tmp_path))
+
+    assert analysed == [
+        (str(tmp_path / f"{scene_id}.mp4"), [scene_id])
+        for scene_id in ("s1", "s2", "s10")
+    ]
+    assert result["missing_videos"] == ["s3"]
+    assert result["scenes_analyzed"] == 3
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled keyframe engine behind anim_fx.apply_keyframes.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from bin.cutout import keyframe_engine
+from bin.cutout.anim_fx import apply_keyframes
+from bin.cutout.keyframe_engine import KeyframeTrack
+from bin.cutout.sdk import Keyframe
+
+moviepy = pytest.importorskip("moviepy.editor")
+
+
+def test_compile_eases_between_keys_and_holds_outside_them():
+    keyframes = [
+        Keyframe(t=1000, x=100),
+        Keyframe(t=0, x=0, opacity=0.0),
+        Keyframe(t=500, opacity=1.0),
+    ]
+    track = KeyframeTrack.compile(keyframes, duration=2.0, fps=10, easing="linear")
+
+    assert len(track) == 21
+    assert track.x[track.index(0.5)] == pytest.approx(50.0)
+    assert track.x[-1] == 100.0  # held after the last x key
+    assert track.opacity[track.index(0.3)] == pytest.approx(0.6)
+    assert track.opacity[track.index(1.5)] == 1.0
+    assert track.y.tolist() == [0.0] * 21 and track.scale.tolist() == [1.0] * 21
+
+    eased = KeyframeTrack.compile(keyframes, duration=2.0, fps=10)
+    assert eased.x[track.index(0.2)] < track.x[track.index(0.2)]
+    assert eased.at(0.5)["x"] == pytest.approx(50.0)
+
+    base = KeyframeTrack.compile([], duration=1.0, fps=10, base={"x": 7, "y": 9})
+    assert base.at(0.3) == {"x": 7, "y": 9, "scale": 1, "rotate": 0, "opacity": 1}
+
+    with pytest.raises(ValueError):
+        KeyframeTrack.compile(keyframes, duration=1.0, easing="bounce")
+
+
+def test_apply_keyframes_renders_position_scale_rotation_and_opacity():
+    clip = moviepy.ColorClip((40, 20), color=(255, 0, 0)).set_duration(1.0)
+    clip = clip.set_position((10, 30))
+    keyframes = [
+        Keyframe(t=0, x=10, y=30, scale=1.0, rotate=0, opacity=1.0),
+        Keyframe(t=1000, x=110, y=30, scale=2.0, rotate=90, opacity=0.5),
+    ]
+    animated = apply_keyframes(clip, keyframes, easing="linear")
+
+    assert animated.duration == 1.0
+    assert animated.pos(0) == (10, 30)
+    assert animated.get_frame(0).shape == (20, 40, 3)
+    assert animated.mask.get_frame(0).max() == pytest.approx(1.0)
+
+    # At t=1 the 40x20 box is doubled and turned a quarter: 40 wide, 80 tall,
+    # centred where the untransformed box at (110, 30) would be centred
+    frame = animated.get_frame(1.0)
+    assert frame.shape[:2] == (80, 40)
+    assert animated.pos(1.0) == (110, 0)
+    alpha = animated.mask.get_frame(1.0)
+    assert alpha[40, 20] == pytest.approx(0.5, abs=0.01)
+    assert tuple(frame[40, 20]) == (255, 0, 0)
+
+
+def test_zero_scale_renders_a_transparent_frame():
+    assert keyframe_engine._affine(40, 20, 10, 30, 0.0, 45) == ((30, 40), (1, 1), None)
+
+    clip = moviepy.ColorClip((40, 20), color=(255, 0, 0)).set_duration(1.0)
+    keyframes = [Keyframe(t=0, scale=0.0), Keyframe(t=1000, scale=1.0)]
+    animated = apply_keyframes(clip, keyframes, easing="linear")
+
+    assert animated.get_frame(0).shape[:2] == (1, 1)
+    assert animated.mask.get_frame(0).max() == 0.0
+    assert animated.mask.get_frame(0.5).max() > 0.0
+
+
+def test_one_warp_per_frame_regardless_of_keyframe_count(monkeypatch):
+    calls = []
+    depth = [0]
+    original = Image.Image.transform
+
+    def counting(self, *args, **kwargs):
+        # PIL re-enters transform for premultiplied RGBA; count outer calls
+        if not depth[0]:
+            calls.append(1)
+        depth[0] += 1
+        try:
+            return original(self, *args, **kwargs)
+        finally:
+            depth[0] -= 1
+
+    monkeypatch.setattr(Image.Image, "transform", counting)
+    clip = moviepy.ColorClip((16, 16), color=(0, 0, 255)).set_duration(1.0)
+    keyframes = [
+        Keyframe(t=i * 50, x=i, scale=1.0 + i / 40, rotate=i) for i in range(21)
+    ]
+    animated = apply_keyframes(clip, keyframes)
+    track = KeyframeTrack.compile(keyframes, duration=1.0)
+
+    for i in range(len(track)):
+        t = i / track.fps
+        animated.get_frame(t)
+        animated.mask.get_frame(t)
+        animated.pos(t)
+    # the first frame (t=0, no rotation) is an untransformed copy
+    assert len(calls) == len(track) - 1
+    assert keyframe_engine.FPS == track.fps
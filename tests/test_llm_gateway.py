@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for the local LLM gateway against a fake Ollama server.
+
+The fake server answers /api/chat after a configurable latency and records
+the order and model of every request it receives.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bin.llm_gateway import LLMGateway, make_server
+from bin.model_runner import ModelRunner
+
+
+class FakeOllama:
+    def __init__(self, latency_s=0.05):
+        self.latency_s = latency_s
+        self.calls = []
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._reply({"models": [{"name": "m1"}, {"name": "m2"}]})
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                fake.calls.append((body["model"], body["messages"][-1]["content"]))
+                time.sleep(fake.latency_s)
+                content = f"{body['model']}:{body['messages'][-1]['content']}"
+                self._reply({"message": {"role": "assistant", "content": content}})
+
+            def _reply(self, data):
+                raw = json.dumps(data).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def upstream():
+    fake = FakeOllama()
+    yield fake
+    fake.close()
+
+
+@pytest.fixture
+def gateway(upstream):
+    gw = LLMGateway(upstream.url)
+    yield gw
+    gw.close()
+
+
+def _chat(model, text):
+    body = {"model": model, "messages": [{"role": "user", "content": text}]}
+    return "/api/chat", json.dumps(body).encode()
+
+
+def _hold(gateway, upstream):
+    """Occupy the single worker so later submissions queue up."""
+    upstream.latency_s = 0.2
+    first = gateway.submit(*_chat("m1", "warmup"))
+    while not upstream.calls:
+        time.sleep(0.005)
+    upstream.latency_s = 0.0
+    return first
+
+
+def test_identical_inflight_requests_are_sent_once(gateway, upstream):
+    upstream.latency_s = 0.2
+    futures = [gateway.submit(*_chat("m1", "same")) for _ in range(5)]
+    futures.append(gateway.submit(*_chat("m1", "other")))
+
+    replies = [json.loads(f.result(timeout=5).body) for f in futures]
+    assert {r["message"]["content"] for r in replies} == {"m1:same", "m1:other"}
+    assert upstream.calls == [("m1", "same"), ("m1", "other")]
+    stats = gateway.snapshot()
+    assert stats["coalesced"] == 4 and stats["upstream"] == 2
+
+    # Once answered, the same request goes upstream again
+    gateway.submit(*_chat("m1", "same")).result(timeout=5)
+    assert len(upstream.calls) == 3
+
+
+def test_priority_then_current_model_ordering(gateway, upstream):
+    first = _hold(gateway, upstream)
+    queued = [
+        gateway.submit(*_chat("m2", "batch-m2"), priority="batch"),
+        gateway.submit(*_chat("m2", "normal-m2")),
+        gateway.submit(*_chat("m1", "normal-m1")),
+        gateway.submit(*_chat("m1", "ui"), priority="interactive"),
+        gateway.submit(*_chat("m1", "batch-m1"), priority="batch"),
+    ]
+    for future in [first] + queued:
+        future.result(timeout=5)
+
+    assert [text for _, text in upstream.calls] == [
+        "warmup",
+        "ui",
+        "normal-m1",  # same class as normal-m2, but m1 is loaded
+        "normal-m2",
+        "batch-m2",  # m2 is loaded now, so its batch work goes first
+        "batch-m1",
+    ]
+    assert gateway.snapshot()["model_switches"] == 2
+
+
+def test_model_streak_is_bounded(upstream):
+    gateway = LLMGateway(upstream.url, max_model_streak=2)
+    try:
+        first = _hold(gateway, upstream)
+        queued = [gateway.submit(*_chat("m2", "a"))]
+        queued += [gateway.submit(*_chat("m1", str(i))) for i in range(3)]
+        for future in [first] + queued:
+            future.result(timeout=5)
+    finally:
+        gateway.close()
+    assert [text for _, text in upstream.calls] == ["warmup", "0", "a", "1", "2"]
+
+
+def test_model_runners_share_the_gateway_over_http(gateway, upstream):
+    server = make_server(gateway, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        upstream.latency_s = 0.2
+        runners = [ModelRunner(base_url=url, priority="batch") for _ in range(4)]
+        messages = [{"role": "user", "content": "hi"}]
+        with ThreadPoolExecutor(4) as pool:
+            replies = list(
+                pool.map(lambda r: r.chat(messages, model="m1", options={}), runners)
+            )
+        stats = json.loads(runners[0].sess.get(f"{url}/gateway/stats").text)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert {r["message"]["content"] for r in replies} == {"m1:hi"}
+    assert len(upstream.calls) == 1
+    assert stats["coalesced"] == 3
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for per-section script generation in llm_script.
+"""
+
+import json
+import re
+import threading
+import time
+
+from bin import llm_script
+
+
+class FakeSession:
+    """Answers section prompts; counts calls and peak concurrency."""
+
+    lock = threading.Lock()
+
+    def __init__(self, state):
+        self.state = state
+
+    def chat(self, system, user, **opts):
+        number = int(re.search(r"Write only section (\d+)", user).group(1))
+        with self.lock:
+            self.state["prompts"].append((system, user))
+            self.state["active"] += 1
+            self.state["peak"] = max(self.state["peak"], self.state["active"])
+            self.state["calls"][number] = self.state["calls"].get(number, 0) + 1
+            attempt = self.state["calls"][number]
+        time.sleep(0.02)
+        with self.lock:
+            self.state["active"] -= 1
+        if number in self.state["bad"] and attempt <= self.state["bad"][number]:
+            return "Sure! Here is the section:"
+        return json.dumps({"id": "x", "title": "x", "content": f"Body {number}."})
+
+
+def _run(tmp_path, monkeypatch, bad, max_concurrency=2):
+    state = {"prompts": [], "calls": {}, "active": 0, "peak": 0, "bad": bad}
+    monkeypatch.setattr(
+        llm_script, "model_session", lambda name, role=None: FakeSession(state)
+    )
+    outline = {
+        "topic": "Eames chairs",
+        "title_options": ["The Eames Story"],
+        "sections": [
+            {"id": i, "label": f"Part {i}", "beats": ["a"], "needs_citations": i == 2}
+            for i in range(1, 6)
+        ],
+    }
+    path = tmp_path / "demo.outline.json"
+    path.write_text(json.dumps(outline))
+    data = llm_script.generate_script(
+        str(path), 60, parallel_sections=True, max_concurrency=max_concurrency
+    )
+    return data, state
+
+
+def test_sections_share_prefix_and_run_bounded(tmp_path, monkeypatch):
+    data, state = _run(tmp_path, monkeypatch, bad={})
+
+    assert 1 < state["peak"] <= 2
+    systems = {system for system, _ in state["prompts"]}
+    assert len(systems) == 1
+    topic_line = state["prompts"][0][1].split("\n\n")[0]
+    assert all(user.startswith(topic_line + "\n\n") for _, user in state["prompts"])
+
+    assert data["title"] == "The Eames Story"
+    assert [s["id"] for s in data["sections"]] == [1, 2, 3, 4, 5]
+    assert [s["title"] for s in data["sections"]][0] == "Part 1"
+    assert data["script"].startswith("Body 1.\n\nBody 2.")
+    assert data["sections"][1]["content"].endswith("[CITATION NEEDED]")
+    assert data["metadata"]["sections_failed"] == 0
+
+
+def test_malformed_section_is_retried_alone(tmp_path, monkeypatch):
+    data, state = _run(tmp_path, monkeypatch, bad={3: 1, 4: 5})
+
+    assert state["calls"] == {1: 1, 2: 1, 3: 2, 4: 3, 5: 1}
+    assert data["sections"][2]["content"] == "Body 3."
+    assert data["sections"][3]["content"] == "[Part 4 content will be generated]"
+    assert data["metadata"]["sections_failed"] == 1
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental log tailing (bin/utils/logtail.py).
+"""
+
+import asyncio
+import os
+
+from bin.utils.logtail import (
+    LogCursor,
+    LogFollower,
+    read_from,
+    tail_lines,
+    tail_with_offset,
+)
+from bin.web_ui import StateSummary
+from fastapi_app import routes
+
+
+def _append(path, text):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_tail_lines_reads_backwards_across_blocks(tmp_path):
+    log = tmp_path / "big.log"
+    _append(log, "".join(f"line {i:05d}\n" for i in range(5000)))
+
+    assert tail_lines(str(log), 3, block_size=64) == [
+        "line 04997",
+        "line 04998",
+        "line 04999",
+    ]
+    assert tail_lines(str(log), 1, block_size=7) == ["line 04999"]
+    assert len(tail_lines(str(log), 10000)) == 5000
+
+
+def test_tail_lines_edge_cases(tmp_path):
+    log = tmp_path / "edge.log"
+    assert tail_lines(str(log), 5) == []
+
+    _append(log, "")
+    assert tail_lines(str(log), 5) == []
+
+    _append(log, "a\nb\nno newline")
+    assert tail_lines(str(log), 2) == ["b", "no newline"]
+    assert tail_lines(str(log), 0) == []
+
+
+def test_tail_with_offset_holds_back_partial_line(tmp_path):
+    log = tmp_path / "partial.log"
+    _append(log, "one\ntwo\nthr")
+
+    lines, offset = tail_with_offset(str(log), 5)
+    assert lines == ["one", "two"]
+    assert offset == len("one\ntwo\n")
+
+    _append(log, "ee\n")
+    assert read_from(str(log), offset) == (["three"], os.path.getsize(log))
+
+
+def test_follower_returns_only_new_lines_per_subscriber(tmp_path):
+    log = tmp_path / "state.jsonl"
+    _append(log, "a\nb\n")
+    follower = LogFollower(str(log))
+
+    assert follower.subscribe("s1", backlog=1) == ["b"]
+    assert follower.poll() == {}
+
+    _append(log, "c\n")
+    assert follower.subscribe("s2", backlog=0) == []
+    _append(log, "d\n")
+
+    updates = follower.poll()
+    assert updates == {"s1": ["c", "d"], "s2": ["d"]}
+    assert follower.poll() == {}
+
+    follower.unsubscribe("s1")
+    assert "s1" not in follower
+    _append(log, "e\n")
+    assert follower.poll() == {"s2": ["e"]}
+
+
+def test_follower_waits_for_complete_lines(tmp_path):
+    log = tmp_path / "pipeline.log"
+    _append(log, "")
+    follower = LogFollower(str(log))
+    follower.subscribe("sid")
+
+    _append(log, "half")
+    assert follower.poll() == {}
+    _append(log, " done\n")
+    assert follower.poll() == {"sid": ["half done"]}
+
+
+def test_follower_handles_truncation_and_rotation(tmp_path):
+    log = tmp_path / "pipeline.log"
+    _append(log, "old 1\nold 2\n")
+    follower = LogFollower(str(log))
+    cursor = LogCursor()
+    assert follower.read_new(cursor) == (["old 1", "old 2"], False)
+
+    # Truncated in place
+    log.write_text("new\n", encoding="utf-8")
+    assert follower.read_new(cursor) == (["new"], True)
+
+    # Rotated: replaced by a different file that is already larger
+    rotated = tmp_path / "pipeline.log.1"
+    os.replace(log, rotated)
+    _append(log, "fresh 1\nfresh 2\nfresh 3\n")
+    lines, reset = follower.read_new(cursor)
+    assert reset
+    assert lines == ["fresh 1", "fresh 2", "fresh 3"]
+
+
+def test_follower_tolerates_missing_file(tmp_path):
+    log = tmp_path / "missing.log"
+    follower = LogFollower(str(log))
+    assert follower.subscribe("sid") == []
+    assert follower.poll() == {}
+
+    _append(log, "created\n")
+    assert follower.poll() == {"sid": ["created"]}
+
+
+def test_state_summary_catches_up_past_the_read_cap(tmp_path, monkeypatch):
+    state = tmp_path / "state.jsonl"
+    entries = [f'{{"step": "s{i % 3}", "status": "OK"}}\n' for i in range(500)]
+    _append(state, "".join(entries))
+    summary = StateSummary(str(state))
+    monkeypatch.setattr(summary._follower, "max_read_bytes", 256)
+
+    assert summary.refresh()["count"] == 500
+    state.write_text('{"step": "s0", "status": "FAIL"}\n', encoding="utf-8")
+    result = summary.refresh()
+    assert result["count"] == 1
+    assert result["step_counts"] == {"s0:FAIL": 1}
+
+
+def test_logs_route_detects_rotation(tmp_path, monkeypatch):
+    log = tmp_path / "pipeline.log"
+    _append(log, "a\nb\n")
+    monkeypatch.setitem(routes.LOG_SOURCES, "pipeline", log)
+
+    def get(**kwargs):
+        return asyncio.run(
+            routes.get_log_lines("pipeline", current_operator="test", **kwargs)
+        )
+
+    first = get(offset=None, lines=10, file_id=None)
+    assert first["lines"] == ["a", "b"]
+
+    # Replaced by a larger file: the offset alone would skip its first lines
+    os.replace(log, tmp_path / "pipeline.log.1")
+    _append(log, "c\nd\ne\n")
+    second = get(offset=first["offset"], lines=10, file_id=first["file_id"])
+    assert second["reset"]
+    assert second["lines"] == ["c", "d", "e"]
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite asset manifest store and incremental manifest rebuilds.
+"""
+
+import hashlib
+import json
+import os
+
+import pytest
+
+from bin.asset_librarian import AssetLibrarian
+from bin.asset_manifest import AssetManifest
+from bin.asset_quality import AssetQualityAnalyzer
+from bin.manifest_store import ManifestStore
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {w} 100">{body}</svg>'
+
+
+def _write_svg(path, w=100, fill="#1C4FA1"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(SVG.format(w=w, body=f'<rect fill="{fill}"/>'), encoding="utf-8")
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    monkeypatch.setattr(AssetManifest, "_generate_thumbnail", lambda self, p: True)
+    brand = tmp_path / "assets" / "brand"
+    _write_svg(brand / "backgrounds" / "bg_sunset.svg", w=1920)
+    _write_svg(brand / "props" / "prop_clock.svg")
+    _write_svg(tmp_path / "assets" / "generated" / "prop_phone.svg", fill="#00FF00")
+    return tmp_path
+
+
+def _count_extractions(monkeypatch):
+    calls = []
+    original = AssetManifest._extract_svg_metadata
+
+    def counting(self, svg_path):
+        calls.append(svg_path.name)
+        return original(self, svg_path)
+
+    monkeypatch.setattr(AssetManifest, "_extract_svg_metadata", counting)
+    return calls
+
+
+def test_rebuild_is_incremental(library, monkeypatch):
+    manifest = AssetManifest(str(library))
+    result = manifest.rebuild_manifest()
+    assert result["total_assets"] == 3
+    assert [v["asset"] for v in result["violations"]] == [
+        os.path.join("assets", "generated", "prop_phone.svg")
+    ]
+    generation = manifest.store.generation()
+
+    calls = _count_extractions(monkeypatch)
+    manifest = AssetManifest(str(library))
+    manifest.rebuild_manifest()
+    assert calls == []
+    assert manifest.store.generation() == generation
+
+    _write_svg(library / "assets" / "brand" / "props" / "prop_clock.svg", w=300)
+    os.remove(library / "assets" / "generated" / "prop_phone.svg")
+    manifest.rebuild_manifest()
+    assert calls == ["prop_clock.svg"]
+    assert manifest.store.count() == 2
+    assert manifest.store.generation() > generation
+    assert manifest.get_manifest_summary()["palette_violations"] == 0
+
+
+def test_usage_counts_survive_rebuilds(library):
+    manifest = AssetManifest(str(library))
+    manifest.rebuild_manifest()
+    clock = next(iter(manifest.store.query(tag="prop", palette_ok=True)))
+    manifest.store.record_usage([clock], "2024-01-01T00:00:00Z")
+
+    # Touch the file so it is re-extracted; content (and hash) is unchanged
+    path = library / "assets" / "brand" / "props" / "prop_clock.svg"
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 10**9))
+    result = AssetManifest(str(library)).rebuild_manifest()
+    assert result["assets"][clock]["usage_count"] == 1
+    assert result["assets"][clock]["last_used"] == "2024-01-01T00:00:00Z"
+
+
+def test_json_export_and_migration(library):
+    AssetManifest(str(library)).rebuild_manifest()
+    json_path = library / "data" / "library_manifest.json"
+    with open(json_path) as f:
+        exported = json.load(f)
+    assert exported["total_assets"] == 3
+    assert all(h == a["hash"] for h, a in exported["assets"].items())
+
+    # A JSON-only library is imported into a fresh store
+    os.remove(library / "data" / "library_manifest.db")
+    first = next(iter(exported["assets"]))
+    exported["assets"][first]["usage_count"] = 7
+    exported["assets"][first]["quality"] = {"overall_score": 91.0}
+    with open(json_path, "w") as f:
+        json.dump(exported, f)
+    manifest = AssetManifest(str(library))
+    assert manifest.store.count() == 3
+    assert list(manifest.store.query(min_quality=("overall_score", 90))) == [first]
+    assert sorted(a["usage_count"] for a in manifest.manifest["assets"].values()) == [
+        0,
+        0,
+        7,
+    ]
+
+
+def test_indexed_filters(tmp_path):
+    store = ManifestStore(str(tmp_path / "manifest.db"))
+    store.sync(
+        {
+            "a": {"path": "a.svg", "tags": ["prop", "brand"], "palette": ["#1"]},
+            "b": {
+                "path": "b.svg",
+                "tags": ["background"],
+                "palette": ["#2"],
+                "palette_ok": True,
+            },
+        }
+    )
+    store.set_quality("b", {"overall_score": 82.5})
+
+    assert list(store.query(tag="prop")) == ["a"]
+    assert list(store.query(color="#2")) == ["b"]
+    assert list(store.query(palette_ok=True)) == ["b"]
+    assert list(store.query(min_quality=("overall_score", 80))) == ["b"]
+    assert store.query(hashes=["b"])["b"]["quality"] == {"overall_score": 82.5}
+    assert store.query(hashes=[]) == {}
+    assert store.tag_counts() == {"prop": 1, "brand": 1, "background": 1}
+
+
+def test_librarian_reads_store_and_sees_updates(library):
+    manifest = AssetManifest(str(library))
+    manifest.rebuild_manifest()
+    librarian = AssetLibrarian(base_dir=str(library))
+    assert len(librarian.manifest["assets"]) == 3
+    assert [a["path"] for _, a in librarian._find_matching_assets("prop", "phone")]
+
+    os.remove(library / "assets" / "generated" / "prop_phone.svg")
+    manifest.rebuild_manifest()
+    assert librarian._find_matching_assets("prop", "phone") == []
+
+
+def test_librarian_records_usage_in_store(library):
+    manifest = AssetManifest(str(library))
+    manifest.rebuild_manifest()
+    librarian = AssetLibrarian(base_dir=str(library))
+    scenescript = {"slug": "demo", "scenes": [{"id": "s1", "bg": "sunset"}]}
+    plan = librarian.resolve_assets(scenescript, seed=1)
+    (used,) = [r["asset_hash"] for r in plan["resolved"]]
+
+    stored = manifest.store.query(hashes=[used])[used]
+    assert stored["usage_count"] == 1
+    assert stored["last_used"] == plan["generated_at"]
+    # Its own write does not make the librarian reload the manifest
+    assert not librarian._manifest_changed_on_disk()
+    assert librarian._manifest_store() is librarian._manifest_store()
+
+
+def test_quality_scores_are_stored_by_content_hash(tmp_path):
+    from PIL import Image
+
+    image = tmp_path / "clock.png"
+    Image.new("RGB", (64, 48), "#1C4FA1").save(image)
+    stray = tmp_path / "stray.png"
+    Image.new("RGB", (64, 48), "#D62828").save(stray)
+    asset_hash = hashlib.sha1(image.read_bytes()).hexdigest()
+    store = ManifestStore(str(tmp_path / "manifest.db"))
+    store.sync({asset_hash: {"path": "clock.png", "tags": ["prop"]}})
+
+    analyzer = AssetQualityAnalyzer()
+    metrics = analyzer.analyze_asset(str(image), "clock")
+    assert analyzer.record_quality(metrics, store)
+    assert not analyzer.record_quality(analyzer.analyze_asset(str(stray), ""), store)
+    quality = store.query(hashes=[asset_hash])[asset_hash]["quality"]
+    assert quality["overall_score"] == pytest.approx(metrics.overall_score)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for the model residency planner and its runtime manager.
+"""
+
+from unittest.mock import patch
+
+from bin.model_residency import (
+    STEP_REQUIRES,
+    ResidencyManager,
+    order_steps,
+    plan_residency,
+    step_models_from_config,
+)
+from bin.model_runner import ModelRunner
+
+STEPS = ["niche_trends", "llm_cluster", "llm_outline", "llm_script", "research_collect"]
+MODELS = {
+    "niche_trends": None,
+    "llm_cluster": "a:3b",
+    "llm_outline": "b:3b",
+    "llm_script": "a:3b",
+    "research_collect": "b:3b",
+}
+# As if research_collect needed the script: nothing can move
+CHAINED = {**STEP_REQUIRES, "research_collect": {"llm_script"}}
+
+
+def test_independent_steps_are_grouped_by_model():
+    # research_collect only needs the cluster step, so it joins the outline
+    # step's model; llm_script still has to follow llm_outline
+    assert order_steps(STEPS, MODELS) == [
+        "niche_trends",
+        "llm_cluster",
+        "llm_outline",
+        "research_collect",
+        "llm_script",
+    ]
+    assert order_steps(STEPS, MODELS, requires=CHAINED) == STEPS
+
+    config = {"models": {"cluster": {"name": "x"}}, "defaults": {"chat_model": "y"}}
+    steps = ["niche_trends", "llm_cluster", "fact_check"]
+    assert step_models_from_config(steps, config) == {
+        "niche_trends": None,
+        "llm_cluster": "x",
+        "fact_check": "y",
+    }
+
+
+def test_plan_swaps_and_preloads_within_budget():
+    sizes = {"a:3b": 2.0, "b:3b": 2.0}
+    tight = plan_residency(STEPS, MODELS, sizes, budget_gb=3.0)
+    assert tight.loads == 3 and tight.swaps == 1
+    assert tight.evict == {"llm_outline": ["a:3b"]}
+    assert tight.release == {"llm_script": ["b:3b"]}
+    assert not tight.preload
+
+    as_listed = plan_residency(STEPS, MODELS, sizes, 3.0, requires=CHAINED)
+    assert (as_listed.loads, as_listed.swaps) == (4, 2)
+
+    roomy = plan_residency(STEPS, MODELS, sizes, budget_gb=4.5)
+    assert (roomy.loads, roomy.swaps) == (2, 0)
+    assert roomy.preload == {"llm_cluster": "b:3b"}
+
+
+class FakeRunner:
+    def __init__(self):
+        self.calls = []
+
+    def load(self, model, keep_alive=None, options=None):
+        self.calls.append(("load", model, keep_alive))
+        self.options = options
+        return {"load_duration": 1_500_000_000}
+
+    def unload(self, model):
+        self.calls.append(("unload", model))
+
+    def list_tags(self):
+        return {"models": [{"name": "a:3b", "size": 2 * 1024**3}]}
+
+    def role_options(self, role):
+        return {"num_ctx": 8192 if role == "scriptwriter" else 4096, "seed": 1}
+
+
+def test_manager_follows_plan_and_reports():
+    plan = plan_residency(STEPS, MODELS, {"a:3b": 2.0, "b:3b": 2.0}, 3.0)
+    runner = FakeRunner()
+    manager = ResidencyManager(plan, runner, keep_alive="10m")
+
+    envs = [manager.before_step(step, {"BRIEF": "x"}) for step in manager.order]
+    assert envs[0] == {"BRIEF": "x"}
+    assert all(env["LLM_KEEP_ALIVE"] == "10m" for env in envs[1:])
+    assert runner.calls == [
+        ("load", "a:3b", "10m"),
+        ("unload", "a:3b"),
+        ("load", "b:3b", "10m"),
+        ("unload", "b:3b"),
+        ("load", "a:3b", "10m"),
+    ]
+    report = manager.report()
+    assert report["loads"] == 3 and report["swaps"] == 1
+    assert report["load_s_by_model"] == {"a:3b": 3.0, "b:3b": 1.5}
+
+
+def test_manager_loads_with_the_step_options(monkeypatch):
+    monkeypatch.setenv("LLM_MEMORY_BUDGET_GB", "3")
+    config = {"models": {"outline": {"name": "a:3b"}, "scriptwriter": {}}}
+    steps = ["llm_outline", "llm_script", "research_collect"]
+    runner = FakeRunner()
+    manager = ResidencyManager.from_config(steps, config, runner=runner)
+    # research_collect calls no model; the script step needs a bigger context
+    assert manager.plan.models == {
+        "llm_outline": "a:3b@4096",
+        "llm_script": "llama3.2:3b@8192",
+        "research_collect": None,
+    }
+
+    manager.before_step("llm_outline")
+    assert runner.calls == [("load", "a:3b", "30m")]
+    assert runner.options == {"num_ctx": 4096, "seed": 1}
+    manager.before_step("llm_script")
+    assert runner.calls[-1] == ("load", "llama3.2:3b", "30m")
+    assert runner.options == {"num_ctx": 8192, "seed": 1}
+
+
+@patch("requests.Session.request")
+def test_runner_sends_keep_alive(mock_req, monkeypatch):
+    sent = []
+
+    class Reply:
+        status_code = 200
+
+        def json(self):
+            return {"models": [{"name": "a:3b"}], "message": {"content": "ok"}}
+
+        def raise_for_status(self):
+            pass
+
+    def request(method, url, **kwargs):
+        sent.append(kwargs.get("json"))
+        return Reply()
+
+    mock_req.side_effect = request
+    monkeypatch.setenv("LLM_KEEP_ALIVE", "30m")
+    runner = ModelRunner(base_url="http://127.0.0.1:9")
+    runner.chat([{"role": "user", "content": "hi"}], model="a:3b")
+    runner.unload("a:3b")
+    assert sent[-2]["keep_alive"] == "30m"
+    assert sent[-1] == {"model": "a:3b", "keep_alive": 0}
+
+    options = runner.role_options("scriptwriter")
+    runner.load("a:3b", options=options)
+    assert sent[-1]["options"] == options
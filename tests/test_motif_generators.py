@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for thread-safe motif generation, the SVG read-through cache and the
+batch API used by the asset loop.
+"""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bin.cutout import motif_generators as mg
+from bin.cutout.motif_generators import (
+    MotifRequest,
+    generate_motif_cached,
+    generate_motifs_batch,
+    make_cutout_collage,
+    make_starburst,
+    pick_scene_colors,
+)
+
+PALETTE = ["#1C4FA1", "#D62828", "#F6BE00"]
+
+
+def test_seeded_generation_does_not_touch_global_random():
+    random.seed(1234)
+    expected = random.random()
+
+    random.seed(1234)
+    make_starburst(100, 100, "#1C4FA1", "#F6BE00", seed=7)
+    make_cutout_collage(400, 300, 6, PALETTE, seed=7)
+    pick_scene_colors(PALETTE, 2, seed=7)
+    assert random.random() == expected
+
+
+def test_seeded_output_is_deterministic_across_threads():
+    def render(seed):
+        return (
+            make_starburst(100, 100, "#1C4FA1", "#F6BE00", seed=seed),
+            make_cutout_collage(400, 300, 9, PALETTE, seed=seed),
+        )
+
+    sequential = [render(seed) for seed in range(1, 17)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        parallel = list(pool.map(render, range(1, 17)))
+    assert parallel == sequential
+
+
+def test_unseeded_collage_is_supported():
+    svg = make_cutout_collage(400, 300, 4, PALETTE)
+    assert svg.count("<path") == 4
+
+
+def test_background_collage_motif():
+    svg = mg.generate_background_motif("cutout_collage", PALETTE, seed=3)
+    assert svg is not None and "<path" in svg
+
+
+def test_cache_is_read_through(tmp_path, monkeypatch):
+    request = MotifRequest("prop", "clock", PALETTE, seed=11)
+    first = generate_motif_cached(request, str(tmp_path))
+    assert len(list(tmp_path.glob("*.svg"))) == 1
+
+    calls = []
+    monkeypatch.setitem(
+        mg._MOTIF_GENERATORS, "prop", lambda *a, **k: calls.append(a) or "regenerated"
+    )
+    assert generate_motif_cached(request, str(tmp_path)) == first
+    assert calls == []
+
+    # Unseeded requests are never served from cache
+    generate_motif_cached(MotifRequest("prop", "clock", PALETTE), str(tmp_path))
+    assert len(calls) == 1
+
+
+def test_batch_matches_sequential_and_dedupes(tmp_path):
+    requests = [
+        MotifRequest("background", "starburst", PALETTE, seed=5),
+        MotifRequest("prop", "phone", PALETTE, seed=6),
+        MotifRequest("character", "narrator", PALETTE, seed=7),
+        MotifRequest("background", "starburst", PALETTE, seed=5),
+    ]
+    sequential = [generate_motif_cached(r, None) for r in requests]
+
+    results = generate_motifs_batch(requests, max_workers=4, cache_dir=str(tmp_path))
+    assert results == sequential
+    assert len(list(tmp_path.glob("*.svg"))) == 3
+
+    with pytest.raises(ValueError):
+        generate_motifs_batch([MotifRequest("texture", "grain", seed=1)], cache_dir=None)
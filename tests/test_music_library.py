@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests for music feature analysis and the indexed music library.
+"""
+
+import json
+import random
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+
+from bin import music_library
+from bin.music_analysis import SAMPLE_RATE, analyze_samples
+from bin.music_library import MusicLibrary, MusicTrack
+
+needs_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None, reason="ffmpeg not available"
+)
+
+
+def _click_track(bpm, seconds=20):
+    """Accented clicks at ``bpm`` over a quiet drone."""
+    samples = np.zeros(int(seconds * SAMPLE_RATE), np.float32)
+    t = np.arange(int(0.03 * SAMPLE_RATE)) / SAMPLE_RATE
+    click = (np.sin(2 * np.pi * 1000 * t) * np.exp(-t * 80)).astype(np.float32)
+    period = 60.0 * SAMPLE_RATE / bpm
+    beat = 0
+    while int(beat * period) + len(click) < len(samples):
+        start = int(beat * period)
+        accent = 1.0 if beat % 4 == 0 else 0.6
+        samples[start : start + len(click)] += click * accent
+        beat += 1
+    drone = np.sin(2 * np.pi * 220 * np.arange(len(samples)) / SAMPLE_RATE)
+    return samples + 0.3 * drone.astype(np.float32)
+
+
+def _write_audio(path, samples):
+    subprocess.run(
+        ["ffmpeg", "-y", "-f", "f32le", "-ar", str(SAMPLE_RATE), "-ac", "1"]
+        + ["-i", "-", str(path)],
+        input=samples.tobytes(),
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.parametrize("bpm", [64, 100, 128, 150, 165])
+def test_tempo_estimation(bpm):
+    features = analyze_samples(_click_track(bpm))
+    assert abs(features["bpm"] - bpm) <= 2
+    assert features["duration"] == pytest.approx(20.0, abs=0.01)
+    assert features["loudness_db"] < 0 < features["energy"]
+
+    quiet = analyze_samples(_click_track(bpm) * 0.1)
+    expected = features["loudness_db"] - 20
+    assert quiet["loudness_db"] == pytest.approx(expected, abs=0.1)
+
+
+@needs_ffmpeg
+def test_import_analyzes_in_parallel_and_caches_by_hash(tmp_path, monkeypatch):
+    for name, bpm in [("a", 90), ("b", 140)]:
+        _write_audio(tmp_path / f"{name}.wav", _click_track(bpm, seconds=8))
+    shutil.copy(tmp_path / "a.wav", tmp_path / "a_copy.wav")
+
+    analyzed = []
+    real = music_library.analyze_files
+
+    def counting(paths, max_workers=None):
+        paths = list(paths)
+        analyzed.extend(paths)
+        return real(paths, max_workers)
+
+    monkeypatch.setattr(music_library, "analyze_files", counting)
+
+    library = MusicLibrary(str(tmp_path / "lib"))
+    entries = [
+        {"file_path": str(tmp_path / f"{name}.wav"), "title": name, "artist": "x"}
+        for name in ["a", "b", "a_copy"]
+    ]
+    assert library.add_tracks(entries) == ["a", "b", "a_copy"]
+    # Identical content is decoded once
+    assert len(analyzed) == 2
+    bpms = {tid: t.bpm for tid, t in library.tracks.items()}
+    assert abs(bpms["a"] - 90) <= 2 and abs(bpms["b"] - 140) <= 2
+    assert bpms["a_copy"] == bpms["a"]
+
+    # A new library instance reuses the cached features
+    again = MusicLibrary(str(tmp_path / "lib"))
+    again.add_track(str(tmp_path / "b.wav"), "b", "x", mood="calm", bpm=77)
+    assert len(analyzed) == 2
+    assert again.tracks["b"].bpm == 77 and again.tracks["b"].mood == "calm"
+    assert json.loads((tmp_path / "lib" / "library.json").read_text())["a"]["bpm"]
+
+
+def _reference_select(tracks, target_bpm, mood, genre, min_duration, max_duration):
+    """The original linear-scan scoring, kept as the selection oracle."""
+    scored = []
+    for track in tracks:
+        score = MusicLibrary._score(
+            track, target_bpm, mood, genre, min_duration, max_duration
+        )
+        if track.duration:
+            if min_duration and track.duration < min_duration:
+                continue
+            if max_duration and track.duration > max_duration:
+                continue
+        scored.append((track, score))
+    if not scored:
+        return None
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return scored[0][0]
+
+
+def test_indexed_selection_matches_linear_scan(tmp_path):
+    rng = random.Random(7)
+    moods = ["calm", "energetic", "dramatic", None]
+    genres = ["ambient", "electronic", None]
+    tracks = {
+        f"t{i}": MusicTrack(
+            file_path=f"t{i}.mp3",
+            title=f"t{i}",
+            artist="x",
+            bpm=rng.choice([None, rng.randint(60, 170)]),
+            mood=rng.choice(moods),
+            genre=rng.choice(genres),
+            duration=rng.choice([None, round(rng.uniform(10, 120), 1)]),
+        )
+        for i in range(300)
+    }
+    library = MusicLibrary(str(tmp_path))
+    library._upsert_tracks(tracks)
+    ordered = list(library.tracks.values())
+
+    for _ in range(300):
+        query = (
+            rng.choice([None, rng.randint(60, 170)]),
+            rng.choice(moods + ["CALM"]),
+            rng.choice(genres),
+            rng.choice([None, rng.uniform(10, 60)]),
+            rng.choice([None, rng.uniform(60, 150)]),
+        )
+        expected = _reference_select(ordered, *query)
+        assert library.select_track(*query) == expected, query
+
+    assert {t.title for t in library.get_tracks_by_mood("Calm")} == {
+        t.title for t in ordered if t.mood == "calm"
+    }
+    assert {t.title for t in library.get_tracks_by_bpm_range(90, 100)} == {
+        t.title for t in ordered if t.bpm and 90 <= t.bpm <= 100
+    }
+
+
+def test_json_library_is_imported(tmp_path):
+    track = MusicTrack("song.mp3", "Song", "Artist", bpm=100, mood="calm")
+    (tmp_path / "library.json").write_text(json.dumps({"song": track.to_dict()}))
+
+    library = MusicLibrary(str(tmp_path))
+    assert library.tracks == {"song": track}
+    assert library.remove_track("song")
+    assert not library.remove_track("song")
+    assert MusicLibrary(str(tmp_path)).tracks == {}
+
+
+def test_fallback_clamps_duration_score_and_exports(tmp_path, monkeypatch):
+    library = MusicLibrary(str(tmp_path))
+    monkeypatch.setattr(library, "analyze_tracks", lambda paths, max_workers=None: {})
+    for name, duration in (("a", 140.0), ("b", 110.0)):
+        path = tmp_path / f"{name}.mp3"
+        path.write_bytes(b"")
+        library.add_track(str(path), name, "x", bpm=60, duration=duration)
+
+    # Both are over 20 s from the 80 s target, so both score 0 and the
+    # earlier track wins although b is closer
+    track = library.select_track(target_bpm=120, min_duration=10, max_duration=150)
+    assert track.title == "a"
+
+    def exported():
+        return list(json.loads((tmp_path / "library.json").read_text()))
+
+    assert exported() == ["a", "b"]
+    assert library.remove_track("a")
+    assert exported() == ["b"]
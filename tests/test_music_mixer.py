@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass music mix filter graph.
+"""
+
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+
+from bin import music_mixer
+from bin.music_mixer import MusicMixer
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None, reason="ffmpeg not available"
+)
+
+RATE = 16000
+VO_SECONDS = 3.0
+
+
+def _lavfi(path, source, seconds):
+    subprocess.run(
+        ["ffmpeg", "-y", "-f", "lavfi", "-i", source, "-t", str(seconds), str(path)],
+        check=True,
+        capture_output=True,
+    )
+
+
+def _decode(path):
+    proc = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", str(path)]
+        + ["-f", "s16le", "-ac", "1", "-ar", str(RATE), "-"],
+        check=True,
+        capture_output=True,
+    )
+    return np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float64) / 32768
+
+
+def _tone_level(samples, start, end, freq=1000):
+    """Magnitude of ``freq`` in a window, separating music from the VO tone."""
+    window = samples[int(start * RATE) : int(end * RATE)]
+    spectrum = np.abs(np.fft.rfft(window * np.hanning(len(window))))
+    freqs = np.fft.rfftfreq(len(window), 1 / RATE)
+    return spectrum[np.argmin(np.abs(freqs - freq))]
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    # Voice for the first half only, so ducking shows up as a level change
+    vo = tmp_path / "vo.wav"
+    _lavfi(
+        vo,
+        "aevalsrc=if(lt(t\\,1.5)\\,0.5*sin(2*PI*300*t)\\,0):s=44100",
+        VO_SECONDS,
+    )
+    # A short stereo bed at another rate has to be looped and resampled
+    music = tmp_path / "music.wav"
+    _lavfi(music, "sine=frequency=1000:sample_rate=48000", 1.0)
+    return vo, music
+
+
+@pytest.fixture
+def ffmpeg_calls(monkeypatch):
+    calls = []
+    real_run = subprocess.run
+
+    def recording_run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(music_mixer.subprocess, "run", recording_run)
+    monkeypatch.setattr(
+        MusicMixer, "_get_duration", lambda self, p, default=30.0: VO_SECONDS
+    )
+    return calls
+
+
+def test_ducked_mix_runs_in_one_pass(inputs, tmp_path, ffmpeg_calls):
+    vo, music = inputs
+    out = tmp_path / "mixed.wav"
+
+    mixer = MusicMixer(config=object())
+    assert mixer.mix_audio_with_music(str(vo), str(music), str(out), music_db=-6.0)
+
+    assert len(ffmpeg_calls) == 1
+    assert not list(tmp_path.glob("*.mp3"))
+
+    samples = _decode(out)
+    assert abs(len(samples) / RATE - VO_SECONDS) < 0.05
+    # The bed is looped to the end and ducked while the voice is present
+    ducked = _tone_level(samples, 0.5, 1.3)
+    open_bed = _tone_level(samples, 1.8, 2.4)
+    assert ducked < open_bed * 0.7
+    # ...and faded out at the end of the mix
+    assert _tone_level(samples, 2.9, 3.0) < open_bed * 0.05
+
+
+def test_simple_mix_and_loudnorm_share_the_graph(inputs, tmp_path, ffmpeg_calls):
+    vo, music = inputs
+    out = tmp_path / "mixed.wav"
+
+    mixer = MusicMixer(config=object())
+    assert mixer.mix_audio_with_music(
+        str(vo), str(music), str(out), enable_ducking=False, target_lufs=-16.0
+    )
+    assert len(ffmpeg_calls) == 1
+    graph = ffmpeg_calls[0][ffmpeg_calls[0].index("-filter_complex") + 1]
+    assert "sidechaincompress" not in graph
+    assert "loudnorm=I=-16.0" in graph
+    assert abs(len(_decode(out)) / RATE - VO_SECONDS) < 0.05
+
+
+def test_mix_fails_when_the_voiceover_duration_is_unknown(
+    inputs, tmp_path, monkeypatch
+):
+    vo, music = inputs
+    out = tmp_path / "mixed.wav"
+    monkeypatch.setattr(
+        MusicMixer, "_get_duration", lambda self, p, default=30.0: default
+    )
+
+    mixer = MusicMixer(config=object())
+    assert not mixer.mix_audio_with_music(str(vo), str(music), str(out))
+    assert not out.exists()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent, per-domain rate-limited research fetching.
+
+Each "domain" is a local in-process HTTP server on its own port, so
+throughput, politeness, retries and conditional requests run offline.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from bin.research_collect import ResearchCollector
+from bin.research_fetch import FetchEngine, FetchRequest, TokenBucket
+
+DELAY = 0.2
+ARTICLE = (
+    "<html><head><title>Color theory</title></head><body>"
+    + "<p>Color theory explains how designers combine hues for contrast.</p>" * 5
+    + "</body></html>"
+)
+
+
+class StandIn:
+    """A local HTTP server standing in for one remote domain."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.hits = []  # (monotonic time, path, request headers)
+        self.failures = {}  # path -> remaining 503 responses
+        self.etag = '"v1"'
+        self.lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stand_in.lock:
+                    stand_in.hits.append((time.monotonic(), self.path, self.headers))
+                    failing = stand_in.failures.get(self.path, 0)
+                    if failing:
+                        stand_in.failures[self.path] = failing - 1
+                time.sleep(stand_in.delay)
+                if failing:
+                    self.send_response(503)
+                    self.send_header("Retry-After", "0")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if self.headers.get("If-None-Match") == stand_in.etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = ARTICLE.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("ETag", stand_in.etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def url(self, path):
+        return f"{self.base}{path}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stand_ins():
+    servers = []
+
+    def make(delay=0.0):
+        server = StandIn(delay)
+        servers.append(server)
+        return server
+
+    yield make
+    for server in servers:
+        server.close()
+
+
+def test_token_bucket_paces_after_burst():
+    now = [0.0]
+    bucket = TokenBucket(rate_per_sec=2, burst=2, clock=lambda: now[0])
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    now[0] = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_domains_are_fetched_concurrently(stand_ins):
+    domains = [stand_ins(delay=DELAY) for _ in range(4)]
+    urls = [d.url(f"/page{i}") for d in domains for i in range(2)]
+
+    with FetchEngine(max_workers=8, rate_per_sec=100) as engine:
+        start = time.perf_counter()
+        results = engine.fetch_all([FetchRequest(url) for url in urls])
+        elapsed = time.perf_counter() - start
+
+    assert [r.url for r in results] == urls
+    assert all(r.status == 200 and "Color theory" in r.text for r in results)
+    # Sequential fetching would take len(urls) * DELAY
+    assert elapsed < DELAY * len(urls) / 2
+
+
+def test_each_domain_is_paced_independently(stand_ins):
+    slow, fast = stand_ins(), stand_ins()
+    urls = [slow.url(f"/s{i}") for i in range(4)] + [fast.url("/f0")]
+
+    with FetchEngine(max_workers=5, rate_per_sec=5) as engine:
+        start = time.monotonic()
+        results = engine.fetch_all([FetchRequest(url) for url in urls])
+
+    assert all(r.status == 200 for r in results)
+    slow_times = sorted(t for t, _, _ in slow.hits)
+    gaps = [b - a for a, b in zip(slow_times, slow_times[1:])]
+    assert min(gaps) >= 0.2 * 0.8
+    # The other domain does not wait behind the first one's bucket
+    assert fast.hits[0][0] - start < 0.15
+
+
+def test_retries_are_bounded_by_budget(stand_ins):
+    server = stand_ins()
+    server.failures = {"/flaky": 2, "/down": 10}
+
+    with FetchEngine(rate_per_sec=0, backoff_ms=0, min_retries=2) as engine:
+        flaky = engine.fetch_all([FetchRequest(server.url("/flaky"))])[0]
+        assert flaky.status == 200 and flaky.attempts == 3
+
+        # A second batch gets a fresh budget, but max_attempts still applies
+        down = engine.fetch_all([FetchRequest(server.url("/down"))])[0]
+        assert down.error == "HTTP 503" and down.attempts == 3
+
+    with FetchEngine(rate_per_sec=0, backoff_ms=0, min_retries=0) as engine:
+        server.failures = {"/flaky": 1}
+        result = engine.fetch_all([FetchRequest(server.url("/flaky"))])[0]
+        assert result.error == "HTTP 503" and result.attempts == 1
+
+
+def test_collector_revalidates_stale_cache_with_etag(stand_ins, tmp_path):
+    server = stand_ins()
+    url = server.url("/article")
+
+    with patch("bin.research_collect.BASE", str(tmp_path)):
+        collector = ResearchCollector(mode="live")
+    collector._fetch_engine = FetchEngine(rate_per_sec=0)
+    brief = {"keywords_include": ["color theory"], "sources_preferred": [url]}
+
+    first = collector._fetch_web_contents([url], brief["keywords_include"])[0]
+    assert first["metadata"]["etag"] == '"v1"'
+
+    # A fresh entry is served from the cache without touching the network
+    assert collector._fetch_web_content(url, brief["keywords_include"])
+    assert len(server.hits) == 1
+
+    # Once expired, the entry is revalidated and the 304 reuses cached text
+    collector.cache_ttl_hours = -1
+    collector._refresh_cache_expiry(url)
+    collector.cache_ttl_hours = 24
+    again = collector._fetch_web_content(url, brief["keywords_include"])
+    assert server.hits[-1][2]["If-None-Match"] == '"v1"'
+    assert again["text_clean"] == first["text_clean"]
+    assert collector._get_cached_content(url) is not None
+    collector.close()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the batched research storage write path.
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from bin.research_collect import ResearchCollector
+
+PARAGRAPH = "Color theory explains how designers combine hues for contrast. " * 2
+SOURCES = 40
+CHUNKS_PER_SOURCE = 150
+
+
+def _synthetic_content(i, chunks=CHUNKS_PER_SOURCE):
+    return "\n\n".join(f"{i}-{j} {PARAGRAPH}" for j in range(chunks))
+
+
+@pytest.fixture
+def collector(tmp_path):
+    with patch("bin.research_collect.BASE", str(tmp_path)):
+        collector = ResearchCollector(mode="live")
+    yield collector
+    collector.close()
+
+
+def test_ingest_uses_one_connection(collector):
+    with patch("bin.research_collect.sqlite3.connect") as connect:
+        for i in range(SOURCES):
+            url = f"https://example{i % 4}.com/article-{i}"
+            assert collector._store_content(url, _synthetic_content(i))
+    connect.assert_not_called()
+
+    total = SOURCES * CHUNKS_PER_SOURCE
+
+    with sqlite3.connect(collector.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0] == SOURCES
+        assert conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0] == total
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(sources)")}
+    assert mode == "wal"
+    assert "idx_sources_domain" in indexes
+
+
+def test_refetch_replaces_chunks_and_keeps_source_id(collector):
+    url = "https://example.com/article"
+    first = collector._store_content(url, _synthetic_content("a", chunks=5))
+    second = collector._store_content(url, _synthetic_content("b", chunks=3))
+    assert first == second
+
+    with sqlite3.connect(collector.db_path) as conn:
+        texts = [
+            row[0]
+            for row in conn.execute(
+                "SELECT chunk_text FROM chunks WHERE source_id = ?", (second,)
+            )
+        ]
+    assert len(texts) == 3 and all(t.startswith("b-") for t in texts)
+
+
+def test_failed_write_stores_nothing(collector):
+    url = "https://example.com/broken"
+    with patch.object(collector, "_chunk_rows", return_value=[(1, None, "h", 0)]):
+        assert collector._store_content(url, _synthetic_content("c")) is None
+
+    with sqlite3.connect(collector.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0] == 0
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for static-layer flattening and held frames in scene rendering.
+"""
+
+import numpy as np
+import pytest
+
+from bin.cutout.anim_fx import apply_keyframes
+from bin.cutout.scene_layers import flatten_scene, keyframe_motion
+from bin.cutout.sdk import Keyframe
+
+moviepy = pytest.importorskip("moviepy.editor")
+
+SIZE = (320, 180)
+DURATION = 1.0
+
+
+def _translucent(size, color, alpha=128):
+    rgba = np.zeros((size[1], size[0], 4), np.uint8)
+    rgba[..., :3] = color
+    rgba[..., 3] = alpha
+    return moviepy.ImageClip(rgba, transparent=True, duration=DURATION)
+
+
+def test_keyframe_motion_marks_only_changing_frames():
+    assert keyframe_motion(None, DURATION) is None
+    held = [Keyframe(t=0, x=5, opacity=0.5), Keyframe(t=900, x=5, opacity=0.5)]
+    assert keyframe_motion(held, DURATION) is None
+
+    moving = [Keyframe(t=300, x=0), Keyframe(t=600, x=90)]
+    changed = keyframe_motion(moving, DURATION, fps=10)
+    assert np.flatnonzero(changed).tolist() == [4, 5, 6]
+
+
+def test_flattened_scene_matches_plain_composite():
+    keyframes = [Keyframe(t=200, x=40, y=40), Keyframe(t=500, x=160, y=60)]
+    mover = moviepy.ColorClip((30, 30), color=(0, 0, 255)).set_duration(DURATION)
+    clips = [
+        moviepy.ColorClip(SIZE, color=(200, 180, 150)).set_duration(DURATION),
+        _translucent((60, 40), (255, 0, 0)).set_position((30, 30)),
+        apply_keyframes(mover.set_position((40, 40)), keyframes, DURATION),
+        _translucent((50, 50), (0, 255, 0)).set_position((150, 50)),
+    ]
+    motion = [None, None, keyframe_motion(keyframes, DURATION, fps=10), None]
+
+    scene, plan = flatten_scene(clips, motion, DURATION, fps=10, size=SIZE)
+    reference = moviepy.CompositeVideoClip(clips, size=SIZE)
+
+    assert plan.static_layers == 3 and plan.animated_layers == 1
+    assert plan.static_groups == 2  # the top layer stays above the mover
+    assert plan.total_frames == 10 and plan.rendered_frames == 4
+    assert plan.held_frames == 6 and plan.speedup > 2
+    for t in np.arange(10) / 10:
+        diff = scene.get_frame(t).astype(float) - reference.get_frame(t)
+        assert np.abs(diff).max() < 1e-6
+
+
+def test_fully_static_scene_composites_once(monkeypatch):
+    clips = [
+        moviepy.ColorClip(SIZE, color=(10, 20, 30)).set_duration(DURATION),
+        _translucent((40, 40), (255, 255, 255)).set_position((10, 10)),
+    ]
+    scene, plan = flatten_scene(clips, [None, None], DURATION, fps=10, size=SIZE)
+    assert plan.rendered_frames == 1 and plan.held_frames == 9
+    assert plan.to_dict()["speedup"] == pytest.approx(20 / 3, abs=0.01)
+
+    first = scene.get_frame(0)
+    assert all(scene.get_frame(t) is first for t in np.arange(10) / 10)
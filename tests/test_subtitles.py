@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared SRT/ASS cue library and its migrated call sites.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from bin.pacing_kpi import parse_srt_timing
+from bin.synthetic_srt import format_srt_timestamp, generate_srt_content
+from bin.utils import subtitles
+from bin.utils.captions import segment_srt, srt_to_ass
+from bin.utils.subtitles import (
+    Cue,
+    clip,
+    format_timestamp,
+    load_srt,
+    merge,
+    parse_srt,
+    parse_timestamp,
+    resegment,
+    shift,
+    split,
+    to_srt,
+)
+from bin.voice_cues import parse_srt_file
+
+MESSY = (
+    "﻿1\r\n00:00:01,000 --> 00:00:02,500 X1:10 X2:20\r\nHello there\r\n"
+    "second line\r\n\r\n\r\n"
+    "00:00:03,000 --> 00:00:04,000\n\nNo index and a blank before text\n\n"
+    "7\n01:02:03.5 --> 01:02:04,250\n42\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    subtitles.clear_cache()
+    yield
+    subtitles.clear_cache()
+
+
+def test_parse_tolerates_real_world_files():
+    assert parse_srt(MESSY) == [
+        Cue(1000, 2500, "Hello there\nsecond line"),
+        Cue(3000, 4000, "No index and a blank before text"),
+        Cue(3723500, 3724250, "42"),
+    ]
+    assert parse_timestamp("00:00:01,5") == 1500
+    assert format_timestamp(3723500) == "01:02:03,500"
+    # Float seconds round instead of truncating (1.001 is 1000.999... ms)
+    assert format_srt_timestamp(1.001) == "00:00:01,001"
+
+    cues = parse_srt(MESSY)
+    assert parse_srt(to_srt(cues)) == cues
+
+
+def test_empty_cue_does_not_swallow_the_next():
+    srt = (
+        "1\n00:00:01,000 --> 00:00:02,000\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nHello\n\n"
+        "3\n00:00:05,000 --> 00:00:06,000\nBye\n"
+    )
+    assert parse_srt(srt) == [Cue(3000, 4000, "Hello"), Cue(5000, 6000, "Bye")]
+
+
+def test_cue_operations():
+    cue = Cue(0, 4000, "one two three four five six seven eight")
+    assert shift([cue, Cue(5000, 6000, "x")], -4500) == [Cue(500, 1500, "x")]
+
+    halves = split(cue, 2)
+    assert [c.text for c in halves] == ["one two three four", "five six seven eight"]
+    assert halves[0].start_ms == 0 and halves[-1].end_ms == 4000
+    assert halves[0].end_ms == halves[1].start_ms
+    assert merge(*halves) == cue
+
+    assert clip([cue, Cue(5000, 6000, "x")], 3000, 5000) == [
+        Cue(0, 1000, cue.text),
+        Cue(2000, 2000, "x"),
+    ]
+
+    long = Cue(0, 6000, " ".join(["word"] * 20))
+    quick = [Cue(6000, 6300, "Hi."), Cue(6350, 7000, "Hello again.")]
+    out = resegment([long] + quick, max_chars=42)
+    assert all(len(c.text) <= 42 for c in out)
+    assert out[-1] == Cue(6000, 7000, "Hi. Hello again.")
+    assert sum(c.duration_ms for c in out[:-1]) == 6000
+
+
+def test_call_sites_share_one_parse(tmp_path, monkeypatch):
+    path = tmp_path / "demo.srt"
+    path.write_text(MESSY, encoding="utf-8")
+
+    parsed = []
+    real = subtitles.iter_cues
+
+    def counting(lines):
+        parsed.append(1)
+        return real(lines)
+
+    monkeypatch.setattr(subtitles, "iter_cues", counting)
+
+    assert parse_srt_file(str(path))[0] == (1000, 2500, "Hello there\nsecond line")
+    assert parse_srt_timing(str(path)) == (3250.0, 0)
+    segment = segment_srt(Path(path), 1.5, 3.5)
+    assert len(parsed) == 1
+
+    path.write_text(to_srt([Cue(0, 1000, "changed")]), encoding="utf-8")
+    subtitles.invalidate(path)
+    assert load_srt(path) == (Cue(0, 1000, "changed"),)
+
+    assert segment.startswith("1\n00:00:00,000 --> 00:00:01,000\nHello there\n")
+    ass = srt_to_ass(segment, "Inter", 64, (255, 255, 255), (0, 0, 0), 120)
+    assert "Dialogue: 0,0:00:00.00,0:00:01.00,Default,Hello there\\Nsecond line" in ass
+    assert "Dialogue: 0,0:00:01.50,0:00:02.00,Default," in ass
+
+
+def test_generated_srt_round_trips():
+    timings = [(0.0, 1.2345, "First caption."), (1.2345, 3.0, "Second one.")]
+    content = generate_srt_content(timings)
+    assert content.startswith("1\n00:00:00,000 --> 00:00:01,234\nFirst caption.\n")
+    assert [c.text for c in parse_srt(content)] == ["First caption.", "Second one."]
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the channel term index and its use by SEOEnhancer.
+"""
+
+import json
+import os
+
+from bin.seo_enhancer import SEOEnhancer
+from bin.term_index import TermIndex, tokenize
+
+CATALOGUE = {
+    "eames-lounge": (
+        "The Eames lounge chair pairs molded plywood with leather. Design "
+        "history remembers the lounge chair as a modern classic.",
+        ["eames", "furniture design"],
+    ),
+    "bauhaus-chairs": (
+        "Bauhaus design brought tubular steel chairs into homes. Design "
+        "history credits Breuer with the steel chair.",
+        ["bauhaus", "furniture design"],
+    ),
+    "kitchen-knives": (
+        "A chef knife needs hard steel and a sharp edge. Sharpening keeps the "
+        "edge keen for years.",
+        ["kitchen", "knives"],
+    ),
+}
+
+
+def _index(path=None):
+    index = TermIndex(path)
+    for slug, (text, tags) in CATALOGUE.items():
+        index.add_document(slug, text, title=slug, tags=tags)
+    return index
+
+
+def test_tokenize_words_and_bigrams():
+    text = "The **Eames** lounge chair, [designed](https://x.io/a_b) in 1956."
+    assert tokenize(text) == [
+        "eames",
+        "lounge",
+        "eames lounge",
+        "chair",
+        "lounge chair",
+        "designed",
+    ]
+
+
+def test_keywords_prefer_terms_distinctive_for_the_channel():
+    index = _index()
+    content = (
+        "Design history: the plywood design of the Eames chair. Plywood "
+        "shells made the chair light, and design history followed."
+    )
+    # "design" is more frequent here, but common across the catalogue
+    assert index.keywords(content, max_keywords=1) == ["plywood"]
+    # Without a catalogue, plain frequency wins
+    assert TermIndex(None).keywords(content, max_keywords=1) == ["design"]
+
+
+def test_similar_videos_and_tag_suggestions():
+    index = _index()
+    content = "Eames molded plywood and leather made the lounge chair."
+    assert index.similar(content, k=1)[0][0] == "eames-lounge"
+    assert index.related("bauhaus-chairs")[0][0] == "eames-lounge"
+    # Both chair videos carry "furniture design"
+    assert index.suggest_tags(content, max_tags=2) == ["furniture design", "eames"]
+    assert "eames-lounge" not in dict(index.similar(content, exclude="eames-lounge"))
+
+
+def test_sync_is_incremental_and_persisted(tmp_path):
+    scripts, videos = tmp_path / "scripts", tmp_path / "videos"
+    scripts.mkdir()
+    videos.mkdir()
+    for slug, (text, _) in CATALOGUE.items():
+        (scripts / f"{slug}.txt").write_text(text, encoding="utf-8")
+    (videos / "eames-lounge.metadata.json").write_text(
+        json.dumps({"title": "Eames Lounge", "tags": ["eames"]}), encoding="utf-8"
+    )
+    path = str(tmp_path / "term_index.json")
+
+    def open_index():
+        return TermIndex(path, scripts_dir=str(scripts), videos_dir=str(videos))
+
+    index = open_index()
+    assert index.sync() == 3
+    assert index.docs["eames-lounge"]["tags"] == ["eames"]
+    assert open_index().sync() == 0
+
+    knives = scripts / "kitchen-knives.txt"
+    knives.write_text("Carbon steel knives rust without care.", encoding="utf-8")
+    stat = knives.stat()
+    os.utime(knives, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    (scripts / "bauhaus-chairs.txt").unlink()
+    index = open_index()
+    assert index.sync() == 2
+    assert sorted(index.docs) == ["eames-lounge", "kitchen-knives"]
+    assert "carbon steel" in index.docs["kitchen-knives"]["terms"]
+    assert index.df["steel"] == 1
+
+
+def test_seo_enhancer_uses_the_index():
+    enhancer = SEOEnhancer(term_index=_index())
+    content = (
+        "## Plywood\n\nEames plywood shells and leather made the lounge chair. "
+        "The plywood lounge chair is still sold today."
+    )
+    seo = enhancer.generate_seo_metadata(content, {"title": "Eames plywood"})
+    assert seo.keywords[0] == "plywood"
+    assert seo.tags[:2] == ["furniture design", "eames"]
+    assert enhancer.related_videos(content, k=1)[0][0] == "eames-lounge"
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the glyph-atlas text renderer and its rendered-block cache.
+"""
+
+import numpy as np
+import pytest
+from PIL import ImageFont
+
+from bin.cutout import text_render
+from bin.cutout.sdk import BrandStyle
+from bin.cutout.text_render import (
+    PADDING_PX,
+    font_for_kind,
+    get_atlas,
+    render_text_block,
+    resolve_font,
+    text_block_size,
+)
+
+
+@pytest.fixture
+def style():
+    return BrandStyle(
+        colors={"text_primary": "#1C4FA1"},
+        fonts={"primary": "NoSuchFamily", "fallback": "Also Missing, sans-serif"},
+        font_sizes={"hook": 48, "body": 24, "lower_third": 32},
+    )
+
+
+@pytest.fixture
+def text_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "text"
+    monkeypatch.setattr(text_render, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(text_render, "_blocks", type(text_render._blocks)())
+    return cache_dir
+
+
+def test_unresolvable_fonts_fall_back_to_bitmap_font(style, tmp_path, monkeypatch):
+    broken = tmp_path / "NoSuchFamily.ttf"
+    broken.write_text("# placeholder, not a font")
+    monkeypatch.setattr(text_render, "FONT_DIRS", [tmp_path])
+    resolve_font.cache_clear()
+    try:
+        assert font_for_kind(style.fonts, "hook") is None
+    finally:
+        resolve_font.cache_clear()
+
+    atlas = get_atlas(None, 22)
+    assert atlas.scale == 2.0
+    assert atlas.measure("ab") == pytest.approx(2 * atlas.glyph("a").advance)
+    assert atlas.glyph("a") is atlas.glyph("a")  # rasterized once
+
+
+def test_wrap_and_metrics_match_rendered_block(style, text_cache):
+    text = "Mid century modern design changed how we sit and work"
+    image = render_text_block(text, style, "body", max_width=300)
+
+    assert image.mode == "RGBA"
+    assert image.size == text_block_size(text, 24, None, 300)
+    atlas = get_atlas(None, 24)
+    lines = atlas.wrap(text, 300 - 2 * PADDING_PX)
+    assert len(lines) > 1 and " ".join(lines) == text
+    assert all(atlas.measure(line) <= 300 - 2 * PADDING_PX for line in lines)
+    assert image.size[1] == len(lines) * atlas.line_height + 2 * PADDING_PX
+
+    pixels = np.asarray(image)
+    assert pixels[..., 3].max() == 255
+    assert tuple(pixels[pixels[..., 3] > 0][0, :3]) == (0x1C, 0x4F, 0xA1)
+    assert pixels[:PADDING_PX, :, 3].max() == 0  # padding stays clear
+
+
+def test_blocks_are_cached_in_memory_and_on_disk(style, text_cache, monkeypatch):
+    first = render_text_block("Lower Third", style, "lower_third")
+    assert render_text_block("Lower Third", style, "lower_third") is first
+    assert len(list(text_cache.glob("*.png"))) == 1
+
+    # A new process (empty memory cache) reads the block back from disk
+    text_render._blocks.clear()
+
+    def no_render(*args, **kwargs):
+        raise AssertionError("cached block was re-rendered")
+
+    with monkeypatch.context() as m:
+        m.setattr(text_render, "_layout", no_render)
+        again = render_text_block("Lower Third", style, "lower_third")
+    assert np.array_equal(np.asarray(again), np.asarray(first))
+
+    # Different kind or width is a different block
+    render_text_block("Lower Third", style, "body")
+    render_text_block("Lower Third", style, "lower_third", max_width=None)
+    assert len(list(text_cache.glob("*.png"))) == 3
+
+
+def test_truetype_kerning_is_applied():
+    try:
+        ImageFont.truetype("DejaVuSans.ttf", 12)
+    except OSError:
+        pytest.skip("no system TrueType font available")
+    atlas = get_atlas("DejaVuSans.ttf", 40)
+    pair = atlas.font.getlength("AV")
+    assert atlas.measure("AV") == pytest.approx(pair)
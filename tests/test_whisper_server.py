@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent whisper.cpp server wrapper.
+
+A stand-in whisper-server (a tiny HTTP script) answers /inference with one
+SRT cue describing the WAV it received, so the tests need no model.
+"""
+
+import json
+import shutil
+import socket
+import subprocess
+import sys
+import textwrap
+import wave
+
+import pytest
+
+from bin.utils import whisper_server
+from bin.utils.subtitles import parse_srt
+from bin.utils.whisper_server import SAMPLE_RATE, WhisperServer, decode_pcm
+
+FAKE_SERVER = f"""\
+#!{sys.executable}
+import io, sys, wave
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+args = dict(zip(sys.argv[1::2], sys.argv[2::2]))
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        head = f"Content-Type: {{self.headers['Content-Type']}}\\r\\n\\r\\n"
+        form = BytesParser(policy=policy.HTTP).parsebytes(head.encode() + body)
+        files = {{
+            part.get_param("name", header="content-disposition"): part
+            for part in form.iter_parts()
+        }}
+        with wave.open(io.BytesIO(files["file"].get_content())) as w:
+            ms = w.getnframes() * 1000 // w.getframerate()
+        body = f"1\\n00:00:00,000 --> 00:00:00,{{ms:03d}}\\n{{ms}} ms\\n\\n"
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *a):
+        pass
+
+
+HTTPServer((args["--host"], int(args["--port"])), Handler).serve_forever()
+"""
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(whisper_server, "SERVER_LOG", str(tmp_path / "server.log"))
+    binary = tmp_path / "whisper-server"
+    binary.write_text(FAKE_SERVER)
+    binary.chmod(0o755)
+    model = tmp_path / "ggml-test.bin"
+    model.write_bytes(b"")
+    srv = WhisperServer(
+        str(binary),
+        str(model),
+        port=_free_port(),
+        state_path=str(tmp_path / "state.json"),
+    )
+    yield srv
+    srv.stop()
+
+
+def test_server_is_started_once_and_reused(server):
+    pid = server.ensure()._read_state()["pid"]
+    # A second run (e.g. a short's captions) attaches to the same process
+    again = WhisperServer(
+        server.binary, server.model, port=server.port, state_path=server.state_path
+    )
+    assert again.running()
+    assert again.ensure()._read_state()["pid"] == pid
+
+    assert server.stop()
+    assert not again.running()
+
+
+def test_stale_state_never_signals_a_reused_pid(server):
+    # After a reboot the recorded pid can belong to an unrelated process
+    other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        state = {"pid": other.pid, "host": server.host, "port": server.port}
+        state.update(model=server.model, started=0.0)
+        with open(server.state_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        assert not server.running()
+        assert not server.stop()
+        assert other.poll() is None
+        assert server._read_state() == {}
+
+        # A live process started at the recorded time but serving something
+        # else is not ours either
+        server.ensure()
+        state = server._read_state()
+        state["model"] = "ggml-other.bin"
+        with open(server.state_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        assert not server.stop()
+        live = whisper_server.psutil.Process(state["pid"])
+        assert live.is_running()
+        live.terminate()
+    finally:
+        other.kill()
+        other.wait()
+
+
+def test_pcm_segments_keep_buffer_relative_times(server):
+    server.ensure()
+    pcm = b"\0\0" * SAMPLE_RATE  # one second of silence
+    srts = server.transcribe_segments(pcm, [(0, 250), (500, 900)])
+    first, second = (parse_srt(srt)[0] for srt in srts)
+    assert (first.start_ms, first.end_ms, first.text) == (0, 250, "250 ms")
+    assert (second.start_ms, second.end_ms, second.text) == (500, 900, "400 ms")
+
+
+@pytest.mark.skipif(not shutil.which("ffmpeg"), reason="ffmpeg not installed")
+def test_files_are_decoded_in_memory(server, tmp_path):
+    audio = tmp_path / "vo.wav"
+    with wave.open(str(audio), "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(44100)
+        w.writeframes(b"\0\0\0\0" * 22050)
+    assert len(decode_pcm(str(audio), loudnorm=False)) == SAMPLE_RATE  # 0.5 s
+
+    server.ensure()
+    (srt,) = server.transcribe_files([(str(audio), str(tmp_path / "vo.srt"))])
+    assert parse_srt(open(srt).read())[0].text == "500 ms"
+    assert sorted(p.name for p in tmp_path.glob("vo.*")) == ["vo.srt", "vo.wav"]
@@ -54,50 +54,6 @@ def test_texture_qa_imports():
         return False
 
 
-def test_dialback_function():
-    """Test the texture strength dialback function."""
-    print("\nTesting Texture Strength Dialback")
-    print("=" * 35)
-
-    try:
-        from cutout.texture_integration import _dial_back_texture_strength
-
-        # Test configuration
-        original_config = {
-            "grain_strength": 0.15,
-            "posterize_levels": 6,
-            "feather_px": 2.0,
-            "halftone": {"enable": True, "opacity": 0.2},
-        }
-
-        print(f"Original config: {original_config}")
-
-        # Apply dialback
-        dialed_config = _dial_back_texture_strength(original_config)
-        print(f"Dialed back config: {dialed_config}")
-
-        # Verify changes
-        assert (
-            dialed_config["grain_strength"] < original_config["grain_strength"]
-        ), "Grain strength should be reduced"
-        assert (
-            dialed_config["posterize_levels"] > original_config["posterize_levels"]
-        ), "Posterize levels should increase"
-        assert (
-            dialed_config["halftone"]["enable"] == False
-        ), "Halftone should be disabled"
-        assert (
-            dialed_config["feather_px"] < original_config["feather_px"]
-        ), "Feather should be reduced"
-
-        print("✓ Dialback function working correctly")
-        return True
-
-    except Exception as e:
-        print(f"✗ Dialback test failed: {e}")
-        return False
-
-
 def test_qa_result_structure():
     """Test the QA result data structure."""
     print("\nTesting QA Result Structure")
@@ -135,7 +91,7 @@ def main():
     print("Texture QA Loop Test Suite")
     print("=" * 40)
 
-    tests = [test_texture_qa_imports, test_dialback_function, test_qa_result_structure]
+    tests = [test_texture_qa_imports, test_qa_result_structure]
 
     passed = 0
     total = len(tests)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the blended-strength texture QA search.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from bin.cutout import qa_gates, texture_integration
+from bin.cutout.qa_gates import check_frame_contrast
+from bin.cutout.texture_integration import apply_texture_with_qa_loop
+
+
+def _card(size):
+    """Dark text-like bars on a light background, in 64px-tile-sized blocks."""
+    img = Image.new("RGB", size, "#F8F1E5")
+    draw = ImageDraw.Draw(img)
+    for y in range(8, size[1] - 32, 64):
+        for x in range(8, size[0] - 32, 64):
+            draw.rectangle((x + 8, y + 20, x + 40, y + 28), fill="#111827")
+    return img
+
+
+@pytest.fixture
+def wash(monkeypatch):
+    """A texture that washes the frame towards mid grey; counts its passes."""
+    calls = []
+
+    def fake_texture(img, cfg, seed):
+        calls.append(seed)
+        arr = np.asarray(img, dtype=np.float32)
+        return Image.fromarray((arr * 0.3 + 128 * 0.7).astype(np.uint8))
+
+    monkeypatch.setattr(texture_integration, "apply_textures_to_frame", fake_texture)
+    return calls
+
+
+def test_bisection_finds_strongest_passing_blend_with_one_texture_pass(wash):
+    img = _card((1280, 720))
+    out, metadata = apply_texture_with_qa_loop(img, {"enable": True}, seed=7)
+    textures = metadata["textures"]
+
+    assert wash == [7]
+    assert textures["applied"] and textures["dialback_applied"]
+    strength = textures["strength"]
+    assert 0.0 < strength < 1.0
+    assert textures["final_params"]["strength"] == round(strength, 4)
+
+    # Proxy checks first, then the chosen strength once at full resolution
+    scales = [qa["scale"] for qa in textures["qa_results"]]
+    assert scales[:-1] == ["1/3"] * (len(scales) - 1) and scales[-1] == "full"
+    assert check_frame_contrast(out).ok
+
+    washed = np.asarray(img, np.float32) * 0.3 + 128 * 0.7
+    stronger = np.asarray(img, np.float32) * (1 - strength - 1 / 16)
+    stronger += washed * (strength + 1 / 16)
+    assert not check_frame_contrast(Image.fromarray(stronger.astype(np.uint8))).ok
+
+
+def test_fixed_dialback_steps_and_small_images_skip_the_proxy(wash):
+    img = _card((384, 256))
+    _, metadata = apply_texture_with_qa_loop(
+        img, {"enable": True}, seed=1, search="dialback", max_retries=4
+    )
+    textures = metadata["textures"]
+    assert textures["strength"] in [0.7**k for k in range(5)]
+    # No downsampling needed: every check is at full size and none repeats
+    strengths = [qa["strength"] for qa in textures["qa_results"]]
+    assert len(strengths) == len(set(strengths))
+    assert all(qa["scale"] == "full" for qa in textures["qa_results"])
+
+
+def test_texture_failing_every_full_resolution_check_is_not_applied(
+    wash, monkeypatch
+):
+    img = _card((1280, 720))
+
+    def proxy_only(frame, threshold=4.5, tile_px=64):
+        ok = frame.size != img.size
+        return SimpleNamespace(ok=ok, details={"min_contrast": 7.0})
+
+    monkeypatch.setattr(qa_gates, "check_frame_contrast", proxy_only)
+    out, metadata = apply_texture_with_qa_loop(
+        img, {"enable": True}, seed=3, max_retries=3
+    )
+    textures = metadata["textures"]
+
+    assert not textures["applied"]
+    assert textures["fallback_reason"] == "all_attempts_failed"
+    assert [qa["scale"] for qa in textures["qa_results"]].count("full") == 4
+    assert np.array_equal(np.asarray(out), np.asarray(img))
+
+
+def test_passing_texture_is_applied_at_full_strength(monkeypatch):
+    def gentle(img, cfg, seed):
+        return Image.eval(img, lambda v: min(255, v + 3))
+
+    monkeypatch.setattr(texture_integration, "apply_textures_to_frame", gentle)
+    img = _card((384, 256))
+    out, metadata = apply_texture_with_qa_loop(img, {"enable": True}, seed=1)
+
+    assert metadata["textures"]["strength"] == 1.0
+    assert not metadata["textures"]["dialback_applied"]
+    assert metadata["textures"]["attempts"] == 1
+    assert np.array_equal(np.asarray(out), np.asarray(gentle(img, {}, 1)))
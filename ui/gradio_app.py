@@ -17,6 +17,7 @@ logger = logging.getLogger(__name__)
 # Configuration
 API_BASE_URL = "http://127.0.0.1:8008/api/v1"
 DEFAULT_HEADERS = {"Content-Type": "application/json"}
+LOG_VIEW_LINES = 500
 
 
 class APIClient:
@@ -101,6 +102,21 @@ class APIClient:
         result = self._make_request("GET", f"/jobs/{job_id}/events?limit={limit}")
         return result.get("events", []) if isinstance(result, dict) else []
 
+    def get_log_lines(
+        self,
+        source: str,
+        offset: Optional[int] = None,
+        lines: int = 200,
+        file_id: Optional[str] = None,
+    ) -> Dict:
+        """Get pipeline log lines appended after a byte offset"""
+        endpoint = f"/logs/{source}?lines={lines}"
+        if offset is not None:
+            endpoint += f"&offset={offset}"
+        if file_id:
+            endpoint += f"&file_id={file_id}"
+        return self._make_request("GET", endpoint)
+
     def compile_brief(
         self, free_text: str, preset: str, testing_mode: str, seed: int
     ) -> Dict:
@@ -866,6 +882,31 @@ def create_job_console_page(
             return event_text
         return "No new events"
 
+    def update_log(source, cursor, last_source, current_text):
+        """Append only the log lines written since the previous refresh"""
+        if not api_client:
+            return current_text, cursor, last_source
+        if source != last_source or not cursor:
+            cursor, current_text = {}, ""
+
+        result = api_client.get_log_lines(
+            source,
+            cursor.get("offset"),
+            lines=LOG_VIEW_LINES,
+            file_id=cursor.get("file_id"),
+        )
+        if "error" in result:
+            return current_text, cursor, source
+        if result.get("reset"):
+            current_text = ""
+
+        new_lines = result.get("lines", [])
+        if new_lines:
+            merged = (current_text.splitlines() if current_text else []) + new_lines
+            current_text = "\n".join(merged[-LOG_VIEW_LINES:])
+        cursor = {"offset": result.get("offset"), "file_id": result.get("file_id")}
+        return current_text, cursor, source
+
     with gr.Blocks(title="Job Console") as page:
         gr.Markdown("# Job Console")
         gr.Markdown("Monitor job progress and manage HITL gates")
@@ -923,11 +964,23 @@ def create_job_console_page(
                     label="Event Stream", lines=10, interactive=False
                 )
 
+                gr.Markdown("## Pipeline Log")
+                with gr.Row():
+                    log_source = gr.Dropdown(
+                        label="Log Source",
+                        choices=["state", "pipeline"],
+                        value="state",
+                    )
+                    refresh_log_btn = gr.Button("Refresh Log", variant="secondary")
+                log_display = gr.Textbox(label="Log", lines=15, interactive=False)
+
         # Hidden inputs for job context
         current_job_id = gr.State(None)
         current_status = gr.State(None)
         current_stage = gr.State(None)
         event_status = gr.State("No events")
+        log_offset = gr.State(None)  # {"offset", "file_id"} of the log panel
+        log_last_source = gr.State(None)
 
         # Wire up events
         refresh_jobs_btn.click(fn=load_jobs, outputs=job_dropdown)
@@ -973,6 +1026,11 @@ def create_job_console_page(
             fn=resume_job, inputs=[current_job_id], outputs=[gate_result, gate_result]
         )
 
+        log_inputs = [log_source, log_offset, log_last_source, log_display]
+        log_outputs = [log_display, log_offset, log_last_source]
+        refresh_log_btn.click(fn=update_log, inputs=log_inputs, outputs=log_outputs)
+        log_source.change(fn=update_log, inputs=log_inputs, outputs=log_outputs)
+
         # Load jobs on page load
         page.load(load_jobs, outputs=job_dropdown)
 